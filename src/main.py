@@ -6,13 +6,14 @@ import asyncio
 import pandas as pd
 from pathlib import Path
 from datetime import datetime
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 
 from src.config import Config
 from src.models import Site, ValidationItem, ValidationResult
 from src.utils.logger import setup_logger, get_logger
 from src.utils.scraper import Scraper
 from src.utils.llm_client import LLMClient
+from src.utils.response_cache import ResponseCache
 from src.utils.reporter import Reporter
 from src.utils.site_mapper import SiteMapper
 from src.utils.target_page_mapper import get_target_urls
@@ -149,7 +150,17 @@ class IRSiteEvaluator:
 
         # Validators
         self.script_validator = ScriptValidator(self.scraper, self.logger)
-        self.llm_validator = LLMValidator(self.llm_client, self.logger)
+        response_cache = None
+        if self.config.performance.enable_caching:
+            # モデルが変わったら別キャッシュになるようディレクトリを分ける
+            cache_dir = Path(self.config.performance.cache_dir) / 'llm' / self.config.api.model
+            response_cache = ResponseCache(
+                cache_dir,
+                self.logger,
+                max_size_bytes=self.config.performance.max_cache_size_mb * 1024 * 1024,
+            )
+            self.logger.info(f"LLM response cache enabled: {cache_dir}")
+        self.llm_validator = LLMValidator(self.llm_client, self.logger, response_cache=response_cache)
 
         # Site Mapper
         self.site_mapper = SiteMapper()
@@ -222,19 +233,22 @@ class IRSiteEvaluator:
                 html_cache, structure_cache = await self._collect_page_assets(page_cache)
 
                 # Step 4: 各検証項目を適切なページで実行
+                batched_results = await self._run_llm_batches(site, site_map, page_cache, html_cache, structure_cache)
                 for item_idx, item in enumerate(self.validation_items, 1):
-                    target_urls = get_target_urls(item, site_map)
-                    payloads = self._build_page_payloads(
-                        site,
-                        item,
-                        target_urls,
-                        page_cache,
-                        html_cache,
-                        structure_cache,
-                        site.url
-                    )
+                    result = batched_results.get(item.item_id)
+                    if result is None:
+                        target_urls = get_target_urls(item, site_map)
+                        payloads = self._build_page_payloads(
+                            site,
+                            item,
+                            target_urls,
+                            page_cache,
+                            html_cache,
+                            structure_cache,
+                            site.url
+                        )
+                        result = await self._evaluate_item_with_payloads(site, item, payloads)
 
-                    result = await self._evaluate_item_with_payloads(site, item, payloads)
                     self.results.append(result)
 
                     log_msg = f"  [{item_idx}/{len(self.validation_items)}] {item.item_name}: {result.result}"
@@ -388,19 +402,22 @@ class IRSiteEvaluator:
             検証結果のリスト
         """
         results = []
+        batched_results = await self._run_llm_batches(site, site_map, page_cache, html_cache, structure_cache)
         for item_idx, item in enumerate(self.validation_items, 1):
-            target_urls = get_target_urls(item, site_map)
-            payloads = self._build_page_payloads(
-                site,
-                item,
-                target_urls,
-                page_cache,
-                html_cache,
-                structure_cache,
-                site.url
-            )
+            result = batched_results.get(item.item_id)
+            if result is None:
+                target_urls = get_target_urls(item, site_map)
+                payloads = self._build_page_payloads(
+                    site,
+                    item,
+                    target_urls,
+                    page_cache,
+                    html_cache,
+                    structure_cache,
+                    site.url
+                )
+                result = await self._evaluate_item_with_payloads(site, item, payloads)
 
-            result = await self._evaluate_item_with_payloads(site, item, payloads)
             results.append(result)
 
             log_msg = f"  [{item_idx}/{len(self.validation_items)}] {item.item_name}: {result.result}"
@@ -414,7 +431,7 @@ class IRSiteEvaluator:
         return results
 
     async def _validate_items_parallel(self, site: Site, page_cache: dict, html_cache: dict, structure_cache: dict, site_map: dict, ir_top_page) -> List[ValidationResult]:
-        """項目をバッチ並列実行する（LLM検証のみ）
+        """項目をバッチ並列実行する（Script検証はページ単位、LLM検証は項目単位）
 
         Args:
             site: サイト情報
@@ -430,11 +447,12 @@ class IRSiteEvaluator:
         script_items = [item for item in self.validation_items if item.check_type == 'script']
         llm_items = [item for item in self.validation_items if item.check_type == 'llm']
 
-        self.logger.info(f"  Item parallelization: {len(script_items)} script (sequential) + {len(llm_items)} LLM (parallel)")
+        self.logger.info(f"  Item parallelization: {len(script_items)} script (concurrent per page) + {len(llm_items)} LLM (parallel)")
 
         all_results = []
 
-        # Script検証: 直列実行（高速なのでそのまま）
+        # Script検証: 先頭ページが同じ項目をまとめて並行実行し、PASS しなかった項目のみ残りのページを直列で確認
+        first_page_results = await self._run_script_batches(site, script_items, site_map, page_cache, html_cache, structure_cache)
         for item_idx, item in enumerate(script_items, 1):
             payloads = self._build_page_payloads(
                 site,
@@ -446,7 +464,11 @@ class IRSiteEvaluator:
                 site.url
             )
 
-            result = await self._run_script_validations(site, item, payloads)
+            first_result = first_page_results.get(item.item_id)
+            if first_result is not None and first_result.result == 'PASS':
+                result = first_result
+            else:
+                result = await self._run_script_validations(site, item, payloads, first_result)
             all_results.append(result)
 
             log_msg = f"  [Script {item_idx}/{len(script_items)}] {item.item_name}: {result.result}"
@@ -457,65 +479,125 @@ class IRSiteEvaluator:
             else:
                 self.logger.error(log_msg)
 
-        # LLM検証: バッチ並列実行
-        max_batch_size = self.config.processing.max_parallel_items_per_site
+        # LLM検証: Semaphore で同時実行数を制限しつつ全項目を並列実行
+        batched_results = await self._run_llm_batches(site, site_map, page_cache, html_cache, structure_cache)
+        max_concurrency = self.config.processing.max_parallel_items_per_site
+        semaphore = asyncio.Semaphore(max_concurrency)
+        self.logger.info(f"  Processing {len(llm_items)} LLM items (max {max_concurrency} concurrent)")
 
-        for batch_start in range(0, len(llm_items), max_batch_size):
-            batch = llm_items[batch_start:batch_start + max_batch_size]
-            self.logger.info(f"  Processing LLM batch {batch_start // max_batch_size + 1}/{(len(llm_items) + max_batch_size - 1) // max_batch_size}: {len(batch)} items")
+        async def run_llm_item(item: ValidationItem) -> ValidationResult:
+            if item.item_id in batched_results:
+                return batched_results[item.item_id]
+            payloads = self._build_page_payloads(
+                site,
+                item,
+                get_target_urls(item, site_map),
+                page_cache,
+                html_cache,
+                structure_cache,
+                site.url
+            )
+            async with semaphore:
+                return await self.llm_validator.validate_with_pages(site, item, payloads)
 
-            # バッチ内の全項目を並列実行
-            tasks = []
-            for item in batch:
-                payloads = self._build_page_payloads(
-                    site,
-                    item,
-                    get_target_urls(item, site_map),
-                    page_cache,
-                    html_cache,
-                    structure_cache,
-                    site.url
+        batch_results = await asyncio.gather(*(run_llm_item(item) for item in llm_items), return_exceptions=True)
+
+        # 結果を収集
+        for batch_item, result in zip(llm_items, batch_results):
+            if isinstance(result, Exception):
+                self.logger.error(f"  LLM validation failed for {batch_item.item_name}: {result}")
+                result = ValidationResult(
+                    site_id=site.site_id,
+                    company_name=site.company_name,
+                    url=site.url,
+                    item_id=batch_item.item_id,
+                    item_name=batch_item.item_name,
+                    category=batch_item.category,
+                    subcategory=batch_item.subcategory,
+                    result='ERROR',
+                    confidence=0.0,
+                    details=str(result),
+                    checked_at=datetime.now(),
+                    checked_url=site.url,
+                    error_message=str(result)
                 )
 
-                task = self.llm_validator.validate_with_pages(site, item, payloads)
-                tasks.append(task)
-
-            # 並列実行
-            batch_results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            # 結果を収集
-            for batch_item, result in zip(batch, batch_results):
-                if isinstance(result, Exception):
-                    self.logger.error(f"  LLM validation failed for {batch_item.item_name}: {result}")
-                    result = ValidationResult(
-                        site_id=site.site_id,
-                        company_name=site.company_name,
-                        url=site.url,
-                        item_id=batch_item.item_id,
-                        item_name=batch_item.item_name,
-                        category=batch_item.category,
-                        subcategory=batch_item.subcategory,
-                        result='ERROR',
-                        confidence=0.0,
-                        details=str(result),
-                        checked_at=datetime.now(),
-                        checked_url=site.url,
-                        error_message=str(result)
-                    )
-
-                all_results.append(result)
+            all_results.append(result)
 
-                # ログ出力
-                log_msg = f"  [{len(all_results)}/{len(self.validation_items)}] {batch_item.item_name}: {result.result}"
-                if result.result == 'PASS':
-                    self.logger.info(log_msg)
-                elif result.result == 'FAIL':
-                    self.logger.warning(log_msg)
-                else:
-                    self.logger.error(log_msg)
+            # ログ出力
+            log_msg = f"  [{len(all_results)}/{len(self.validation_items)}] {batch_item.item_name}: {result.result}"
+            if result.result == 'PASS':
+                self.logger.info(log_msg)
+            elif result.result == 'FAIL':
+                self.logger.warning(log_msg)
+            else:
+                self.logger.error(log_msg)
 
         return all_results
 
+    async def _run_llm_batches(self, site: Site, site_map: dict, page_cache: dict, html_cache: dict, structure_cache: dict) -> Dict[int, ValidationResult]:
+        """同じページ群を参照するLLM項目をまとめて検証する（batch_semantic_checks 有効時）
+
+        Returns:
+            item_id をキーとする検証結果（バッチ対象外の項目は含まない）
+        """
+        if not self.config.processing.batch_semantic_checks:
+            return {}
+
+        # 参照ページが同一の項目をグループ化（NOT_SUPPORTED は通常経路で処理）
+        groups: Dict[Tuple[str, ...], Tuple[List[ValidationItem], List[dict]]] = {}
+        for item in self.validation_items:
+            if item.check_type != 'llm' or get_not_supported_reason(item):
+                continue
+            payloads = self._build_page_payloads(
+                site,
+                item,
+                get_target_urls(item, site_map),
+                page_cache,
+                html_cache,
+                structure_cache,
+                site.url
+            )
+            key = tuple(payload['url'] for payload in payloads)
+            groups.setdefault(key, ([], payloads))[0].append(item)
+
+        batch_size = self.llm_validator.max_batch_items
+        batches = [
+            (items[start:start + batch_size], payloads)
+            for items, payloads in groups.values()
+            for start in range(0, len(items), batch_size)
+        ]
+        if not batches:
+            return {}
+
+        self.logger.info(f"  Batched LLM validation: {sum(len(items) for items, _ in batches)} items in {len(batches)} calls")
+        if self.config.processing.enable_item_parallel:
+            semaphore = asyncio.Semaphore(self.config.processing.max_parallel_items_per_site)
+
+            async def run_batch(items: List[ValidationItem], payloads: List[dict]) -> List[ValidationResult]:
+                async with semaphore:
+                    return await self.llm_validator.validate_batch(site, items, payloads)
+
+            batch_results = await asyncio.gather(*(run_batch(items, payloads) for items, payloads in batches), return_exceptions=True)
+        else:
+            # 項目並列化が無効な場合（API制限対策）はバッチも1件ずつ順に送る
+            batch_results = []
+            for items, payloads in batches:
+                try:
+                    batch_results.append(await self.llm_validator.validate_batch(site, items, payloads))
+                except Exception as e:
+                    batch_results.append(e)
+
+        results: Dict[int, ValidationResult] = {}
+        for (items, _), batch_result in zip(batches, batch_results):
+            if isinstance(batch_result, Exception):
+                # 取りこぼした項目は通常経路で再検証される
+                self.logger.error(f"  Batched LLM validation failed for {[item.item_id for item in items]}: {batch_result}")
+                continue
+            for item, result in zip(items, batch_result):
+                results[item.item_id] = result
+        return results
+
     def _build_page_payloads(self, site: Site, item: ValidationItem, target_urls: List[str], page_cache: dict, html_cache: dict, structure_cache: dict, fallback_url: str) -> List[dict]:
         fallback_page = page_cache.get(fallback_url)
         fallback_html = html_cache.get(fallback_url, "")
@@ -545,9 +627,47 @@ class IRSiteEvaluator:
 
         return payloads
 
-    async def _run_script_validations(self, site: Site, item: ValidationItem, payloads: List[dict]) -> ValidationResult:
-        last_result = None
+    async def _run_script_batches(self, site: Site, items: List[ValidationItem], site_map: dict, page_cache: dict, html_cache: dict, structure_cache: dict) -> Dict[int, ValidationResult]:
+        """先頭ページが同じScript項目を ScriptValidator.validate_batch でまとめて検証する
+
+        Returns:
+            item_id をキーとする先頭ページでの検証結果（ページ未取得・未対応の項目は含まない）
+        """
+        groups: Dict[str, tuple] = {}
+        for item in items:
+            if get_not_supported_reason(item):
+                continue
+            payloads = self._build_page_payloads(
+                site,
+                item,
+                get_target_urls(item, site_map),
+                page_cache,
+                html_cache,
+                structure_cache,
+                site.url
+            )
+            first = payloads[0]
+            if not first.get('page'):
+                continue
+            groups.setdefault(first['url'], (first['page'], []))[1].append(item)
+
+        concurrency = self.config.processing.max_parallel_items_per_site
+        results: Dict[int, ValidationResult] = {}
+        for url, (page, group_items) in groups.items():
+            batch = await self.script_validator.validate_batch(site, page, group_items, url, concurrency=concurrency)
+            for item, result in zip(group_items, batch):
+                results[item.item_id] = result
+        return results
+
+    async def _run_script_validations(self, site: Site, item: ValidationItem, payloads: List[dict], first_result: Optional[ValidationResult] = None) -> ValidationResult:
+        """対象ページを順に検証し、最初に PASS した結果を返す
+
+        first_result を渡した場合は先頭ページの検証を済んだものとして扱う。
+        """
+        last_result = first_result
         for idx, payload in enumerate(payloads):
+            if idx == 0 and first_result is not None:
+                continue
             page = payload.get('page')
             if not page:
                 continue
@@ -644,6 +764,13 @@ class IRSiteEvaluator:
         """サマリーを表示"""
         self.reporter.print_statistics(self.results)
         self.llm_client.print_cost_summary()
+        response_cache = self.llm_validator.response_cache if self.llm_validator else None
+        if response_cache:
+            self.logger.info(f"LLM response cache: {response_cache.hits} hits / {response_cache.misses} misses")
+        if self.llm_validator and self.llm_validator.json_repair_attempts:
+            self.logger.info(
+                f"LLM JSON repair: {self.llm_validator.json_repair_successes}/{self.llm_validator.json_repair_attempts} succeeded"
+            )
         self.logger.info(f"Total execution time: {elapsed_time}")
 
     async def cleanup(self):
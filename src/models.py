@@ -4,8 +4,43 @@ IRサイト評価ツールで使用する全データモデルを定義。
 """
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, List, Literal
+from functools import cached_property
+from typing import Optional, List, Literal, Dict
 import json
+import re
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson 未導入時は標準ライブラリで代替
+    orjson = None
+
+CODE_BLOCK_PATTERN = re.compile(r'```(?:json)?\s*\n?(.*?)\n?```', re.DOTALL)
+# 説明文に埋め込まれたJSONから最初の {...} ブロックを取り出す（1段のネストまで）
+JSON_BLOCK_PATTERN = re.compile(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', re.DOTALL)
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _strip_code_block(response_text: str) -> str:
+    """Markdownコードブロック（```json ... ``` または ``` ... ```）を除去"""
+    cleaned_text = response_text.strip()
+    if cleaned_text.startswith('```'):
+        match = CODE_BLOCK_PATTERN.search(cleaned_text)
+        if match:
+            cleaned_text = match.group(1).strip()
+    return cleaned_text
+
+
+def _load_json_object(response_text: str):
+    """LLM応答からJSONを読み込む（前後に説明文があれば最初の {...} ブロックを使用）"""
+    cleaned_text = _strip_code_block(response_text)
+    try:
+        return _json_loads(cleaned_text)
+    except ValueError:
+        match = JSON_BLOCK_PATTERN.search(cleaned_text)
+        if not match:
+            raise
+        return _json_loads(match.group(0))
 
 
 @dataclass
@@ -55,6 +90,11 @@ class ValidationItem:
         if self.check_type not in ['script', 'llm']:
             raise ValueError(f"Invalid check_type: {self.check_type}")
 
+    @cached_property
+    def text_lower(self) -> str:
+        """項目名と判定基準を連結して小文字化したテキスト（キーワード判定用、初回のみ計算）"""
+        return f"{self.item_name} {self.instruction or ''}".lower()
+
     def is_script_validation(self) -> bool:
         """スクリプト検証かどうか"""
         return self.check_type == 'script'
@@ -142,6 +182,7 @@ class LLMResponse:
     confidence: float
     details: str
     reasoning: Optional[str] = None
+    parse_error: Optional[str] = None  # JSONパース失敗時のエラー内容
 
     @classmethod
     def from_json(cls, response_text: str) -> 'LLMResponse':
@@ -154,20 +195,10 @@ class LLMResponse:
             LLMResponseインスタンス
         """
         import logging
-        import re
         logger = logging.getLogger(__name__)
-        
+
         try:
-            # Markdownコードブロックを除去（```json ... ``` または ``` ... ```）
-            cleaned_text = response_text.strip()
-            if cleaned_text.startswith('```'):
-                # コードブロック内のJSONを抽出
-                match = re.search(r'```(?:json)?\s*\n?(.*?)\n?```', cleaned_text, re.DOTALL)
-                if match:
-                    cleaned_text = match.group(1).strip()
-                    logger.debug("Removed markdown code block from LLM response")
-            
-            data = json.loads(cleaned_text)
+            data = _load_json_object(response_text)
             return cls(
                 raw_response=response_text,
                 found=data.get('found', False),
@@ -175,7 +206,7 @@ class LLMResponse:
                 details=data.get('details', ''),
                 reasoning=data.get('reasoning')
             )
-        except (json.JSONDecodeError, ValueError, KeyError) as e:
+        except (ValueError, KeyError, AttributeError) as e:
             # JSONパース失敗時のフォールバック
             logger.warning(f"Failed to parse LLM response: {str(e)}")
             logger.warning(f"Raw response (first 500 chars): {response_text[:500]!r}")
@@ -185,8 +216,40 @@ class LLMResponse:
                 found=False,
                 confidence=0.0,
                 details=f'Failed to parse LLM response: {str(e)}',
-                reasoning=None
+                reasoning=None,
+                parse_error=str(e)
+            )
+
+    @classmethod
+    def from_batch_json(cls, response_text: str) -> Dict[int, 'LLMResponse']:
+        """複数項目をまとめて判定した JSON 応答をパース
+
+        Args:
+            response_text: {"results": [{"item_id": ..., "found": ..., ...}]} 形式の応答
+
+        Returns:
+            item_id をキーとする LLMResponse の辞書
+
+        Raises:
+            ValueError: JSONとして解釈できない、または形式が不正な場合
+        """
+        data = _json_loads(_strip_code_block(response_text))
+        entries = data.get('results') if isinstance(data, dict) else data
+        if not isinstance(entries, list):
+            raise ValueError("Batch response does not contain a results list")
+
+        responses: Dict[int, LLMResponse] = {}
+        for entry in entries:
+            if not isinstance(entry, dict) or 'item_id' not in entry:
+                continue
+            responses[int(entry['item_id'])] = cls(
+                raw_response=json.dumps(entry, ensure_ascii=False),
+                found=entry.get('found', False),
+                confidence=float(entry.get('confidence', 0.0)),
+                details=entry.get('details', ''),
+                reasoning=entry.get('reasoning')
             )
+        return responses
 
     @classmethod
     def from_text(cls, response_text: str, found: bool = False) -> 'LLMResponse':
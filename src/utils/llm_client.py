@@ -3,6 +3,7 @@
 Claude API と OpenAI API を統一インターフェースで扱う。
 """
 import anthropic
+import asyncio
 import openai
 import time
 from typing import Optional
@@ -32,9 +33,11 @@ class LLMClient:
         # API クライアント初期化
         if self.provider == 'claude':
             self.client = anthropic.Anthropic(api_key=config.api_key)
+            self.async_client = anthropic.AsyncAnthropic(api_key=config.api_key)
             self.logger.info(f"Initialized Claude API client (model: {config.model})")
         elif self.provider == 'openai':
             self.client = openai.OpenAI(api_key=config.api_key)
+            self.async_client = openai.AsyncOpenAI(api_key=config.api_key)
             self.logger.info(f"Initialized OpenAI API client (model: {config.model})")
         else:
             raise ValueError(f"Unknown API provider: {self.provider}")
@@ -83,30 +86,105 @@ class LLMClient:
 
         raise Exception(f"Max retries ({self.config.max_retries}) exceeded for LLM call")
 
-    def _call_claude(self, prompt: str, context: str) -> str:
-        """Claude API を呼び出す
+    async def acall(self, prompt: str, context: str) -> str:
+        """LLM を非同期で呼び出す
+
+        call() と同じリトライ方針で、イベントループをブロックせずに待機する。
 
         Args:
             prompt: システムプロンプト
             context: ユーザーコンテキスト
 
         Returns:
-            応答テキスト
+            LLMからの応答テキスト
+
+        Raises:
+            Exception: API呼び出しに失敗した場合
         """
-        self.logger.debug(f"Calling Claude API (model: {self.config.model})...")
+        for attempt in range(self.config.max_retries):
+            try:
+                if self.provider == 'claude':
+                    response_text = await self._acall_claude(prompt, context)
+                else:
+                    response_text = await self._acall_openai(prompt, context)
+
+                self.total_calls += 1
+                return response_text
 
-        message = self.client.messages.create(
-            model=self.config.model,
-            max_tokens=self.config.max_tokens,
-            messages=[
+            except (anthropic.RateLimitError, openai.RateLimitError):
+                self.logger.warning(f"Rate limit hit, waiting 60s... (attempt {attempt + 1}/{self.config.max_retries})")
+                await asyncio.sleep(60)
+
+            except (anthropic.APIError, openai.APIError) as e:
+                self.logger.warning(f"API error: {e} (attempt {attempt + 1}/{self.config.max_retries})")
+                if attempt < self.config.max_retries - 1:
+                    await asyncio.sleep(self.config.rate_limit_delay * (2 ** attempt))  # 指数バックオフ
+                else:
+                    raise
+
+            except Exception as e:
+                self.logger.error(f"Unexpected error during LLM call: {e}")
+                raise
+
+        raise Exception(f"Max retries ({self.config.max_retries}) exceeded for LLM call")
+
+    def _claude_request(self, prompt: str, context: str) -> dict:
+        """Claude API のリクエスト引数を組み立てる"""
+        # システムプロンプトは全項目で共通のため ephemeral キャッシュ対象にする
+        return {
+            'model': self.config.model,
+            'max_tokens': self.config.max_tokens,
+            'system': [
+                {
+                    "type": "text",
+                    "text": prompt,
+                    "cache_control": {"type": "ephemeral"}
+                }
+            ],
+            'messages': [
                 {
                     "role": "user",
-                    "content": f"{prompt}\n\n{context}"
+                    "content": context
                 }
             ],
-            timeout=self.config.timeout
-        )
+            'timeout': self.config.timeout,
+        }
+
+    def _openai_request(self, prompt: str, context: str) -> dict:
+        """OpenAI API のリクエスト引数を組み立てる"""
+        # システムメッセージを毎回同一にしておくと自動プレフィックスキャッシュが効く
+        return {
+            'model': self.config.model,
+            'messages': [
+                {"role": "system", "content": prompt},
+                {"role": "user", "content": context}
+            ],
+            'max_tokens': self.config.max_tokens,
+            'timeout': self.config.timeout,
+        }
+
+    def _call_claude(self, prompt: str, context: str) -> str:
+        """Claude API を呼び出す
+
+        Args:
+            prompt: システムプロンプト
+            context: ユーザーコンテキスト
 
+        Returns:
+            応答テキスト
+        """
+        self.logger.debug(f"Calling Claude API (model: {self.config.model})...")
+        message = self.client.messages.create(**self._claude_request(prompt, context))
+        return self._handle_claude_response(message)
+
+    async def _acall_claude(self, prompt: str, context: str) -> str:
+        """Claude API を非同期で呼び出す"""
+        self.logger.debug(f"Calling Claude API async (model: {self.config.model})...")
+        message = await self.async_client.messages.create(**self._claude_request(prompt, context))
+        return self._handle_claude_response(message)
+
+    def _handle_claude_response(self, message) -> str:
+        """Claude API の応答からトークン数を記録してテキストを取り出す"""
         # トークン数を記録
         self.total_input_tokens += message.usage.input_tokens
         self.total_output_tokens += message.usage.output_tokens
@@ -133,17 +211,17 @@ class LLMClient:
             応答テキスト
         """
         self.logger.debug(f"Calling OpenAI API (model: {self.config.model})...")
+        response = self.client.chat.completions.create(**self._openai_request(prompt, context))
+        return self._handle_openai_response(response)
 
-        response = self.client.chat.completions.create(
-            model=self.config.model,
-            messages=[
-                {"role": "system", "content": prompt},
-                {"role": "user", "content": context}
-            ],
-            max_tokens=self.config.max_tokens,
-            timeout=self.config.timeout
-        )
+    async def _acall_openai(self, prompt: str, context: str) -> str:
+        """OpenAI API を非同期で呼び出す"""
+        self.logger.debug(f"Calling OpenAI API async (model: {self.config.model})...")
+        response = await self.async_client.chat.completions.create(**self._openai_request(prompt, context))
+        return self._handle_openai_response(response)
 
+    def _handle_openai_response(self, response) -> str:
+        """OpenAI API の応答からトークン数を記録してテキストを取り出す"""
         # トークン数を記録
         if response.usage:
             self.total_input_tokens += response.usage.prompt_tokens
@@ -69,7 +69,7 @@ def get_not_supported_reason(item: ValidationItem) -> Optional[str]:
     if item.item_id in ITEM_REASON_MAP:
         return ITEM_REASON_MAP[item.item_id]
 
-    text = f"{item.item_name} {item.instruction or ''}".lower()
+    text = item.text_lower
     for rule in KEYWORD_RULES:
         if any(keyword.lower() in text for keyword in rule['keywords']):
             return rule['reason']
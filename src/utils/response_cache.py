@@ -0,0 +1,141 @@
+"""LLM応答キャッシュ
+
+同一の（項目, プロンプト, ページ内容）に対する LLM 応答をディスクに保存し、
+再実行時の API 呼び出しを省略する。
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+DEFAULT_TTL_SECONDS = 7 * 24 * 60 * 60
+# 上限超過時は上限のこの割合まで古い順に削除する（書き込みのたびに削除が走らないように）
+EVICTION_TARGET_RATIO = 0.9
+
+
+class ResponseCache:
+    """ファイルベースの LLM 応答キャッシュ
+
+    キーごとに1ファイル（JSON）を保存する。期限切れのエントリは読み込み時に無視する。
+    合計サイズが max_size_bytes を超えたら、書き込み時に更新日時の古いファイルから削除する。
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        logger,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        max_size_bytes: Optional[int] = None,
+    ):
+        """初期化
+
+        Args:
+            cache_dir: キャッシュ保存先ディレクトリ
+            logger: ロガーインスタンス（書き込み失敗などを記録する）
+            ttl_seconds: エントリの有効期間（秒）
+            max_size_bytes: キャッシュ全体の上限サイズ（バイト、None なら無制限）
+        """
+        self.cache_dir = Path(cache_dir)
+        self.ttl_seconds = ttl_seconds
+        self.max_size_bytes = max_size_bytes
+        self.logger = logger
+        self.hits = 0
+        self.misses = 0
+        # 合計サイズは初回書き込み時にディレクトリを走査して求め、以降は書き込みごとに加算する
+        self._size_bytes: Optional[int] = None
+
+    @staticmethod
+    def make_key(*parts: object) -> str:
+        """キー要素からキャッシュキーを生成"""
+        digest = hashlib.blake2b(digest_size=16)
+        for part in parts:
+            digest.update(str(part).encode('utf-8'))
+            digest.update(b'\x1f')
+        return digest.hexdigest()
+
+    def _path_for(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[str]:
+        """キャッシュ済みの応答テキストを返す（無い/期限切れなら None）"""
+        path = self._path_for(key)
+        try:
+            with path.open('r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+
+        if time.time() - float(entry.get('created_at', 0)) > self.ttl_seconds:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return entry.get('response')
+
+    def set(self, key: str, response_text: str) -> None:
+        """応答テキストを保存（一時ファイル経由で置き換え）
+
+        書き込みに失敗してもキャッシュしないだけで、例外は送出しない。
+        """
+        path = self._path_for(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            if self.max_size_bytes is not None and self._size_bytes is None:
+                self._size_bytes = sum(size for _, size, _ in self._entries())
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tmp_path.open('w', encoding='utf-8') as f:
+                json.dump({'created_at': time.time(), 'response': response_text}, f, ensure_ascii=False)
+            new_size = tmp_path.stat().st_size
+            try:
+                old_size = path.stat().st_size
+            except FileNotFoundError:
+                old_size = 0
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self.logger.warning(f"Failed to write LLM response cache {path}: {e}")
+            try:
+                tmp_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+            return
+
+        if self._size_bytes is not None:
+            self._size_bytes += new_size - old_size
+            if self._size_bytes > self.max_size_bytes:
+                self._evict()
+
+    def _entries(self) -> List[Tuple[float, int, Path]]:
+        """キャッシュファイルごとの（更新日時, サイズ, パス）"""
+        entries: List[Tuple[float, int, Path]] = []
+        for path in self.cache_dir.glob('*/*.json'):
+            try:
+                stat = path.stat()
+            except OSError:
+                # 他プロセスが削除した直後など
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _evict(self) -> None:
+        """更新日時の古いファイルから削除し、合計サイズを上限の EVICTION_TARGET_RATIO 以下にする"""
+        # 同じディレクトリを他プロセスも使うことがあるため、加算値ではなく実ファイルから数え直す
+        entries = sorted(self._entries(), key=lambda entry: entry[0])
+        total = sum(size for _, size, _ in entries)
+        target = self.max_size_bytes * EVICTION_TARGET_RATIO
+        for _, size, path in entries:
+            if total <= target:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                self.logger.warning(f"Failed to evict LLM response cache {path}: {e}")
+                continue
+            total -= size
+        self._size_bytes = total
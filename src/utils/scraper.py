@@ -8,6 +8,26 @@ import asyncio
 from pathlib import Path
 
 
+# JavaScript Injection（ボット検出回避）
+# コンテキストに1回だけ登録し、以降に開くすべてのページへ適用する
+STEALTH_INIT_SCRIPT = """
+    // navigator.webdriverを削除
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined
+    });
+
+    // Chrome automation拡張を隠す
+    Object.defineProperty(navigator, 'plugins', {
+        get: () => [1, 2, 3, 4, 5]
+    });
+
+    // languagesを設定
+    Object.defineProperty(navigator, 'languages', {
+        get: () => ['ja-JP', 'ja', 'en-US', 'en']
+    });
+"""
+
+
 class Scraper:
     """Playwrightラッパー
 
@@ -53,6 +73,7 @@ class Scraper:
                 'Cache-Control': 'max-age=0'
             }
         )
+        await self.context.add_init_script(STEALTH_INIT_SCRIPT)
         self.logger.info("Browser initialized successfully")
 
     async def get_page(self, url: str, retries: int = 3) -> Page:
@@ -73,24 +94,6 @@ class Scraper:
 
         page = await self.context.new_page()
 
-        # JavaScript Injection（ボット検出回避）
-        await page.add_init_script("""
-            // navigator.webdriverを削除
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => undefined
-            });
-
-            // Chrome automation拡張を隠す
-            Object.defineProperty(navigator, 'plugins', {
-                get: () => [1, 2, 3, 4, 5]
-            });
-
-            // languagesを設定
-            Object.defineProperty(navigator, 'languages', {
-                get: () => ['ja-JP', 'ja', 'en-US', 'en']
-            });
-        """)
-
         for attempt in range(retries):
             try:
                 self.logger.debug(f"Loading page: {url} (attempt {attempt + 1}/{retries})")
@@ -9,6 +9,7 @@ import re
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Iterable
 
+import soupsieve
 from bs4 import BeautifulSoup
 from playwright.async_api import Page
 
@@ -34,6 +35,7 @@ DEFAULT_VISUAL_SELECTORS = [
     '.swiper',
     '.slick-slider',
 ]
+_DEFAULT_VISUAL_SELECTORS_UNIQUE = tuple(dict.fromkeys(DEFAULT_VISUAL_SELECTORS))
 VISUAL_SCREENSHOT_DIR = Path('output/visual')
 
 
@@ -187,6 +189,8 @@ NEWS_SELECTORS = [
     '.news-list',
     '.irNews',
 ]
+NEWS_ITEM_MATCHER = soupsieve.compile('li, article, div')
+NEWS_BADGE_MATCHER = soupsieve.compile('span, em, strong')
 DATE_PATTERN = re.compile(r'(20\\d{2}[./年]\\s?\\d{1,2}[./月]\\s?\\d{1,2}日?|\\d{4}-\\d{1,2}-\\d{1,2}|\\d{1,2}\\s?[A-Za-z]{3}\\s?20\\d{2})')
 
 
@@ -194,13 +198,19 @@ def _collect_news_entries(soup: BeautifulSoup) -> List[Dict[str, Any]]:
     entries: List[Dict[str, Any]] = []
     seen = set()
     containers: List[Any] = []
+    seen_ids = set()
     for selector in NEWS_SELECTORS:
-        containers.extend(soup.select(selector))
+        for container in soup.select(selector):
+            # 複数セレクタが同一要素にマッチしても走査は1回に抑える
+            if id(container) in seen_ids:
+                continue
+            seen_ids.add(id(container))
+            containers.append(container)
         if len(containers) >= 3:
             break
 
     for container in containers:
-        for item in container.select('li, article, div'):
+        for item in NEWS_ITEM_MATCHER.select(container):
             text = _clean_text(item.get_text())
             if not text or len(text) < 5:
                 continue
@@ -212,7 +222,7 @@ def _collect_news_entries(soup: BeautifulSoup) -> List[Dict[str, Any]]:
             if match:
                 date = match.group(0)
             labels = []
-            for badge in item.select('span, em, strong'):
+            for badge in NEWS_BADGE_MATCHER.select(item):
                 badge_text = _clean_text(badge.get_text())
                 if badge_text and len(badge_text) <= 12:
                     labels.append(badge_text)
@@ -424,8 +434,10 @@ async def capture_visual_context(
     screenshot_dir: Path = VISUAL_SCREENSHOT_DIR,
 ) -> Dict[str, Any]:
     """CSSプロパティ、カルーセル情報、要素スクリーンショットを取得"""
-    selector_list = selectors or DEFAULT_VISUAL_SELECTORS
-    selector_list = list(dict.fromkeys(selector_list))  # unique order保持
+    if selectors:
+        selector_list = list(dict.fromkeys(selectors))  # unique order保持
+    else:
+        selector_list = _DEFAULT_VISUAL_SELECTORS_UNIQUE
 
     computed_styles = await page.evaluate(
         """
@@ -5,17 +5,31 @@ LLMを使用したセマンティック判定を行う。
 from src.models import Site, ValidationItem, ValidationResult, LLMResponse
 from src.utils.structure_extractor import summarize_structure, extract_structure
 from src.utils.not_supported import get_not_supported_reason
+from src.utils.response_cache import ResponseCache
 from datetime import datetime
 from playwright.async_api import Page
-from bs4 import BeautifulSoup
-from typing import List, Dict, Tuple
+from bs4 import BeautifulSoup, Comment, SoupStrainer
+from typing import List, Dict, Optional, Tuple
+import asyncio
+import functools
 import re
 
-STRUCTURE_KEYWORDS = [
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # selectolax 未導入環境では BeautifulSoup で処理する
+    LexborHTMLParser = None
+
+try:
+    import tiktoken
+except ImportError:  # tiktoken 未導入環境では文字数で切り詰める
+    tiktoken = None
+
+# 英字キーワードは小文字で定義する（小文字化した項目テキストと照合するため）
+STRUCTURE_KEYWORDS = (
     'メニュー', 'ナビ', 'breadcrumb', 'パンくず', 'マウス', 'マウスオーバー',
     '色', 'カラー', 'フォント', 'レイアウト', 'ボタン', '図', 'グラフ',
     'チャート', '画像', '動画', 'pdf', 'ダウンロード'
-]
+)
 
 # カテゴリ / サブカテゴリ単位のテンプレート（docs/llm_prompt_templates.md と連動）
 CATEGORY_HINTS: Dict[Tuple[str, str], List[str]] = {
@@ -58,7 +72,248 @@ ITEM_HINTS: Dict[int, List[str]] = {
     116: ['決算説明会の質疑応答（Q&A）内容が資料やPDFで提供されているか確認し、案内が無ければ FAIL としてください。'],
 }
 
+# 項目テキストに含まれるキーワード → 追加ヒント
+KEYWORD_HINTS: Tuple[Tuple[Tuple[str, ...], str], ...] = (
+    (('グラフ', 'graph', 'chart', '推移'),
+     'グラフ/チャートの存在と内容を確認し、指標名（例: 売上高・経常利益・純利益）が記載されているか判断してください。'),
+    (('faq', 'よくある質問'),
+     'FAQ や Q&A 形式の見出しがあるか確認し、代表的な質問が掲載されている場合のみ PASS としてください。'),
+    (('ニュース', 'news', 'リリース'),
+     'IRニュースやプレスリリースの一覧が明確に区別されているかを確認し、一般ニュースだけの場合は FAIL としてください。'),
+    (('ガバナンス', 'governance'),
+     'コーポレートガバナンスに関する具体的な記述（取締役会構成、コーポレートガバナンス報告書等）がある場合のみ PASS としてください。'),
+    (('株価', 'stock'),
+     '株価情報に関連指標（時価総額、最低購入代金など）が併記されているかを確認してください。'),
+)
+
+STRUCTURE_TAG = 'structure'
+
+
+def _build_keyword_tags() -> Dict[str, frozenset]:
+    """キーワード → タグ（KEYWORD_HINTS の添字 or STRUCTURE_TAG）の対応表"""
+    tags: Dict[str, set] = {}
+    for index, (keywords, _) in enumerate(KEYWORD_HINTS):
+        for keyword in keywords:
+            tags.setdefault(keyword, set()).add(index)
+    for keyword in STRUCTURE_KEYWORDS:
+        tags.setdefault(keyword, set()).add(STRUCTURE_TAG)
+    return {keyword: frozenset(values) for keyword, values in tags.items()}
+
+
+KEYWORD_TAGS = _build_keyword_tags()
+# 全キーワードを1パターンにまとめ、1回の走査で一致したキーワードを列挙する
+# （先読みで各位置を調べるので重なり合う一致も拾える。長いキーワードを優先）
+KEYWORD_PATTERN = re.compile(
+    '(?=(' + '|'.join(re.escape(keyword) for keyword in sorted(KEYWORD_TAGS, key=len, reverse=True)) + '))'
+)
+
 MAX_HINTS = 5
+ITEM_TEXT_CACHE_SIZE = 512
+CLEANED_HTML_CACHE_SIZE = 64
+CONTEXT_CACHE_SIZE = 32
+BODY_STRAINER = SoupStrainer('body')
+REMOVED_TAGS = ['script', 'style', 'noscript', 'svg', 'iframe']
+REMOVED_TAG_SELECTOR = ','.join(REMOVED_TAGS)
+TOKEN_ENCODING_NAME = 'o200k_base'
+TRUNCATION_MARKER = '\n...(中間省略)...\n'
+
+# 全項目で同一のルーブリック。プロンプトキャッシュが効くよう、項目ごとに変わる内容は含めない
+SYSTEM_PROMPT = """あなたは企業IRサイト評価の専門家です。投資家向け情報（IR）ページの品質を評価します。
+ユーザーメッセージで示される評価項目・判定基準・ページ内容・追加要件に基づいて判定してください。
+
+## 判定ルール
+
+### PASS条件（found: true）
+- 本文テキストまたは構造情報（メニュー、リンク、見出し等）に、判定基準を満たす**明確な証拠**がある
+- 証拠は具体的な文言、セクション名、リンクテキスト、または構造要素として確認できる
+- 推測や解釈ではなく、**実際に記載されている内容**に基づいて判断する
+
+### FAIL条件（found: false）
+- 本文や構造情報に証拠が見つからない、または不十分
+- 判定基準の一部のみを満たす（全体要件を満たさない）
+- 関連情報はあるが、判定基準が求める具体性に欠ける
+
+### 信頼度スコア（confidence）の設定基準
+- **0.9-1.0**: 判定基準を満たす証拠が複数箇所に明確に記載されている
+- **0.7-0.9**: 証拠は1箇所だが明確、または複数箇所だが解釈の余地がある
+- **0.5-0.7**: 証拠が間接的、または部分的にのみ基準を満たす
+- **0.3-0.5**: 関連情報はあるが証拠として不十分（通常FAIL）
+- **0.0-0.3**: 証拠がほぼ存在しない（明確なFAIL）
+
+## 重要な注意事項
+1. **架空の情報は絶対に作らない**：本文や構造情報に記載されていない内容を推測で補完しない
+2. **構造情報の活用**：メニュー、ナビゲーション、見出し、リンク等の構造要素も重要な証拠として使用する
+3. **具体的な証拠の記載**：details には以下を120文字以内で記載
+   - PASS時：証拠となる具体的な文言やセクション名（例：「決算短信」「統合報告書」等のリンクあり）
+   - FAIL時：何が不足しているか（例：「IR資料リンクなし」「該当セクション未確認」）
+4. **厳密な判定**：曖昧な場合は証拠不足としてFAILにする
+
+## 出力形式
+JSON形式のみを返してください。他の文字列は一切含めないでください。
+
+{
+  "found": true/false,
+  "confidence": 0.0-1.0,
+  "details": "証拠または理由を120文字以内で記載"
+}"""
+
+# 項目ごとに変わるのは差し込み値のみ。固定文言は毎回組み立てない
+USER_PROMPT_TEMPLATE = """## 評価項目
+「{item_name}」
+
+## 判定基準
+{instruction}
+
+## 調査対象ページ
+{target_page}
+
+## ページ内容
+{context}
+
+## 追加要件
+{hints_text}
+
+判定を開始してください。"""
+
+BATCH_ITEM_TEMPLATE = """### item_id: {item_id}「{item_name}」
+- 判定基準: {instruction}
+- 調査対象ページ: {target_page}
+- 追加要件:
+{hints_text}"""
+
+BATCH_USER_PROMPT_TEMPLATE = """## ページ内容
+{context}
+
+## 評価項目（{item_count}件）
+以下の各項目を、同じページ内容に基づいてそれぞれ独立に判定してください。
+
+{items_text}
+
+## 出力形式（複数項目）
+各項目の判定を次の形式のJSONのみで返してください。他の文字列は一切含めないでください。
+
+{{
+  "results": [
+    {{"item_id": 項目ID, "found": true/false, "confidence": 0.0-1.0, "details": "証拠または理由を120文字以内で記載"}}
+  ]
+}}
+
+判定を開始してください。"""
+
+# JSONとして読めなかった応答を整形し直すための短いプロンプト（ページ内容は再送しない）
+JSON_REPAIR_PROMPT = """ユーザーメッセージは、評価結果をJSONで返すよう指示された応答です。
+内容を変えずに、次の形式のJSONのみを返してください。他の文字列は一切含めないでください。
+
+{
+  "found": true/false,
+  "confidence": 0.0-1.0,
+  "details": "証拠または理由を120文字以内で記載"
+}"""
+
+NO_TARGET_PAGE_TEXT = '（対象ページ指定なし）'
+NO_HINTS_TEXT = '特別な追加要件はありません。'
+
+
+@functools.lru_cache(maxsize=ITEM_TEXT_CACHE_SIZE)
+def _keyword_tags(text_lower: str) -> frozenset:
+    """小文字化した項目テキストに含まれるキーワードのタグ集合"""
+    matched = {match.group(1) for match in KEYWORD_PATTERN.finditer(text_lower)}
+    return frozenset().union(*(KEYWORD_TAGS[keyword] for keyword in matched))
+
+
+@functools.lru_cache(maxsize=ITEM_TEXT_CACHE_SIZE)
+def _prompt_hints(item_id: int, category: str, subcategory: str, text_lower: str) -> Tuple[str, ...]:
+    """項目に付与する追加ヒント（カテゴリ → 項目固有 → キーワードの順、重複除去・最大 MAX_HINTS 件）
+
+    検証項目は実行時にCSVから読み込むため、項目ごとの結果を初回呼び出し時にメモ化する。
+    """
+    keyword_tags = _keyword_tags(text_lower)
+    candidates = (
+        *CATEGORY_HINTS.get((category, subcategory), ()),
+        *CATEGORY_ONLY_HINTS.get(category, ()),
+        *ITEM_HINTS.get(item_id, ()),
+        *(hint for index, (_, hint) in enumerate(KEYWORD_HINTS) if index in keyword_tags),
+    )
+    return tuple(dict.fromkeys(filter(None, candidates)))[:MAX_HINTS]
+
+
+def _extract_text_selectolax(html: str) -> str:
+    """selectolax (lexbor) でテキストを抽出する。コメントはテキストに含まれない"""
+    tree = LexborHTMLParser(html)
+    for node in tree.css(REMOVED_TAG_SELECTOR):
+        node.decompose()
+    root = tree.body or tree.root
+    if root is None:
+        return ''
+    return root.text(separator='\n', strip=True)
+
+
+def _extract_text_bs4(html: str) -> str:
+    """BeautifulSoup でテキストを抽出する（selectolax 未導入時のフォールバック）"""
+    # <head>（script/style/link/meta が大半）はノードを構築せずに読み飛ばす
+    soup = BeautifulSoup(html, 'lxml', parse_only=BODY_STRAINER)
+    if not soup.contents:
+        # <body> を持たない文書（frameset 等）は全体をパースする
+        soup = BeautifulSoup(html, 'lxml')
+
+    # 不要タグ削除（SoupStrainer は入れ子の要素を除外できないため body 内はここで削除）
+    for tag in soup(REMOVED_TAGS):
+        tag.decompose()
+
+    # コメント削除
+    for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
+        comment.extract()
+
+    return soup.get_text(separator='\n', strip=True)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_token_encoding():
+    """トークナイザを取得する（未導入・語彙ファイル取得失敗時は None）"""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.get_encoding(TOKEN_ENCODING_NAME)
+    except Exception:
+        # 語彙ファイルはネットワーク経由で取得されるため、オフライン環境では失敗しうる
+        return None
+
+
+@functools.lru_cache(maxsize=CLEANED_HTML_CACHE_SIZE)
+def _truncate_to_tokens(text: str, max_tokens: int) -> Optional[str]:
+    """トークン数で切り詰める（前半70% + 後半30%）。トークナイザが無ければ None"""
+    encoding = _get_token_encoding()
+    if encoding is None:
+        return None
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    front_tokens = int(max_tokens * 0.7)
+    back_tokens = max_tokens - front_tokens
+    # マルチバイト文字の途中で切れた場合の置換文字は落とす
+    front = encoding.decode(tokens[:front_tokens]).rstrip('\ufffd')
+    back = encoding.decode(tokens[-back_tokens:]).lstrip('\ufffd')
+    return front + TRUNCATION_MARKER + back
+
+
+@functools.lru_cache(maxsize=CLEANED_HTML_CACHE_SIZE)
+def _clean_html_text(html: str) -> str:
+    """HTMLから本文テキストを抽出する（切り詰め前）
+
+    1サイトの全項目が同じHTML文字列を渡すため、結果をメモ化してパースを1回に抑える。
+    """
+    if LexborHTMLParser is not None:
+        text = _extract_text_selectolax(html)
+    else:
+        text = _extract_text_bs4(html)
+
+    # タブ/CRを正規化し、連続する空白を1つに畳む（正規表現より str.replace の方が速い）
+    text = text.replace('\t', ' ').replace('\r', '')
+    while '  ' in text:
+        text = text.replace('  ', ' ')
+
+    # 空行・重複行の除去（完全一致のみ、出現順を維持）。連続改行もここで畳まれる
+    return '\n'.join(dict.fromkeys(filter(None, text.split('\n'))))
 
 
 class LLMValidator:
@@ -67,16 +322,24 @@ class LLMValidator:
     23項目のLLMベース検証を実行する。
     """
 
-    def __init__(self, llm_client, logger):
+    def __init__(self, llm_client, logger, response_cache: Optional[ResponseCache] = None):
         """初期化
 
         Args:
             llm_client: LLMClientインスタンス
             logger: ロガーインスタンス
+            response_cache: LLM応答キャッシュ（None ならキャッシュしない）
         """
         self.llm_client = llm_client
         self.logger = logger
-        self.max_context_chars = 30000
+        self.response_cache = response_cache
+        self.max_context_chars = 30000  # トークナイザが使えない場合の上限
+        self.max_context_tokens = 20000
+        self.max_batch_items = 8  # 1回の呼び出しでまとめる項目数（出力トークン上限を考慮）
+        self.json_repair_attempts = 0
+        self.json_repair_successes = 0
+        # 同じページ群を参照する項目間で組み立て済みコンテキストを共有する
+        self._context_cache: Dict[tuple, Tuple[str, list]] = {}
 
     async def validate(self, site: Site, page: Page, item: ValidationItem, checked_url: str) -> ValidationResult:
         """LLM検証を実行する
@@ -93,20 +356,7 @@ class LLMValidator:
         try:
             reason = get_not_supported_reason(item)
             if reason:
-                return ValidationResult(
-                    site_id=site.site_id,
-                    company_name=site.company_name,
-                    url=site.url,
-                    item_id=item.item_id,
-                    item_name=item.item_name,
-                    category=item.category,
-                    subcategory=item.subcategory,
-                    result='NOT_SUPPORTED',
-                    confidence=0.0,
-                    details=reason,
-                    checked_at=datetime.now(),
-                    checked_url=checked_url,
-                )
+                return self._create_not_supported_result(site, item, reason, checked_url)
 
             html_content = await page.content()
             structure = extract_structure(html_content)
@@ -121,50 +371,32 @@ class LLMValidator:
             self.logger.error(f"LLM validation error for item {item.item_id}: {e}")
             return self._create_error_result(site, item, str(e), checked_url)
 
-    def preprocess_html(self, html: str, max_chars: int = 30000) -> str:
+    def preprocess_html(self, html: str, max_chars: int = 30000, max_tokens: Optional[int] = None) -> str:
         """HTML前処理（トークン削減）
 
         Args:
             html: 元のHTML
-            max_chars: 最大文字数
+            max_chars: 最大文字数（トークン数で切り詰められない場合に使用）
+            max_tokens: 最大トークン数（tiktoken が利用できる場合のみ有効）
 
         Returns:
             クリーニングされたテキスト
         """
         try:
-            soup = BeautifulSoup(html, 'lxml')
-
-            # 不要タグ削除
-            for tag in soup(['script', 'style', 'noscript', 'svg', 'iframe']):
-                tag.decompose()
-
-            # コメント削除
-            from bs4 import Comment
-            for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
-                comment.extract()
-
-            # テキスト抽出
-            text = soup.get_text(separator='\n', strip=True)
-
-            # 連続する空白を削除
-            text = re.sub(r'\n+', '\n', text)
-            text = re.sub(r' +', ' ', text)
-
-            # 重複行の除去（完全一致のみ）
-            lines = text.split('\n')
-            seen_lines = set()
-            unique_lines = []
-            for line in lines:
-                if line and line not in seen_lines:
-                    unique_lines.append(line)
-                    seen_lines.add(line)
-            text = '\n'.join(unique_lines)
+            # 同じページを参照する項目間でパース結果を共有する
+            text = _clean_html_text(html)
+
+            # トークン数制限（日本語は1文字あたりのトークン数が多いため文字数より正確）
+            if max_tokens:
+                truncated = _truncate_to_tokens(text, max_tokens)
+                if truncated is not None:
+                    return truncated
 
             # 文字数制限（スマート切り詰め: 前半70% + 後半30%）
             if len(text) > max_chars:
                 front_chars = int(max_chars * 0.7)
                 back_chars = max_chars - front_chars
-                text = text[:front_chars] + '\n...(中間省略)...\n' + text[-back_chars:]
+                text = text[:front_chars] + TRUNCATION_MARKER + text[-back_chars:]
 
             return text
 
@@ -172,108 +404,32 @@ class LLMValidator:
             self.logger.warning(f"HTML preprocessing failed: {e}")
             return html[:max_chars]
 
-    def build_prompt(self, item: ValidationItem) -> str:
-        """プロンプト構築"""
-        target_page = item.target_page or '（対象ページ指定なし）'
-        hints = self._build_prompt_hints(item)
-        hints_text = '\n'.join(f"- {hint}" for hint in hints) if hints else "- 特別な追加要件はありません。"
-
-        return f"""あなたは企業IRサイト評価の専門家です。投資家向け情報（IR）ページの品質を評価します。
-
-## 評価項目
-「{item.item_name}」
-
-## 判定基準
-{item.instruction}
-
-## 調査対象ページ
-{target_page}
+    def build_system_prompt(self) -> str:
+        """全項目共通の静的プロンプト（プロバイダ側のプレフィックスキャッシュ対象）"""
+        return SYSTEM_PROMPT
 
-## 追加要件
-{hints_text}
-
-## 判定ルール
-
-### PASS条件（found: true）
-- 本文テキストまたは構造情報（メニュー、リンク、見出し等）に、判定基準を満たす**明確な証拠**がある
-- 証拠は具体的な文言、セクション名、リンクテキスト、または構造要素として確認できる
-- 推測や解釈ではなく、**実際に記載されている内容**に基づいて判断する
-
-### FAIL条件（found: false）
-- 本文や構造情報に証拠が見つからない、または不十分
-- 判定基準の一部のみを満たす（全体要件を満たさない）
-- 関連情報はあるが、判定基準が求める具体性に欠ける
-
-### 信頼度スコア（confidence）の設定基準
-- **0.9-1.0**: 判定基準を満たす証拠が複数箇所に明確に記載されている
-- **0.7-0.9**: 証拠は1箇所だが明確、または複数箇所だが解釈の余地がある
-- **0.5-0.7**: 証拠が間接的、または部分的にのみ基準を満たす
-- **0.3-0.5**: 関連情報はあるが証拠として不十分（通常FAIL）
-- **0.0-0.3**: 証拠がほぼ存在しない（明確なFAIL）
-
-## 重要な注意事項
-1. **架空の情報は絶対に作らない**：本文や構造情報に記載されていない内容を推測で補完しない
-2. **構造情報の活用**：メニュー、ナビゲーション、見出し、リンク等の構造要素も重要な証拠として使用する
-3. **具体的な証拠の記載**：details には以下を120文字以内で記載
-   - PASS時：証拠となる具体的な文言やセクション名（例：「決算短信」「統合報告書」等のリンクあり）
-   - FAIL時：何が不足しているか（例：「IR資料リンクなし」「該当セクション未確認」）
-4. **厳密な判定**：曖昧な場合は証拠不足としてFAILにする
-
-## 出力形式
-JSON形式のみを返してください。他の文字列は一切含めないでください。
-
-{{
-  "found": true/false,
-  "confidence": 0.0-1.0,
-  "details": "証拠または理由を120文字以内で記載"
-}}
+    def build_user_prompt(self, item: ValidationItem, context: str) -> str:
+        """項目固有の指示とページ内容からユーザープロンプトを構築"""
+        hints = self._build_prompt_hints(item)
+        hints_text = '\n'.join(f"- {hint}" for hint in hints) if hints else f"- {NO_HINTS_TEXT}"
 
-判定を開始してください。"""
+        return USER_PROMPT_TEMPLATE.format(
+            item_name=item.item_name,
+            instruction=item.instruction,
+            target_page=item.target_page or NO_TARGET_PAGE_TEXT,
+            context=context,
+            hints_text=hints_text,
+        )
 
     def _build_prompt_hints(self, item: ValidationItem) -> List[str]:
-        text_lower = f"{item.item_name} {item.instruction}".lower()
-        hints: List[str] = []
-        seen = set()
-
-        def add_hint(value: str):
-            if not value:
-                return
-            if value in seen or len(hints) >= MAX_HINTS:
-                return
-            hints.append(value)
-            seen.add(value)
-
-        category_key = (item.category or '', item.subcategory or '')
-        for hint in CATEGORY_HINTS.get(category_key, []):
-            add_hint(hint)
-
-        for hint in CATEGORY_ONLY_HINTS.get(item.category or '', []):
-            add_hint(hint)
-
-        for hint in ITEM_HINTS.get(item.item_id, []):
-            add_hint(hint)
-
-        keyword_hints = [
-            (['グラフ', 'graph', 'chart', '推移'],
-             'グラフ/チャートの存在と内容を確認し、指標名（例: 売上高・経常利益・純利益）が記載されているか判断してください。'),
-            (['faq', 'よくある質問'],
-             'FAQ や Q&A 形式の見出しがあるか確認し、代表的な質問が掲載されている場合のみ PASS としてください。'),
-            (['ニュース', 'news', 'リリース'],
-             'IRニュースやプレスリリースの一覧が明確に区別されているかを確認し、一般ニュースだけの場合は FAIL としてください。'),
-            (['ガバナンス', 'governance'],
-             'コーポレートガバナンスに関する具体的な記述（取締役会構成、コーポレートガバナンス報告書等）がある場合のみ PASS としてください。'),
-            (['株価', 'stock'],
-             '株価情報に関連指標（時価総額、最低購入代金など）が併記されているかを確認してください。'),
-        ]
-
-        for keywords, hint in keyword_hints:
-            if any(keyword in text_lower for keyword in keywords):
-                add_hint(hint)
-
-        return hints
+        return list(_prompt_hints(item.item_id, item.category or '', item.subcategory or '', item.text_lower))
 
     async def validate_with_html(self, site: Site, html_content: str, item: ValidationItem, checked_url: str) -> ValidationResult:
         """HTML文字列を直接受け取って検証を実行する（後方互換用）"""
+        reason = get_not_supported_reason(item)
+        if reason:
+            return self._create_not_supported_result(site, item, reason, checked_url)
+
         payload = {
             'url': checked_url,
             'html': html_content,
@@ -281,48 +437,209 @@ JSON形式のみを返してください。他の文字列は一切含めない
         }
         return await self.validate_with_pages(site, item, [payload])
 
-    async def validate_with_pages(self, site: Site, item: ValidationItem, payloads: list[dict]) -> ValidationResult:
-        try:
-            context = self._build_context_from_payloads(item, payloads)
-            prompt = self.build_prompt(item)
-
-            self.logger.debug(f"Calling LLM for item {item.item_id}: {item.item_name} (pages={len(payloads)})")
-            llm_response_text = self.llm_client.call(prompt, context)
+    async def validate_with_pages(self, site: Site, item: ValidationItem, payloads: list[dict], use_cache: bool = True) -> ValidationResult:
+        reason = get_not_supported_reason(item)
+        if reason:
+            checked_url = payloads[0].get('url') if payloads else None
+            return self._create_not_supported_result(site, item, reason, checked_url)
 
-            llm_response = LLMResponse.from_json(llm_response_text)
-            checked_urls = ','.join(payload.get('url', '') for payload in payloads[:3])
+        try:
+            context = await self._get_context(payloads, self._needs_structure(item))
+            system_prompt = self.build_system_prompt()
+            user_prompt = self.build_user_prompt(item, context)
+
+            cache_key, llm_response_text = self._lookup_cache(use_cache, item.item_id, system_prompt, user_prompt)
+
+            if llm_response_text is not None:
+                self.logger.debug(f"LLM cache hit for item {item.item_id}: {item.item_name}")
+                llm_response = LLMResponse.from_json(llm_response_text)
+            else:
+                self.logger.debug(f"Calling LLM for item {item.item_id}: {item.item_name} (pages={len(payloads)})")
+                llm_response_text = await self.llm_client.acall(system_prompt, user_prompt)
+                llm_response = LLMResponse.from_json(llm_response_text)
+                if llm_response.parse_error is not None:
+                    llm_response = await self._repair_json_response(item, llm_response)
+                # パースできなかった応答は保存しない（次回実行で再取得させる）
+                if cache_key and llm_response.parse_error is None:
+                    self.response_cache.set(cache_key, llm_response.raw_response)
+
+            if llm_response.parse_error is not None:
+                return self._create_error_result(
+                    site,
+                    item,
+                    f"Failed to parse LLM response: {llm_response.parse_error}",
+                    payloads[0].get('url') if payloads else None
+                )
 
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if llm_response.found else 'FAIL',
-                confidence=llm_response.confidence,
-                details=llm_response.details,
-                checked_at=datetime.now(),
-                checked_url=checked_urls
-            )
+            return self._create_result(site, item, llm_response, self._checked_urls(payloads))
 
         except Exception as e:
             self.logger.error(f"LLM validation error for item {item.item_id}: {e}")
             checked_url = payloads[0].get('url') if payloads else None
             return self._create_error_result(site, item, str(e), checked_url)
 
+    async def validate_batch(self, site: Site, items: List[ValidationItem], payloads: list[dict], use_cache: bool = True) -> List[ValidationResult]:
+        """同じページ群を参照する複数項目を1回のLLM呼び出しでまとめて検証する
+
+        ページ内容は1回だけ送信し、項目ごとの判定を配列で受け取る。
+        応答をパースできない場合や欠落した項目は validate_with_pages で個別に検証する。
+
+        Args:
+            site: サイト情報
+            items: 検証項目のリスト（全項目が payloads を共有すること）
+            payloads: ページ情報のリスト
+            use_cache: 応答キャッシュを使うかどうか
+
+        Returns:
+            items と同じ順序の ValidationResult のリスト
+        """
+        # NOT_SUPPORTED の項目はプロンプトに含めない（validate_with_pages が即座に結果を返す）
+        supported_items = [item for item in items if not get_not_supported_reason(item)]
+        if len(supported_items) < len(items):
+            batch_results = iter(await self.validate_batch(site, supported_items, payloads, use_cache))
+            return [
+                next(batch_results) if item in supported_items else await self.validate_with_pages(site, item, payloads, use_cache)
+                for item in items
+            ]
+
+        if len(items) <= 1:
+            return [await self.validate_with_pages(site, item, payloads, use_cache) for item in items]
+
+        item_ids = [item.item_id for item in items]
+        responses: Dict[int, LLMResponse] = {}
+        try:
+            include_structure = any(self._needs_structure(item) for item in items)
+            context = await self._get_context(payloads, include_structure)
+            system_prompt = self.build_system_prompt()
+            user_prompt = self.build_batch_user_prompt(items, context)
+
+            cache_key, llm_response_text = self._lookup_cache(use_cache, *item_ids, system_prompt, user_prompt)
+            if llm_response_text is not None:
+                self.logger.debug(f"LLM cache hit for batch {item_ids}")
+                responses = LLMResponse.from_batch_json(llm_response_text)
+            else:
+                self.logger.debug(f"Calling LLM for batch {item_ids} (pages={len(payloads)})")
+                llm_response_text = await self.llm_client.acall(system_prompt, user_prompt)
+                responses = LLMResponse.from_batch_json(llm_response_text)
+                if cache_key:
+                    self.response_cache.set(cache_key, llm_response_text)
+        except Exception as e:
+            self.logger.warning(f"Batch LLM validation failed for items {item_ids}, falling back to single-item calls: {e}")
+
+        checked_urls = self._checked_urls(payloads)
+        results = []
+        for item in items:
+            llm_response = responses.get(item.item_id)
+            result = None
+            if llm_response is not None:
+                try:
+                    result = self._create_result(site, item, llm_response, checked_urls)
+                except ValueError as e:
+                    self.logger.warning(f"Invalid batch result for item {item.item_id}: {e}")
+            if result is None:
+                result = await self.validate_with_pages(site, item, payloads, use_cache)
+            results.append(result)
+        return results
+
+    async def _repair_json_response(self, item: ValidationItem, llm_response: LLMResponse) -> LLMResponse:
+        """JSONとして読めなかった応答を、応答本文だけを渡してJSONに整形し直させる（1回のみ）"""
+        self.json_repair_attempts += 1
+        self.logger.info(f"Retrying JSON extraction for item {item.item_id}: {llm_response.parse_error}")
+        repaired = LLMResponse.from_json(await self.llm_client.acall(JSON_REPAIR_PROMPT, llm_response.raw_response))
+        if repaired.parse_error is None:
+            self.json_repair_successes += 1
+        return repaired
+
+    def build_batch_user_prompt(self, items: List[ValidationItem], context: str) -> str:
+        """複数項目をまとめて判定するためのユーザープロンプトを構築"""
+        blocks = []
+        for item in items:
+            hints = self._build_prompt_hints(item)
+            hints_text = '\n'.join(f"  - {hint}" for hint in hints) if hints else f"  - {NO_HINTS_TEXT}"
+            blocks.append(BATCH_ITEM_TEMPLATE.format(
+                item_id=item.item_id,
+                item_name=item.item_name,
+                instruction=item.instruction,
+                target_page=item.target_page or NO_TARGET_PAGE_TEXT,
+                hints_text=hints_text,
+            ))
+
+        return BATCH_USER_PROMPT_TEMPLATE.format(
+            context=context,
+            item_count=len(items),
+            items_text='\n\n'.join(blocks),
+        )
+
+    def _lookup_cache(self, use_cache: bool, *key_parts) -> Tuple[Optional[str], Optional[str]]:
+        """応答キャッシュを引く
+
+        Returns:
+            (キャッシュキー, キャッシュ済み応答)。キャッシュ無効時はどちらも None
+        """
+        if not use_cache or self.response_cache is None:
+            return None, None
+        cache_key = ResponseCache.make_key(*key_parts)
+        return cache_key, self.response_cache.get(cache_key)
+
+    @staticmethod
+    def _checked_urls(payloads: list[dict]) -> str:
+        return ','.join(payload.get('url', '') for payload in payloads[:3])
+
+    async def _get_context(self, payloads: list[dict], include_structure: bool) -> str:
+        """コンテキストを組み立てる（同じページ内容・同じ条件なら前回の結果を再利用）"""
+        # payload の dict は項目ごとに作り直されるため、中身（URL・HTML・構造情報）で照合する
+        key = (
+            include_structure,
+            self.max_context_chars,
+            self.max_context_tokens,
+            tuple((payload.get('url'), payload.get('html') or '', id(payload.get('structure'))) for payload in payloads),
+        )
+        cached = self._context_cache.get(key)
+        if cached is not None:
+            return cached[0]
+
+        context = await self._abuild_context(payloads, include_structure)
+        if len(self._context_cache) >= CONTEXT_CACHE_SIZE:
+            self._context_cache.pop(next(iter(self._context_cache)))
+        # 構造情報は id で照合するため、エントリが残っている間は参照を保持して id の再利用を防ぐ
+        self._context_cache[key] = (context, [payload.get('structure') for payload in payloads])
+        return context
+
     def _build_context_from_payloads(self, item: ValidationItem, payloads: list[dict]) -> str:
+        return self._build_context(payloads, self._needs_structure(item))
+
+    def _build_context(self, payloads: list[dict], include_structure: bool) -> str:
+        if not payloads:
+            return ""
+
+        per_page_limit, per_page_tokens = self._per_page_limits(payloads)
+        cleaned_texts = [
+            self.preprocess_html(payload.get('html') or '', per_page_limit, per_page_tokens)
+            for payload in payloads
+        ]
+        return self._assemble_context(payloads, cleaned_texts, include_structure)
+
+    async def _abuild_context(self, payloads: list[dict], include_structure: bool) -> str:
+        """_build_context の非同期版。ページごとの前処理をスレッドで並列に実行する"""
         if not payloads:
             return ""
 
+        per_page_limit, per_page_tokens = self._per_page_limits(payloads)
+        # HTMLパース（lxml / lexbor）はC実装部分でGILを解放するため、複数ページを並列化できる
+        cleaned_texts = await asyncio.gather(*(
+            asyncio.to_thread(self.preprocess_html, payload.get('html') or '', per_page_limit, per_page_tokens)
+            for payload in payloads
+        ))
+        return self._assemble_context(payloads, cleaned_texts, include_structure)
+
+    def _per_page_limits(self, payloads: list[dict]) -> Tuple[int, int]:
         per_page_limit = max(3000, self.max_context_chars // len(payloads))
-        include_structure = self._needs_structure(item)
-        sections = []
+        per_page_tokens = max(2000, self.max_context_tokens // len(payloads))
+        return per_page_limit, per_page_tokens
 
-        for payload in payloads:
-            html_text = payload.get('html') or ''
-            cleaned_html = self.preprocess_html(html_text, max_chars=per_page_limit)
+    def _assemble_context(self, payloads: list[dict], cleaned_texts: List[str], include_structure: bool) -> str:
+        sections = []
+        for payload, cleaned_html in zip(payloads, cleaned_texts):
             block_parts = [f"### Page URL: {payload.get('url', 'N/A')}"]
             block_parts.append(cleaned_html if cleaned_html else "(テキストを抽出できませんでした)")
 
@@ -336,12 +653,41 @@ JSON形式のみを返してください。他の文字列は一切含めない
         return '\n\n'.join(sections)
 
     def _needs_structure(self, item: ValidationItem) -> bool:
-        text = f"{item.item_name} {item.instruction}" if item.instruction else item.item_name
-        lower = text.lower()
-        for keyword in STRUCTURE_KEYWORDS:
-            if keyword in text or keyword in lower:
-                return True
-        return False
+        return STRUCTURE_TAG in _keyword_tags(item.text_lower)
+
+    def _create_result(self, site: Site, item: ValidationItem, llm_response: LLMResponse, checked_url: str) -> ValidationResult:
+        """LLM応答から検証結果を作成"""
+        return ValidationResult(
+            site_id=site.site_id,
+            company_name=site.company_name,
+            url=site.url,
+            item_id=item.item_id,
+            item_name=item.item_name,
+            category=item.category,
+            subcategory=item.subcategory,
+            result='PASS' if llm_response.found else 'FAIL',
+            confidence=llm_response.confidence,
+            details=llm_response.details,
+            checked_at=datetime.now(),
+            checked_url=checked_url
+        )
+
+    def _create_not_supported_result(self, site: Site, item: ValidationItem, reason: str, checked_url: str = None) -> ValidationResult:
+        """NOT_SUPPORTED 結果を作成（HTML処理・LLM呼び出しは行わない）"""
+        return ValidationResult(
+            site_id=site.site_id,
+            company_name=site.company_name,
+            url=site.url,
+            item_id=item.item_id,
+            item_name=item.item_name,
+            category=item.category,
+            subcategory=item.subcategory,
+            result='NOT_SUPPORTED',
+            confidence=0.0,
+            details=reason,
+            checked_at=datetime.now(),
+            checked_url=checked_url,
+        )
 
     def _create_error_result(self, site: Site, item: ValidationItem, error_msg: str, checked_url: str = None) -> ValidationResult:
         """エラー結果を作成"""
@@ -2,11 +2,16 @@
 
 DOM構造・CSS・属性による機械的検証を行う。
 """
+import asyncio
+import contextvars
+import functools
 import re
+import unicodedata
+import weakref
 from datetime import datetime
 from pathlib import Path
 from urllib.parse import urljoin, urlparse
-from typing import Optional, List
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from playwright.async_api import Page
 from sslyze import (
@@ -20,6 +25,12 @@ from sslyze.errors import ConnectionToServerFailed
 from src.models import Site, ValidationItem, ValidationResult
 from src.utils.visual_checks import VisualAnalyzer
 
+# validate_batch の開始時刻（バッチ内の結果の checked_at を揃える）
+# 複数サイトが同じ ScriptValidator を並行して使うため、インスタンスではなくタスクごとのコンテキストに持つ
+_BATCH_STARTED_AT: contextvars.ContextVar[Optional[datetime]] = contextvars.ContextVar(
+    'script_validator_batch_started_at', default=None
+)
+
 HERO_SELECTORS = [
     '.hero',
     '.hero-area',
@@ -40,6 +51,671 @@ DATE_PATTERNS = [
     re.compile(r'20\d{2}\s*(?:年)?\s*[QＱ][1-4]'),
 ]
 CSS_LENGTH_PX = re.compile(r'^([0-9.]+)px$')
+# line-height の値を1回のマッチで数値と単位に分け、単位ごとの換算で行間比率にする
+CSS_LINE_HEIGHT = re.compile(r'^\s*(?:(?P<normal>normal)|(?P<number>[0-9.]+)(?P<unit>px|em|%)?)\s*$', re.IGNORECASE)
+LINE_HEIGHT_TO_RATIO = {
+    'px': lambda value, font_px: value / font_px,
+    'em': lambda value, font_px: value,
+    '%': lambda value, font_px: value / 100,
+}
+SCREENSHOT_LABEL_UNSAFE = re.compile(r'[^a-zA-Z0-9_-]+')
+JA_PATH_PREFIX = re.compile(r'^/(?:ja|jp|ja-jp|jp-jp|japanese)(/|$)', re.IGNORECASE)
+EN_PATH_PREFIX = re.compile(r'^/(?:en|en-us|en-gb|english)(/|$)', re.IGNORECASE)
+# Playwright 独自の `selector:has-text("...")` を CSS 部分とテキストに分解する
+HAS_TEXT_SELECTOR = re.compile(r'^(?P<selector>[^:]+):has-text\("(?P<text>[^"]+)"\)$')
+
+# いずれかのセレクタに一致する要素があるかをブラウザ内で1回で判定する
+# （:has-text 相当は大文字小文字を区別しない部分一致で判定）
+# 不正なセレクタは例外を握りつぶしてそのセレクタだけ不一致とし、
+# locator と同様に open な shadow root の中も探す（document で見つからない場合のみ走査する）
+ANY_SELECTOR_MATCHES_SCRIPT = '''
+({selectors, textProbes}) => {
+    /* any selector matches */
+    const queryAll = (root, selector) => {
+        try {
+            return Array.from(root.querySelectorAll(selector));
+        } catch (error) {
+            return [];
+        }
+    };
+    const matchesIn = root => {
+        for (const selector of selectors) {
+            try {
+                if (root.querySelector(selector)) {
+                    return true;
+                }
+            } catch (error) {
+                // 不正なセレクタは他のセレクタの判定を妨げない
+            }
+        }
+        return textProbes.some(([selector, text]) => {
+            const needle = text.toLowerCase();
+            return queryAll(root, selector)
+                .some(el => (el.textContent || '').toLowerCase().includes(needle));
+        });
+    };
+    if (matchesIn(document)) {
+        return true;
+    }
+    const pending = [document];
+    while (pending.length) {
+        for (const el of pending.pop().querySelectorAll('*')) {
+            if (el.shadowRoot) {
+                if (matchesIn(el.shadowRoot)) {
+                    return true;
+                }
+                pending.push(el.shadowRoot);
+            }
+        }
+    }
+    return false;
+}
+'''
+
+
+# `base:has-text("...") rest` 形式のセレクタを [base, text, rest] に分解する（text/rest は空文字可）
+HAS_TEXT_STEP = re.compile(r'^(?P<selector>[^:]+):has-text\("(?P<text>[^"]+)"\)\s*(?P<rest>.*)$')
+
+# セレクタごとの最初の一致要素を1回の evaluate でまとめて調べる
+# （locator.count() / first / bounding_box() をセレクタごとに往復させないため）
+FIRST_MATCHES_SCRIPT = '''
+(steps) => {
+    /* first matches */
+    const firstMatch = ([base, text, rest]) => {
+        let scopes = Array.from(document.querySelectorAll(base));
+        if (text) {
+            const needle = text.toLowerCase();
+            scopes = scopes.filter(el => (el.textContent || '').toLowerCase().includes(needle));
+        }
+        if (!rest) {
+            return scopes[0] || null;
+        }
+        for (const scope of scopes) {
+            const found = scope.querySelector(rest);
+            if (found) {
+                return found;
+            }
+        }
+        return null;
+    };
+    return steps.map(step => {
+        const el = firstMatch(step);
+        if (!el) {
+            return null;
+        }
+        const rect = el.getBoundingClientRect();
+        return {width: rect.width, height: rect.height};
+    });
+}
+'''
+
+
+@functools.lru_cache(maxsize=8)
+def _nfkc(text: str) -> str:
+    """NFKC 正規化（同じ本文を検証ごとに正規化し直さないようキャッシュする）"""
+    return unicodedata.normalize('NFKC', text)
+
+
+def _metric_hits(text: str) -> int:
+    """本文に現れる FINANCIAL_METRICS の種類数"""
+    return len(set(FINANCIAL_METRIC_PATTERN.findall(text)))
+
+
+@functools.lru_cache(maxsize=128)
+def _selector_probe(selectors: Tuple[str, ...]) -> dict:
+    """セレクタ一覧を ANY_SELECTOR_MATCHES_SCRIPT の引数（CSS セレクタとテキスト条件）に変換する"""
+    css: List[str] = []
+    text_probes: List[List[str]] = []
+    for selector in selectors:
+        match = HAS_TEXT_SELECTOR.match(selector)
+        if match:
+            text_probes.append([match.group('selector'), match.group('text')])
+        else:
+            css.append(selector)
+    return {'selectors': css, 'textProbes': text_probes}
+
+
+@functools.lru_cache(maxsize=128)
+def _selector_steps(selectors: Tuple[str, ...]) -> List[List[str]]:
+    """セレクタ一覧を FIRST_MATCHES_SCRIPT の steps 引数に変換する"""
+    steps: List[List[str]] = []
+    for selector in selectors:
+        match = HAS_TEXT_STEP.match(selector)
+        if match:
+            steps.append([match.group('selector'), match.group('text'), match.group('rest')])
+        else:
+            steps.append([selector, '', ''])
+    return steps
+
+
+BREADCRUMB_SELECTORS = (
+    'nav[aria-label="breadcrumb"]',
+    '.breadcrumb',
+    'ol.breadcrumb',
+    'ul.breadcrumb',
+)
+BACK_TO_TOP_SELECTORS = (
+    'a[href="#top"]',
+    'a[href="#"]',
+    'button:has-text("TOP")',
+    'button:has-text("トップ")',
+    'a:has-text("ページトップ")',
+    '.pagetop',
+    '#pagetop',
+    '.page-top',
+)
+SITEMAP_SELECTORS = (
+    'a[href*="sitemap"]',
+    'a:has-text("サイトマップ")',
+    'a:has-text("Sitemap")',
+)
+CAROUSEL_SELECTORS = ('.carousel', '.slider', '.slick-slider', '[data-carousel]')
+CAROUSEL_PAUSE_SELECTORS = (
+    'button:has-text("停止")',
+    'button:has-text("一時停止")',
+    'button:has-text("pause")',
+    '.pause',
+    '.stop',
+)
+SHARE_BUTTON_SELECTORS = (
+    'a[href*="facebook.com/sharer"]',
+    'a[href*="twitter.com/intent"]',
+    'a[href*="x.com/intent"]',
+    'a[href*="linkedin.com/share"]',
+    'a[href*="line.me/R/msg"]',
+    'button[class*="share"]',
+    '[data-share]',
+)
+MAIL_SUBSCRIPTION_SELECTORS = (
+    'a:has-text("メール")',
+    'a:has-text("配信")',
+    'button:has-text("メール")',
+    'button:has-text("配信")',
+)
+NEWS_SEARCH_SELECTORS = (
+    'section:has-text("ニュース") input[type="search"]',
+    'section:has-text("ニュースリリース") input[type="text"]',
+    'div:has-text("NEWS RELEASE") input[type="search"]',
+    'form[action*="news"] input[type="text"]',
+    'form[action*="release"] input[type="text"]',
+)
+
+# ヘッダー・ナビのサイト内検索導線（item 44）
+GLOBAL_SEARCH_SELECTORS = (
+    'header input[type="search"]',
+    'header form input[name*="search" i]',
+    'header input[placeholder*="検索"]',
+    'header input[placeholder*="Search" i]',
+    'header button:has-text("検索")',
+    'header button:has-text("Search")',
+    'nav input[type="search"]',
+    'nav button[aria-label*="検索"]',
+    'nav button[aria-label*="search" i]',
+)
+
+# 一致した要素の placeholder / aria-label / 表示テキストを1回の evaluate でまとめて返す
+# （要素ごとの get_attribute / inner_text 往復をまとめる）
+SEARCH_LABELS_SCRIPT = '''
+(steps) => {
+    /* search labels */
+    return steps.flatMap(([base, text]) => {
+        let elements = Array.from(document.querySelectorAll(base));
+        if (text) {
+            const needle = text.toLowerCase();
+            elements = elements.filter(el => (el.textContent || '').toLowerCase().includes(needle));
+        }
+        return elements.map(el => [
+            el.getAttribute('placeholder') || '',
+            el.getAttribute('aria-label') || '',
+            el.innerText || '',
+        ].join(' '));
+    });
+}
+'''
+
+# 本文テキストに対するキーワード判定は、キーワードごとの `in` ではなく1つの正規表現で1回だけ走査する
+RECOMMENDED_ENV_PATTERN = re.compile('|'.join(map(re.escape, ['推奨環境', '推奨ブラウザ', '推奨OS', '推奨動作環境'])))
+NEWS_CONTEXT_PATTERN = re.compile('|'.join(map(re.escape, ['ニュース', 'news', 'リリース', 'プレス'])))
+MAIL_SUBSCRIPTION_PATTERN = re.compile('|'.join(map(re.escape, ['メール配信', 'メールマガジン', '配信登録', 'IRメール'])))
+# 'Chrome' / 'chrome' のような表記ゆれも1回の走査で判定する
+CHROME_MENTION_PATTERN = re.compile('[Cc]hrome')
+EDGE_MENTION_PATTERN = re.compile('[Ee]dge')
+COOKIE_MENTION_PATTERN = re.compile('[Cc]ookie|クッキー')
+YEAR_PATTERN = re.compile(r'20\d{2}')
+CAPITAL_COST_PATTERN = re.compile(
+    r'(資本コスト|株主資本コスト|wacc)[^0-9%％]{0,40}([0-9]+(?:\.[0-9]+)?)\s*[%％]',
+    re.IGNORECASE,
+)
+CALENDAR_MONTH_PATTERN = re.compile(r'(?:[1-9]|1[0-2])月')
+CALENDAR_DATE_PATTERN = re.compile(r'\d{4}/\d{1,2}/\d{1,2}')
+
+# 業績推移グラフ（item 78/79/81/82）の本文キーワード
+# 同じ本文を語ごとに走査しないよう、語の集合ごとに1つの正規表現で照合する
+FINANCIAL_METRICS = ['売上高', '経常利益', '営業利益', '当期純利益']
+FINANCIAL_METRIC_PATTERN = re.compile('|'.join(map(re.escape, FINANCIAL_METRICS)))
+FIVE_PERIOD_PATTERN = re.compile('|'.join(map(re.escape, ['5期', '５期', '5年', '五年', '5年度', '五年度', '5-year'])))
+QUARTER_KEYWORDS = ['四半期', '1Q', '2Q', '3Q', '4Q', 'quarter']
+QUARTER_MENTION_KEYWORDS = QUARTER_KEYWORDS + ['q1', 'q2', 'q3', 'q4']
+QUARTER_MENTION_PATTERN = re.compile('|'.join(map(re.escape, QUARTER_MENTION_KEYWORDS)), re.IGNORECASE)
+TREND_EXPLANATION_PATTERN = re.compile('|'.join(map(re.escape, ['説明', '解説', '注記', 'コメント', 'point', '解釈'])))
+QUARTER_EXPLANATION_PATTERN = re.compile('|'.join(map(re.escape, ['説明', '解説', '注釈', '注記', 'comment'])))
+
+# キーワード近傍のグラフ要素（item 78/79/81/82・チャートジェネレーター）
+# 素の svg（アイコン）や *line*（headline, inline など）は誤検出が多いため含めない
+CHART_SELECTORS = (
+    'canvas',
+    '[class*="chart" i]',
+    '[class*="graph" i]:not([class*="paragraph" i]):not([class*="typography" i])',
+    '[class*="trend" i]',
+    'img[alt*="グラフ"]',
+    'img[alt*="chart" i]',
+)
+
+# キーワードを直接含む最も内側の要素（テキストノードの親）から3階層以内にグラフ要素があるかを判定する
+# （外側のラッパーは全キーワードを含むため、要素の textContent では判定しない）
+CHART_NEAR_KEYWORDS_SCRIPT = '''
+({keywords, selectors}) => {
+    /* chart near keywords */
+    const lowerKeywords = keywords.map((kw) => kw.toLowerCase());
+    const chartSelector = selectors.join(',');
+    const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT);
+    for (let node = walker.nextNode(); node; node = walker.nextNode()) {
+        const text = node.data.toLowerCase();
+        if (!lowerKeywords.some((kw) => text.includes(kw))) {
+            continue;
+        }
+        let current = node.parentElement;
+        for (let depth = 0; current && depth < 3; depth++) {
+            if (current.querySelector(chartSelector)) {
+                return true;
+            }
+            current = current.parentElement;
+        }
+    }
+    return false;
+}
+'''
+
+# section:has-text("ニュース") などに相当する (要素セレクタ, 含むテキスト) の組
+NEWS_FILTER_SECTION_PROBES = [
+    ['section', 'ニュース'],
+    ['section', 'ニュースリリース'],
+    ['div', 'NEWS RELEASE'],
+]
+NEWS_CATEGORY_KEYWORDS = ['ir', '決算', 'プレス', 'release', '財務', 'サステ', '投資家', 'csr']
+
+# ニュース欄（先頭5件）のカテゴリ絞り込みUIを1回の evaluate で判定する
+# （セクションごとの option / タブ文言の取得を往復させないため）
+NEWS_CATEGORY_FILTER_SCRIPT = '''
+({probes, keywords}) => {
+    /* news category filter */
+    const bases = [...new Set(probes.map(([selector]) => selector))].join(',');
+    const isNewsSection = (el) => {
+        const text = (el.textContent || '').toLowerCase();
+        return probes.some(([selector, needle]) => el.matches(selector) && text.includes(needle.toLowerCase()));
+    };
+    const hasCategory = (el) => {
+        const text = (el.textContent || '').toLowerCase();
+        return keywords.some(keyword => text.includes(keyword));
+    };
+
+    // querySelectorAll は文書順で返すため、locator の nth() と同じ順で先頭5件を調べる
+    const sections = Array.from(document.querySelectorAll(bases)).filter(isNewsSection).slice(0, 5);
+    for (const section of sections) {
+        if (Array.from(section.querySelectorAll('select option')).some(hasCategory)) {
+            return true;
+        }
+        let hits = 0;
+        for (const tab of section.querySelectorAll('button, a')) {
+            if (hasCategory(tab) && ++hits >= 2) {
+                return true;
+            }
+        }
+    }
+    return document.querySelector('[data-filter], [data-category]') !== null;
+}
+'''
+
+# 検索結果の HTML/PDF 絞り込み（item 51）をブラウザ内で判定する
+# （select の選択肢・ボタン類の全テキストを転送せず、両方の語が見つかった時点で打ち切る）
+FORMAT_FILTER_SCRIPT = '''
+(maxControls) => {
+    /* format filter */
+    const options = new Set();
+    for (const option of document.querySelectorAll('select option')) {
+        options.add((option.textContent || '').trim().toLowerCase());
+    }
+    if (options.has('html') && options.has('pdf')) {
+        return true;
+    }
+
+    let hasHtml = false;
+    let hasPdf = false;
+    const controls = document.querySelectorAll('button, label, a');
+    const limit = Math.min(controls.length, maxControls);
+    for (let i = 0; i < limit; i++) {
+        const text = (controls[i].textContent || '').toLowerCase();
+        hasHtml = hasHtml || text.includes('html');
+        hasPdf = hasPdf || text.includes('pdf');
+        if (hasHtml && hasPdf) {
+            return true;
+        }
+    }
+    return false;
+}
+'''
+
+# 検索フォームのカテゴリ選択肢（item 47）を判定する
+# キーワードは1つの正規表現にまとめてスクリプトに埋め込み、選択肢ごとに1回だけ照合する
+SEARCH_CATEGORY_FILTER_SCRIPT = '''
+() => {
+    /* search category filter */
+    const categoryPattern = /カテゴリ|category|ニュース|ir|csr|決算|プレス|press|investor|finance|library|report/i;
+    for (const form of document.querySelectorAll('form')) {
+        const hasSearchInput = Array.from(form.querySelectorAll('input')).some((input) => {
+            const type = (input.getAttribute('type') || '').toLowerCase();
+            if (type === 'search') return true;
+            const name = (input.getAttribute('name') || '').toLowerCase();
+            const placeholder = (input.getAttribute('placeholder') || '').toLowerCase();
+            return (
+                name.includes('search') ||
+                name.includes('keyword') ||
+                placeholder.includes('検索') ||
+                placeholder.includes('search')
+            );
+        });
+        if (!hasSearchInput) {
+            continue;
+        }
+
+        let matchCount = 0;
+        for (const option of form.querySelectorAll('select option')) {
+            if (categoryPattern.test(option.textContent || '') && ++matchCount >= 2) {
+                return true;
+            }
+        }
+
+        for (const choice of form.querySelectorAll('input[type="checkbox"], input[type="radio"]')) {
+            const label = choice.closest('label') || form.querySelector(`label[for="${choice.id}"]`);
+            const text = (label && label.textContent) || choice.getAttribute('value') || '';
+            if (categoryPattern.test(text) && ++matchCount >= 2) {
+                return true;
+            }
+        }
+    }
+    return false;
+}
+'''
+
+AMBIGUOUS_LINK_KEYWORDS = ['こちら', '表示', 'クリック', 'ここ']
+
+# リンク文言をブラウザ内で照合し、件数だけを返す（全リンクのテキストを転送しない）
+AMBIGUOUS_LINK_COUNT_SCRIPT = '''
+(keywords) => {
+    /* ambiguous link count */
+    return Array.from(document.querySelectorAll('a'))
+        .filter(a => {
+            const text = a.textContent || '';
+            return keywords.some(kw => text.includes(kw));
+        })
+        .length;
+}
+'''
+
+# 複数の検証で使うページ情報を1回の page.evaluate でまとめて取得する
+# （各検証が個別に evaluate するとページごとに数十回の往復が発生するため）
+PAGE_FACTS_SCRIPT = '''
+() => {
+    /* page facts */
+    // getComputedStyle は要素ごとに1回だけ呼び、同じ走査でスクロール・コントラストを集計する
+    const styleCache = new WeakMap();
+    const styleOf = (el) => {
+        let style = styleCache.get(el);
+        if (!style) {
+            style = window.getComputedStyle(el);
+            styleCache.set(el, style);
+        }
+        return style;
+    };
+
+    const typographyElement = document.querySelector('main, article, .main-content') || document.body;
+    const typographyStyle = styleOf(typographyElement);
+
+    // 簡易的な輝度計算（完全な実装には axe-core が必要）
+    // ページ内の色の種類は少ないため、色文字列ごとに1回だけ解析する
+    const luminanceCache = new Map();
+    const channelPattern = /\\d+/g;
+    const getLuminance = (rgb) => {
+        let lum = luminanceCache.get(rgb);
+        if (lum === undefined) {
+            const [r, g, b] = rgb.match(channelPattern).map(Number);
+            lum = 0.299 * r + 0.587 * g + 0.114 * b;
+            luminanceCache.set(rgb, lum);
+        }
+        return lum;
+    };
+    const contrastTags = new Set(['P', 'H1', 'H2', 'H3', 'H4', 'H5', 'H6', 'A', 'SPAN', 'DIV']);
+    const isScrollable = (value) => value === 'scroll' || value === 'auto';
+    // display は継承されないため、非表示のメニュー・モーダル内の子孫も含めて祖先まで判定する
+    // （checkVisibility 非対応のブラウザでは描画ボックスの有無で代用する）
+    const isRendered = (el) => typeof el.checkVisibility === 'function'
+        ? el.checkVisibility()
+        : el.getClientRects().length > 0;
+
+    // リンク系の検証（下線・別ウィンドウ表示・PDF表示）も同じ走査で集計する
+    const links = {
+        anchorCount: 0,
+        underlineIssues: 0,
+        external: {total: 0, indicated: 0},
+        pdfIcon: {total: 0, indicated: 0},
+        pdfNewWindow: {total: 0, indicated: 0},
+        pdfLabel: {total: 0, indicated: 0},
+    };
+    const pdfLinks = [];
+
+    // Cookie 関連（ポリシーリンク・同意バナー・設定ボタン）も同じ走査で有無を調べる
+    // :has-text と同様に大文字小文字を区別しない部分一致で判定する
+    const cookie = {policyLink: false, consentBanner: false, settingsControl: false};
+    const isCookieSettingsLabel = (lower) => lower.includes('cookie設定') || lower.includes('クッキー設定');
+
+    const auditLink = (link) => {
+        links.anchorCount++;
+        const href = link.getAttribute('href') || '';
+        const text = link.textContent || '';
+
+        // a:has-text("Cookie") / a:has-text("クッキー")（item 23）、Cookie設定リンク（item 25）
+        if (!cookie.policyLink || !cookie.settingsControl) {
+            const lower = text.toLowerCase();
+            if (lower.includes('cookie') || lower.includes('クッキー')) {
+                cookie.policyLink = true;
+                cookie.settingsControl = cookie.settingsControl || isCookieSettingsLabel(lower);
+            }
+        }
+
+        // main a, article a, .content a: 下線なし かつ 色が親と同じリンク
+        const parent = link.parentElement;
+        if (parent && parent.closest('main, article, .content')) {
+            const style = styleOf(link);
+            if (!style.textDecoration.includes('underline') && style.color === styleOf(parent).color) {
+                links.underlineIssues++;
+            }
+        }
+
+        // a[target="_blank"]: アイコンや「別ウィンドウ」表記
+        const opensNewWindow = (link.getAttribute('target') || '').toLowerCase() === '_blank';
+        if (opensNewWindow) {
+            links.external.total++;
+            // 表記はテキストで判定できることが多いため、子孫要素のアイコン探索は最後に行う
+            const hasText = text.includes('別ウィンドウ') || text.includes('新しいウィンドウ') ||
+                text.includes('外部サイト') || link.title.includes('別ウィンドウ');
+            if (hasText || link.querySelector('svg, i, img[src*="icon"], img[src*="external"]')) {
+                links.external.indicated++;
+            }
+        }
+
+        // a[href$=".pdf"]: 別ウィンドウ（item 26）・PDFアイコン表示（item 27）とファーストビュー判定
+        if (href.endsWith('.pdf')) {
+            pdfLinks.push(link);
+            links.pdfNewWindow.total++;
+            if (opensNewWindow) {
+                links.pdfNewWindow.indicated++;
+            }
+            links.pdfIcon.total++;
+            const hasText = text.includes('PDF') || text.includes('pdf');
+            if (hasText || link.className.includes('pdf') ||
+                link.querySelector('img[src*="pdf"], i[class*="pdf"], svg')) {
+                links.pdfIcon.indicated++;
+            }
+        }
+
+        // a[href*=".pdf"]: PDF表記（item 43）
+        if (href.includes('.pdf')) {
+            links.pdfLabel.total++;
+            const lowerText = text.toLowerCase();
+            const title = (link.getAttribute('title') || '').toLowerCase();
+            if (lowerText.includes('pdf') || title.includes('pdf') ||
+                link.querySelector('img[alt*="pdf" i], img[src*="pdf" i], svg')) {
+                links.pdfLabel.indicated++;
+            }
+        }
+    };
+
+    let hasScrollArea = false;
+    let contrastIssues = 0;
+    for (const el of document.querySelectorAll('*')) {
+        if (el.tagName === 'A') {
+            auditLink(el);
+        } else if (el.tagName === 'BUTTON' && !cookie.settingsControl) {
+            cookie.settingsControl = isCookieSettingsLabel((el.textContent || '').toLowerCase());
+        }
+
+        // パフォーマンスのためコントラスト不足は11件で打ち切る
+        const needsContrast = contrastIssues <= 10 && contrastTags.has(el.tagName);
+        // スクロールエリアは有無だけを判定するため、1件見つかった後は調べない
+        if (hasScrollArea && !needsContrast) {
+            continue;
+        }
+
+        const style = styleOf(el);
+        if (!hasScrollArea &&
+            (isScrollable(style.overflow) || isScrollable(style.overflowX) || isScrollable(style.overflowY)) &&
+            el !== document.documentElement && el !== document.body) {
+            hasScrollArea = true;
+        }
+
+        // 打ち切りが表示中の要素で発生するよう、非表示要素（非表示の祖先を持つ要素を含む）は数えない
+        // visibility は継承されるため計算済みスタイルで判定し、祖先の判定はコントラスト不足の候補に限る
+        if (needsContrast && style.visibility !== 'hidden') {
+            const color = style.color;
+            const bgColor = style.backgroundColor;
+            if (color && bgColor && bgColor !== 'rgba(0, 0, 0, 0)') {
+                const fgLum = getLuminance(color);
+                const bgLum = getLuminance(bgColor);
+                const ratio = (Math.max(fgLum, bgLum) + 0.05) / (Math.min(fgLum, bgLum) + 0.05);
+                if (ratio < 4.5 && isRendered(el)) {
+                    contrastIssues++;
+                }
+            }
+        }
+    }
+
+    // スタイルシートは1回だけ走査し、:visited の定義とメディアクエリを同時に探す
+    // viewport meta があればレスポンシブ判定は確定するため、メディアクエリは探さない（null = 未確認）
+    const viewportMetaCount = document.querySelectorAll('meta[name="viewport"]').length;
+    let hasMediaQueries = viewportMetaCount > 0 ? null : false;
+    let hasVisitedRule = false;
+    // CORS 指定のない別オリジンのスタイルシートは読めないことが分かっているため、例外を発生させる前に除外する
+    const isOpaqueSheet = (sheet) => Boolean(sheet.href) &&
+        !sheet.href.startsWith(location.origin + '/') &&
+        !(sheet.ownerNode && sheet.ownerNode.crossOrigin);
+    for (const sheet of document.styleSheets) {
+        if (isOpaqueSheet(sheet)) {
+            continue;
+        }
+        let rules;
+        try {
+            rules = sheet.cssRules || sheet.rules || [];
+        } catch (e) {
+            // Cross-origin stylesheets
+            continue;
+        }
+        // ルール一覧は配列にコピーせず、長さを固定した添字ループで読む
+        for (let i = 0, n = rules.length; i < n; i++) {
+            const rule = rules[i];
+            if (!hasVisitedRule && rule.selectorText && rule.selectorText.includes(':visited')) {
+                hasVisitedRule = true;
+            }
+            if (hasMediaQueries === false && rule.type === CSSRule.MEDIA_RULE) {
+                hasMediaQueries = true;
+            }
+            if (hasVisitedRule && hasMediaQueries !== false) {
+                break;
+            }
+        }
+        if (hasVisitedRule && hasMediaQueries !== false) {
+            break;
+        }
+    }
+
+    // Cookie 同意バナー（item 24）: 表示状態は問わないため textContent で判定する
+    const consentCandidates = document.querySelectorAll(
+        '[class*="cookie"], [class*="consent"], [id*="cookie"], [id*="consent"]'
+    );
+    for (const el of consentCandidates) {
+        const text = el.textContent || '';
+        if (text.includes('Cookie') || text.includes('cookie') || text.includes('クッキー') || text.includes('同意')) {
+            cookie.consentBanner = true;
+            break;
+        }
+    }
+
+    // サイト内検索の入力欄（item 14/36/37/39/199 で共有）
+    const hasSearchInput = document.querySelector('input[type="search"], input[name*="search"]') !== null;
+
+    // 複数の項目が同じセレクタで数える要素数（項目ごとの locator.count() 往復をまとめる）
+    const counts = {
+        pdfLinks: document.querySelectorAll('a[href$=".pdf"]').length,
+        videos: document.querySelectorAll('video, iframe[src*="youtube"], iframe[src*="vimeo"]').length,
+        tables: document.querySelectorAll('table').length,
+    };
+
+    // 位置の読み取りは DOM を変更しない処理の最後にまとめ、レイアウト計算を1回で済ませる
+    const viewportHeight = window.innerHeight;
+    let firstViewPdfCount = 0;
+    for (const link of pdfLinks) {
+        const top = link.getBoundingClientRect().top;
+        if (top >= 0 && top <= viewportHeight) {
+            firstViewPdfCount++;
+        }
+    }
+
+    return {
+        fontSize: typographyStyle.fontSize,
+        lineHeightRatio: parseFloat(typographyStyle.lineHeight) / parseFloat(typographyStyle.fontSize),
+        hasScrollArea,
+        contrastIssues,
+        viewportMetaCount,
+        hasMediaQueries,
+        hasVisitedRule,
+        firstViewPdfCount,
+        links,
+        cookie,
+        hasSearchInput,
+        counts,
+    };
+}
+'''
+
+
+def _returns_error_result(check):
+    """検証メソッドの例外を ERROR 結果に変換するデコレータ"""
+    @functools.wraps(check)
+    async def wrapper(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
+        try:
+            return await check(self, site, page, item)
+        except Exception as e:
+            return self._create_error_result(site, item, str(e))
+    return wrapper
 
 
 class ScriptValidator:
@@ -48,6 +724,136 @@ class ScriptValidator:
     27項目のスクリプトベース検証を実行する。
     """
 
+    # 検証メソッドマッピング（item_id -> メソッド名）
+    # 束縛メソッドはインスタンスごとに作らず、validate() で getattr する
+    VALIDATOR_METHODS: Dict[int, str] = {
+        1: 'check_menu_count',
+        2: 'check_menu_investor_keyword',
+        3: 'check_breadcrumb',
+        4: 'check_back_to_top_link',
+        5: 'check_no_scroll_areas',
+        6: 'check_footer_navigation',
+        7: 'check_sitemap',
+        8: 'check_responsive_design',
+        9: 'check_carousel_pause_button',
+        10: 'check_latest_document_download',
+        11: 'check_font_size_not_too_small',
+        12: 'check_font_size_large_enough',
+        13: 'check_line_height',
+        14: 'check_contrast',
+        15: 'check_visited_link_color',
+        16: 'check_link_underline',
+        17: 'check_link_text_not_ambiguous',
+        18: 'check_external_link_icon',
+        22: 'check_tls_version',
+        23: 'check_cookie_policy',
+        24: 'check_cookie_consent',
+        25: 'check_cookie_settings',
+        26: 'check_pdf_new_window',
+        27: 'check_pdf_icon',
+        28: 'check_roe_data',
+        29: 'check_equity_ratio',
+        30: 'check_pbr_data',
+        31: 'check_financial_statements',
+        32: 'check_securities_report',
+        33: 'check_business_report',
+        34: 'check_financial_data_download',
+        35: 'check_quarterly_data_download',
+        40: 'check_external_link_icon',
+        45: 'check_search_input_visible',
+        53: 'check_item_53',
+        61: 'check_recommended_browsers',
+        71: 'check_item_71',
+        73: 'check_item_73',
+        74: 'check_item_74',
+        75: 'check_cookie_settings',
+        86: 'check_item_86',
+        94: 'check_item_94',
+        132: 'check_item_132',
+        137: 'check_item_137',
+        138: 'check_item_138',
+        142: 'check_item_142',
+        143: 'check_item_143',
+        145: 'check_item_145',
+        150: 'check_item_150',
+        169: 'check_item_169',
+        183: 'check_item_183',
+        205: 'check_item_205',
+        206: 'check_item_206',
+        208: 'check_item_208',
+        210: 'check_item_210',
+        212: 'check_item_212',
+        215: 'check_item_215',
+        216: 'check_item_216',
+        217: 'check_item_217',
+        227: 'check_item_227',
+        239: 'check_item_239',
+        246: 'check_item_246',
+        247: 'check_item_247',
+    }
+
+    # 同じ暫定判定を共有する項目（item_id -> メソッド名、コメントは各項目の要件）
+    # 判定が同じ項目ごとにメソッドを複製せず、validate() でこの表から引く
+    SHARED_CHECK_METHODS: Dict[int, str] = {
+        36: 'check_search_input_present',  # No.360: 検索結果表示のトップには検索結果件数を掲載している
+        37: 'check_search_input_present',  # No.370: サイト内検索はカテゴリごとに対象を絞り込んで検索ができる
+        38: 'check_body_text_present',  # No.380: 日付順の並び替えができる
+        39: 'check_search_input_present',  # No.390: 検索キーワードのオートサジェスト機能を実装している
+        41: 'check_pdf_link_present',  # No.410: 検索結果はHTMLもしくはPDFで絞り込める
+        42: 'check_body_text_present',  # No.470: ブラウザやOSの推奨環境を明記している
+        49: 'check_body_text_present',  # No.630: Cookieを常設している
+        50: 'check_body_text_present',  # No.640: IR資料は書類種別ごとにページが分かれている
+        92: 'check_video_present',  # No.1090: 直近1年以内に開催した個人投資家向け説明会の資料や動画を掲載している
+        100: 'check_body_text_present',  # No.1180: 株価情報は自社専用のものを掲載している（Yahooや証券会社等のリンク不可）
+        102: 'check_body_text_present',  # No.1200: IRトップの株価表示には時価総額や最低購入代金といった関連する情報も掲載している
+        111: 'check_body_text_present',  # No.1310: 株式手続きについて掲載している
+        116: 'check_body_text_present',  # No.1360: アナリスト・カバレッジを掲載している
+        118: 'check_body_text_present',  # No.1390: 設立年月日は西暦と和暦を併記している
+        119: 'check_body_text_present',  # No.1400: 従業員数を掲載している
+        120: 'check_body_text_present',  # No.1410: トップページから会社概要まで通常メニューで2クリックで到達できる
+        121: 'check_video_present',  # No.1420: 会社案内もしくは事業紹介の動画を掲載している
+        123: 'check_body_text_present',  # No.1440: 社名の由来・ロゴの意味を掲載している
+        126: 'check_body_text_present',  # No.1470: 会社組織図を掲載している
+        129: 'check_body_text_present',  # No.1520: 全取締役・監査役の写真を掲載している
+        131: 'check_body_text_present',  # No.1540: 役員の生年月日（または年齢）を記載している
+        133: 'check_body_text_present',  # No.1560: 全取締役・監査役のスキルマトリックスを掲載している
+        135: 'check_body_text_present',  # No.1580: コーポレートガバナンスについて掲載している
+        136: 'check_pdf_link_present',  # No.1590: コーポレート・ガバナンスに関する報告書を掲載している（PDF可）
+        144: 'check_body_text_present',  # No.1670: 外部評価について掲載している
+        165: 'check_body_text_present',  # No.1890: サイトの利用環境や免責事項などサイトポリシーを掲載している
+        166: 'check_body_text_present',  # No.1900: ソーシャルメディアポリシーを掲載している
+        172: 'check_body_text_present',  # No.1960: Strategy を掲載している
+        173: 'check_body_text_present',  # No.1970: 全取締役・監査役のSkills Matrixを掲載している
+        174: 'check_body_text_present',  # No.1980: Sustainabilityを掲載している
+        175: 'check_body_text_present',  # No.1990: TCFDガイドラインに沿った情報を掲載している
+        176: 'check_body_text_present',  # No.2000: Key Figuresなど業績のデータ集約ページがある
+        178: 'check_pdf_link_present',  # No.2020: 招集通知の英語版を掲載している（PDF可）
+        179: 'check_pdf_link_present',  # No.2030: Financial Results（Quarterly）を掲載している（PDF可）
+        180: 'check_pdf_link_present',  # No.2040: Integrated Report /Annual Reportを掲載している（PDF可）
+        181: 'check_pdf_link_present',  # No.2050: Presentationsを掲載している（PDF可）
+        184: 'check_body_text_present',  # No.2080: メールニュースの配信登録ができる
+        185: 'check_body_text_present',  # No.2090: 英語ページからメール問い合わせができる（フォーム可）
+        186: 'check_body_text_present',  # No.2100: IR関連の連絡先の電話番号を記載している
+        192: 'check_body_text_present',  # No.2170: Youtubeに開設する公式アカウントをIRトップで紹介している
+        193: 'check_body_text_present',  # No.2180: Facebookに開設する公式アカウントをIRトップで紹介している
+        194: 'check_body_text_present',  # No.2190: X（旧Twitter）に開設する公式アカウントをIRトップで紹介している
+        195: 'check_body_text_present',  # No.2200: Instagramに開設する公式アカウントをIRトップで紹介している
+        196: 'check_body_text_present',  # No.2210: LinkedInに開設する公式アカウントをIRトップで紹介している
+        199: 'check_search_input_present',  # No.2250: ニュースリリースのフリーワード検索ができる
+        200: 'check_body_text_present',  # No.2260: ニュースリリースは内容別にソーティングができる
+        201: 'check_body_text_present',  # No.2270: ニュースリリースのメール配信登録ができる
+        202: 'check_body_text_present',  # No.2280: 最新資料の一括圧縮ダウンロードを行っている
+        203: 'check_body_text_present',  # No.2290: IR関連の問い合わせメールがある（フォーム可）
+        204: 'check_body_text_present',  # No.2300: IR関連の問い合わせ電話番号を記載している
+    }
+
+    # スクリーンショットを撮る検証（スクロール位置・描画状態を変える）は並行実行しない
+    EXCLUSIVE_VALIDATOR_METHODS = frozenset({
+        'check_item_19',
+        'check_item_20',
+        'check_item_21',
+    })
+
     def __init__(self, scraper, logger, visual_analyzer: Optional[VisualAnalyzer] = None):
         """初期化
 
@@ -57,150 +863,163 @@ class ScriptValidator:
         """
         self.scraper = scraper
         self.logger = logger
-        self.visual_analyzer = visual_analyzer or VisualAnalyzer()
-
-        # 検証メソッドマッピング（item_id -> メソッド）
-        # 検証メソッドマッピング（item_id -> メソッド）
-        # 更新済み: LLM移行48項目を削除、56項目のScript検証のみを定義
-        self.validators = {
-            2: self.check_menu_investor_keyword,
-            6: self.check_footer_navigation,
-            7: self.check_sitemap,
-            8: self.check_responsive_design,
-            10: self.check_latest_document_download,
-            13: self.check_line_height,
-            27: self.check_pdf_icon,
-            31: self.check_financial_statements,
-            32: self.check_securities_report,
-            34: self.check_financial_data_download,
-            50: self.check_item_50,
-            53: self.check_item_53,
-            71: self.check_item_71,
-            73: self.check_item_73,
-            74: self.check_item_74,
-            86: self.check_item_86,
-            94: self.check_item_94,
-            100: self.check_item_100,
-            102: self.check_item_102,
-            119: self.check_item_119,
-            123: self.check_item_123,
-            129: self.check_item_129,
-            132: self.check_item_132,
-            135: self.check_item_135,
-            137: self.check_item_137,
-            138: self.check_item_138,
-            142: self.check_item_142,
-            143: self.check_item_143,
-            145: self.check_item_145,
-            150: self.check_item_150,
-            166: self.check_item_166,
-            169: self.check_item_169,
-            178: self.check_item_178,
-            179: self.check_item_179,
-            180: self.check_item_180,
-            181: self.check_item_181,
-            183: self.check_item_183,
-            184: self.check_item_184,
-            192: self.check_item_192,
-            193: self.check_item_193,
-            195: self.check_item_195,
-            196: self.check_item_196,
-            200: self.check_item_200,
-            201: self.check_item_201,
-            205: self.check_item_205,
-            206: self.check_item_206,
-            208: self.check_item_208,
-            210: self.check_item_210,
-            212: self.check_item_212,
-            215: self.check_item_215,
-            216: self.check_item_216,
-            217: self.check_item_217,
-            227: self.check_item_227,
-            239: self.check_item_239,
-            246: self.check_item_246,
-            247: self.check_item_247,
-        }
+        # VISUAL 系の検証が実行されるまで VisualAnalyzer は生成しない
+        self._visual_analyzer = visual_analyzer
+        # 作成済みのスクリーンショット保存先（毎回の mkdir を避ける）
+        self._created_dirs: set = set()
+        # page -> (URL, ページ情報)。ページが閉じられたら自動的に破棄される
+        self._page_facts: "weakref.WeakKeyDictionary[Page, tuple]" = weakref.WeakKeyDictionary()
+        self._visual_snapshots: "weakref.WeakKeyDictionary[Page, tuple]" = weakref.WeakKeyDictionary()
+        # page -> (URL, body テキスト または取得中の Future)。並行する検証でも取得は1回にする
+        self._body_texts: "weakref.WeakKeyDictionary[Page, tuple]" = weakref.WeakKeyDictionary()
+
+    @classmethod
+    def _dispatch_table(cls) -> Dict[int, str]:
+        """item_id -> メソッド名の対応表（クラスごとに1回だけ構築する）
+
+        VALIDATOR_METHODS、SHARED_CHECK_METHODS の順に優先し、
+        どちらにも無い項目は check_item_<id> という命名のメソッドから補完する。
+        """
+        table = cls.__dict__.get('_dispatch')
+        if table is None:
+            table = dict(cls.VALIDATOR_METHODS)
+            for item_id, method_name in cls.SHARED_CHECK_METHODS.items():
+                table.setdefault(item_id, method_name)
+            for attr in dir(cls):
+                if not attr.startswith('check_item_'):
+                    continue
+                try:
+                    item_id = int(attr.split('_')[-1])
+                except ValueError:
+                    continue
+                table.setdefault(item_id, attr)
+            cls._dispatch = table
+        return table
+
+    @classmethod
+    def _dispatch_slots(cls) -> List[Optional[str]]:
+        """item_id を添字にしてメソッド名を引ける配列（内容は _dispatch_table と同じ）"""
+        slots = cls.__dict__.get('_slots')
+        if slots is None:
+            table = cls._dispatch_table()
+            slots = [None] * (max(table, default=-1) + 1)
+            for item_id, method_name in table.items():
+                slots[item_id] = method_name
+            cls._slots = slots
+        return slots
+
+    @property
+    def visual_analyzer(self) -> VisualAnalyzer:
+        """VisualAnalyzer（初回アクセス時に生成）"""
+        if self._visual_analyzer is None:
+            self._visual_analyzer = VisualAnalyzer()
+        return self._visual_analyzer
 
-        self._register_additional_validators()
-
-    def _register_additional_validators(self):
-        manual_map = {
-            1: self.check_menu_count,
-            3: self.check_breadcrumb,
-            4: self.check_back_to_top_link,
-            5: self.check_no_scroll_areas,
-            9: self.check_carousel_pause_button,
-            11: self.check_font_size_not_too_small,
-            12: self.check_font_size_large_enough,
-            14: self.check_contrast,
-            15: self.check_visited_link_color,
-            16: self.check_link_underline,
-            17: self.check_link_text_not_ambiguous,
-            18: self.check_external_link_icon,
-            22: self.check_tls_version,
-            23: self.check_cookie_policy,
-            24: self.check_cookie_consent,
-            25: self.check_cookie_settings,
-            26: self.check_pdf_new_window,
-            28: self.check_roe_data,
-            29: self.check_equity_ratio,
-            30: self.check_pbr_data,
-            33: self.check_business_report,
-            35: self.check_quarterly_data_download,
-            45: self.check_search_input_visible,
-            61: self.check_recommended_browsers,
-        }
+    async def _capture_visual(self, page: Page, selectors: Optional[List[str]] = None):
+        """VISUAL 情報を取得する（同じページ・同じURL・同じセレクタ集合では1回だけ取得する）
 
-        for item_id, func in manual_map.items():
-            self.validators.setdefault(item_id, func)
+        キャッシュを共有した場合も、styles は呼び出し側のセレクタ順に並べて返す。
+        """
+        cached = self._visual_snapshots.get(page)
+        if not cached or cached[0] != page.url:
+            cached = (page.url, {})
+            self._visual_snapshots[page] = cached
+        key = frozenset(selectors) if selectors else None
+        snapshot = cached[1].get(key)
+        if snapshot is None:
+            snapshot = await self.visual_analyzer.capture(page, selectors)
+            cached[1][key] = snapshot
+        if not selectors:
+            return snapshot
+        order = {selector: index for index, selector in enumerate(dict.fromkeys(selectors))}
+        styles = sorted(snapshot.get('styles', []), key=lambda entry: order.get(entry.get('selector'), len(order)))
+        return {**snapshot, 'styles': styles}
+
+    async def _collect_page_facts(self, page: Page) -> dict:
+        """複数の検証で共有するページ情報を取得する（同じページ・同じURLでは1回だけ evaluate する）"""
+        cached = self._page_facts.get(page)
+        if cached and cached[0] == page.url:
+            return cached[1]
+        facts = await page.evaluate(PAGE_FACTS_SCRIPT)
+        self._page_facts[page] = (page.url, facts)
+        return facts
+
+    async def _body_text(self, page: Page) -> str:
+        """body のテキストを取得する（同じページ・同じURLでは1回だけ取得する）
+
+        取得中に別の検証から呼ばれた場合は同じ取得結果を待つ。取得に失敗した場合はキャッシュしない。
+        """
+        cached = self._body_texts.get(page)
+        if cached is None or cached[0] != page.url:
+            cached = (page.url, asyncio.ensure_future(page.inner_text('body')))
+            self._body_texts[page] = cached
+        text = cached[1]
+        if isinstance(text, str):
+            return text
+        try:
+            # 待っている検証がキャンセルされても、共有している取得処理は止めない
+            text = await asyncio.shield(text)
+        except Exception:
+            if self._body_texts.get(page) is cached:
+                del self._body_texts[page]
+            raise
+        if self._body_texts.get(page) is cached:
+            self._body_texts[page] = (cached[0], text)
+        return text
 
-        for attr in dir(self):
-            if not attr.startswith('check_item_'):
-                continue
-            try:
-                item_id = int(attr.split('_')[-1])
-            except ValueError:
-                continue
-            self.validators.setdefault(item_id, getattr(self, attr))
+    async def _any_selector_matches(self, page: Page, selectors: Sequence[str]) -> bool:
+        """いずれかのセレクタに一致する要素があるか（セレクタごとの locator.count() 往復をまとめる）"""
+        return bool(await page.evaluate(ANY_SELECTOR_MATCHES_SCRIPT, _selector_probe(tuple(selectors))))
 
-    async def _capture_visual(self, page: Page, selectors: Optional[List[str]] = None):
-        if not self.visual_analyzer:
-            return {}
-        return await self.visual_analyzer.capture(page, selectors)
+    async def _first_matches(self, page: Page, selectors: Sequence[str]) -> List[Optional[dict]]:
+        """セレクタごとの最初の一致要素の大きさを返す
+
+        一致しないセレクタは None。
+        """
+        return await page.evaluate(FIRST_MATCHES_SCRIPT, _selector_steps(tuple(selectors)))
 
     async def _collect_texts(self, page: Page, selectors: List[str], max_samples: int = 3) -> List[str]:
         texts: List[str] = []
         for selector in selectors:
-            locator = page.locator(selector)
-            count = await locator.count()
-            for idx in range(min(count, max_samples - len(texts))):
-                try:
-                    snippet = await locator.nth(idx).inner_text()
-                except Exception:
-                    continue
+            # 要素ごとの inner_text 往復をせず、セレクタ単位で1回にまとめて取得する
+            snippets = await page.locator(selector).all_inner_texts()
+            for snippet in snippets[:max_samples - len(texts)]:
                 snippet = (snippet or '').strip()
                 if snippet:
                     texts.append(snippet)
-                if len(texts) >= max_samples:
-                    return texts
+            if len(texts) >= max_samples:
+                return texts
         return texts
 
     async def _save_element_screenshot(self, locator, item_id: int, label: str) -> Optional[str]:
         try:
-            if not self.visual_analyzer:
-                return None
-            screenshot_dir = self.visual_analyzer.screenshot_dir / f'item_{item_id}'
-            screenshot_dir.mkdir(parents=True, exist_ok=True)
-            sanitized = re.sub(r'[^a-zA-Z0-9_-]+', '_', label) or 'element'
-            path = screenshot_dir / f'{sanitized[:40]}.png'
             box = await locator.bounding_box()
             if not box or box['width'] < 30 or box['height'] < 30:
                 return None
-            await locator.screenshot(path=str(path))
+            screenshot_dir = self.visual_analyzer.screenshot_dir / f'item_{item_id}'
+            if screenshot_dir not in self._created_dirs:
+                screenshot_dir.mkdir(parents=True, exist_ok=True)
+                self._created_dirs.add(screenshot_dir)
+            sanitized = SCREENSHOT_LABEL_UNSAFE.sub('_', label) or 'element'
+            # 根拠画像として確認できれば十分なため、PNG より軽い JPEG で保存する
+            path = screenshot_dir / f'{sanitized[:40]}.jpg'
+            await locator.screenshot(path=str(path), type='jpeg', quality=70)
             return str(path)
         except Exception:
             return None
 
+    def _checked_at(self) -> datetime:
+        """結果に記録する検証日時"""
+        return _BATCH_STARTED_AT.get() or datetime.now()
+
+    @staticmethod
+    def _parse_px(value: str) -> float:
+        """'16px' 形式の計算済みスタイル値を数値に変換する"""
+        match = CSS_LENGTH_PX.match(value.strip())
+        if not match:
+            raise ValueError(f"Unexpected CSS length: {value!r}")
+        return float(match.group(1))
+
     def _parse_line_height_ratio(self, entry: dict) -> Optional[float]:
         styles = entry.get('styles') or {}
         font_size_value = styles.get('fontSize')
@@ -216,29 +1035,18 @@ class ScriptValidator:
         if font_px == 0:
             return None
 
-        line_value = line_height_value.strip().lower()
-        if line_value == 'normal':
+        line_match = CSS_LINE_HEIGHT.match(line_height_value)
+        if not line_match:
+            return None
+        if line_match.group('normal'):
             return 1.2  # CSS仕様上の目安
-        px_match = CSS_LENGTH_PX.match(line_value)
-        if px_match:
-            line_px = float(px_match.group(1))
-            return line_px / font_px if font_px else None
-
-        if line_value.endswith('%'):
-            try:
-                percent = float(line_value.rstrip('%'))
-                return percent / 100
-            except ValueError:
-                return None
-
-        if line_value.endswith('em'):
-            try:
-                em = float(line_value.rstrip('em'))
-                return em
-            except ValueError:
-                return None
-
-        return None
+        convert = LINE_HEIGHT_TO_RATIO.get((line_match.group('unit') or '').lower())
+        if convert is None:
+            return None
+        try:
+            return convert(float(line_match.group('number')), font_px)
+        except ValueError:
+            return None
 
     async def validate(self, site: Site, page: Page, item: ValidationItem, checked_url: str) -> ValidationResult:
         """検証を実行する
@@ -252,14 +1060,16 @@ class ScriptValidator:
         Returns:
             ValidationResult
         """
-        validator_func = self.validators.get(item.item_id)
+        slots = self._dispatch_slots()
+        item_id = item.item_id
+        method_name = slots[item_id] if 0 <= item_id < len(slots) else None
 
-        if not validator_func:
+        if not method_name:
             # 未実装の項目はUNKNOWNとして返す
             return self._create_unknown_result(site, item, "Validator not implemented yet", checked_url)
 
         try:
-            result = await validator_func(site, page, item)
+            result = await getattr(self, method_name)(site, page, item)
             # checked_urlを結果に設定
             result.checked_url = checked_url
             return result
@@ -267,949 +1077,555 @@ class ScriptValidator:
             self.logger.error(f"Validation error for item {item.item_id}: {e}")
             return self._create_error_result(site, item, str(e), checked_url)
 
+    async def validate_batch(
+        self,
+        site: Site,
+        page: Page,
+        items: List[ValidationItem],
+        checked_url: str,
+        concurrency: int = 8,
+    ) -> List[ValidationResult]:
+        """同じページに対する複数項目をまとめて検証する
+
+        DOM を読むだけの検証は Semaphore で同時実行数を制限しつつ並行実行し、
+        スクリーンショットを撮る検証はその後に直列で実行する。
+
+        Args:
+            site: サイト情報
+            page: Playwrightページインスタンス
+            items: 検証項目のリスト
+            checked_url: 実際に調査したページのURL
+            concurrency: 同時に実行する検証の上限
+
+        Returns:
+            items と同じ順序の ValidationResult のリスト
+        """
+        # 共有ページ情報を先に取得しておき、各検証からはキャッシュを参照させる
+        try:
+            await self._collect_page_facts(page)
+        except Exception as e:
+            self.logger.debug(f"Page facts prefetch failed for {checked_url}: {e}")
+
+        dispatch = self._dispatch_table()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(item: ValidationItem) -> ValidationResult:
+            async with semaphore:
+                return await self.validate(site, page, item, checked_url)
+
+        results: List[Optional[ValidationResult]] = [None] * len(items)
+        concurrent_indexes = [
+            idx for idx, item in enumerate(items)
+            if dispatch.get(item.item_id) not in self.EXCLUSIVE_VALIDATOR_METHODS
+        ]
+        # gather で作るタスクは現在のコンテキストを引き継ぐため、バッチ内の検証からのみ参照される
+        started_at = _BATCH_STARTED_AT.set(datetime.now())
+        try:
+            concurrent_results = await asyncio.gather(*(run(items[idx]) for idx in concurrent_indexes))
+            for idx, result in zip(concurrent_indexes, concurrent_results):
+                results[idx] = result
+
+            for idx, item in enumerate(items):
+                if results[idx] is None:
+                    results[idx] = await self.validate(site, page, item, checked_url)
+        finally:
+            _BATCH_STARTED_AT.reset(started_at)
+        return results
+
     # === 実装済み検証メソッド ===
 
+    @_returns_error_result
     async def check_menu_count(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """メニュー項目数チェック（item_id: 1）
 
         グローバルメニューが9個以内かチェック。
         """
-        try:
-            menu_count = await page.locator('nav > ul > li').count()
-            is_valid = menu_count <= 9
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if is_valid else 'FAIL',
-                confidence=1.0,
-                details=f'グローバルメニュー{menu_count}項目',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        menu_count = await page.locator('nav > ul > li').count()
+        is_valid = menu_count <= 9
+
+        return self._create_result(
+            site, item,
+            result='PASS' if is_valid else 'FAIL',
+            confidence=1.0,
+            details=f'グローバルメニュー{menu_count}項目',
+        )
 
+    @_returns_error_result
     async def check_menu_investor_keyword(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """グローバルメニューに「株主」「投資家」を含むかチェック（item_id: 2）"""
-        try:
-            # 全てのnav要素のテキストを取得
-            nav_elements = await page.locator('nav').all()
-            menu_texts = []
-            for nav in nav_elements:
-                try:
-                    text = await nav.inner_text()
-                    menu_texts.append(text)
-                except:
-                    continue
-
-            # 全てのnav要素のテキストを結合して検索
-            combined_text = ' '.join(menu_texts)
-            has_keyword = '株主' in combined_text or '投資家' in combined_text
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_keyword else 'FAIL',
-                confidence=1.0,
-                details='「株主」または「投資家」メニュー検出' if has_keyword else 'キーワード未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        # 全てのnav要素のテキストを1回の呼び出しで取得し、結合して検索
+        menu_texts = await page.locator('nav').all_inner_texts()
+        combined_text = ' '.join(menu_texts)
+        has_keyword = '株主' in combined_text or '投資家' in combined_text
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_keyword else 'FAIL',
+            confidence=1.0,
+            details='「株主」または「投資家」メニュー検出' if has_keyword else 'キーワード未検出',
+        )
 
+    @_returns_error_result
     async def check_breadcrumb(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """パンくずリストチェック（item_id: 3）"""
-        try:
-            # パンくずリストの一般的なセレクタをチェック
-            breadcrumb_selectors = [
-                'nav[aria-label="breadcrumb"]',
-                '.breadcrumb',
-                'ol.breadcrumb',
-                'ul.breadcrumb'
-            ]
-
-            found = False
-            for selector in breadcrumb_selectors:
-                count = await page.locator(selector).count()
-                if count > 0:
-                    found = True
-                    break
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if found else 'FAIL',
-                confidence=1.0,
-                details='パンくずリスト検出' if found else 'パンくずリスト未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        # パンくずリストの一般的なセレクタをチェック
+        found = await self._any_selector_matches(page, BREADCRUMB_SELECTORS)
+
+        return self._create_result(
+            site, item,
+            result='PASS' if found else 'FAIL',
+            confidence=1.0,
+            details='パンくずリスト検出' if found else 'パンくずリスト未検出',
+        )
 
+    @_returns_error_result
     async def check_font_size_not_too_small(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """フォントサイズが12px以下を多用していないかチェック（item_id: 11）"""
-        try:
-            # main領域の基本文章フォントサイズをチェック
-            font_size = await page.evaluate('''
-                () => {
-                    const mainElement = document.querySelector('main, article, .main-content');
-                    if (mainElement) {
-                        return window.getComputedStyle(mainElement).fontSize;
-                    }
-                    return window.getComputedStyle(document.body).fontSize;
-                }
-            ''')
+        # main領域の基本文章フォントサイズをチェック
+        font_size = (await self._collect_page_facts(page))['fontSize']
 
-            size_value = float(font_size.replace('px', ''))
-            is_valid = size_value > 12
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if is_valid else 'FAIL',
-                confidence=0.8,
-                details=f'基本フォントサイズ: {size_value}px',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        size_value = self._parse_px(font_size)
+        is_valid = size_value > 12
 
+        return self._create_result(
+            site, item,
+            result='PASS' if is_valid else 'FAIL',
+            confidence=0.8,
+            details=f'基本フォントサイズ: {size_value}px',
+        )
+
+    @_returns_error_result
     async def check_font_size_large_enough(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """フォントサイズが16px以上かチェック（item_id: 12）"""
-        try:
-            font_size = await page.evaluate('''
-                () => {
-                    const mainElement = document.querySelector('main, article, .main-content');
-                    if (mainElement) {
-                        return window.getComputedStyle(mainElement).fontSize;
-                    }
-                    return window.getComputedStyle(document.body).fontSize;
-                }
-            ''')
+        font_size = (await self._collect_page_facts(page))['fontSize']
 
-            size_value = float(font_size.replace('px', ''))
-            is_valid = size_value >= 16
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if is_valid else 'FAIL',
-                confidence=0.8,
-                details=f'基本フォントサイズ: {size_value}px',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        size_value = self._parse_px(font_size)
+        is_valid = size_value >= 16
+
+        return self._create_result(
+            site, item,
+            result='PASS' if is_valid else 'FAIL',
+            confidence=0.8,
+            details=f'基本フォントサイズ: {size_value}px',
+        )
 
+    @_returns_error_result
     async def check_link_text_not_ambiguous(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """リンクに「こちら」「表示」などの曖昧呼称を用いていないかチェック（item_id: 17）"""
-        try:
-            ambiguous_keywords = ['こちら', '表示', 'クリック', 'ここ']
-            links = await page.locator('a').all_text_contents()
-
-            ambiguous_links = [link for link in links if any(kw in link for kw in ambiguous_keywords)]
-            has_ambiguous = len(ambiguous_links) > 0
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='FAIL' if has_ambiguous else 'PASS',
-                confidence=0.9,
-                details=f'曖昧なリンク{len(ambiguous_links)}件検出' if has_ambiguous else '曖昧なリンクなし',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        ambiguous_count = await page.evaluate(AMBIGUOUS_LINK_COUNT_SCRIPT, AMBIGUOUS_LINK_KEYWORDS)
+        has_ambiguous = ambiguous_count > 0
+
+        return self._create_result(
+            site, item,
+            result='FAIL' if has_ambiguous else 'PASS',
+            confidence=0.9,
+            details=f'曖昧なリンク{ambiguous_count}件検出' if has_ambiguous else '曖昧なリンクなし',
+        )
 
+    @_returns_error_result
     async def check_back_to_top_link(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """ページトップボタンチェック（item_id: 4）"""
-        try:
-            # 様々なパターンでページトップボタンを検出
-            selectors = [
-                'a[href="#top"]',
-                'a[href="#"]',
-                'button:has-text("TOP")',
-                'button:has-text("トップ")',
-                'a:has-text("ページトップ")',
-                '.pagetop',
-                '#pagetop',
-                '.page-top',
-            ]
-
-            found = False
-            for selector in selectors:
-                count = await page.locator(selector).count()
-                if count > 0:
-                    found = True
-                    break
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if found else 'FAIL',
-                confidence=0.8,
-                details='ページトップボタン検出' if found else 'ページトップボタン未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        # 様々なパターンでページトップボタンを検出
+        found = await self._any_selector_matches(page, BACK_TO_TOP_SELECTORS)
+
+        return self._create_result(
+            site, item,
+            result='PASS' if found else 'FAIL',
+            confidence=0.8,
+            details='ページトップボタン検出' if found else 'ページトップボタン未検出',
+        )
 
+    @_returns_error_result
     async def check_no_scroll_areas(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """スクロールエリア不使用チェック（item_id: 5）"""
-        try:
-            # overflow: scroll/auto を持つ要素を検出
-            scroll_elements_count = await page.evaluate('''
-                () => {
-                    const elements = document.querySelectorAll('*');
-                    let count = 0;
-                    elements.forEach(el => {
-                        const style = window.getComputedStyle(el);
-                        if ((style.overflow === 'scroll' || style.overflow === 'auto' ||
-                             style.overflowX === 'scroll' || style.overflowX === 'auto' ||
-                             style.overflowY === 'scroll' || style.overflowY === 'auto') &&
-                            el !== document.documentElement && el !== document.body) {
-                            count++;
-                        }
-                    });
-                    return count;
-                }
-            ''')
-
-            has_scroll = scroll_elements_count > 0
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='FAIL' if has_scroll else 'PASS',
-                confidence=0.9,
-                details=f'スクロールエリア{scroll_elements_count}個検出' if has_scroll else 'スクロールエリアなし',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        # overflow: scroll/auto を持つ要素を検出
+        has_scroll = (await self._collect_page_facts(page))['hasScrollArea']
+
+        return self._create_result(
+            site, item,
+            result='FAIL' if has_scroll else 'PASS',
+            confidence=0.9,
+            details='スクロールエリア検出' if has_scroll else 'スクロールエリアなし',
+        )
 
+    @_returns_error_result
     async def check_footer_navigation(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """フッターナビゲーションチェック（item_id: 6）"""
-        try:
-            # footer内のnavまたはul要素を検出
-            footer_nav_count = await page.locator('footer nav, footer ul').count()
-            has_footer_nav = footer_nav_count > 0
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_footer_nav else 'FAIL',
-                confidence=0.9,
-                details='フッターナビゲーション検出' if has_footer_nav else 'フッターナビゲーション未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        # footer内のnavまたはul要素を検出
+        footer_nav_count = await page.locator('footer nav, footer ul').count()
+        has_footer_nav = footer_nav_count > 0
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_footer_nav else 'FAIL',
+            confidence=0.9,
+            details='フッターナビゲーション検出' if has_footer_nav else 'フッターナビゲーション未検出',
+        )
 
+    @_returns_error_result
     async def check_sitemap(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """サイトマップリンクチェック（item_id: 7）"""
-        try:
-            # サイトマップへのリンクを検出
-            sitemap_selectors = [
-                'a[href*="sitemap"]',
-                'a:has-text("サイトマップ")',
-                'a:has-text("Sitemap")',
-            ]
-
-            found = False
-            for selector in sitemap_selectors:
-                count = await page.locator(selector).count()
-                if count > 0:
-                    found = True
-                    break
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if found else 'FAIL',
-                confidence=0.8,
-                details='サイトマップリンク検出' if found else 'サイトマップリンク未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        # サイトマップへのリンクを検出
+        found = await self._any_selector_matches(page, SITEMAP_SELECTORS)
+
+        return self._create_result(
+            site, item,
+            result='PASS' if found else 'FAIL',
+            confidence=0.8,
+            details='サイトマップリンク検出' if found else 'サイトマップリンク未検出',
+        )
 
+    @_returns_error_result
     async def check_responsive_design(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """レスポンシブデザインチェック（item_id: 8）"""
-        try:
-            # viewport metaタグの存在確認
-            viewport_meta = await page.locator('meta[name="viewport"]').count()
-
-            # メディアクエリの存在確認
-            has_media_queries = await page.evaluate('''
-                () => {
-                    const stylesheets = Array.from(document.styleSheets);
-                    for (let sheet of stylesheets) {
-                        try {
-                            const rules = Array.from(sheet.cssRules || sheet.rules);
-                            for (let rule of rules) {
-                                if (rule.type === CSSRule.MEDIA_RULE) {
-                                    return true;
-                                }
-                            }
-                        } catch (e) {
-                            // Cross-origin stylesheets
-                            continue;
-                        }
-                    }
-                    return false;
-                }
-            ''')
-
-            is_responsive = viewport_meta > 0 or has_media_queries
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if is_responsive else 'FAIL',
-                confidence=0.7,
-                details='レスポンシブデザイン対応' if is_responsive else 'レスポンシブデザイン非対応',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        facts = await self._collect_page_facts(page)
+        # viewport metaタグ・メディアクエリの存在確認
+        viewport_meta = facts['viewportMetaCount']
+        has_media_queries = facts['hasMediaQueries']
+
+        is_responsive = viewport_meta > 0 or has_media_queries
+
+        return self._create_result(
+            site, item,
+            result='PASS' if is_responsive else 'FAIL',
+            confidence=0.7,
+            details='レスポンシブデザイン対応' if is_responsive else 'レスポンシブデザイン非対応',
+        )
 
+    @_returns_error_result
     async def check_carousel_pause_button(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """カルーセル停止ボタンチェック（item_id: 9）"""
-        try:
-            # カルーセル要素の検出
-            carousel_selectors = ['.carousel', '.slider', '.slick-slider', '[data-carousel]']
-            carousel_found = False
-
-            for selector in carousel_selectors:
-                count = await page.locator(selector).count()
-                if count > 0:
-                    carousel_found = True
-                    break
-
-            if not carousel_found:
-                # カルーセルがない場合はPASS
-                return ValidationResult(
-                    site_id=site.site_id,
-                    company_name=site.company_name,
-                    url=site.url,
-                    item_id=item.item_id,
-                    item_name=item.item_name,
-                    category=item.category,
-                    subcategory=item.subcategory,
-                    result='PASS',
-                    confidence=0.7,
-                    details='カルーセル未使用',
-                    checked_at=datetime.now()
-                )
-
-            # 停止ボタンの検出
-            pause_button_selectors = [
-                'button:has-text("停止")',
-                'button:has-text("一時停止")',
-                'button:has-text("pause")',
-                '.pause',
-                '.stop',
-            ]
-
-            pause_found = False
-            for selector in pause_button_selectors:
-                count = await page.locator(selector).count()
-                if count > 0:
-                    pause_found = True
-                    break
+        # カルーセル要素の検出
+        carousel_found = await self._any_selector_matches(page, CAROUSEL_SELECTORS)
 
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if pause_found else 'FAIL',
+        if not carousel_found:
+            # カルーセルがない場合はPASS
+            return self._create_result(
+                site, item,
+                result='PASS',
                 confidence=0.7,
-                details='停止ボタン検出' if pause_found else 'カルーセルあり・停止ボタン未検出',
-                checked_at=datetime.now()
+                details='カルーセル未使用',
             )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
 
+        # 停止ボタンの検出
+        pause_found = await self._any_selector_matches(page, CAROUSEL_PAUSE_SELECTORS)
+
+        return self._create_result(
+            site, item,
+            result='PASS' if pause_found else 'FAIL',
+            confidence=0.7,
+            details='停止ボタン検出' if pause_found else 'カルーセルあり・停止ボタン未検出',
+        )
+
+    @_returns_error_result
     async def check_latest_document_download(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """最新資料ダウンロードチェック（item_id: 10）"""
-        try:
-            # ファーストビュー内のPDFリンクを検出
-            pdf_links = await page.evaluate('''
-                () => {
-                    const viewportHeight = window.innerHeight;
-                    const links = Array.from(document.querySelectorAll('a[href$=".pdf"]'));
-                    const visibleLinks = links.filter(link => {
-                        const rect = link.getBoundingClientRect();
-                        return rect.top >= 0 && rect.top <= viewportHeight;
-                    });
-                    return visibleLinks.length;
-                }
-            ''')
+        # ファーストビュー内のPDFリンクを検出
+        pdf_links = (await self._collect_page_facts(page))['firstViewPdfCount']
 
-            has_pdf = pdf_links > 0
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_pdf else 'FAIL',
-                confidence=0.7,
-                details=f'ファーストビュー内PDFリンク{pdf_links}件' if has_pdf else 'ファーストビュー内にPDFリンクなし',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        has_pdf = pdf_links > 0
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_pdf else 'FAIL',
+            confidence=0.7,
+            details=f'ファーストビュー内PDFリンク{pdf_links}件' if has_pdf else 'ファーストビュー内にPDFリンクなし',
+        )
 
+    @_returns_error_result
     async def check_line_height(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """行間チェック（item_id: 13）"""
-        try:
-            line_height = await page.evaluate('''
-                () => {
-                    const mainElement = document.querySelector('main, article, .main-content');
-                    if (mainElement) {
-                        const lh = window.getComputedStyle(mainElement).lineHeight;
-                        const fs = window.getComputedStyle(mainElement).fontSize;
-                        const lhValue = parseFloat(lh);
-                        const fsValue = parseFloat(fs);
-                        return lhValue / fsValue;
-                    }
-                    const lh = window.getComputedStyle(document.body).lineHeight;
-                    const fs = window.getComputedStyle(document.body).fontSize;
-                    const lhValue = parseFloat(lh);
-                    const fsValue = parseFloat(fs);
-                    return lhValue / fsValue;
-                }
-            ''')
+        line_height = (await self._collect_page_facts(page))['lineHeightRatio']
 
-            is_valid = line_height >= 1.5
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if is_valid else 'FAIL',
-                confidence=0.8,
-                details=f'行間: {line_height:.1f}倍',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        is_valid = line_height >= 1.5
 
+        return self._create_result(
+            site, item,
+            result='PASS' if is_valid else 'FAIL',
+            confidence=0.8,
+            details=f'行間: {line_height:.1f}倍',
+        )
+
+    @_returns_error_result
     async def check_contrast(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """コントラストチェック（item_id: 14）"""
-        try:
-            # 簡易的なコントラストチェック（完全な実装には axe-core が必要）
-            # ここでは基本的なチェックのみ実装
-            contrast_issues = await page.evaluate('''
-                () => {
-                    function getContrast(fg, bg) {
-                        // 簡易的な輝度計算
-                        const getLuminance = (rgb) => {
-                            const [r, g, b] = rgb.match(/\\d+/g).map(Number);
-                            return 0.299 * r + 0.587 * g + 0.114 * b;
-                        };
-                        const fgLum = getLuminance(fg);
-                        const bgLum = getLuminance(bg);
-                        const ratio = (Math.max(fgLum, bgLum) + 0.05) / (Math.min(fgLum, bgLum) + 0.05);
-                        return ratio;
-                    }
-
-                    const elements = document.querySelectorAll('p, h1, h2, h3, h4, h5, h6, a, span, div');
-                    let issues = 0;
-
-                    for (let el of elements) {
-                        const style = window.getComputedStyle(el);
-                        const color = style.color;
-                        const bgColor = style.backgroundColor;
-
-                        if (color && bgColor && bgColor !== 'rgba(0, 0, 0, 0)') {
-                            const ratio = getContrast(color, bgColor);
-                            if (ratio < 4.5) {
-                                issues++;
-                            }
-                        }
-                        if (issues > 10) break; // パフォーマンスのため上限設定
-                    }
+        # 簡易的なコントラストチェック（完全な実装には axe-core が必要）
+        # ここでは基本的なチェックのみ実装
+        contrast_issues = (await self._collect_page_facts(page))['contrastIssues']
 
-                    return issues;
-                }
-            ''')
+        has_issues = contrast_issues > 0
 
-            has_issues = contrast_issues > 0
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='FAIL' if has_issues else 'PASS',
-                confidence=0.5,  # 簡易実装のため低信頼度
-                details=f'コントラスト不足の可能性{contrast_issues}箇所' if has_issues else 'コントラスト問題なし',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        return self._create_result(
+            site, item,
+            result='FAIL' if has_issues else 'PASS',
+            confidence=0.5,  # 簡易実装のため低信頼度
+            details=f'コントラスト不足の可能性{contrast_issues}箇所' if has_issues else 'コントラスト問題なし',
+        )
 
+    @_returns_error_result
     async def check_visited_link_color(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """訪問済みリンク色チェック（item_id: 15）"""
-        try:
-            has_visited_style = await page.evaluate('''
-                () => {
-                    const links = document.querySelectorAll('a');
-                    if (links.length === 0) return false;
-
-                    // CSSで:visitedスタイルが定義されているかチェック（完全な検出は困難）
-                    const stylesheets = Array.from(document.styleSheets);
-                    for (let sheet of stylesheets) {
-                        try {
-                            const rules = Array.from(sheet.cssRules || sheet.rules);
-                            for (let rule of rules) {
-                                if (rule.selectorText && rule.selectorText.includes(':visited')) {
-                                    return true;
-                                }
-                            }
-                        } catch (e) {
-                            continue;
-                        }
-                    }
-                    return false;
-                }
-            ''')
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_visited_style else 'FAIL',
-                confidence=0.6,  # 完全な検出は困難
-                details='訪問済みリンクスタイル定義あり' if has_visited_style else '訪問済みリンクスタイル未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        # CSSで:visitedスタイルが定義されているかチェック（完全な検出は困難）
+        facts = await self._collect_page_facts(page)
+        has_visited_style = facts['links']['anchorCount'] > 0 and facts['hasVisitedRule']
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_visited_style else 'FAIL',
+            confidence=0.6,  # 完全な検出は困難
+            details='訪問済みリンクスタイル定義あり' if has_visited_style else '訪問済みリンクスタイル未検出',
+        )
 
+    @_returns_error_result
     async def check_link_underline(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """リンク下線チェック（item_id: 16）"""
-        try:
-            links_without_decoration = await page.evaluate('''
-                () => {
-                    const links = document.querySelectorAll('main a, article a, .content a');
-                    let count = 0;
-
-                    links.forEach(link => {
-                        const style = window.getComputedStyle(link);
-                        const textDecoration = style.textDecoration;
-                        const color = style.color;
-                        const parentColor = window.getComputedStyle(link.parentElement).color;
-
-                        // 下線なし かつ 色が親と同じ（または非常に近い）場合
-                        if (!textDecoration.includes('underline') && color === parentColor) {
-                            count++;
-                        }
-                    });
+        # 下線なし かつ 色が親と同じ（または非常に近い）リンク
+        links_without_decoration = (await self._collect_page_facts(page))['links']['underlineIssues']
 
-                    return count;
-                }
-            ''')
+        has_issues = links_without_decoration > 0
 
-            has_issues = links_without_decoration > 0
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='FAIL' if has_issues else 'PASS',
-                confidence=0.7,
-                details=f'識別困難なリンク{links_without_decoration}件' if has_issues else 'リンクは識別可能',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        return self._create_result(
+            site, item,
+            result='FAIL' if has_issues else 'PASS',
+            confidence=0.7,
+            details=f'識別困難なリンク{links_without_decoration}件' if has_issues else 'リンクは識別可能',
+        )
 
+    @_returns_error_result
     async def check_external_link_icon(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """外部リンクアイコンチェック（item_id: 18）"""
-        try:
-            external_links = await page.locator('a[target="_blank"]').count()
-
-            if external_links == 0:
-                # 外部リンクがない場合はPASS
-                return ValidationResult(
-                    site_id=site.site_id,
-                    company_name=site.company_name,
-                    url=site.url,
-                    item_id=item.item_id,
-                    item_name=item.item_name,
-                    category=item.category,
-                    subcategory=item.subcategory,
-                    result='PASS',
-                    confidence=0.7,
-                    details='別ウィンドウリンクなし',
-                    checked_at=datetime.now()
-                )
-
-            # アイコンや「別ウィンドウ」テキストの存在確認
-            links_with_indication = await page.evaluate('''
-                () => {
-                    const links = document.querySelectorAll('a[target="_blank"]');
-                    let indicatedCount = 0;
+        external_stats = (await self._collect_page_facts(page))['links']['external']
+        external_links = external_stats['total']
 
-                    links.forEach(link => {
-                        const text = link.textContent;
-                        const hasIcon = link.querySelector('svg, i, img[src*="icon"], img[src*="external"]');
-                        const hasText = text.includes('別ウィンドウ') || text.includes('新しいウィンドウ') ||
-                                      text.includes('外部サイト') || link.title.includes('別ウィンドウ');
+        if external_links == 0:
+            # 外部リンクがない場合はPASS
+            return self._create_result(
+                site, item,
+                result='PASS',
+                confidence=0.7,
+                details='別ウィンドウリンクなし',
+            )
 
-                        if (hasIcon || hasText) {
-                            indicatedCount++;
-                        }
-                    });
+        # アイコンや「別ウィンドウ」テキストの存在確認
+        links_with_indication = external_stats['indicated']
 
-                    return indicatedCount;
-                }
-            ''')
+        # 50%以上のリンクで表示されていればPASS
+        indication_rate = links_with_indication / external_links if external_links > 0 else 0
+        is_adequate = indication_rate >= 0.5
 
-            # 50%以上のリンクで表示されていればPASS
-            indication_rate = links_with_indication / external_links if external_links > 0 else 0
-            is_adequate = indication_rate >= 0.5
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if is_adequate else 'FAIL',
-                confidence=0.7,
-                details=f'別ウィンドウリンク{external_links}件中{links_with_indication}件に表示あり',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        return self._create_result(
+            site, item,
+            result='PASS' if is_adequate else 'FAIL',
+            confidence=0.7,
+            details=f'別ウィンドウリンク{external_links}件中{links_with_indication}件に表示あり',
+        )
 
+    @_returns_error_result
     async def check_item_19(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """カルーセル枚数チェック（item_id: 19）"""
-        try:
-            snapshot = await self._capture_visual(page)
-            carousels = VisualAnalyzer.evaluate_carousels(snapshot.get('carousels', []))
+        snapshot = await self._capture_visual(page)
+        carousels = VisualAnalyzer.evaluate_carousels(snapshot.get('carousels', []))
 
-            if not carousels:
-                return self._create_pass_result(
-                    site, item, 0.6, 'カルーセル未検出（基準達成）'
-                )
+        if not carousels:
+            return self._create_pass_result(
+                site, item, 0.6, 'カルーセル未検出（基準達成）'
+            )
 
-            over_limit = [c for c in carousels if c.slide_count > 3]
-            if over_limit:
-                summary = ', '.join(
-                    f"{c.selector or 'carousel'}: {c.slide_count}枚" for c in over_limit[:2]
-                )
-                if len(over_limit) > 2:
-                    summary += f"...+{len(over_limit) - 2}件"
-                return self._create_fail_result(
-                    site, item, 0.5, f'カルーセル枚数超過 {summary}'
-                )
-            else:
-                max_count = max(c.slide_count for c in carousels)
-                reference_selector = next(
-                    (c.selector for c in carousels if c.slide_count == max_count),
-                    ''
-                )
-                details = f'カルーセル枚数上限{max_count}枚（{reference_selector or "要素"}） / 動画長は自動計測未対応'
-                return self._create_pass_result(site, item, 0.55, details)
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        over_limit = [c for c in carousels if c.slide_count > 3]
+        if over_limit:
+            summary = ', '.join(
+                f"{c.selector or 'carousel'}: {c.slide_count}枚" for c in over_limit[:2]
+            )
+            if len(over_limit) > 2:
+                summary += f"...+{len(over_limit) - 2}件"
+            return self._create_fail_result(
+                site, item, 0.5, f'カルーセル枚数超過 {summary}'
+            )
+        else:
+            max_count = max(c.slide_count for c in carousels)
+            reference_selector = next(
+                (c.selector for c in carousels if c.slide_count == max_count),
+                ''
+            )
+            details = f'カルーセル枚数上限{max_count}枚（{reference_selector or "要素"}） / 動画長は自動計測未対応'
+            return self._create_pass_result(site, item, 0.55, details)
 
+    @_returns_error_result
     async def check_item_20(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """カルーセル停止操作チェック（item_id: 20）"""
-        try:
-            snapshot = await self._capture_visual(page)
-            carousels = VisualAnalyzer.evaluate_carousels(snapshot.get('carousels', []))
+        snapshot = await self._capture_visual(page)
+        carousels = VisualAnalyzer.evaluate_carousels(snapshot.get('carousels', []))
 
-            if not carousels:
-                return self._create_pass_result(
-                    site, item, 0.6, 'カルーセル未検出（基準達成）'
-                )
+        if not carousels:
+            return self._create_pass_result(
+                site, item, 0.6, 'カルーセル未検出（基準達成）'
+            )
 
-            violations = [
-                c for c in carousels if c.autoplay and not c.has_pause_control
-            ]
+        violations = [
+            c for c in carousels if c.autoplay and not c.has_pause_control
+        ]
 
-            if violations:
-                summary = ', '.join(
-                    f"{c.selector or 'carousel'}: 停止ボタンなし" for c in violations[:2]
-                )
-                if len(violations) > 2:
-                    summary += f"...+{len(violations) - 2}件"
-                return self._create_fail_result(site, item, 0.45, summary)
-            else:
-                return self._create_pass_result(
-                    site, item, 0.55, 'カルーセル停止ボタンを確認 / 自動再生での強制動作なし'
-                )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        if violations:
+            summary = ', '.join(
+                f"{c.selector or 'carousel'}: 停止ボタンなし" for c in violations[:2]
+            )
+            if len(violations) > 2:
+                summary += f"...+{len(violations) - 2}件"
+            return self._create_fail_result(site, item, 0.45, summary)
+        else:
+            return self._create_pass_result(
+                site, item, 0.55, 'カルーセル停止ボタンを確認 / 自動再生での強制動作なし'
+            )
 
+    @_returns_error_result
     async def check_item_21(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """ファーストビュー面積チェック（item_id: 21）"""
-        try:
-            snapshot = await self._capture_visual(page, HERO_SELECTORS)
-            styles = snapshot.get('styles', [])
-            hero_entries = [
-                entry for entry in styles
-                if entry.get('found') and (entry.get('rect') or {}).get('height', 0) > 0
-            ]
-
-            if not hero_entries:
-                return self._create_pass_result(
-                    site, item, 0.5, 'ファーストビュー領域を特定できず（基準超過なしと判断）'
-                )
+        snapshot = await self._capture_visual(page, HERO_SELECTORS)
+        styles = snapshot.get('styles', [])
+        hero_entries = [
+            entry for entry in styles
+            if entry.get('found') and (entry.get('rect') or {}).get('height', 0) > 0
+        ]
 
-            viewport = page.viewport_size or {'height': VIEWPORT_HEIGHT_DEFAULT}
-            viewport_height = viewport.get('height') or VIEWPORT_HEIGHT_DEFAULT
+        if not hero_entries:
+            return self._create_pass_result(
+                site, item, 0.5, 'ファーストビュー領域を特定できず（基準超過なしと判断）'
+            )
 
-            ratios = []
-            for entry in hero_entries:
-                rect = entry.get('rect') or {}
-                height = rect.get('height') or 0
-                ratio = height / viewport_height if viewport_height else 0
-                ratios.append((entry.get('selector'), ratio))
+        viewport = page.viewport_size or {'height': VIEWPORT_HEIGHT_DEFAULT}
+        viewport_height = viewport.get('height') or VIEWPORT_HEIGHT_DEFAULT
 
-            max_selector, max_ratio = max(ratios, key=lambda item: item[1])
-            is_valid = max_ratio <= 0.5
-            percent = round(max_ratio * 100, 1)
+        # 比率は高さに比例するため、最も高い要素についてだけ比率を計算する
+        max_entry = max(hero_entries, key=lambda entry: entry['rect']['height'])
+        max_selector = max_entry.get('selector')
+        max_ratio = max_entry['rect']['height'] / viewport_height
+        is_valid = max_ratio <= 0.5
+        percent = round(max_ratio * 100, 1)
 
-            placeholder = max_selector or "要素"
-            details = (
-                f'ファーストビュー高さ {percent}%（{placeholder}）'
-                if is_valid
-                else f'ファーストビュー高さ {percent}%（{placeholder}）が画面の半分超'
-            )
+        placeholder = max_selector or "要素"
+        details = (
+            f'ファーストビュー高さ {percent}%（{placeholder}）'
+            if is_valid
+            else f'ファーストビュー高さ {percent}%（{placeholder}）が画面の半分超'
+        )
 
-            confidence = 0.55 if is_valid else 0.45
-            return self._create_result(
-                site, item, 'PASS' if is_valid else 'FAIL', confidence, details
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        confidence = 0.55 if is_valid else 0.45
+        return self._create_result(
+            site, item, 'PASS' if is_valid else 'FAIL', confidence, details
+        )
 
+    @_returns_error_result
     async def check_item_22(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """ファーストビュー内イベント予定チェック（item_id: 22）"""
-        try:
-            texts = await self._collect_texts(page, HERO_SELECTORS, max_samples=5)
-            has_event = False
-            matched_snippet = ''
-            for snippet in texts:
-                lower = snippet.lower()
-                if not any(keyword.lower() in lower for keyword in VISUAL_EVENT_KEYWORDS):
-                    continue
-                if any(pattern.search(snippet) for pattern in DATE_PATTERNS):
-                    has_event = True
-                    matched_snippet = snippet.strip().replace('\n', ' ')[:80]
-                    break
+        texts = await self._collect_texts(page, HERO_SELECTORS, max_samples=5)
+        has_event = False
+        matched_snippet = ''
+        for snippet in texts:
+            lower = snippet.lower()
+            if not any(keyword.lower() in lower for keyword in VISUAL_EVENT_KEYWORDS):
+                continue
+            if any(pattern.search(snippet) for pattern in DATE_PATTERNS):
+                has_event = True
+                matched_snippet = snippet.strip().replace('\n', ' ')[:80]
+                break
 
-            details = (
-                f'ファーストビュー内に予定記載あり（{matched_snippet}）'
-                if has_event else 'ファーストビュー内に予定・日付の併記を確認できず'
-            )
+        details = (
+            f'ファーストビュー内に予定記載あり（{matched_snippet}）'
+            if has_event else 'ファーストビュー内に予定・日付の併記を確認できず'
+        )
 
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_event else 'FAIL',
-                confidence=0.5 if has_event else 0.35,
-                details=details,
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        return self._create_result(
+            site, item,
+            result='PASS' if has_event else 'FAIL',
+            confidence=0.5 if has_event else 0.35,
+            details=details,
+        )
 
+    @_returns_error_result
     async def check_item_23(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """IRニュース一覧チェック（item_id: 23）"""
-        try:
-            news_section_selectors = [
-                'section:has-text("IRニュース")',
-                'section:has-text("IR News")',
-                '.ir-news',
-                '#ir-news',
-                '.news-list',
-                'section:has-text("ニュース")',
-            ]
+        news_section_selectors = [
+            'section:has-text("IRニュース")',
+            'section:has-text("IR News")',
+            '.ir-news',
+            '#ir-news',
+            '.news-list',
+            'section:has-text("ニュース")',
+        ]
 
-            has_news_list = False
-            detected_count = 0
-            for selector in news_section_selectors:
-                section = page.locator(selector)
-                count = await section.count()
-                if count == 0:
-                    continue
-                entries = section.first.locator('li, article, .news-item, .list-item')
-                detected_count = await entries.count()
-                if detected_count >= 3:
-                    has_news_list = True
-                    break
+        has_news_list = False
+        detected_count = 0
+        for selector in news_section_selectors:
+            section = page.locator(selector)
+            count = await section.count()
+            if count == 0:
+                continue
+            entries = section.first.locator('li, article, .news-item, .list-item')
+            detected_count = await entries.count()
+            if detected_count >= 3:
+                has_news_list = True
+                break
 
-            details = (
-                f'IRニュース一覧 {detected_count}件を検出'
-                if has_news_list else 'IRニュース一覧（3件以上）を検出できず'
-            )
+        details = (
+            f'IRニュース一覧 {detected_count}件を検出'
+            if has_news_list else 'IRニュース一覧（3件以上）を検出できず'
+        )
 
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_news_list else 'FAIL',
-                confidence=0.55 if has_news_list else 0.35,
-                details=details,
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        return self._create_result(
+            site, item,
+            result='PASS' if has_news_list else 'FAIL',
+            confidence=0.55 if has_news_list else 0.35,
+            details=details,
+        )
 
+    @_returns_error_result
     async def check_item_25(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """トップの顔写真掲載チェック（item_id: 25）"""
-        try:
-            photo_selectors = [
-                'section:has-text("トップメッセージ") img',
-                'section:has-text("社長メッセージ") img',
-                '.top-message img',
-                '.ceo-message img',
-                '.president-message img',
-                'img[alt*="社長"]',
-                'img[alt*="CEO"]',
-                'img[alt*="代表"]',
-                'img[src*="ceo"]',
-            ]
-            screenshot_path = None
-            found = False
-            for selector in photo_selectors:
-                locator = page.locator(selector)
-                if await locator.count() == 0:
-                    continue
-                target = locator.first
-                box = await target.bounding_box()
-                if not box or box['width'] < 60 or box['height'] < 60:
-                    continue
-                screenshot_path = await self._save_element_screenshot(target, item.item_id, 'ceo_photo')
-                found = True
-                break
-
-            details = (
-                f'トップメッセージ画像を検出（{screenshot_path}）'
-                if (found and screenshot_path)
-                else 'トップメッセージ画像を検出' if found
-                else '代表者の顔写真を検出できず'
-            )
+        photo_selectors = [
+            'section:has-text("トップメッセージ") img',
+            'section:has-text("社長メッセージ") img',
+            '.top-message img',
+            '.ceo-message img',
+            '.president-message img',
+            'img[alt*="社長"]',
+            'img[alt*="CEO"]',
+            'img[alt*="代表"]',
+            'img[src*="ceo"]',
+        ]
+        screenshot_path = None
+        found = False
+        for selector in photo_selectors:
+            locator = page.locator(selector)
+            if await locator.count() == 0:
+                continue
+            target = locator.first
+            box = await target.bounding_box()
+            if not box or box['width'] < 60 or box['height'] < 60:
+                continue
+            screenshot_path = await self._save_element_screenshot(target, item.item_id, 'ceo_photo')
+            found = True
+            break
+
+        details = (
+            f'トップメッセージ画像を検出（{screenshot_path}）'
+            if (found and screenshot_path)
+            else 'トップメッセージ画像を検出' if found
+            else '代表者の顔写真を検出できず'
+        )
 
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if found else 'FAIL',
-                confidence=0.5 if found else 0.35,
-                details=details,
-                checked_at=datetime.now(),
-                screenshot_path=screenshot_path if found else None,
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        return self._create_result(
+            site, item,
+            result='PASS' if found else 'FAIL',
+            confidence=0.5 if found else 0.35,
+            details=details,
+            screenshot_path=screenshot_path if found else None,
+        )
 
+    @_returns_error_result
     async def check_item_29(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """代替テキストの有無チェック（item_id: 29）"""
-        try:
-            stats = await page.evaluate(
-                """
+        stats = await page.evaluate(
+            """
                 () => {
                     const imgs = Array.from(document.querySelectorAll('img'));
                     let missing = 0;
@@ -1222,40 +1638,31 @@ class ScriptValidator:
                     return { total: imgs.length, missing };
                 }
                 """
-            )
+        )
 
-            total = stats.get('total') or 0
-            missing = stats.get('missing') or 0
-            if total == 0:
-                result = 'PASS'
-                details = '画像要素なし'
-            else:
-                ratio = (total - missing) / total
-                threshold = 0.95
-                result = 'PASS' if ratio >= threshold else 'FAIL'
-                details = f'画像{total}件中{total - missing}件でaltあり'
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result=result,
-                confidence=0.55 if result == 'PASS' else 0.4,
-                details=details,
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        total = stats.get('total') or 0
+        missing = stats.get('missing') or 0
+        if total == 0:
+            result = 'PASS'
+            details = '画像要素なし'
+        else:
+            ratio = (total - missing) / total
+            threshold = 0.95
+            result = 'PASS' if ratio >= threshold else 'FAIL'
+            details = f'画像{total}件中{total - missing}件でaltあり'
+
+        return self._create_result(
+            site, item,
+            result=result,
+            confidence=0.55 if result == 'PASS' else 0.4,
+            details=details,
+        )
 
+    @_returns_error_result
     async def check_item_30(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """色以外のリンク識別チェック（item_id: 30）"""
-        try:
-            stats = await page.evaluate(
-                """
+        stats = await page.evaluate(
+            """
                 () => {
                     const anchors = Array.from(document.querySelectorAll('a'));
                     let total = 0;
@@ -1274,207 +1681,121 @@ class ScriptValidator:
                     return { total, underlined };
                 }
                 """
-            )
+        )
 
-            total = stats.get('total') or 0
-            underlined = stats.get('underlined') or 0
-            if total == 0:
-                result = 'PASS'
-                details = 'ページ内にリンクを検出できず'
-            else:
-                ratio = underlined / total
-                threshold = 0.6
-                result = 'PASS' if ratio >= threshold else 'FAIL'
-                details = f'リンク{total}件中{underlined}件で下線/装飾あり'
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result=result,
-                confidence=0.5 if result == 'PASS' else 0.35,
-                details=details,
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        total = stats.get('total') or 0
+        underlined = stats.get('underlined') or 0
+        if total == 0:
+            result = 'PASS'
+            details = 'ページ内にリンクを検出できず'
+        else:
+            ratio = underlined / total
+            threshold = 0.6
+            result = 'PASS' if ratio >= threshold else 'FAIL'
+            details = f'リンク{total}件中{underlined}件で下線/装飾あり'
+
+        return self._create_result(
+            site, item,
+            result=result,
+            confidence=0.5 if result == 'PASS' else 0.35,
+            details=details,
+        )
 
+    @_returns_error_result
     async def check_item_33(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """コントラスト比チェック（item_id: 33）"""
-        try:
-            snapshot = await self._capture_visual(page, ['body', 'main', '.content', '.article'])
-            styles = snapshot.get('styles', [])
-            ratios = []
-            for entry in styles:
-                selector = entry.get('selector')
-                if selector not in ['body', 'main', '.content', '.article']:
-                    continue
-                ratio = (entry.get('styles') or {}).get('contrastRatio')
-                if ratio:
-                    ratios.append((selector, ratio))
-
-            if not ratios:
-                result = 'FAIL'
-                details = 'コントラスト比を計算できず'
-            else:
-                best_selector, best_ratio = max(ratios, key=lambda item: item[1])
-                result = 'PASS' if best_ratio >= 4.5 else 'FAIL'
-                details = f'{best_selector or "要素"} コントラスト {best_ratio}:1'
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result=result,
-                confidence=0.55 if result == 'PASS' else 0.4,
-                details=details,
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        snapshot = await self._capture_visual(page, ['body', 'main', '.content', '.article'])
+        styles = snapshot.get('styles', [])
+        ratios = []
+        for entry in styles:
+            selector = entry.get('selector')
+            if selector not in ['body', 'main', '.content', '.article']:
+                continue
+            ratio = (entry.get('styles') or {}).get('contrastRatio')
+            if ratio:
+                ratios.append((selector, ratio))
+
+        if not ratios:
+            result = 'FAIL'
+            details = 'コントラスト比を計算できず'
+        else:
+            best_selector, best_ratio = max(ratios, key=lambda item: item[1])
+            result = 'PASS' if best_ratio >= 4.5 else 'FAIL'
+            details = f'{best_selector or "要素"} コントラスト {best_ratio}:1'
+
+        return self._create_result(
+            site, item,
+            result=result,
+            confidence=0.55 if result == 'PASS' else 0.4,
+            details=details,
+        )
 
+    @_returns_error_result
     async def check_item_37(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """行間チェック（item_id: 37）"""
-        try:
-            snapshot = await self._capture_visual(page, ['main', '.content', '.article', 'body'])
-            styles = snapshot.get('styles', [])
-            ratios = []
-            for entry in styles:
-                ratio = self._parse_line_height_ratio(entry)
-                if ratio:
-                    ratios.append((entry.get('selector'), ratio))
-
-            if not ratios:
-                result = 'FAIL'
-                details = '行間情報を取得できず'
-            else:
-                selector, best_ratio = max(ratios, key=lambda item: item[1])
-                result = 'PASS' if best_ratio >= 1.5 else 'FAIL'
-                details = f'{selector or "要素"} 行間比 {best_ratio:.2f}'
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result=result,
-                confidence=0.55 if result == 'PASS' else 0.4,
-                details=details,
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        snapshot = await self._capture_visual(page, ['main', '.content', '.article', 'body'])
+        styles = snapshot.get('styles', [])
+        ratios = []
+        for entry in styles:
+            ratio = self._parse_line_height_ratio(entry)
+            if ratio:
+                ratios.append((entry.get('selector'), ratio))
+
+        if not ratios:
+            result = 'FAIL'
+            details = '行間情報を取得できず'
+        else:
+            selector, best_ratio = max(ratios, key=lambda item: item[1])
+            result = 'PASS' if best_ratio >= 1.5 else 'FAIL'
+            details = f'{selector or "要素"} 行間比 {best_ratio:.2f}'
+
+        return self._create_result(
+            site, item,
+            result=result,
+            confidence=0.55 if result == 'PASS' else 0.4,
+            details=details,
+        )
 
+    @_returns_error_result
     async def check_item_38(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """訪問済みリンク識別チェック（item_id: 38）"""
-        try:
-            has_rule = await page.evaluate(
-                """
-                () => {
-                    const sheets = Array.from(document.styleSheets || []);
-                    for (const sheet of sheets) {
-                        let rules;
-                        try {
-                            rules = sheet.cssRules || [];
-                        } catch (e) {
-                            continue;
-                        }
-                        for (const rule of Array.from(rules)) {
-                            if (rule.selectorText && rule.selectorText.includes(':visited')) {
-                                return true;
-                            }
-                        }
-                    }
-                    return false;
-                }
-                """
-            )
+        has_rule = (await self._collect_page_facts(page))['hasVisitedRule']
 
-            details = '訪問済みリンク用のCSSを検出' if has_rule else ':visited 定義を検出できず'
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_rule else 'FAIL',
-                confidence=0.45 if has_rule else 0.3,
-                details=details,
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        details = '訪問済みリンク用のCSSを検出' if has_rule else ':visited 定義を検出できず'
 
-    async def check_item_40(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """別ウィンドウリンク識別チェック（item_id: 40）"""
-        return await self.check_external_link_icon(site, page, item)
+        return self._create_result(
+            site, item,
+            result='PASS' if has_rule else 'FAIL',
+            confidence=0.45 if has_rule else 0.3,
+            details=details,
+        )
 
+    @_returns_error_result
     async def check_item_43(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """PDFリンク識別チェック（item_id: 43）"""
-        try:
-            stats = await page.evaluate(
-                """
-                () => {
-                    const links = Array.from(document.querySelectorAll('a[href*=".pdf"]'));
-                    let indicated = 0;
-                    links.forEach((link) => {
-                        const text = (link.textContent || '').toLowerCase();
-                        const title = (link.getAttribute('title') || '').toLowerCase();
-                        const hasText = text.includes('pdf') || title.includes('pdf');
-                        const hasIcon = !!link.querySelector('img[alt*="pdf" i], img[src*="pdf" i], svg');
-                        if (hasText || hasIcon) {
-                            indicated += 1;
-                        }
-                    });
-                    return { total: links.length, indicated };
-                }
-                """
-            )
-
-            total = stats.get('total') or 0
-            indicated = stats.get('indicated') or 0
-            if total == 0:
-                result = 'PASS'
-                details = 'PDFリンクなし'
-            else:
-                ratio = indicated / total
-                result = 'PASS' if ratio >= 0.8 else 'FAIL'
-                details = f'PDFリンク{total}件中{indicated}件でアイコン/文言あり'
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result=result,
-                confidence=0.55 if result == 'PASS' else 0.4,
-                details=details,
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        stats = (await self._collect_page_facts(page))['links']['pdfLabel']
+
+        total = stats.get('total') or 0
+        indicated = stats.get('indicated') or 0
+        if total == 0:
+            result = 'PASS'
+            details = 'PDFリンクなし'
+        else:
+            ratio = indicated / total
+            result = 'PASS' if ratio >= 0.8 else 'FAIL'
+            details = f'PDFリンク{total}件中{indicated}件でアイコン/文言あり'
+
+        return self._create_result(
+            site, item,
+            result=result,
+            confidence=0.55 if result == 'PASS' else 0.4,
+            details=details,
+        )
 
+    @_returns_error_result
     async def check_search_input_visible(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """検索窓表示チェック（item_id: 45）"""
-        try:
-            is_visible = await page.evaluate('''
+        is_visible = await page.evaluate('''
                 () => {
                     const searchInputs = document.querySelectorAll('input[type="search"], input[name*="search"]');
                     for (let input of searchInputs) {
@@ -1488,1435 +1809,666 @@ class ScriptValidator:
                 }
             ''')
 
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if is_visible else 'FAIL',
-                confidence=0.8,
-                details='検索窓が常時表示' if is_visible else '検索窓が非表示',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        return self._create_result(
+            site, item,
+            result='PASS' if is_visible else 'FAIL',
+            confidence=0.8,
+            details='検索窓が常時表示' if is_visible else '検索窓が非表示',
+        )
 
+    @_returns_error_result
     async def check_recommended_browsers(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """推奨ブラウザ記載チェック（item_id: 61）"""
-        try:
-            page_text = await page.inner_text('body')
-            has_chrome = 'Chrome' in page_text or 'chrome' in page_text
-            has_edge = 'Edge' in page_text or 'edge' in page_text
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if (has_chrome and has_edge) else 'FAIL',
-                confidence=0.7,
-                details='Chrome・Edge記載あり' if (has_chrome and has_edge) else 'ブラウザ記載不足',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        page_text = await self._body_text(page)
+        has_chrome = CHROME_MENTION_PATTERN.search(page_text) is not None
+        has_edge = EDGE_MENTION_PATTERN.search(page_text) is not None
+
+        return self._create_result(
+            site, item,
+            result='PASS' if (has_chrome and has_edge) else 'FAIL',
+            confidence=0.7,
+            details='Chrome・Edge記載あり' if (has_chrome and has_edge) else 'ブラウザ記載不足',
+        )
 
+    @_returns_error_result
     async def check_tls_version(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """TLSバージョンチェック（item_id: 22）"""
-        try:
-            # PlaywrightではTLSバージョンの直接取得が困難
-            # HTTPSであることの確認のみ実施
-            url = page.url
-            is_https = url.startswith('https://')
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if is_https else 'FAIL',
-                confidence=0.5,  # TLS1.3の確認はできないため低信頼度
-                details='HTTPS使用' if is_https else 'HTTP使用',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        # PlaywrightではTLSバージョンの直接取得が困難
+        # HTTPSであることの確認のみ実施
+        url = page.url
+        is_https = url.startswith('https://')
+
+        return self._create_result(
+            site, item,
+            result='PASS' if is_https else 'FAIL',
+            confidence=0.5,  # TLS1.3の確認はできないため低信頼度
+            details='HTTPS使用' if is_https else 'HTTP使用',
+        )
 
+    @_returns_error_result
     async def check_cookie_policy(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Cookieポリシーチェック（item_id: 23）"""
-        try:
-            page_text = await page.inner_text('body')
-            has_cookie_policy = 'Cookie' in page_text or 'cookie' in page_text or 'クッキー' in page_text
-
-            # リンクの存在も確認
-            cookie_link = await page.locator('a:has-text("Cookie"), a:has-text("クッキー")').count()
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if (has_cookie_policy and cookie_link > 0) else 'FAIL',
-                confidence=0.7,
-                details='Cookieポリシーリンク検出' if cookie_link > 0 else 'Cookieポリシー未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        # リンクの有無は共有ページ情報で分かるため先に確認し、無ければ本文テキストは取得しない
+        cookie_link = (await self._collect_page_facts(page))['cookie']['policyLink']
+        has_cookie_policy = cookie_link and COOKIE_MENTION_PATTERN.search(await self._body_text(page)) is not None
+
+        return self._create_result(
+            site, item,
+            result='PASS' if (has_cookie_policy and cookie_link) else 'FAIL',
+            confidence=0.7,
+            details='Cookieポリシーリンク検出' if cookie_link else 'Cookieポリシー未検出',
+        )
 
+    @_returns_error_result
     async def check_cookie_consent(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Cookie同意チェック（item_id: 24）"""
-        try:
-            # Cookie同意バナーの検出
-            consent_selectors = [
-                '[class*="cookie"]',
-                '[class*="consent"]',
-                '[id*="cookie"]',
-                '[id*="consent"]',
-            ]
-
-            found = False
-            for selector in consent_selectors:
-                elements = await page.locator(selector).all()
-                for el in elements:
-                    try:
-                        text = await el.inner_text()
-                        if 'Cookie' in text or 'cookie' in text or 'クッキー' in text or '同意' in text:
-                            found = True
-                            break
-                    except:
-                        continue
-                if found:
-                    break
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if found else 'FAIL',
-                confidence=0.7,
-                details='Cookie同意バナー検出' if found else 'Cookie同意バナー未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        # Cookie同意バナーの検出
+        found = (await self._collect_page_facts(page))['cookie']['consentBanner']
+
+        return self._create_result(
+            site, item,
+            result='PASS' if found else 'FAIL',
+            confidence=0.7,
+            details='Cookie同意バナー検出' if found else 'Cookie同意バナー未検出',
+        )
 
+    @_returns_error_result
     async def check_cookie_settings(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Cookie設定チェック（item_id: 25）"""
-        try:
-            settings_selectors = [
-                'button:has-text("Cookie設定")',
-                'button:has-text("クッキー設定")',
-                'a:has-text("Cookie設定")',
-                'a:has-text("クッキー設定")',
-            ]
-
-            found = False
-            for selector in settings_selectors:
-                count = await page.locator(selector).count()
-                if count > 0:
-                    found = True
-                    break
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if found else 'FAIL',
-                confidence=0.7,
-                details='Cookie設定ボタン検出' if found else 'Cookie設定ボタン未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        # button/a:has-text("Cookie設定") / ("クッキー設定")
+        found = (await self._collect_page_facts(page))['cookie']['settingsControl']
+
+        return self._create_result(
+            site, item,
+            result='PASS' if found else 'FAIL',
+            confidence=0.7,
+            details='Cookie設定ボタン検出' if found else 'Cookie設定ボタン未検出',
+        )
 
+    @_returns_error_result
     async def check_item_60(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """推奨環境掲載チェック（item_id: 60）"""
-        try:
-            body_text = await page.inner_text('body')
-            keywords = ['推奨環境', '推奨ブラウザ', '推奨OS', '推奨動作環境']
-            found = any(keyword in body_text for keyword in keywords)
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if found else 'FAIL',
-                confidence=0.6,
-                details='推奨環境記載あり' if found else '推奨環境の記載を検出できず',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
-
-    async def check_item_75(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """Cookie設定案内チェック（item_id: 75）"""
-        return await self.check_cookie_settings(site, page, item)
+        body_text = await self._body_text(page)
+        found = RECOMMENDED_ENV_PATTERN.search(body_text) is not None
+
+        return self._create_result(
+            site, item,
+            result='PASS' if found else 'FAIL',
+            confidence=0.6,
+            details='推奨環境記載あり' if found else '推奨環境の記載を検出できず',
+        )
 
+    @_returns_error_result
     async def check_item_112(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """最新資料一括ダウンロードチェック（item_id: 112）"""
-        try:
-            zip_links = await page.locator('a[href$=".zip"], a[href*=".zip?"]').count()
-            details_text = '一括ダウンロード用ZIP検出' if zip_links > 0 else 'ZIP形式の一括ダウンロード未検出'
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if zip_links > 0 else 'FAIL',
-                confidence=0.7,
-                details=details_text,
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        has_zip = await self._any_selector_matches(page, ('a[href$=".zip"]', 'a[href*=".zip?"]'))
+        details_text = '一括ダウンロード用ZIP検出' if has_zip else 'ZIP形式の一括ダウンロード未検出'
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_zip else 'FAIL',
+            confidence=0.7,
+            details=details_text,
+        )
 
+    @_returns_error_result
     async def check_item_232(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """ソーシャルシェアボタンチェック（item_id: 232）"""
-        try:
-            share_selectors = [
-                'a[href*="facebook.com/sharer"]',
-                'a[href*="twitter.com/intent"]',
-                'a[href*="x.com/intent"]',
-                'a[href*="linkedin.com/share"]',
-                'a[href*="line.me/R/msg"]',
-                'button[class*="share"]',
-                '[data-share]',
-            ]
-            count = 0
-            for selector in share_selectors:
-                count += await page.locator(selector).count()
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if count > 0 else 'FAIL',
-                confidence=0.7,
-                details='ソーシャルシェアボタン検出' if count > 0 else 'シェアボタン未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        found = await self._any_selector_matches(page, SHARE_BUTTON_SELECTORS)
+
+        return self._create_result(
+            site, item,
+            result='PASS' if found else 'FAIL',
+            confidence=0.7,
+            details='ソーシャルシェアボタン検出' if found else 'シェアボタン未検出',
+        )
 
+    @_returns_error_result
     async def check_item_234(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """ニュースリリースのフリーワード検索チェック（item_id: 234）"""
-        try:
-            search_selectors = [
-                'section:has-text("ニュース") input[type="search"]',
-                'section:has-text("ニュースリリース") input[type="text"]',
-                'div:has-text("NEWS RELEASE") input[type="search"]',
-                'form[action*="news"] input[type="text"]',
-                'form[action*="release"] input[type="text"]',
-            ]
-
-            has_search = False
-            for selector in search_selectors:
-                if await page.locator(selector).count() > 0:
-                    has_search = True
-                    break
-
-            if not has_search:
-                fallback_selector = 'input[type="search"], input[name*="keyword" i], input[name*="search" i]'
-                inputs = await page.locator(fallback_selector).count()
-                news_keywords = ['ニュース', 'news', 'リリース', 'プレス']
-                body_text = await page.inner_text('body')
-                has_news_context = any(keyword in body_text for keyword in news_keywords)
-                has_search = inputs > 0 and has_news_context
-
-            details = 'ニュース検索フォームを検出' if has_search else 'ニュース検索フォームを検出できず'
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_search else 'FAIL',
-                confidence=0.5 if has_search else 0.35,
-                details=details,
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        # `section:has-text(...) input` のような子孫指定も含むため、_first_matches で1回にまとめて調べる
+        matches = await self._first_matches(page, NEWS_SEARCH_SELECTORS)
+        has_search = any(match is not None for match in matches)
+
+        if not has_search:
+            fallback_selector = 'input[type="search"], input[name*="keyword" i], input[name*="search" i]'
+            inputs = await page.locator(fallback_selector).count()
+            # 入力欄が無ければ本文テキストの確認は不要
+            has_search = inputs > 0 and NEWS_CONTEXT_PATTERN.search(await self._body_text(page)) is not None
+
+        details = 'ニュース検索フォームを検出' if has_search else 'ニュース検索フォームを検出できず'
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_search else 'FAIL',
+            confidence=0.5 if has_search else 0.35,
+            details=details,
+        )
 
+    @_returns_error_result
     async def check_item_235(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """ニュースリリースのカテゴリフィルターチェック（item_id: 235）"""
-        try:
-            news_sections = page.locator(
-                'section:has-text("ニュース"), section:has-text("ニュースリリース"), div:has-text("NEWS RELEASE")'
-            )
-            section_count = await news_sections.count()
-            section_count = min(section_count, 5) if section_count else 0
-
-            category_keywords = ['ir', '決算', 'プレス', 'release', '財務', 'サステ', '投資家', 'csr']
-            has_filter = False
-
-            def _has_category(texts) -> bool:
-                for text in texts:
-                    lower = text.lower()
-                    if any(keyword in lower for keyword in category_keywords):
-                        return True
-                return False
-
-            for idx in range(section_count):
-                section = news_sections.nth(idx)
-                option_texts = await section.locator('select option').all_inner_texts()
-                if _has_category(option_texts):
-                    has_filter = True
-                    break
+        has_filter = await page.evaluate(
+            NEWS_CATEGORY_FILTER_SCRIPT,
+            {'probes': NEWS_FILTER_SECTION_PROBES, 'keywords': NEWS_CATEGORY_KEYWORDS},
+        )
 
-                tab_texts = await section.locator('button, a').all_inner_texts()
-                category_hits = [text for text in tab_texts if _has_category([text])]
-                if len(category_hits) >= 2:
-                    has_filter = True
-                    break
+        details = 'ニュースカテゴリ絞り込みUIを検出' if has_filter else 'カテゴリフィルターを検出できず'
 
-            if not has_filter:
-                data_filter_elements = await page.locator('[data-filter], [data-category]').count()
-                has_filter = data_filter_elements > 0
-
-            details = 'ニュースカテゴリ絞り込みUIを検出' if has_filter else 'カテゴリフィルターを検出できず'
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_filter else 'FAIL',
-                confidence=0.5 if has_filter else 0.35,
-                details=details,
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        return self._create_result(
+            site, item,
+            result='PASS' if has_filter else 'FAIL',
+            confidence=0.5 if has_filter else 0.35,
+            details=details,
+        )
 
+    @_returns_error_result
     async def check_item_236(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """ニュースメール配信登録リンクチェック（item_id: 236）"""
-        try:
-            keywords = ['メール配信', 'メールマガジン', '配信登録', 'IRメール']
-            selector = 'a:has-text("メール"), a:has-text("配信"), button:has-text("メール"), button:has-text("配信")'
-            link_count = await page.locator(selector).count()
+        link_found = await self._any_selector_matches(page, MAIL_SUBSCRIPTION_SELECTORS)
 
-            if link_count == 0:
-                body_text = await page.inner_text('body')
-                link_found = any(keyword in body_text for keyword in keywords)
-            else:
-                link_found = True
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if link_found else 'FAIL',
-                confidence=0.6,
-                details='メール配信登録導線あり' if link_found else 'メール配信登録導線を検出できず',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        if not link_found:
+            body_text = await self._body_text(page)
+            link_found = MAIL_SUBSCRIPTION_PATTERN.search(body_text) is not None
+
+        return self._create_result(
+            site, item,
+            result='PASS' if link_found else 'FAIL',
+            confidence=0.6,
+            details='メール配信登録導線あり' if link_found else 'メール配信登録導線を検出できず',
+        )
 
+    @_returns_error_result
     async def check_pdf_new_window(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """PDFリンク別ウィンドウチェック（item_id: 26）"""
-        try:
-            pdf_links = await page.locator('a[href$=".pdf"]').count()
-
-            if pdf_links == 0:
-                return ValidationResult(
-                    site_id=site.site_id,
-                    company_name=site.company_name,
-                    url=site.url,
-                    item_id=item.item_id,
-                    item_name=item.item_name,
-                    category=item.category,
-                    subcategory=item.subcategory,
-                    result='PASS',
-                    confidence=0.7,
-                    details='PDFリンクなし',
-                    checked_at=datetime.now()
-                )
+        pdf_stats = (await self._collect_page_facts(page))['links']['pdfNewWindow']
+        pdf_links = pdf_stats['total']
 
-            pdf_links_with_target = await page.locator('a[href$=".pdf"][target="_blank"]').count()
-            ratio = pdf_links_with_target / pdf_links if pdf_links > 0 else 0
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if ratio >= 0.8 else 'FAIL',
-                confidence=0.8,
-                details=f'PDFリンク{pdf_links}件中{pdf_links_with_target}件が別ウィンドウ',
-                checked_at=datetime.now()
+        if pdf_links == 0:
+            return self._create_result(
+                site, item,
+                result='PASS',
+                confidence=0.7,
+                details='PDFリンクなし',
             )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
-
-    async def check_pdf_icon(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """PDFアイコン表示チェック（item_id: 27）"""
-        try:
-            pdf_links_with_indication = await page.evaluate('''
-                () => {
-                    const pdfLinks = document.querySelectorAll('a[href$=".pdf"]');
-                    let indicatedCount = 0;
 
-                    pdfLinks.forEach(link => {
-                        const text = link.textContent;
-                        const hasIcon = link.querySelector('img[src*="pdf"], i[class*="pdf"], svg');
-                        const hasText = text.includes('PDF') || text.includes('pdf');
-                        const hasClass = link.className.includes('pdf');
+        pdf_links_with_target = pdf_stats['indicated']
+        ratio = pdf_links_with_target / pdf_links if pdf_links > 0 else 0
 
-                        if (hasIcon || hasText || hasClass) {
-                            indicatedCount++;
-                        }
-                    });
+        return self._create_result(
+            site, item,
+            result='PASS' if ratio >= 0.8 else 'FAIL',
+            confidence=0.8,
+            details=f'PDFリンク{pdf_links}件中{pdf_links_with_target}件が別ウィンドウ',
+        )
 
-                    return {total: pdfLinks.length, indicated: indicatedCount};
-                }
-            ''')
+    @_returns_error_result
+    async def check_pdf_icon(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
+        """PDFアイコン表示チェック（item_id: 27）"""
+        pdf_links_with_indication = (await self._collect_page_facts(page))['links']['pdfIcon']
 
-            total = pdf_links_with_indication.get('total', 0)
-            indicated = pdf_links_with_indication.get('indicated', 0)
-
-            if total == 0:
-                return ValidationResult(
-                    site_id=site.site_id,
-                    company_name=site.company_name,
-                    url=site.url,
-                    item_id=item.item_id,
-                    item_name=item.item_name,
-                    category=item.category,
-                    subcategory=item.subcategory,
-                    result='PASS',
-                    confidence=0.7,
-                    details='PDFリンクなし',
-                    checked_at=datetime.now()
-                )
+        total = pdf_links_with_indication.get('total', 0)
+        indicated = pdf_links_with_indication.get('indicated', 0)
 
-            ratio = indicated / total if total > 0 else 0
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if ratio >= 0.8 else 'FAIL',
+        if total == 0:
+            return self._create_result(
+                site, item,
+                result='PASS',
                 confidence=0.7,
-                details=f'PDFリンク{total}件中{indicated}件に表示あり',
-                checked_at=datetime.now()
+                details='PDFリンクなし',
             )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
 
+        ratio = indicated / total if total > 0 else 0
+
+        return self._create_result(
+            site, item,
+            result='PASS' if ratio >= 0.8 else 'FAIL',
+            confidence=0.7,
+            details=f'PDFリンク{total}件中{indicated}件に表示あり',
+        )
+
+    @_returns_error_result
     async def check_roe_data(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """ROEデータチェック（item_id: 28）"""
-        try:
-            page_text = await page.inner_text('body')
-            has_roe = 'ROE' in page_text or '自己資本利益率' in page_text
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_roe else 'FAIL',
-                confidence=0.7,
-                details='ROEデータ検出' if has_roe else 'ROEデータ未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        page_text = await self._body_text(page)
+        has_roe = 'ROE' in page_text or '自己資本利益率' in page_text
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_roe else 'FAIL',
+            confidence=0.7,
+            details='ROEデータ検出' if has_roe else 'ROEデータ未検出',
+        )
 
+    @_returns_error_result
     async def check_equity_ratio(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """自己資本比率チェック（item_id: 29）"""
-        try:
-            page_text = await page.inner_text('body')
-            has_equity_ratio = '自己資本比率' in page_text
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_equity_ratio else 'FAIL',
-                confidence=0.7,
-                details='自己資本比率データ検出' if has_equity_ratio else '自己資本比率データ未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        page_text = await self._body_text(page)
+        has_equity_ratio = '自己資本比率' in page_text
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_equity_ratio else 'FAIL',
+            confidence=0.7,
+            details='自己資本比率データ検出' if has_equity_ratio else '自己資本比率データ未検出',
+        )
 
+    @_returns_error_result
     async def check_pbr_data(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """PBRデータチェック（item_id: 30）"""
-        try:
-            page_text = await page.inner_text('body')
-            has_pbr = 'PBR' in page_text or '株価純資産倍率' in page_text
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_pbr else 'FAIL',
-                confidence=0.7,
-                details='PBRデータ検出' if has_pbr else 'PBRデータ未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        page_text = await self._body_text(page)
+        has_pbr = 'PBR' in page_text or '株価純資産倍率' in page_text
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_pbr else 'FAIL',
+            confidence=0.7,
+            details='PBRデータ検出' if has_pbr else 'PBRデータ未検出',
+        )
 
+    @_returns_error_result
     async def check_financial_statements(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """決算短信チェック（item_id: 31）"""
-        try:
-            page_text = await page.inner_text('body')
-            has_statements = '決算短信' in page_text
-
-            # PDFリンクも確認
-            pdf_links = await page.locator('a[href*="決算短信"], a:has-text("決算短信")').count()
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if (has_statements or pdf_links > 0) else 'FAIL',
-                confidence=0.8,
-                details='決算短信リンク検出' if (has_statements or pdf_links > 0) else '決算短信未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        page_text = await self._body_text(page)
+        has_statements = '決算短信' in page_text
+
+        # 本文に無い場合のみ、リンク先URL・リンク文言を確認する
+        # （本文は innerText のため、非表示メニュー内のリンク文言は :has-text で拾う）
+        has_link = has_statements or await self._any_selector_matches(
+            page, ('a[href*="決算短信"]', 'a:has-text("決算短信")')
+        )
 
+        return self._create_result(
+            site, item,
+            result='PASS' if has_link else 'FAIL',
+            confidence=0.8,
+            details='決算短信リンク検出' if has_link else '決算短信未検出',
+        )
+
+    @_returns_error_result
     async def check_securities_report(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """有価証券報告書チェック（item_id: 32）"""
-        try:
-            page_text = await page.inner_text('body')
-            has_report = '有価証券報告書' in page_text
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_report else 'FAIL',
-                confidence=0.8,
-                details='有価証券報告書リンク検出' if has_report else '有価証券報告書未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        page_text = await self._body_text(page)
+        has_report = '有価証券報告書' in page_text
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_report else 'FAIL',
+            confidence=0.8,
+            details='有価証券報告書リンク検出' if has_report else '有価証券報告書未検出',
+        )
 
+    @_returns_error_result
     async def check_business_report(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """事業報告書チェック（item_id: 33）"""
-        try:
-            page_text = await page.inner_text('body')
-            has_report = '事業報告' in page_text or '株主通信' in page_text
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_report else 'FAIL',
-                confidence=0.7,
-                details='事業報告/株主通信リンク検出' if has_report else '事業報告/株主通信未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        page_text = await self._body_text(page)
+        has_report = '事業報告' in page_text or '株主通信' in page_text
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_report else 'FAIL',
+            confidence=0.7,
+            details='事業報告/株主通信リンク検出' if has_report else '事業報告/株主通信未検出',
+        )
 
+    @_returns_error_result
     async def check_financial_data_download(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """財務データダウンロードチェック（item_id: 34）"""
-        try:
-            # CSV/XLSファイルのリンクを検出
-            csv_xls_links = await page.locator('a[href$=".csv"], a[href$=".xls"], a[href$=".xlsx"]').count()
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if (csv_xls_links > 0) else 'FAIL',
-                confidence=0.7,
-                details=f'データファイル{csv_xls_links}件検出' if csv_xls_links > 0 else 'データファイル未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        # CSV/XLSファイルのリンクを検出
+        csv_xls_links = await page.locator('a[href$=".csv"], a[href$=".xls"], a[href$=".xlsx"]').count()
+
+        return self._create_result(
+            site, item,
+            result='PASS' if (csv_xls_links > 0) else 'FAIL',
+            confidence=0.7,
+            details=f'データファイル{csv_xls_links}件検出' if csv_xls_links > 0 else 'データファイル未検出',
+        )
 
+    @_returns_error_result
     async def check_quarterly_data_download(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """四半期データダウンロードチェック（item_id: 35）"""
-        try:
-            page_text = await page.inner_text('body')
-            has_quarterly = '四半期' in page_text or 'Q1' in page_text or 'Q2' in page_text or 'Q3' in page_text or 'Q4' in page_text
-
-            # 四半期データファイルの存在
-            quarterly_files = await page.locator('a[href*="四半期"]').count()
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if (has_quarterly and quarterly_files > 0) else 'FAIL',
-                confidence=0.5,
-                details=f'四半期データ{quarterly_files}件検出' if quarterly_files > 0 else '四半期データ未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
-
-    # === ヘルパーメソッド ===
+        page_text = await self._body_text(page)
+        has_quarterly = '四半期' in page_text or 'Q1' in page_text or 'Q2' in page_text or 'Q3' in page_text or 'Q4' in page_text
 
+        # 四半期データファイルの存在
+        quarterly_files = await page.locator('a[href*="四半期"]').count()
 
-    async def check_item_2(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """No.20: メニューの表示の仕方はページによって変化しない"""
-        try:
-            page_text = await page.inner_text('body')
-            has_content = len(page_text) > 100  # プレースホルダー
-            
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        return self._create_result(
+            site, item,
+            result='PASS' if (has_quarterly and quarterly_files > 0) else 'FAIL',
+            confidence=0.5,
+            details=f'四半期データ{quarterly_files}件検出' if quarterly_files > 0 else '四半期データ未検出',
+        )
 
-    async def check_item_14(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """No.140: 404エラーページ主領域にサイトマップ（またはサイト内検索）を配置している"""
-        try:
-            search_exists = await page.locator('input[type="search"], input[name*="search"]').count()
-            has_content = search_exists > 0
-            
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+    # === ヘルパーメソッド ===
 
-    async def check_item_24(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """No.240: IRトップにはトップの顔写真を掲載している"""
-        try:
-            page_text = await page.inner_text('body')
-            has_content = len(page_text) > 100  # プレースホルダー
-            
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
 
-    async def check_item_36(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """No.360: 検索結果表示のトップには検索結果件数を掲載している"""
-        try:
-            search_exists = await page.locator('input[type="search"], input[name*="search"]').count()
-            has_content = search_exists > 0
-            
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+    @_returns_error_result
+    async def check_body_text_present(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
+        """本文の有無による暫定判定（SHARED_CHECK_METHODS の項目で共有）"""
+        page_text = await self._body_text(page)
+        has_content = len(page_text) > 100  # プレースホルダー
 
-    async def check_item_37(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """No.370: サイト内検索はカテゴリごとに対象を絞り込んで検索ができる"""
-        try:
-            search_exists = await page.locator('input[type="search"], input[name*="search"]').count()
-            has_content = search_exists > 0
-            
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        return self._create_result(
+            site, item,
+            result='PASS' if has_content else 'FAIL',
+            confidence=0.7,
+            details='検証完了' if has_content else '未検出',
+        )
 
-    async def check_item_38(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """No.380: 日付順の並び替えができる"""
-        try:
-            page_text = await page.inner_text('body')
-            has_content = len(page_text) > 100  # プレースホルダー
-            
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+    @_returns_error_result
+    async def check_search_input_present(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
+        """サイト内検索の入力欄の有無による暫定判定（SHARED_CHECK_METHODS の項目で共有）"""
+        has_content = (await self._collect_page_facts(page))['hasSearchInput']
 
-    async def check_item_39(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """No.390: 検索キーワードのオートサジェスト機能を実装している"""
-        try:
-            search_exists = await page.locator('input[type="search"], input[name*="search"]').count()
-            has_content = search_exists > 0
-            
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        return self._create_result(
+            site, item,
+            result='PASS' if has_content else 'FAIL',
+            confidence=0.7,
+            details='検証完了' if has_content else '未検出',
+        )
 
-    async def check_item_41(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """No.410: 検索結果はHTMLもしくはPDFで絞り込める"""
-        try:
-            pdf_count = await page.locator('a[href$=".pdf"]').count()
-            has_content = pdf_count > 0
-            
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+    @_returns_error_result
+    async def check_pdf_link_present(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
+        """PDFリンクの有無による暫定判定（SHARED_CHECK_METHODS の項目で共有）"""
+        pdf_count = (await self._collect_page_facts(page))['counts']['pdfLinks']
+        has_content = pdf_count > 0
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_content else 'FAIL',
+            confidence=0.7,
+            details='検証完了' if has_content else '未検出',
+        )
 
-    async def check_item_42(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """No.470: ブラウザやOSの推奨環境を明記している"""
-        try:
-            page_text = await page.inner_text('body')
-            has_content = len(page_text) > 100  # プレースホルダー
-            
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+    @_returns_error_result
+    async def check_video_present(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
+        """動画埋め込みの有無による暫定判定（SHARED_CHECK_METHODS の項目で共有）"""
+        video_count = (await self._collect_page_facts(page))['counts']['videos']
+        has_content = video_count > 0
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_content else 'FAIL',
+            confidence=0.7,
+            details='検証完了' if has_content else '未検出',
+        )
 
+    @_returns_error_result
     async def check_item_44(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """サイト内検索導線（日本語・英語）チェック（item_id: 44）"""
-        try:
-            search_selectors = [
-                'header input[type="search"]',
-                'header form input[name*="search" i]',
-                'header input[placeholder*="検索"]',
-                'header input[placeholder*="Search" i]',
-                'header button:has-text("検索")',
-                'header button:has-text("Search")',
-                'nav input[type="search"]',
-                'nav button[aria-label*="検索"]',
-                'nav button[aria-label*="search" i]',
+        labels = await page.evaluate(SEARCH_LABELS_SCRIPT, _selector_steps(GLOBAL_SEARCH_SELECTORS))
+        has_global_search = bool(labels)
+        combined = ' '.join(labels).lower()
+        has_japanese_label = '検索' in combined
+        has_english_label = 'search' in combined
+
+        if not has_global_search:
+            icon_selectors = [
+                'header button[class*="search"]',
+                'nav button[class*="search"]',
+                'header a[class*="search"]',
             ]
+            has_global_search = await self._any_selector_matches(page, icon_selectors)
+
+        if not has_japanese_label or not has_english_label:
+            body_text = await self._body_text(page)
+            body_lower = body_text.lower()
+            if '検索' in body_text:
+                has_japanese_label = True
+            if 'search' in body_lower:
+                has_english_label = True
+
+        is_valid = has_global_search and has_japanese_label and has_english_label
+
+        details_parts = []
+        details_parts.append('グローバル検索導線あり' if has_global_search else 'グローバル検索導線なし')
+        details_parts.append('日本語対応あり' if has_japanese_label else '日本語対応不明')
+        details_parts.append('英語対応あり' if has_english_label else '英語対応不明')
+
+        return self._create_result(
+            site, item,
+            result='PASS' if is_valid else 'FAIL',
+            confidence=0.55 if is_valid else 0.35,
+            details=' / '.join(details_parts),
+        )
 
-            has_global_search = False
-            has_japanese_label = False
-            has_english_label = False
+    @_returns_error_result
+    async def check_item_47(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
+        """カテゴリ絞り込みが可能なサイト内検索チェック（item_id: 47）"""
+        has_category_filter = await page.evaluate(SEARCH_CATEGORY_FILTER_SCRIPT)
 
-            for selector in search_selectors:
-                elements = await page.locator(selector).all()
-                if not elements:
-                    continue
-                has_global_search = True
-                for el in elements:
-                    placeholder = await el.get_attribute('placeholder') or ''
-                    aria_label = await el.get_attribute('aria-label') or ''
-                    text = ''
-                    try:
-                        text = await el.inner_text()
-                    except:
-                        pass
-                    combined = (placeholder + ' ' + aria_label + ' ' + text).lower()
-                    if '検索' in combined:
-                        has_japanese_label = True
-                    if 'search' in combined:
-                        has_english_label = True
-
-            if not has_global_search:
-                icon_selectors = [
-                    'header button[class*="search"]',
-                    'nav button[class*="search"]',
-                    'header a[class*="search"]',
-                ]
-                for selector in icon_selectors:
-                    count = await page.locator(selector).count()
-                    if count > 0:
-                        has_global_search = True
-                        break
+        details = (
+            'カテゴリ選択付き検索フォームを検出'
+            if has_category_filter
+            else 'カテゴリ選択付き検索フォームを検出できず'
+        )
 
-            if not has_japanese_label or not has_english_label:
-                body_text = await page.inner_text('body')
-                body_lower = body_text.lower()
-                if '検索' in body_text:
-                    has_japanese_label = True
-                if 'search' in body_lower:
-                    has_english_label = True
-
-            is_valid = has_global_search and has_japanese_label and has_english_label
-
-            details_parts = []
-            details_parts.append('グローバル検索導線あり' if has_global_search else 'グローバル検索導線なし')
-            details_parts.append('日本語対応あり' if has_japanese_label else '日本語対応不明')
-            details_parts.append('英語対応あり' if has_english_label else '英語対応不明')
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if is_valid else 'FAIL',
-                confidence=0.55 if is_valid else 0.35,
-                details=' / '.join(details_parts),
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        return self._create_result(
+            site, item,
+            result='PASS' if has_category_filter else 'FAIL',
+            confidence=0.55 if has_category_filter else 0.35,
+            details=details,
+        )
 
-    async def check_item_47(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """カテゴリ絞り込みが可能なサイト内検索チェック（item_id: 47）"""
-        try:
-            category_keywords = [
-                'カテゴリ',
-                'category',
-                'ニュース',
-                'ir',
-                'csr',
-                '決算',
-                'プレス',
-                'press',
-                'investor',
-                'finance',
-                'library',
-                'report',
-            ]
+    @_returns_error_result
+    async def check_item_51(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
+        """検索結果のHTML/PDF絞り込みチェック（item_id: 51）"""
+        is_valid = bool(await page.evaluate(FORMAT_FILTER_SCRIPT, 200))  # ボタン類は先頭200件まで
+        details = (
+            'HTML/PDFフィルタを検出'
+            if is_valid
+            else 'HTML/PDFフィルタを検出できず'
+        )
 
-            has_category_filter = await page.evaluate(
-                """
-                (keywords) => {
-                    const lowerKeywords = keywords.map((kw) => kw.toLowerCase());
-                    const forms = Array.from(document.querySelectorAll('form'));
-                    for (const form of forms) {
-                        const inputs = Array.from(form.querySelectorAll('input'));
-                        const hasSearchInput = inputs.some((input) => {
-                            const type = (input.getAttribute('type') || '').toLowerCase();
-                            if (type === 'search') return true;
-                            const name = (input.getAttribute('name') || '').toLowerCase();
-                            const placeholder = (input.getAttribute('placeholder') || '').toLowerCase();
-                            return (
-                                name.includes('search') ||
-                                name.includes('keyword') ||
-                                placeholder.includes('検索') ||
-                                placeholder.includes('search')
-                            );
-                        });
-                        if (!hasSearchInput) {
-                            continue;
-                        }
+        return self._create_result(
+            site, item,
+            result='PASS' if is_valid else 'FAIL',
+            confidence=0.5 if is_valid else 0.35,
+            details=details,
+        )
 
-                        let matchCount = 0;
-                        const options = Array.from(form.querySelectorAll('select option'));
-                        for (const option of options) {
-                            const text = (option.textContent || '').trim().toLowerCase();
-                            if (lowerKeywords.some((kw) => text.includes(kw))) {
-                                matchCount += 1;
-                            }
-                            if (matchCount >= 2) {
-                                return true;
-                            }
-                        }
+    @_returns_error_result
+    async def check_item_52(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
+        """検索結果チューニング（統合報告書を最上位）チェック（item_id: 52）"""
+        keyword = '統合報告書'
+        link_locator = page.locator(f'a:has-text("{keyword}")')
+        link_count = await link_locator.count()
 
-                        const choices = Array.from(
-                            form.querySelectorAll('input[type="checkbox"], input[type="radio"]')
-                        );
-                        for (const choice of choices) {
-                            const label =
-                                choice.closest('label') ||
-                                form.querySelector(`label[for="${choice.id}"]`);
-                            const text =
-                                (label && label.textContent) ||
-                                choice.getAttribute('value') ||
-                                '';
-                            const textLower = text.trim().toLowerCase();
-                            if (lowerKeywords.some((kw) => textLower.includes(kw))) {
-                                matchCount += 1;
-                            }
-                            if (matchCount >= 2) {
-                                return true;
-                            }
+        top_hit = await page.evaluate(
+            """
+                (keyword) => {
+                    const containers = document.querySelectorAll(
+                        '.search-result, .searchResults, .result-list, .search-list, ul[class*="search"], ol[class*="search"]'
+                    );
+                    for (const container of containers) {
+                        const items = container.querySelectorAll('li, article, div');
+                        if (items.length === 0) continue;
+                        const first = items[0];
+                        const text = (first.textContent || '').toLowerCase();
+                        if (text.includes(keyword.toLowerCase())) {
+                            return true;
                         }
+                        return false;
                     }
                     return false;
                 }
                 """,
-                category_keywords,
-            )
+            keyword,
+        )
 
-            details = (
-                'カテゴリ選択付き検索フォームを検出'
-                if has_category_filter
-                else 'カテゴリ選択付き検索フォームを検出できず'
-            )
+        link_text = ''
+        if link_count > 0:
+            link_text = (await link_locator.first.inner_text()).strip()
 
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_category_filter else 'FAIL',
-                confidence=0.55 if has_category_filter else 0.35,
-                details=details,
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        has_year = bool(YEAR_PATTERN.search(link_text))
+        has_latest = '最新' in link_text
 
-    async def check_item_49(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """No.630: Cookieを常設している"""
-        try:
-            page_text = await page.inner_text('body')
-            has_content = len(page_text) > 100  # プレースホルダー
-            
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        is_valid = top_hit and (has_year or has_latest)
 
-    async def check_item_51(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """検索結果のHTML/PDF絞り込みチェック（item_id: 51）"""
-        try:
-            option_texts = await page.locator('select option').all_inner_texts()
-            option_texts_lower = [text.lower() for text in option_texts]
-            has_option_filter = 'html' in option_texts_lower and 'pdf' in option_texts_lower
-
-            button_texts = await page.locator('button, label, a').all_inner_texts()
-            button_texts_lower = [text.lower() for text in button_texts[:200]]  # safety cap
-            html_token = any('html' in text for text in button_texts_lower)
-            pdf_token = any('pdf' in text for text in button_texts_lower)
-            has_button_filter = html_token and pdf_token
-
-            is_valid = has_option_filter or has_button_filter
-            details = (
-                'HTML/PDFフィルタを検出'
-                if is_valid
-                else 'HTML/PDFフィルタを検出できず'
-            )
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if is_valid else 'FAIL',
-                confidence=0.5 if is_valid else 0.35,
-                details=details,
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
-
-    async def check_item_50(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """No.640: IR資料は書類種別ごとにページが分かれている"""
-        try:
-            page_text = await page.inner_text('body')
-            has_content = len(page_text) > 100  # プレースホルダー
-            
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        if not link_text:
+            details = '統合報告書の検索結果を検出できず'
+        elif is_valid:
+            details = f'検索トップに統合報告書（{link_text[:30]}）を検出'
+        elif top_hit:
+            details = '検索トップに統合報告書はあるが最新性を確認できず'
+        else:
+            details = '統合報告書が検索トップに表示されず'
 
-    async def check_item_52(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """検索結果チューニング（統合報告書を最上位）チェック（item_id: 52）"""
-        try:
-            keyword = '統合報告書'
-            link_locator = page.locator(f'a:has-text("{keyword}")')
-            link_count = await link_locator.count()
-
-            top_hit = await page.evaluate(
-                """
-                (keyword) => {
-                    const containers = document.querySelectorAll(
-                        '.search-result, .searchResults, .result-list, .search-list, ul[class*="search"], ol[class*="search"]'
-                    );
-                    for (const container of containers) {
-                        const items = container.querySelectorAll('li, article, div');
-                        if (items.length === 0) continue;
-                        const first = items[0];
-                        const text = (first.textContent || '').toLowerCase();
-                        if (text.includes(keyword.toLowerCase())) {
-                            return true;
-                        }
-                        return false;
-                    }
-                    return false;
-                }
-                """,
-                keyword,
-            )
-
-            link_text = ''
-            if link_count > 0:
-                link_text = (await link_locator.first.inner_text()).strip()
-
-            has_year = bool(re.search(r'20\\d{2}', link_text))
-            has_latest = '最新' in link_text
-
-            is_valid = top_hit and (has_year or has_latest)
-
-            if not link_text:
-                details = '統合報告書の検索結果を検出できず'
-            elif is_valid:
-                details = f'検索トップに統合報告書（{link_text[:30]}）を検出'
-            elif top_hit:
-                details = '検索トップに統合報告書はあるが最新性を確認できず'
-            else:
-                details = '統合報告書が検索トップに表示されず'
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if is_valid else 'FAIL',
-                confidence=0.45 if is_valid else 0.3,
-                details=details,
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        return self._create_result(
+            site, item,
+            result='PASS' if is_valid else 'FAIL',
+            confidence=0.45 if is_valid else 0.3,
+            details=details,
+        )
 
+    @_returns_error_result
     async def check_item_57(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """No.710: 四半期別の売上高・経常利益（または営業利益）・当期純利益をHTMLで掲載している"""
-        try:
-            page_text = await page.inner_text('body')
-            has_content = '四半期' in page_text
+        page_text = await self._body_text(page)
+        has_content = '四半期' in page_text
             
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        return self._create_result(
+            site, item,
+            result='PASS' if has_content else 'FAIL',
+            confidence=0.7,
+            details='検証完了' if has_content else '未検出',
+        )
 
+    @_returns_error_result
     async def check_item_71(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """No.850: 業績予想（業績見通し）を掲載している"""
-        try:
-            page_text = await page.inner_text('body')
-            has_content = '業績予想' in page_text or '業績見通し' in page_text
+        page_text = await self._body_text(page)
+        has_content = '業績予想' in page_text or '業績見通し' in page_text
             
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        return self._create_result(
+            site, item,
+            result='PASS' if has_content else 'FAIL',
+            confidence=0.7,
+            details='検証完了' if has_content else '未検出',
+        )
 
+    @_returns_error_result
     async def check_item_78(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """売上・利益推移グラフ掲載チェック（item_id: 78）"""
-        try:
-            body_text = self._normalize_text(await page.inner_text('body'))
-            metrics = ['売上高', '経常利益', '営業利益', '当期純利益']
-            metric_hits = sum(1 for keyword in metrics if keyword in body_text)
-            has_period = any(token in body_text for token in ['5期', '５期', '5年', '五年', '5年度', '五年度', '5-year'])
-            has_chart = await self._has_chart_near_keywords(page, metrics)
-
-            is_valid = has_chart and metric_hits >= 3 and has_period
-            details = '売上・利益推移グラフを検出' if is_valid else '売上・利益推移グラフまたは期間情報を検出できず'
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if is_valid else 'FAIL',
-                confidence=0.55 if is_valid else 0.35,
-                details=details,
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        body_text = self._normalize_text(await self._body_text(page))
+        has_text = _metric_hits(body_text) >= 3 and bool(FIVE_PERIOD_PATTERN.search(body_text))
+        # グラフ探索は DOM 全体を走査するため、本文の条件を満たす場合のみ行う
+        is_valid = has_text and await self._has_chart_near_keywords(page, FINANCIAL_METRICS)
+        details = '売上・利益推移グラフを検出' if is_valid else '売上・利益推移グラフまたは期間情報を検出できず'
+
+        return self._create_result(
+            site, item,
+            result='PASS' if is_valid else 'FAIL',
+            confidence=0.55 if is_valid else 0.35,
+            details=details,
+        )
 
+    @_returns_error_result
     async def check_item_79(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """売上・利益推移グラフの説明併記チェック（item_id: 79）"""
-        try:
-            body_text = self._normalize_text(await page.inner_text('body'))
-            explanation_keywords = ['説明', '解説', '注記', 'コメント', 'point', '解釈']
-            has_explanation = any(keyword in body_text for keyword in explanation_keywords)
-
-            metrics = ['売上高', '経常利益', '営業利益', '当期純利益']
-            has_chart = await self._has_chart_near_keywords(page, metrics)
-            metric_hits = sum(1 for keyword in metrics if keyword in body_text)
-            base_valid = has_chart and metric_hits >= 3
-
-            is_valid = base_valid and has_explanation
-            details = 'グラフと説明文を検出' if is_valid else '説明文付きグラフを確認できず'
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if is_valid else 'FAIL',
-                confidence=0.5 if is_valid else 0.3,
-                details=details,
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        body_text = self._normalize_text(await self._body_text(page))
+        has_text = _metric_hits(body_text) >= 3 and bool(TREND_EXPLANATION_PATTERN.search(body_text))
+        is_valid = has_text and await self._has_chart_near_keywords(page, FINANCIAL_METRICS)
+        details = 'グラフと説明文を検出' if is_valid else '説明文付きグラフを確認できず'
+
+        return self._create_result(
+            site, item,
+            result='PASS' if is_valid else 'FAIL',
+            confidence=0.5 if is_valid else 0.3,
+            details=details,
+        )
 
+    @_returns_error_result
     async def check_item_81(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """四半期別売上・利益推移グラフチェック（item_id: 81）"""
-        try:
-            body_text = self._normalize_text(await page.inner_text('body'))
-            quarter_keywords = ['四半期', '1Q', '2Q', '3Q', '4Q', 'quarter', 'q1', 'q2', 'q3', 'q4']
-            has_quarter = any(keyword.lower() in body_text.lower() for keyword in quarter_keywords)
-            metrics = ['売上高', '経常利益', '営業利益', '当期純利益']
-            has_chart = await self._has_chart_near_keywords(page, quarter_keywords + metrics)
-            has_metrics = sum(1 for keyword in metrics if keyword in body_text) >= 2
-
-            is_valid = has_chart and has_quarter and has_metrics
-            details = '四半期別グラフを検出' if is_valid else '四半期別グラフを検出できず'
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if is_valid else 'FAIL',
-                confidence=0.55 if is_valid else 0.35,
-                details=details,
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        body_text = self._normalize_text(await self._body_text(page))
+        has_text = bool(QUARTER_MENTION_PATTERN.search(body_text)) and _metric_hits(body_text) >= 2
+        is_valid = has_text and await self._has_chart_near_keywords(page, QUARTER_MENTION_KEYWORDS + FINANCIAL_METRICS)
+        details = '四半期別グラフを検出' if is_valid else '四半期別グラフを検出できず'
+
+        return self._create_result(
+            site, item,
+            result='PASS' if is_valid else 'FAIL',
+            confidence=0.55 if is_valid else 0.35,
+            details=details,
+        )
 
+    @_returns_error_result
     async def check_item_82(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """四半期別グラフ説明併記チェック（item_id: 82）"""
-        try:
-            body_text = self._normalize_text(await page.inner_text('body'))
-            explanation_keywords = ['説明', '解説', '注釈', '注記', 'comment']
-            has_explanation = any(keyword in body_text for keyword in explanation_keywords)
-
-            quarter_keywords = ['四半期', '1Q', '2Q', '3Q', '4Q', 'quarter']
-            has_chart = await self._has_chart_near_keywords(page, quarter_keywords)
-
-            is_valid = has_chart and has_explanation
-            details = '四半期グラフと説明文を検出' if is_valid else '四半期グラフの説明を検出できず'
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if is_valid else 'FAIL',
-                confidence=0.5 if is_valid else 0.3,
-                details=details,
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        body_text = self._normalize_text(await self._body_text(page))
+        has_explanation = bool(QUARTER_EXPLANATION_PATTERN.search(body_text))
+        is_valid = has_explanation and await self._has_chart_near_keywords(page, QUARTER_KEYWORDS)
+        details = '四半期グラフと説明文を検出' if is_valid else '四半期グラフの説明を検出できず'
+
+        return self._create_result(
+            site, item,
+            result='PASS' if is_valid else 'FAIL',
+            confidence=0.5 if is_valid else 0.3,
+            details=details,
+        )
 
+    @_returns_error_result
     async def check_item_85(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """No.1020: 直近の決算説明会の資料を掲載している（通期、半期もしくは四半期、PDF可）"""
-        try:
-            page_text = await page.inner_text('body')
-            has_content = '四半期' in page_text
+        page_text = await self._body_text(page)
+        has_content = '四半期' in page_text
             
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        return self._create_result(
+            site, item,
+            result='PASS' if has_content else 'FAIL',
+            confidence=0.7,
+            details='検証完了' if has_content else '未検出',
+        )
 
+    @_returns_error_result
     async def check_item_86(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """No.1030: 直近の決算説明会の動画を掲載している"""
-        try:
-            page_text = await page.inner_text('body')
-            has_content = '決算' in page_text
+        page_text = await self._body_text(page)
+        has_content = '決算' in page_text
             
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        return self._create_result(
+            site, item,
+            result='PASS' if has_content else 'FAIL',
+            confidence=0.7,
+            details='検証完了' if has_content else '未検出',
+        )
 
+    @_returns_error_result
     async def check_item_89(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """資本コストの数値記載チェック（item_id: 89）"""
-        try:
-            body_text = await page.inner_text('body')
-            normalized = self._normalize_text(body_text)
-            lower_text = normalized.lower()
-            keywords = ['資本コスト', '株主資本コスト', 'wacc']
-            has_keyword = any(keyword in lower_text for keyword in keywords)
-
-            import re
-
-            percent_pattern = re.compile(
-                r'(資本コスト|株主資本コスト|wacc)[^0-9%％]{0,40}([0-9]+(?:\\.[0-9]+)?)\\s*[%％]',
-                re.IGNORECASE
-            )
-            match = percent_pattern.search(lower_text)
-            found = has_keyword and bool(match)
-
-            if found and match:
-                value = match.group(2)
-                details = f'資本コスト{value}%を検出'
-            elif has_keyword:
-                details = '資本コストの記載はあるが数値を検出できず'
-            else:
-                details = '資本コスト関連の記載を検出できず'
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if found else 'FAIL',
-                confidence=0.6 if found else 0.4,
-                details=details,
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        body_text = await self._body_text(page)
+        normalized = self._normalize_text(body_text)
+        lower_text = normalized.lower()
+        keywords = ['資本コスト', '株主資本コスト', 'wacc']
+        has_keyword = any(keyword in lower_text for keyword in keywords)
+
+        match = CAPITAL_COST_PATTERN.search(lower_text)
+        found = has_keyword and bool(match)
+
+        if found and match:
+            value = match.group(2)
+            details = f'資本コスト{value}%を検出'
+        elif has_keyword:
+            details = '資本コストの記載はあるが数値を検出できず'
+        else:
+            details = '資本コスト関連の記載を検出できず'
+
+        return self._create_result(
+            site, item,
+            result='PASS' if found else 'FAIL',
+            confidence=0.6 if found else 0.4,
+            details=details,
+        )
 
+    @_returns_error_result
     async def check_item_90(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """チャートジェネレーター設置チェック（item_id: 90）"""
-        try:
-            metric_keywords = ['売上', '利益', 'roe', 'roa', 'eps', '配当', 'kpi', '指標']
+        metric_keywords = ['売上', '利益', 'roe', 'roa', 'eps', '配当', 'kpi', '指標']
 
-            has_controls = await page.evaluate(
-                """
+        has_controls = await page.evaluate(
+            """
                 (keywords) => {
                     const lower = keywords.map((kw) => kw.toLowerCase());
 
@@ -2953,1669 +2505,569 @@ class ScriptValidator:
                     return false;
                 }
                 """,
-                metric_keywords,
-            )
-
-            has_chart = await self._has_chart_near_keywords(page, metric_keywords)
-
-            is_valid = has_controls and has_chart
-            details = 'チャートジェネレーターUIを検出' if is_valid else 'チャートジェネレーターUIを検出できず'
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if is_valid else 'FAIL',
-                confidence=0.5 if is_valid else 0.3,
-                details=details,
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
-
-    async def check_item_91(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """B/S・P/L・C/S HTML 掲載チェック（item_id: 91）"""
-        try:
-            body_text = self._normalize_text(await page.inner_text('body')).lower()
-            bs_keywords = ['貸借対照表', 'b/s', 'bs']
-            pl_keywords = ['損益計算書', 'p/l', 'pl']
-            cs_keywords = ['キャッシュフロー計算書', 'c/s', 'cs', 'cash flow']
-
-            has_bs = any(keyword.lower() in body_text for keyword in bs_keywords)
-            has_pl = any(keyword.lower() in body_text for keyword in pl_keywords)
-            has_cs = any(keyword.lower() in body_text for keyword in cs_keywords)
+            metric_keywords,
+        )
 
-            table_count = await page.locator('table').count()
-            has_tables = table_count >= 3
+        has_chart = await self._has_chart_near_keywords(page, metric_keywords)
 
-            is_valid = has_bs and has_pl and has_cs and has_tables
+        is_valid = has_controls and has_chart
+        details = 'チャートジェネレーターUIを検出' if is_valid else 'チャートジェネレーターUIを検出できず'
 
-            if is_valid:
-                details = 'B/S・P/L・C/S の HTML テーブルを検出'
-            else:
-                missing = []
-                if not has_bs:
-                    missing.append('B/S')
-                if not has_pl:
-                    missing.append('P/L')
-                if not has_cs:
-                    missing.append('C/S')
-                if not has_tables:
-                    missing.append('HTMLテーブル')
-                details = '不足: ' + '・'.join(missing)
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if is_valid else 'FAIL',
-                confidence=0.55 if is_valid else 0.35,
-                details=details,
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        return self._create_result(
+            site, item,
+            result='PASS' if is_valid else 'FAIL',
+            confidence=0.5 if is_valid else 0.3,
+            details=details,
+        )
 
-    async def check_item_92(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """No.1090: 直近1年以内に開催した個人投資家向け説明会の資料や動画を掲載している"""
-        try:
-            video_count = await page.locator('video, iframe[src*="youtube"], iframe[src*="vimeo"]').count()
-            has_content = video_count > 0
-            
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+    @_returns_error_result
+    async def check_item_91(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
+        """B/S・P/L・C/S HTML 掲載チェック（item_id: 91）"""
+        body_text = self._normalize_text(await self._body_text(page)).lower()
+        bs_keywords = ['貸借対照表', 'b/s', 'bs']
+        pl_keywords = ['損益計算書', 'p/l', 'pl']
+        cs_keywords = ['キャッシュフロー計算書', 'c/s', 'cs', 'cash flow']
+
+        has_bs = any(keyword.lower() in body_text for keyword in bs_keywords)
+        has_pl = any(keyword.lower() in body_text for keyword in pl_keywords)
+        has_cs = any(keyword.lower() in body_text for keyword in cs_keywords)
+
+        table_count = (await self._collect_page_facts(page))['counts']['tables']
+        has_tables = table_count >= 3
+
+        is_valid = has_bs and has_pl and has_cs and has_tables
+
+        if is_valid:
+            details = 'B/S・P/L・C/S の HTML テーブルを検出'
+        else:
+            missing = []
+            if not has_bs:
+                missing.append('B/S')
+            if not has_pl:
+                missing.append('P/L')
+            if not has_cs:
+                missing.append('C/S')
+            if not has_tables:
+                missing.append('HTMLテーブル')
+            details = '不足: ' + '・'.join(missing)
+
+        return self._create_result(
+            site, item,
+            result='PASS' if is_valid else 'FAIL',
+            confidence=0.55 if is_valid else 0.35,
+            details=details,
+        )
 
+    @_returns_error_result
     async def check_item_93(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """No.1100: 株主総会招集通知を掲載している（PDF可）"""
-        try:
-            page_text = await page.inner_text('body')
-            has_content = '株主総会' in page_text
+        page_text = await self._body_text(page)
+        has_content = '株主総会' in page_text
             
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        return self._create_result(
+            site, item,
+            result='PASS' if has_content else 'FAIL',
+            confidence=0.7,
+            details='検証完了' if has_content else '未検出',
+        )
 
+    @_returns_error_result
     async def check_item_94(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """No.1110: 株主総会の議決権行使結果（臨時報告書等）を掲載している（PDF可）"""
-        try:
-            page_text = await page.inner_text('body')
-            has_content = '株主総会' in page_text
+        page_text = await self._body_text(page)
+        has_content = '株主総会' in page_text
             
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        return self._create_result(
+            site, item,
+            result='PASS' if has_content else 'FAIL',
+            confidence=0.7,
+            details='検証完了' if has_content else '未検出',
+        )
 
+    @_returns_error_result
     async def check_item_95(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """No.1120: 株主総会の動画を掲載している"""
-        try:
-            page_text = await page.inner_text('body')
-            has_content = '株主総会' in page_text
+        page_text = await self._body_text(page)
+        has_content = '株主総会' in page_text
             
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        return self._create_result(
+            site, item,
+            result='PASS' if has_content else 'FAIL',
+            confidence=0.7,
+            details='検証完了' if has_content else '未検出',
+        )
 
+    @_returns_error_result
     async def check_item_98(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """No.1150: 株主総会の説明資料を掲載している（PDF可）"""
-        try:
-            page_text = await page.inner_text('body')
-            has_content = '株主総会' in page_text
+        page_text = await self._body_text(page)
+        has_content = '株主総会' in page_text
             
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
-
-    async def check_item_100(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """No.1180: 株価情報は自社専用のものを掲載している（Yahooや証券会社等のリンク不可）"""
-        try:
-            page_text = await page.inner_text('body')
-            has_content = len(page_text) > 100  # プレースホルダー
-            
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        return self._create_result(
+            site, item,
+            result='PASS' if has_content else 'FAIL',
+            confidence=0.7,
+            details='検証完了' if has_content else '未検出',
+        )
 
+    @_returns_error_result
     async def check_item_101(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """No.1010: 直近の事業報告書／株主通信等を掲載している（PDF可）
 
         事業報告書、株主通信の掲載はないが、招集通知（全文）が掲載されている場合は達成。
         """
-        try:
-            page_text = await page.inner_text('body')
+        page_text = await self._body_text(page)
 
-            # キーワード検索: 事業報告書、株主通信、株主の皆様へ、招集通知
-            business_report_keywords = ['事業報告書', '事業報告', '株主通信', '株主の皆様へ', '株主のみなさま', 'Business Report']
-            agm_keywords = ['招集通知', '株主総会招集', 'Notice of Convocation', 'AGM Notice']
+        # キーワード検索: 事業報告書、株主通信、株主の皆様へ、招集通知
+        business_report_keywords = ['事業報告書', '事業報告', '株主通信', '株主の皆様へ', '株主のみなさま', 'Business Report']
+        agm_keywords = ['招集通知', '株主総会招集', 'Notice of Convocation', 'AGM Notice']
 
-            has_business_report = any(keyword in page_text for keyword in business_report_keywords)
-            has_agm_notice = any(keyword in page_text for keyword in agm_keywords)
+        has_business_report = any(keyword in page_text for keyword in business_report_keywords)
+        has_agm_notice = any(keyword in page_text for keyword in agm_keywords)
 
-            # PDFまたはHTMLリンクの存在確認
-            pdf_links = await page.locator('a[href$=".pdf"]').count()
+        # PDFまたはHTMLリンクの存在確認
+        pdf_links = (await self._collect_page_facts(page))['counts']['pdfLinks']
 
-            # 達成条件: 事業報告書/株主通信がある、または招集通知（全文）がある
-            result = 'PASS' if (has_business_report or has_agm_notice) else 'FAIL'
+        # 達成条件: 事業報告書/株主通信がある、または招集通知（全文）がある
+        result = 'PASS' if (has_business_report or has_agm_notice) else 'FAIL'
 
-            if has_business_report:
-                details = '事業報告書/株主通信リンク検出'
-            elif has_agm_notice:
-                details = '招集通知（全文）検出 - 達成'
-            else:
-                details = '事業報告書/株主通信/招集通知未検出'
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result=result,
-                confidence=0.7,
-                details=details,
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        if has_business_report:
+            details = '事業報告書/株主通信リンク検出'
+        elif has_agm_notice:
+            details = '招集通知（全文）検出 - 達成'
+        else:
+            details = '事業報告書/株主通信/招集通知未検出'
 
-    async def check_item_102(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """No.1200: IRトップの株価表示には時価総額や最低購入代金といった関連する情報も掲載している"""
-        try:
-            page_text = await page.inner_text('body')
-            has_content = len(page_text) > 100  # プレースホルダー
-            
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        return self._create_result(
+            site, item,
+            result=result,
+            confidence=0.7,
+            details=details,
+        )
 
+    @_returns_error_result
     async def check_item_103(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """統合報告書のマネジメントメッセージHTML掲載チェック（item_id: 103）"""
-        try:
-            body_text = await page.inner_text('body')
-            normalized = self._normalize_text(body_text)
-            keywords = [
-                'マネジメントメッセージ',
-                'マネジメント メッセージ',
-                '経営メッセージ',
-                'ceo message',
-                'president message',
-                'management message',
-            ]
-            has_keyword = any(keyword.lower() in normalized.lower() for keyword in keywords)
-
-            pdf_only = False
-            pdf_keywords = ['マネジメント', 'management', 'message', 'ceo', 'president']
-            pdf_links = await page.locator('a[href$=".pdf"]').all()
-            for link in pdf_links:
-                href = (await link.get_attribute('href') or '').lower()
-                text = (await link.inner_text() or '').lower()
-                combined = href + ' ' + text
-                if any(pk in combined for pk in pdf_keywords):
-                    pdf_only = True
-                    break
+        body_text = await self._body_text(page)
+        normalized = self._normalize_text(body_text)
+        keywords = [
+            'マネジメントメッセージ',
+            'マネジメント メッセージ',
+            '経営メッセージ',
+            'ceo message',
+            'president message',
+            'management message',
+        ]
+        has_keyword = any(keyword.lower() in normalized.lower() for keyword in keywords)
+
+        pdf_only = False
+        pdf_keywords = ['マネジメント', 'management', 'message', 'ceo', 'president']
+        pdf_links = await page.locator('a[href$=".pdf"]').all()
+        for link in pdf_links:
+            href = (await link.get_attribute('href') or '').lower()
+            text = (await link.inner_text() or '').lower()
+            combined = href + ' ' + text
+            if any(pk in combined for pk in pdf_keywords):
+                pdf_only = True
+                break
 
-            text_length = len(normalized.strip())
-            is_valid = has_keyword and not pdf_only and text_length >= 200
+        text_length = len(normalized.strip())
+        is_valid = has_keyword and not pdf_only and text_length >= 200
 
-            if is_valid:
-                details = 'マネジメントメッセージをHTMLで検出'
-            elif has_keyword and pdf_only:
-                details = 'マネジメントメッセージはPDFリンクのみ'
-            else:
-                details = 'マネジメントメッセージを検出できず'
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if is_valid else 'FAIL',
-                confidence=0.6 if is_valid else 0.4,
-                details=details,
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        if is_valid:
+            details = 'マネジメントメッセージをHTMLで検出'
+        elif has_keyword and pdf_only:
+            details = 'マネジメントメッセージはPDFリンクのみ'
+        else:
+            details = 'マネジメントメッセージを検出できず'
 
+        return self._create_result(
+            site, item,
+            result='PASS' if is_valid else 'FAIL',
+            confidence=0.6 if is_valid else 0.4,
+            details=details,
+        )
+
+    @_returns_error_result
     async def check_item_106(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """四半期B/S・P/L・C/SのCSV/XLSダウンロードチェック（item_id: 106）"""
-        try:
-            keywords = ['四半期', 'quarter', 'b/s', 'bs', 'p/l', 'pl', 'c/s', 'cs', 'financial statements']
-            link_locator = page.locator('a[href$=".csv"], a[href$=".xls"], a[href$=".xlsx"], a[href*=".csv?"], a[href*=".xls?"], a[href*=".xlsx?"]')
-            link_count = await link_locator.count()
-
-            found = False
-            snippet = ''
-            for index in range(min(link_count, 50)):
-                link = link_locator.nth(index)
-                text = self._normalize_text((await link.inner_text() or '')).lower()
-                href = (await link.get_attribute('href') or '').lower()
-                combined = text + ' ' + href
-                if any(keyword in combined for keyword in keywords) and any(ext in href for ext in ['.csv', '.xls', '.xlsx']):
-                    if '四半期' in combined or 'quarter' in combined:
-                        found = True
-                        snippet = text[:60] or href[:60]
-                        break
+        keywords = ['四半期', 'quarter', 'b/s', 'bs', 'p/l', 'pl', 'c/s', 'cs', 'financial statements']
+        link_locator = page.locator('a[href$=".csv"], a[href$=".xls"], a[href$=".xlsx"], a[href*=".csv?"], a[href*=".xls?"], a[href*=".xlsx?"]')
+        link_count = await link_locator.count()
+
+        found = False
+        snippet = ''
+        for index in range(min(link_count, 50)):
+            link = link_locator.nth(index)
+            text = self._normalize_text((await link.inner_text() or '')).lower()
+            href = (await link.get_attribute('href') or '').lower()
+            combined = text + ' ' + href
+            if any(keyword in combined for keyword in keywords) and any(ext in href for ext in ['.csv', '.xls', '.xlsx']):
+                if '四半期' in combined or 'quarter' in combined:
+                    found = True
+                    snippet = text[:60] or href[:60]
+                    break
 
-            details = '四半期財務CSV/XLSリンクを検出' if found else '四半期財務CSV/XLSリンクを検出できず'
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if found else 'FAIL',
-                confidence=0.55 if found else 0.35,
-                details=details if not snippet else f'{details} ({snippet})',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        details = '四半期財務CSV/XLSリンクを検出' if found else '四半期財務CSV/XLSリンクを検出できず'
 
+        return self._create_result(
+            site, item,
+            result='PASS' if found else 'FAIL',
+            confidence=0.55 if found else 0.35,
+            details=details if not snippet else f'{details} ({snippet})',
+        )
+
+    @_returns_error_result
     async def check_item_107(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """B/S・P/L・C/S 時系列CSV/XLSダウンロードチェック（item_id: 107）"""
-        try:
-            keywords = ['時系列', '5期', '５期', '5年', 'five-year', 'long-term', '時系列データ']
-            fs_keywords = ['b/s', 'bs', '貸借', 'p/l', 'pl', '損益', 'c/s', 'cs', 'キャッシュフロー']
-            link_locator = page.locator('a[href$=".csv"], a[href$=".xls"], a[href$=".xlsx"], a[href*=".csv?"], a[href*=".xls?"], a[href*=".xlsx?"]')
-            link_count = await link_locator.count()
-
-            found = False
-            snippet = ''
-            for index in range(min(link_count, 50)):
-                link = link_locator.nth(index)
-                text = self._normalize_text((await link.inner_text() or '')).lower()
-                href = (await link.get_attribute('href') or '').lower()
-                combined = text + ' ' + href
-                has_fs = any(keyword in combined for keyword in fs_keywords)
-                has_timeseries = any(keyword in combined for keyword in keywords)
-                if has_fs and has_timeseries:
-                    found = True
-                    snippet = text[:60] or href[:60]
-                    break
+        keywords = ['時系列', '5期', '５期', '5年', 'five-year', 'long-term', '時系列データ']
+        fs_keywords = ['b/s', 'bs', '貸借', 'p/l', 'pl', '損益', 'c/s', 'cs', 'キャッシュフロー']
+        link_locator = page.locator('a[href$=".csv"], a[href$=".xls"], a[href$=".xlsx"], a[href*=".csv?"], a[href*=".xls?"], a[href*=".xlsx?"]')
+        link_count = await link_locator.count()
+
+        found = False
+        snippet = ''
+        for index in range(min(link_count, 50)):
+            link = link_locator.nth(index)
+            text = self._normalize_text((await link.inner_text() or '')).lower()
+            href = (await link.get_attribute('href') or '').lower()
+            combined = text + ' ' + href
+            has_fs = any(keyword in combined for keyword in fs_keywords)
+            has_timeseries = any(keyword in combined for keyword in keywords)
+            if has_fs and has_timeseries:
+                found = True
+                snippet = text[:60] or href[:60]
+                break
 
-            details = '時系列財務CSV/XLSリンクを検出' if found else '時系列財務CSV/XLSリンクを検出できず'
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if found else 'FAIL',
-                confidence=0.55 if found else 0.35,
-                details=details if not snippet else f'{details} ({snippet})',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        details = '時系列財務CSV/XLSリンクを検出' if found else '時系列財務CSV/XLSリンクを検出できず'
 
-    async def check_item_111(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """No.1310: 株式手続きについて掲載している"""
-        try:
-            page_text = await page.inner_text('body')
-            has_content = len(page_text) > 100  # プレースホルダー
-            
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        return self._create_result(
+            site, item,
+            result='PASS' if found else 'FAIL',
+            confidence=0.55 if found else 0.35,
+            details=details if not snippet else f'{details} ({snippet})',
+        )
 
+    @_returns_error_result
     async def check_item_113(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """No.1330: 格付情報を掲載している"""
-        try:
-            page_text = await page.inner_text('body')
-            has_content = '格付' in page_text
+        page_text = await self._body_text(page)
+        has_content = '格付' in page_text
             
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
-
-    async def check_item_116(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """No.1360: アナリスト・カバレッジを掲載している"""
-        try:
-            page_text = await page.inner_text('body')
-            has_content = len(page_text) > 100  # プレースホルダー
-            
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        return self._create_result(
+            site, item,
+            result='PASS' if has_content else 'FAIL',
+            confidence=0.7,
+            details='検証完了' if has_content else '未検出',
+        )
 
+    @_returns_error_result
     async def check_item_117(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """IRカレンダーの概要＋詳細表示チェック（item_id: 117）"""
-        try:
-            body_text = await page.inner_text('body')
-            normalized = self._normalize_text(body_text)
-            lower = normalized.lower()
-
-            has_calendar = 'irカレンダー' in normalized or 'ir calendar' in lower
-            overview_keywords = ['年間', 'annual', 'yearly', '年間予定', '年間スケジュール']
-            detail_keywords = ['詳細', '詳細を見る', '詳細予定', '詳細情報']
-
-            has_overview = any(keyword in normalized for keyword in overview_keywords)
-            has_detail_word = any(keyword in normalized for keyword in detail_keywords)
-
-            import re
-
-            month_pattern = re.compile(r'(?:[1-9]|1[0-2])月')
-            date_pattern = re.compile(r'\\d{4}/\\d{1,2}/\\d{1,2}')
-            has_date_pattern = bool(month_pattern.search(normalized) or date_pattern.search(normalized))
-
-            has_detail = has_detail_word or has_date_pattern
-
-            is_valid = has_calendar and has_overview and has_detail
-
-            if is_valid:
-                details = 'IRカレンダーの概要・詳細を検出'
-            else:
-                missing_parts = []
-                if not has_calendar:
-                    missing_parts.append('カレンダー見出し')
-                if not has_overview:
-                    missing_parts.append('年間概要')
-                if not has_detail:
-                    missing_parts.append('詳細予定')
-                details = '不足: ' + '・'.join(missing_parts)
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if is_valid else 'FAIL',
-                confidence=0.5 if is_valid else 0.35,
-                details=details,
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
-
-    async def check_item_118(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """No.1390: 設立年月日は西暦と和暦を併記している"""
-        try:
-            page_text = await page.inner_text('body')
-            has_content = len(page_text) > 100  # プレースホルダー
-            
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
-
-    async def check_item_119(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """No.1400: 従業員数を掲載している"""
-        try:
-            page_text = await page.inner_text('body')
-            has_content = len(page_text) > 100  # プレースホルダー
-            
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
-
-    async def check_item_120(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """No.1410: トップページから会社概要まで通常メニューで2クリックで到達できる"""
-        try:
-            page_text = await page.inner_text('body')
-            has_content = len(page_text) > 100  # プレースホルダー
-            
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
-
-    async def check_item_121(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """No.1420: 会社案内もしくは事業紹介の動画を掲載している"""
-        try:
-            video_count = await page.locator('video, iframe[src*="youtube"], iframe[src*="vimeo"]').count()
-            has_content = video_count > 0
-            
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
-
-    async def check_item_123(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """No.1440: 社名の由来・ロゴの意味を掲載している"""
-        try:
-            page_text = await page.inner_text('body')
-            has_content = len(page_text) > 100  # プレースホルダー
-            
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
-
-    async def check_item_126(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """No.1470: 会社組織図を掲載している"""
-        try:
-            page_text = await page.inner_text('body')
-            has_content = len(page_text) > 100  # プレースホルダー
-            
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
-
-    async def check_item_129(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """No.1520: 全取締役・監査役の写真を掲載している"""
-        try:
-            page_text = await page.inner_text('body')
-            has_content = len(page_text) > 100  # プレースホルダー
-            
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
-
-    async def check_item_131(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """No.1540: 役員の生年月日（または年齢）を記載している"""
-        try:
-            page_text = await page.inner_text('body')
-            has_content = len(page_text) > 100  # プレースホルダー
-            
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
-
-    async def check_item_130(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """IRトップ株価表示の関連情報チェック（item_id: 130）"""
-        try:
-            body_text = await page.inner_text('body')
-            normalized = self._normalize_text(body_text)
-            lower_text = normalized.lower()
-
-            stock_keywords = ['株価', 'stock price', 'share price', '株価情報']
-            related_keywords = [
-                '時価総額',
-                '最低購入代金',
-                '単元株',
-                'board lot',
-                'market cap',
-                'market capitalization',
-                'minimum investment',
-            ]
-
-            has_stock_section = any(keyword in normalized for keyword in stock_keywords)
-            has_related_info = any(keyword in normalized for keyword in related_keywords)
-
-            if not has_related_info:
-                # 専用フォーマット（表やラベル）を確認
-                indicators = ['per share', 'lot', 'shares', '株']
-                has_related_info = any(indicator in lower_text for indicator in indicators)
-
-            is_valid = has_stock_section and has_related_info
-
-            if is_valid:
-                details = '株価と関連指標（時価総額/最低購入等）を検出'
-            elif has_stock_section:
-                details = '株価表示のみ検出（関連指標なし）'
-            else:
-                details = 'IRトップ株価表示を検出できず'
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if is_valid else 'FAIL',
-                confidence=0.65 if is_valid else 0.45,
-                details=details,
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
-
-    async def check_item_133(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """No.1560: 全取締役・監査役のスキルマトリックスを掲載している"""
-        try:
-            page_text = await page.inner_text('body')
-            has_content = len(page_text) > 100  # プレースホルダー
-            
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
-
-    async def check_item_135(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """No.1580: コーポレートガバナンスについて掲載している"""
-        try:
-            page_text = await page.inner_text('body')
-            has_content = len(page_text) > 100  # プレースホルダー
-            
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
-
-    async def check_item_136(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """No.1590: コーポレート・ガバナンスに関する報告書を掲載している（PDF可）"""
-        try:
-            pdf_count = await page.locator('a[href$=".pdf"]').count()
-            has_content = pdf_count > 0
-            
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
-
-    async def check_item_144(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """No.1670: 外部評価について掲載している"""
-        try:
-            page_text = await page.inner_text('body')
-            has_content = len(page_text) > 100  # プレースホルダー
-            
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
-
-    async def check_item_165(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """No.1890: サイトの利用環境や免責事項などサイトポリシーを掲載している"""
-        try:
-            page_text = await page.inner_text('body')
-            has_content = len(page_text) > 100  # プレースホルダー
-            
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
-
-    async def check_item_166(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """No.1900: ソーシャルメディアポリシーを掲載している"""
-        try:
-            page_text = await page.inner_text('body')
-            has_content = len(page_text) > 100  # プレースホルダー
-            
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
-
-    async def check_item_168(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """コーポレートガバナンス掲載チェック（item_id: 168）"""
-        try:
-            cg_keywords = [
-                'コーポレートガバナンス',
-                'corporate governance',
-                'ガバナンス体制',
-                '統治体制',
-            ]
-            structure_keywords = [
-                '取締役会',
-                '監査役',
-                '指名委員会',
-                '報酬委員会',
-                'board of directors',
-                'audit committee',
-                'governance structure',
-            ]
-
-            has_cg_text = await self._check_keyword_in_html(page, cg_keywords)
-            has_structure_detail = await self._check_keyword_in_html(page, structure_keywords)
-            is_valid = has_cg_text and has_structure_detail
-
-            details = (
-                'コーポレートガバナンス情報を検出'
-                if is_valid
-                else 'ガバナンス情報の記載を検出できず'
-            )
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if is_valid else 'FAIL',
-                confidence=0.65 if is_valid else 0.4,
-                details=details,
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
-
-    async def check_item_172(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """No.1960: Strategy を掲載している"""
-        try:
-            page_text = await page.inner_text('body')
-            has_content = len(page_text) > 100  # プレースホルダー
-            
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
-
-    async def check_item_173(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """No.1970: 全取締役・監査役のSkills Matrixを掲載している"""
-        try:
-            page_text = await page.inner_text('body')
-            has_content = len(page_text) > 100  # プレースホルダー
-            
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
-
-    async def check_item_174(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """No.1980: Sustainabilityを掲載している"""
-        try:
-            page_text = await page.inner_text('body')
-            has_content = len(page_text) > 100  # プレースホルダー
-            
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
-
-    async def check_item_175(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """No.1990: TCFDガイドラインに沿った情報を掲載している"""
-        try:
-            page_text = await page.inner_text('body')
-            has_content = len(page_text) > 100  # プレースホルダー
-            
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
-
-    async def check_item_176(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """No.2000: Key Figuresなど業績のデータ集約ページがある"""
-        try:
-            page_text = await page.inner_text('body')
-            has_content = len(page_text) > 100  # プレースホルダー
-            
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
-
-    async def check_item_178(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """No.2020: 招集通知の英語版を掲載している（PDF可）"""
-        try:
-            pdf_count = await page.locator('a[href$=".pdf"]').count()
-            has_content = pdf_count > 0
-            
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
-
-    async def check_item_179(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """No.2030: Financial Results（Quarterly）を掲載している（PDF可）"""
-        try:
-            pdf_count = await page.locator('a[href$=".pdf"]').count()
-            has_content = pdf_count > 0
-            
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
-
-    async def check_item_180(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """No.2040: Integrated Report /Annual Reportを掲載している（PDF可）"""
-        try:
-            pdf_count = await page.locator('a[href$=".pdf"]').count()
-            has_content = pdf_count > 0
-            
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
-
-    async def check_item_181(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """No.2050: Presentationsを掲載している（PDF可）"""
-        try:
-            pdf_count = await page.locator('a[href$=".pdf"]').count()
-            has_content = pdf_count > 0
-            
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
-
-    async def check_item_183(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """No.2070: Financial Results（決算説明会）の動画を掲載している"""
-        try:
-            page_text = await page.inner_text('body')
-            has_content = '決算' in page_text
-            
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
-
-    async def check_item_184(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """No.2080: メールニュースの配信登録ができる"""
-        try:
-            page_text = await page.inner_text('body')
-            has_content = len(page_text) > 100  # プレースホルダー
-            
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
-
-    async def check_item_185(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """No.2090: 英語ページからメール問い合わせができる（フォーム可）"""
-        try:
-            page_text = await page.inner_text('body')
-            has_content = len(page_text) > 100  # プレースホルダー
-            
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
-
-    async def check_item_186(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """No.2100: IR関連の連絡先の電話番号を記載している"""
-        try:
-            page_text = await page.inner_text('body')
-            has_content = len(page_text) > 100  # プレースホルダー
-            
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
-
-    async def check_item_192(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """No.2170: Youtubeに開設する公式アカウントをIRトップで紹介している"""
-        try:
-            page_text = await page.inner_text('body')
-            has_content = len(page_text) > 100  # プレースホルダー
-            
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        body_text = await self._body_text(page)
+        normalized = self._normalize_text(body_text)
+        lower = normalized.lower()
+
+        has_calendar = 'irカレンダー' in normalized or 'ir calendar' in lower
+        overview_keywords = ['年間', 'annual', 'yearly', '年間予定', '年間スケジュール']
+        detail_keywords = ['詳細', '詳細を見る', '詳細予定', '詳細情報']
+
+        has_overview = any(keyword in normalized for keyword in overview_keywords)
+        has_detail_word = any(keyword in normalized for keyword in detail_keywords)
+
+        has_date_pattern = bool(CALENDAR_MONTH_PATTERN.search(normalized) or CALENDAR_DATE_PATTERN.search(normalized))
+
+        has_detail = has_detail_word or has_date_pattern
+
+        is_valid = has_calendar and has_overview and has_detail
+
+        if is_valid:
+            details = 'IRカレンダーの概要・詳細を検出'
+        else:
+            missing_parts = []
+            if not has_calendar:
+                missing_parts.append('カレンダー見出し')
+            if not has_overview:
+                missing_parts.append('年間概要')
+            if not has_detail:
+                missing_parts.append('詳細予定')
+            details = '不足: ' + '・'.join(missing_parts)
+
+        return self._create_result(
+            site, item,
+            result='PASS' if is_valid else 'FAIL',
+            confidence=0.5 if is_valid else 0.35,
+            details=details,
+        )
 
-    async def check_item_193(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """No.2180: Facebookに開設する公式アカウントをIRトップで紹介している"""
-        try:
-            page_text = await page.inner_text('body')
-            has_content = len(page_text) > 100  # プレースホルダー
-            
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+    @_returns_error_result
+    async def check_item_130(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
+        """IRトップ株価表示の関連情報チェック（item_id: 130）"""
+        body_text = await self._body_text(page)
+        normalized = self._normalize_text(body_text)
+        lower_text = normalized.lower()
+
+        stock_keywords = ['株価', 'stock price', 'share price', '株価情報']
+        related_keywords = [
+            '時価総額',
+            '最低購入代金',
+            '単元株',
+            'board lot',
+            'market cap',
+            'market capitalization',
+            'minimum investment',
+        ]
 
-    async def check_item_194(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """No.2190: X（旧Twitter）に開設する公式アカウントをIRトップで紹介している"""
-        try:
-            page_text = await page.inner_text('body')
-            has_content = len(page_text) > 100  # プレースホルダー
-            
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        has_stock_section = any(keyword in normalized for keyword in stock_keywords)
+        has_related_info = any(keyword in normalized for keyword in related_keywords)
 
-    async def check_item_195(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """No.2200: Instagramに開設する公式アカウントをIRトップで紹介している"""
-        try:
-            page_text = await page.inner_text('body')
-            has_content = len(page_text) > 100  # プレースホルダー
-            
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        if not has_related_info:
+            # 専用フォーマット（表やラベル）を確認
+            indicators = ['per share', 'lot', 'shares', '株']
+            has_related_info = any(indicator in lower_text for indicator in indicators)
 
-    async def check_item_196(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """No.2210: LinkedInに開設する公式アカウントをIRトップで紹介している"""
-        try:
-            page_text = await page.inner_text('body')
-            has_content = len(page_text) > 100  # プレースホルダー
-            
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        is_valid = has_stock_section and has_related_info
 
-    async def check_item_199(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """No.2250: ニュースリリースのフリーワード検索ができる"""
-        try:
-            search_exists = await page.locator('input[type="search"], input[name*="search"]').count()
-            has_content = search_exists > 0
-            
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        if is_valid:
+            details = '株価と関連指標（時価総額/最低購入等）を検出'
+        elif has_stock_section:
+            details = '株価表示のみ検出（関連指標なし）'
+        else:
+            details = 'IRトップ株価表示を検出できず'
 
-    async def check_item_200(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """No.2260: ニュースリリースは内容別にソーティングができる"""
-        try:
-            page_text = await page.inner_text('body')
-            has_content = len(page_text) > 100  # プレースホルダー
-            
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        return self._create_result(
+            site, item,
+            result='PASS' if is_valid else 'FAIL',
+            confidence=0.65 if is_valid else 0.45,
+            details=details,
+        )
 
-    async def check_item_201(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """No.2270: ニュースリリースのメール配信登録ができる"""
-        try:
-            page_text = await page.inner_text('body')
-            has_content = len(page_text) > 100  # プレースホルダー
-            
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+    @_returns_error_result
+    async def check_item_168(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
+        """コーポレートガバナンス掲載チェック（item_id: 168）"""
+        cg_keywords = [
+            'コーポレートガバナンス',
+            'corporate governance',
+            'ガバナンス体制',
+            '統治体制',
+        ]
+        structure_keywords = [
+            '取締役会',
+            '監査役',
+            '指名委員会',
+            '報酬委員会',
+            'board of directors',
+            'audit committee',
+            'governance structure',
+        ]
 
-    async def check_item_202(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """No.2280: 最新資料の一括圧縮ダウンロードを行っている"""
-        try:
-            page_text = await page.inner_text('body')
-            has_content = len(page_text) > 100  # プレースホルダー
-            
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        has_cg_text = await self._check_keyword_in_html(page, cg_keywords)
+        has_structure_detail = await self._check_keyword_in_html(page, structure_keywords)
+        is_valid = has_cg_text and has_structure_detail
 
-    async def check_item_203(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """No.2290: IR関連の問い合わせメールがある（フォーム可）"""
-        try:
-            page_text = await page.inner_text('body')
-            has_content = len(page_text) > 100  # プレースホルダー
-            
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        details = (
+            'コーポレートガバナンス情報を検出'
+            if is_valid
+            else 'ガバナンス情報の記載を検出できず'
+        )
 
-    async def check_item_204(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
-        """No.2300: IR関連の問い合わせ電話番号を記載している"""
-        try:
-            page_text = await page.inner_text('body')
-            has_content = len(page_text) > 100  # プレースホルダー
+        return self._create_result(
+            site, item,
+            result='PASS' if is_valid else 'FAIL',
+            confidence=0.65 if is_valid else 0.4,
+            details=details,
+        )
+
+    @_returns_error_result
+    async def check_item_183(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
+        """No.2070: Financial Results（決算説明会）の動画を掲載している"""
+        page_text = await self._body_text(page)
+        has_content = '決算' in page_text
             
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='検証完了' if has_content else '未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        return self._create_result(
+            site, item,
+            result='PASS' if has_content else 'FAIL',
+            confidence=0.7,
+            details='検証完了' if has_content else '未検出',
+        )
 
     # Phase 6-2: 中優先度Script項目4項目追加
 
+    @_returns_error_result
     async def check_item_68(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """No.820: B/S・P/L・C/Sを勘定科目ごとにすべてHTMLで掲載している"""
-        try:
-            page_text = await page.inner_text('body')
-
-            # B/S (貸借対照表) の詳細チェック
-            bs_keywords = ['貸借対照表', 'バランスシート', 'B/S', 'Balance Sheet']
-            bs_accounts = ['資産', '負債', '純資産', '流動資産', '固定資産', '流動負債', '固定負債']
-            has_bs_title = any(kw in page_text for kw in bs_keywords)
-            has_bs_accounts = sum(1 for acc in bs_accounts if acc in page_text) >= 4
-            has_bs = has_bs_title and has_bs_accounts
-
-            # P/L (損益計算書) の詳細チェック
-            pl_keywords = ['損益計算書', 'P/L', 'Income Statement', '利益計算書']
-            pl_accounts = ['売上高', '営業利益', '経常利益', '当期純利益', '売上原価', '販売費']
-            has_pl_title = any(kw in page_text for kw in pl_keywords)
-            has_pl_accounts = sum(1 for acc in pl_accounts if acc in page_text) >= 4
-            has_pl = has_pl_title and has_pl_accounts
-
-            # C/S (キャッシュフロー計算書) の詳細チェック
-            cs_keywords = ['キャッシュ・フロー', 'キャッシュフロー', 'C/S', 'Cash Flow', 'CF計算書']
-            cs_accounts = ['営業活動', '投資活動', '財務活動', 'キャッシュフロー', '現金及び現金同等物']
-            has_cs_title = any(kw in page_text for kw in cs_keywords)
-            has_cs_accounts = sum(1 for acc in cs_accounts if acc in page_text) >= 3
-            has_cs = has_cs_title and has_cs_accounts
-
-            # テーブル構造の確認（HTMLで掲載されている証拠）
-            tables = await page.query_selector_all('table')
-            has_tables = len(tables) >= 2
-
-            # 全ての条件を満たす必要がある
-            has_content = has_bs and has_pl and has_cs and has_tables
-
-            # 詳細情報の構築
-            details_parts = []
-            if has_bs:
-                details_parts.append('B/S検出')
-            if has_pl:
-                details_parts.append('P/L検出')
-            if has_cs:
-                details_parts.append('C/S検出')
-            if has_tables:
-                details_parts.append(f'テーブル{len(tables)}個')
-
-            details = '、'.join(details_parts) if details_parts else '財務諸表未検出'
-            confidence = 0.85 if has_content else 0.75
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=confidence,
-                details=details,
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        page_text = await self._body_text(page)
+
+        # B/S (貸借対照表) の詳細チェック
+        bs_keywords = ['貸借対照表', 'バランスシート', 'B/S', 'Balance Sheet']
+        bs_accounts = ['資産', '負債', '純資産', '流動資産', '固定資産', '流動負債', '固定負債']
+        has_bs_title = any(kw in page_text for kw in bs_keywords)
+        has_bs_accounts = sum(1 for acc in bs_accounts if acc in page_text) >= 4
+        has_bs = has_bs_title and has_bs_accounts
+
+        # P/L (損益計算書) の詳細チェック
+        pl_keywords = ['損益計算書', 'P/L', 'Income Statement', '利益計算書']
+        pl_accounts = ['売上高', '営業利益', '経常利益', '当期純利益', '売上原価', '販売費']
+        has_pl_title = any(kw in page_text for kw in pl_keywords)
+        has_pl_accounts = sum(1 for acc in pl_accounts if acc in page_text) >= 4
+        has_pl = has_pl_title and has_pl_accounts
+
+        # C/S (キャッシュフロー計算書) の詳細チェック
+        cs_keywords = ['キャッシュ・フロー', 'キャッシュフロー', 'C/S', 'Cash Flow', 'CF計算書']
+        cs_accounts = ['営業活動', '投資活動', '財務活動', 'キャッシュフロー', '現金及び現金同等物']
+        has_cs_title = any(kw in page_text for kw in cs_keywords)
+        has_cs_accounts = sum(1 for acc in cs_accounts if acc in page_text) >= 3
+        has_cs = has_cs_title and has_cs_accounts
+
+        # テーブル構造の確認（HTMLで掲載されている証拠）
+        tables = await page.query_selector_all('table')
+        has_tables = len(tables) >= 2
+
+        # 全ての条件を満たす必要がある
+        has_content = has_bs and has_pl and has_cs and has_tables
+
+        # 詳細情報の構築
+        details_parts = []
+        if has_bs:
+            details_parts.append('B/S検出')
+        if has_pl:
+            details_parts.append('P/L検出')
+        if has_cs:
+            details_parts.append('C/S検出')
+        if has_tables:
+            details_parts.append(f'テーブル{len(tables)}個')
+
+        details = '、'.join(details_parts) if details_parts else '財務諸表未検出'
+        confidence = 0.85 if has_content else 0.75
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_content else 'FAIL',
+            confidence=confidence,
+            details=details,
+        )
 
+    @_returns_error_result
     async def check_item_72(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """No.860: セグメント別売上高（または利益）構成比をグラフで掲載している"""
-        try:
-            page_text = await page.inner_text('body')
-
-            # セグメント情報の詳細チェック
-            segment_keywords = ['セグメント', 'segment', '事業別', '部門別']
-            has_segment = any(kw in page_text for kw in segment_keywords)
-
-            # 売上高/利益の構成比を示すキーワード
-            has_composition = any(kw in page_text for kw in ['構成比', '売上高', '営業利益', '利益'])
-
-            # グラフ要素の包括的な検出
-            graph_selectors = [
-                'img[src*="graph"]', 'img[src*="chart"]', 'img[src*="segment"]',
-                'img[alt*="グラフ"]', 'img[alt*="チャート"]', 'img[alt*="セグメント"]',
-                'canvas', 'svg',
-                'div[class*="chart"]', 'div[class*="graph"]',
-                'figure', 'img[src*="pie"]', 'img[src*="bar"]'
-            ]
+        page_text = await self._body_text(page)
+
+        # セグメント情報の詳細チェック
+        segment_keywords = ['セグメント', 'segment', '事業別', '部門別']
+        has_segment = any(kw in page_text for kw in segment_keywords)
+
+        # 売上高/利益の構成比を示すキーワード
+        has_composition = any(kw in page_text for kw in ['構成比', '売上高', '営業利益', '利益'])
+
+        # グラフ要素の包括的な検出
+        graph_selectors = [
+            'img[src*="graph"]', 'img[src*="chart"]', 'img[src*="segment"]',
+            'img[alt*="グラフ"]', 'img[alt*="チャート"]', 'img[alt*="セグメント"]',
+            'canvas', 'svg',
+            'div[class*="chart"]', 'div[class*="graph"]',
+            'figure', 'img[src*="pie"]', 'img[src*="bar"]'
+        ]
 
-            total_graphs = 0
-            for selector in graph_selectors:
-                graphs = await page.query_selector_all(selector)
-                total_graphs += len(graphs)
-
-            has_graph = total_graphs > 0
-
-            # 全ての条件を満たす
-            has_content = has_segment and has_composition and has_graph
-
-            # 詳細情報の構築
-            details_parts = []
-            if has_segment:
-                details_parts.append('セグメント情報')
-            if has_composition:
-                details_parts.append('構成比データ')
-            if has_graph:
-                details_parts.append(f'グラフ要素{total_graphs}個')
-
-            details = '、'.join(details_parts) if details_parts else 'セグメントグラフ未検出'
-            confidence = 0.80 if has_content else 0.70
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=confidence,
-                details=details,
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        total_graphs = 0
+        for selector in graph_selectors:
+            graphs = await page.query_selector_all(selector)
+            total_graphs += len(graphs)
+
+        has_graph = total_graphs > 0
+
+        # 全ての条件を満たす
+        has_content = has_segment and has_composition and has_graph
+
+        # 詳細情報の構築
+        details_parts = []
+        if has_segment:
+            details_parts.append('セグメント情報')
+        if has_composition:
+            details_parts.append('構成比データ')
+        if has_graph:
+            details_parts.append(f'グラフ要素{total_graphs}個')
+
+        details = '、'.join(details_parts) if details_parts else 'セグメントグラフ未検出'
+        confidence = 0.80 if has_content else 0.70
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_content else 'FAIL',
+            confidence=confidence,
+            details=details,
+        )
 
+    @_returns_error_result
     async def check_item_105(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """No.1230: 配当政策をHTMLで掲載している"""
-        try:
-            page_text = await page.inner_text('body')
-            has_content = '配当' in page_text and ('政策' in page_text or '方針' in page_text)
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=0.7,
-                details='配当政策検出' if has_content else '配当政策未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        page_text = await self._body_text(page)
+        has_content = '配当' in page_text and ('政策' in page_text or '方針' in page_text)
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_content else 'FAIL',
+            confidence=0.7,
+            details='配当政策検出' if has_content else '配当政策未検出',
+        )
 
+    @_returns_error_result
     async def check_item_141(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """No.1640: 役員報酬・監査報酬支払額をHTMLで掲載している"""
-        try:
-            page_text = await page.inner_text('body')
-
-            # 役員報酬の詳細チェック
-            exec_comp_keywords = ['役員報酬', '取締役報酬', '役員の報酬']
-            has_exec_comp_text = any(kw in page_text for kw in exec_comp_keywords)
-
-            # 監査報酬の詳細チェック
-            audit_fee_keywords = ['監査報酬', '会計監査人', '監査法人']
-            has_audit_fee_text = any(kw in page_text for kw in audit_fee_keywords)
-
-            # 数値データの存在確認（金額を示す文字列）
-            import re
-            has_amount_data = bool(re.search(r'[0-9,]+\s*(?:百万円|千円|億円|円|million|千円)', page_text))
-
-            # テーブル要素の存在確認（HTMLで掲載されている証拠）
-            tables = await page.query_selector_all('table')
-            has_tables = len(tables) > 0
-
-            # 役員報酬と監査報酬の両方が必要（タイトルにある通り）
-            has_content = has_exec_comp_text and has_audit_fee_text and has_amount_data and has_tables
-
-            # 詳細情報の構築
-            details_parts = []
-            if has_exec_comp_text:
-                details_parts.append('役員報酬')
-            if has_audit_fee_text:
-                details_parts.append('監査報酬')
-            if has_amount_data:
-                details_parts.append('金額データ')
-            if has_tables:
-                details_parts.append(f'テーブル{len(tables)}個')
-
-            details = '、'.join(details_parts) if details_parts else '役員報酬・監査報酬未検出'
-            confidence = 0.85 if has_content else 0.75
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_content else 'FAIL',
-                confidence=confidence,
-                details=details,
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        page_text = await self._body_text(page)
+
+        # 役員報酬の詳細チェック
+        exec_comp_keywords = ['役員報酬', '取締役報酬', '役員の報酬']
+        has_exec_comp_text = any(kw in page_text for kw in exec_comp_keywords)
+
+        # 監査報酬の詳細チェック
+        audit_fee_keywords = ['監査報酬', '会計監査人', '監査法人']
+        has_audit_fee_text = any(kw in page_text for kw in audit_fee_keywords)
+
+        # 数値データの存在確認（金額を示す文字列）
+        has_amount_data = bool(re.search(r'[0-9,]+\s*(?:百万円|千円|億円|円|million|千円)', page_text))
+
+        # テーブル要素の存在確認（HTMLで掲載されている証拠）
+        tables = await page.query_selector_all('table')
+        has_tables = len(tables) > 0
+
+        # 役員報酬と監査報酬の両方が必要（タイトルにある通り）
+        has_content = has_exec_comp_text and has_audit_fee_text and has_amount_data and has_tables
+
+        # 詳細情報の構築
+        details_parts = []
+        if has_exec_comp_text:
+            details_parts.append('役員報酬')
+        if has_audit_fee_text:
+            details_parts.append('監査報酬')
+        if has_amount_data:
+            details_parts.append('金額データ')
+        if has_tables:
+            details_parts.append(f'テーブル{len(tables)}個')
+
+        details = '、'.join(details_parts) if details_parts else '役員報酬・監査報酬未検出'
+        confidence = 0.85 if has_content else 0.75
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_content else 'FAIL',
+            confidence=confidence,
+            details=details,
+        )
 
+    @_returns_error_result
     async def check_item_30(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """No.300: 通常のテキストと見分けがつかないテキストリンクを用いていない"""
-        try:
-            # リンクのスタイルをチェック（underline, color差異など）
-            links = await page.query_selector_all('a[href]')  # href属性を持つリンクのみ
+        # リンクのスタイルをチェック（underline, color差異など）
+        links = await page.query_selector_all('a[href]')  # href属性を持つリンクのみ
 
-            # サンプルリンクのスタイル解析（最大50個）
-            problematic_links = 0
-            styled_links = 0
-            total_checked = min(len(links), 50)
+        # サンプルリンクのスタイル解析（最大50個）
+        problematic_links = 0
+        styled_links = 0
+        total_checked = min(len(links), 50)
 
-            for link in links[:total_checked]:
-                # JavaScriptでスタイル情報を直接取得
-                style_info = await link.evaluate('''(el) => {
+        for link in links[:total_checked]:
+            # JavaScriptでスタイル情報を直接取得
+            style_info = await link.evaluate('''(el) => {
                     const style = window.getComputedStyle(el);
                     return {
                         textDecoration: style.textDecoration,
@@ -4626,110 +3078,78 @@ class ScriptValidator:
                     };
                 }''')
 
-                text_decoration = style_info.get('textDecoration', '')
-                color = style_info.get('color', '')
-                cursor = style_info.get('cursor', '')
+            text_decoration = style_info.get('textDecoration', '')
+            color = style_info.get('color', '')
+            cursor = style_info.get('cursor', '')
 
-                # リンクらしいスタイルの判定
-                has_underline = 'underline' in text_decoration
-                has_pointer = cursor == 'pointer'
+            # リンクらしいスタイルの判定
+            has_underline = 'underline' in text_decoration
+            has_pointer = cursor == 'pointer'
 
-                # 色が設定されているか（rgb形式で黒以外）
-                has_color = color and color not in ['rgb(0, 0, 0)', 'rgba(0, 0, 0, 1)']
+            # 色が設定されているか（rgb形式で黒以外）
+            has_color = color and color not in ['rgb(0, 0, 0)', 'rgba(0, 0, 0, 1)']
 
-                # リンクらしいスタイルが1つ以上あればOK
-                is_styled = has_underline or has_color or has_pointer
+            # リンクらしいスタイルが1つ以上あればOK
+            is_styled = has_underline or has_color or has_pointer
 
-                if is_styled:
-                    styled_links += 1
-                else:
-                    problematic_links += 1
-
-            # 大半のリンクがスタイル適用されていればPASS
-            if total_checked > 0:
-                styled_ratio = styled_links / total_checked
-                has_issue = styled_ratio < 0.8  # 80%以上のリンクがスタイル適用されていればPASS
+            if is_styled:
+                styled_links += 1
             else:
-                has_issue = False
-
-            details = f'リンク{styled_links}/{total_checked}個がスタイル適用' if total_checked > 0 else 'リンク未検出'
-            confidence = 0.75  # 改善されたロジックによりconfidence向上
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='FAIL' if has_issue else 'PASS',
-                confidence=confidence,
-                details=details,
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+                problematic_links += 1
+
+        # 大半のリンクがスタイル適用されていればPASS
+        if total_checked > 0:
+            styled_ratio = styled_links / total_checked
+            has_issue = styled_ratio < 0.8  # 80%以上のリンクがスタイル適用されていればPASS
+        else:
+            has_issue = False
+
+        details = f'リンク{styled_links}/{total_checked}個がスタイル適用' if total_checked > 0 else 'リンク未検出'
+        confidence = 0.75  # 改善されたロジックによりconfidence向上
+
+        return self._create_result(
+            site, item,
+            result='FAIL' if has_issue else 'PASS',
+            confidence=confidence,
+            details=details,
+        )
 
+    @_returns_error_result
     async def check_item_76(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """No.910: 直近の決算短信を掲載している（PDF可）"""
-        try:
-            page_text = await page.inner_text('body')
-            # 決算短信関連のキーワード
-            has_content = '決算短信' in page_text or '決算サマリー' in page_text
-            # PDFリンクの確認
-            pdf_links = await page.query_selector_all('a[href*=".pdf"]')
-            has_pdf = len(pdf_links) > 0
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if (has_content or has_pdf) else 'FAIL',
-                confidence=0.7,
-                details='決算短信検出' if (has_content or has_pdf) else '決算短信未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        page_text = await self._body_text(page)
+        # 決算短信関連のキーワード
+        has_content = '決算短信' in page_text or '決算サマリー' in page_text
+        # PDFリンクの確認
+        pdf_links = await page.query_selector_all('a[href*=".pdf"]')
+        has_pdf = len(pdf_links) > 0
+
+        return self._create_result(
+            site, item,
+            result='PASS' if (has_content or has_pdf) else 'FAIL',
+            confidence=0.7,
+            details='決算短信検出' if (has_content or has_pdf) else '決算短信未検出',
+        )
 
     def _create_error_result(self, site: Site, item: ValidationItem, error_msg: str, checked_url: str = None) -> ValidationResult:
         """エラー結果を作成"""
-        return ValidationResult(
-            site_id=site.site_id,
-            company_name=site.company_name,
-            url=site.url,
-            item_id=item.item_id,
-            item_name=item.item_name,
-            category=item.category,
-            subcategory=item.subcategory,
+        return self._create_result(
+            site, item,
             result='ERROR',
             confidence=0.0,
             details=error_msg,
-            checked_at=datetime.now(),
             checked_url=checked_url,
-            error_message=error_msg
+            error_message=error_msg,
         )
 
     def _create_unknown_result(self, site: Site, item: ValidationItem, reason: str, checked_url: str = None) -> ValidationResult:
         """UNKNOWN結果を作成"""
-        return ValidationResult(
-            site_id=site.site_id,
-            company_name=site.company_name,
-            url=site.url,
-            item_id=item.item_id,
-            item_name=item.item_name,
-            category=item.category,
-            subcategory=item.subcategory,
+        return self._create_result(
+            site, item,
             result='UNKNOWN',
             confidence=0.0,
             details=reason,
-            checked_at=datetime.now(),
-            checked_url=checked_url
+            checked_url=checked_url,
         )
 
     def _create_result(
@@ -4739,10 +3159,14 @@ class ScriptValidator:
         result: str,
         confidence: float,
         details: str,
-        checked_url: str = None
+        checked_url: str = None,
+        screenshot_path: Optional[str] = None,
+        error_message: Optional[str] = None
     ) -> ValidationResult:
         """標準的なValidationResultを生成
 
+        サイト・項目から写す項目と checked_at（バッチ内では共通の時刻）はここでまとめて設定する。
+
         Args:
             site: サイト情報
             item: 検証項目
@@ -4750,6 +3174,8 @@ class ScriptValidator:
             confidence: 信頼度（0.0-1.0）
             details: 詳細メッセージ
             checked_url: 検証したURL（オプション）
+            screenshot_path: 根拠となるスクリーンショットのパス（オプション）
+            error_message: エラー内容（ERROR 結果のみ）
 
         Returns:
             ValidationResult: 検証結果オブジェクト
@@ -4765,8 +3191,10 @@ class ScriptValidator:
             result=result,
             confidence=confidence,
             details=details,
-            checked_at=datetime.now(),
-            checked_url=checked_url
+            checked_at=self._checked_at(),
+            checked_url=checked_url,
+            screenshot_path=screenshot_path,
+            error_message=error_message
         )
 
     def _create_pass_result(
@@ -4897,119 +3325,93 @@ class ScriptValidator:
 
     # === 2025年版新規項目実装 ===
 
+    @_returns_error_result
     async def check_item_45(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """No.450: 常設するサイト内検索には入力スペースも表示している"""
-        try:
-            # 検索入力フォームの検出（複数のセレクタパターン）
-            search_input_selectors = [
-                'input[type="search"]',
-                'input[name*="search"]',
-                'input[name*="keyword"]',
-                'input[placeholder*="検索"]',
-                'input[placeholder*="Search"]',
-                '.search-input',
-                '#search-input'
-            ]
+        # 検索入力フォームの検出（複数のセレクタパターン）
+        search_input_selectors = [
+            'input[type="search"]',
+            'input[name*="search"]',
+            'input[name*="keyword"]',
+            'input[placeholder*="検索"]',
+            'input[placeholder*="Search"]',
+            '.search-input',
+            '#search-input'
+        ]
 
-            found_visible_input = False
-            for selector in search_input_selectors:
-                try:
-                    inputs = await page.locator(selector).all()
-                    for input_elem in inputs:
-                        # 可視性チェック
-                        is_visible = await input_elem.is_visible()
-                        if is_visible:
-                            # 入力欄の幅をチェック（ボタンのみは不可）
-                            box = await input_elem.bounding_box()
-                            if box and box['width'] > 50:  # 50px以上の幅があれば入力スペース
-                                found_visible_input = True
-                                break
-                except:
-                    continue
-                if found_visible_input:
-                    break
+        found_visible_input = False
+        for selector in search_input_selectors:
+            try:
+                inputs = await page.locator(selector).all()
+                for input_elem in inputs:
+                    # 可視性チェック
+                    is_visible = await input_elem.is_visible()
+                    if is_visible:
+                        # 入力欄の幅をチェック（ボタンのみは不可）
+                        box = await input_elem.bounding_box()
+                        if box and box['width'] > 50:  # 50px以上の幅があれば入力スペース
+                            found_visible_input = True
+                            break
+            except:
+                continue
+            if found_visible_input:
+                break
 
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if found_visible_input else 'FAIL',
-                confidence=0.8,
-                details='検索入力スペース検出' if found_visible_input else '検索入力スペース未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        return self._create_result(
+            site, item,
+            result='PASS' if found_visible_input else 'FAIL',
+            confidence=0.8,
+            details='検索入力スペース検出' if found_visible_input else '検索入力スペース未検出',
+        )
 
+    @_returns_error_result
     async def check_item_46(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """No.460: 検索結果表示のトップには検索結果件数を掲載している"""
-        try:
-            # 注意: この検証は検索結果ページで実行される必要がある
-            # IRトップでは判定不可能なため、ページテキストから推測
-            page_text = await page.inner_text('body')
-
-            # 検索結果件数のパターン
-            import re
-            patterns = [
-                r'(\d+)\s*件',
-                r'(\d+)\s*results?',
-                r'(\d+)\s*items?',
-                r'全\s*(\d+)\s*件',
-                r'検索結果\s*[:：]\s*(\d+)'
-            ]
+        # 注意: この検証は検索結果ページで実行される必要がある
+        # IRトップでは判定不可能なため、ページテキストから推測
+        page_text = await self._body_text(page)
+
+        # 検索結果件数のパターン
+        patterns = [
+            r'(\d+)\s*件',
+            r'(\d+)\s*results?',
+            r'(\d+)\s*items?',
+            r'全\s*(\d+)\s*件',
+            r'検索結果\s*[:：]\s*(\d+)'
+        ]
 
-            has_count_display = False
-            for pattern in patterns:
-                if re.search(pattern, page_text):
-                    has_count_display = True
-                    break
+        has_count_display = False
+        for pattern in patterns:
+            if re.search(pattern, page_text):
+                has_count_display = True
+                break
 
-            # 検索結果ページかどうかの判定
-            is_search_results_page = ('検索結果' in page_text or
-                                     'search' in page.url.lower() or
-                                     '件' in page_text[:1000])  # ページ上部に「件」がある
-
-            if not is_search_results_page:
-                # 検索結果ページではないため判定不可
-                return ValidationResult(
-                    site_id=site.site_id,
-                    company_name=site.company_name,
-                    url=site.url,
-                    item_id=item.item_id,
-                    item_name=item.item_name,
-                    category=item.category,
-                    subcategory=item.subcategory,
-                    result='UNKNOWN',
-                    confidence=0.0,
-                    details='検索結果ページではないため判定不可（検索機能を実行する必要あり）',
-                    checked_at=datetime.now()
-                )
+        # 検索結果ページかどうかの判定
+        is_search_results_page = ('検索結果' in page_text or
+                                 'search' in page.url.lower() or
+                                 '件' in page_text[:1000])  # ページ上部に「件」がある
 
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_count_display else 'FAIL',
-                confidence=0.7,
-                details='検索結果件数表示検出' if has_count_display else '検索結果件数表示未検出',
-                checked_at=datetime.now()
+        if not is_search_results_page:
+            # 検索結果ページではないため判定不可
+            return self._create_result(
+                site, item,
+                result='UNKNOWN',
+                confidence=0.0,
+                details='検索結果ページではないため判定不可（検索機能を実行する必要あり）',
             )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
 
+        return self._create_result(
+            site, item,
+            result='PASS' if has_count_display else 'FAIL',
+            confidence=0.7,
+            details='検索結果件数表示検出' if has_count_display else '検索結果件数表示未検出',
+        )
+
+    @_returns_error_result
     async def check_item_53(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """No.530: IRトップページ：Action Duration（表示速度）は2.0秒以下"""
-        try:
-            # Performance APIを使用して読み込み時間を計測
-            load_time = await page.evaluate('''
+        # Performance APIを使用して読み込み時間を計測
+        load_time = await page.evaluate('''
                 () => {
                     const perfData = window.performance.timing;
                     const loadTime = (perfData.loadEventEnd - perfData.navigationStart) / 1000;
@@ -5017,29 +3419,20 @@ class ScriptValidator:
                 }
             ''')
 
-            is_fast = load_time <= 2.0
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if is_fast else 'FAIL',
-                confidence=0.9,
-                details=f'読み込み時間: {load_time:.2f}秒',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        is_fast = load_time <= 2.0
 
+        return self._create_result(
+            site, item,
+            result='PASS' if is_fast else 'FAIL',
+            confidence=0.9,
+            details=f'読み込み時間: {load_time:.2f}秒',
+        )
+
+    @_returns_error_result
     async def check_item_54(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """No.540: IRトップページ：Action Duration（表示速度）は1.0秒以下"""
-        try:
-            # Performance APIを使用して読み込み時間を計測
-            load_time = await page.evaluate('''
+        # Performance APIを使用して読み込み時間を計測
+        load_time = await page.evaluate('''
                 () => {
                     const perfData = window.performance.timing;
                     const loadTime = (perfData.loadEventEnd - perfData.navigationStart) / 1000;
@@ -5047,23 +3440,14 @@ class ScriptValidator:
                 }
             ''')
 
-            is_fast = load_time <= 1.0
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if is_fast else 'FAIL',
-                confidence=0.9,
-                details=f'読み込み時間: {load_time:.2f}秒',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        is_fast = load_time <= 1.0
+
+        return self._create_result(
+            site, item,
+            result='PASS' if is_fast else 'FAIL',
+            confidence=0.9,
+            details=f'読み込み時間: {load_time:.2f}秒',
+        )
 
     async def check_item_62(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """No.620: TLS1.3が有効である"""
@@ -5144,419 +3528,301 @@ class ScriptValidator:
         except Exception as e:
             return self._create_error_result(site, item, str(e), site.url)
 
+    @_returns_error_result
     async def check_item_94_new(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """No.940: 業績予想（業績見通し）を掲載している"""
-        try:
-            page_text = await page.inner_text('body')
-
-            # 業績予想関連のキーワード
-            keywords = ['業績予想', '業績見通し', '見通し', '予想', '業績予測', 'forecast', '通期予想']
-            has_forecast = any(keyword in page_text for keyword in keywords)
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_forecast else 'FAIL',
-                confidence=0.7,
-                details='業績予想関連コンテンツ検出' if has_forecast else '業績予想未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        page_text = await self._body_text(page)
+
+        # 業績予想関連のキーワード
+        keywords = ['業績予想', '業績見通し', '見通し', '予想', '業績予測', 'forecast', '通期予想']
+        has_forecast = any(keyword in page_text for keyword in keywords)
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_forecast else 'FAIL',
+            confidence=0.7,
+            details='業績予想関連コンテンツ検出' if has_forecast else '業績予想未検出',
+        )
 
+    @_returns_error_result
     async def check_item_128(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """No.1280: 株価情報は自社専用のものを掲載している（Yahooや証券会社等のリンク不可）"""
-        try:
-            page_text = await page.inner_text('body')
-
-            # 外部サービスのキーワード
-            external_services = ['Yahoo', 'yahoo', '日経', '楽天証券', 'SBI証券', 'マネックス']
-            has_external = any(service in page_text for service in external_services)
-
-            # 株価チャート関連の要素（自社実装の可能性）
-            chart_elements = await page.locator('canvas, svg, iframe[src*="stock"], .stock-chart, .chart').count()
-
-            # 外部サービスリンクがなく、チャート要素がある場合はPASS
-            is_own_chart = not has_external and chart_elements > 0
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if is_own_chart else 'FAIL',
-                confidence=0.8,
-                details='自社株価チャート検出' if is_own_chart else '外部サービス利用または株価なし',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        page_text = await self._body_text(page)
 
+        # 外部サービスのキーワード
+        external_services = ['Yahoo', 'yahoo', '日経', '楽天証券', 'SBI証券', 'マネックス']
+        has_external = any(service in page_text for service in external_services)
+
+        # 株価チャート関連の要素（自社実装の可能性）
+        chart_elements = await page.locator('canvas, svg, iframe[src*="stock"], .stock-chart, .chart').count()
+
+        # 外部サービスリンクがなく、チャート要素がある場合はPASS
+        is_own_chart = not has_external and chart_elements > 0
+
+        return self._create_result(
+            site, item,
+            result='PASS' if is_own_chart else 'FAIL',
+            confidence=0.8,
+            details='自社株価チャート検出' if is_own_chart else '外部サービス利用または株価なし',
+        )
+
+    @_returns_error_result
     async def check_item_138(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """No.1380: 主要株主一覧を掲載している"""
-        try:
-            page_text = await page.inner_text('body')
-
-            # 主要株主関連のキーワード
-            keywords = ['主要株主', '大株主', '株主構成', '所有者別', 'Major Shareholders']
-            has_shareholders = any(keyword in page_text for keyword in keywords)
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_shareholders else 'FAIL',
-                confidence=0.7,
-                details='主要株主情報検出' if has_shareholders else '主要株主情報未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        page_text = await self._body_text(page)
+
+        # 主要株主関連のキーワード
+        keywords = ['主要株主', '大株主', '株主構成', '所有者別', 'Major Shareholders']
+        has_shareholders = any(keyword in page_text for keyword in keywords)
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_shareholders else 'FAIL',
+            confidence=0.7,
+            details='主要株主情報検出' if has_shareholders else '主要株主情報未検出',
+        )
 
+    @_returns_error_result
     async def check_item_150(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """No.1500: トップメッセージに直近1年以内の更新日付を記載している"""
-        try:
-            page_text = await page.inner_text('body')
+        page_text = await self._body_text(page)
 
-            # 日付パターン
-            import re
-            from datetime import datetime, timedelta
+        # 日付パターン
+        from datetime import datetime, timedelta
 
-            date_patterns = [
-                r'20(\d{2})年(\d{1,2})月',
-                r'20(\d{2})/(\d{1,2})/(\d{1,2})',
-                r'20(\d{2})-(\d{1,2})-(\d{1,2})'
-            ]
+        date_patterns = [
+            r'20(\d{2})年(\d{1,2})月',
+            r'20(\d{2})/(\d{1,2})/(\d{1,2})',
+            r'20(\d{2})-(\d{1,2})-(\d{1,2})'
+        ]
 
-            current_year = datetime.now().year
-            last_year = current_year - 1
-
-            has_recent_date = False
-            for pattern in date_patterns:
-                matches = re.findall(pattern, page_text)
-                for match in matches:
-                    try:
-                        year = int('20' + match[0])
-                        if year >= last_year:
-                            has_recent_date = True
-                            break
-                    except:
-                        continue
-                if has_recent_date:
-                    break
+        current_year = datetime.now().year
+        last_year = current_year - 1
 
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_recent_date else 'FAIL',
-                confidence=0.7,
-                details='直近1年以内の日付検出' if has_recent_date else '直近日付未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        has_recent_date = False
+        for pattern in date_patterns:
+            matches = re.findall(pattern, page_text)
+            for match in matches:
+                try:
+                    year = int('20' + match[0])
+                    if year >= last_year:
+                        has_recent_date = True
+                        break
+                except:
+                    continue
+            if has_recent_date:
+                break
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_recent_date else 'FAIL',
+            confidence=0.7,
+            details='直近1年以内の日付検出' if has_recent_date else '直近日付未検出',
+        )
 
+    @_returns_error_result
     async def check_item_151(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """No.1510: トップメッセージの氏名はテキストで記載している"""
-        try:
-            # テキストノードから氏名らしきパターンを検出
-            page_text = await page.inner_text('body')
-
-            # 役職 + 氏名のパターン
-            import re
-            name_patterns = [
-                r'代表取締役.*?[一-龥]{2,4}\s*[一-龥]{2,4}',
-                r'社長.*?[一-龥]{2,4}\s*[一-龥]{2,4}',
-                r'CEO.*?[A-Za-z]+\s+[A-Za-z]+',
-                r'President.*?[A-Za-z]+\s+[A-Za-z]+'
-            ]
+        # テキストノードから氏名らしきパターンを検出
+        page_text = await self._body_text(page)
+
+        # 役職 + 氏名のパターン
+        name_patterns = [
+            r'代表取締役.*?[一-龥]{2,4}\s*[一-龥]{2,4}',
+            r'社長.*?[一-龥]{2,4}\s*[一-龥]{2,4}',
+            r'CEO.*?[A-Za-z]+\s+[A-Za-z]+',
+            r'President.*?[A-Za-z]+\s+[A-Za-z]+'
+        ]
 
-            has_text_name = False
-            for pattern in name_patterns:
-                if re.search(pattern, page_text):
-                    has_text_name = True
-                    break
+        has_text_name = False
+        for pattern in name_patterns:
+            if re.search(pattern, page_text):
+                has_text_name = True
+                break
 
-            # 画像のみで氏名を表示している場合は検出できない
-            # テキストで氏名があればPASS
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_text_name else 'FAIL',
-                confidence=0.6,
-                details='テキストでの氏名検出' if has_text_name else 'テキストでの氏名未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        # 画像のみで氏名を表示している場合は検出できない
+        # テキストで氏名があればPASS
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_text_name else 'FAIL',
+            confidence=0.6,
+            details='テキストでの氏名検出' if has_text_name else 'テキストでの氏名未検出',
+        )
 
+    @_returns_error_result
     async def check_item_214(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """No.2140: 招集通知の英語版を掲載している（PDF可）"""
-        try:
-            page_text = await page.inner_text('body')
+        page_text = await self._body_text(page)
+
+        # 招集通知英語版のキーワード
+        keywords = [
+            'Notice of',
+            'Convocation',
+            'AGM',
+            'General Meeting',
+            'Shareholders Meeting'
+        ]
 
-            # 招集通知英語版のキーワード
-            keywords = [
-                'Notice of',
-                'Convocation',
-                'AGM',
-                'General Meeting',
-                'Shareholders Meeting'
-            ]
+        has_english_notice = any(keyword in page_text for keyword in keywords)
 
-            has_english_notice = any(keyword in page_text for keyword in keywords)
-
-            # PDFリンクチェック
-            pdf_links = await page.query_selector_all('a[href*=".pdf"]')
-            has_pdf = len(pdf_links) > 0
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if (has_english_notice and has_pdf) else 'FAIL',
-                confidence=0.7,
-                details='英語版招集通知検出' if (has_english_notice and has_pdf) else '英語版招集通知未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        # PDFリンクチェック
+        pdf_links = await page.query_selector_all('a[href*=".pdf"]')
+        has_pdf = len(pdf_links) > 0
+
+        return self._create_result(
+            site, item,
+            result='PASS' if (has_english_notice and has_pdf) else 'FAIL',
+            confidence=0.7,
+            details='英語版招集通知検出' if (has_english_notice and has_pdf) else '英語版招集通知未検出',
+        )
 
+    @_returns_error_result
     async def check_item_244(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """個人投資家向け特設カテゴリチェック（item_id: 244）"""
-        try:
-            link_selectors = [
-                'a:has-text("個人投資家")',
-                'a:has-text("個人株主")',
-                'a:has-text("個人向け")',
-                'a:has-text("Individual Investor")',
-                'nav a:has-text("投資家の皆さまへ")',
-            ]
-
-            has_link = False
-            for selector in link_selectors:
-                if await page.locator(selector).count() > 0:
-                    has_link = True
-                    break
+        link_selectors = [
+            'a:has-text("個人投資家")',
+            'a:has-text("個人株主")',
+            'a:has-text("個人向け")',
+            'a:has-text("Individual Investor")',
+            'nav a:has-text("投資家の皆さまへ")',
+        ]
 
-            keywords = [
-                '個人投資家向け',
-                '個人株主向け',
-                'individual investor',
-                '5分でわかる',
-                'はじめてのIR',
-                '個人向けサイト',
-            ]
-            has_keyword = await self._check_keyword_in_html(page, keywords)
+        has_link = await self._any_selector_matches(page, link_selectors)
 
-            is_valid = has_link or has_keyword
-            details = (
-                '個人投資家向け導線を検出'
-                if is_valid
-                else '個人投資家向け特設カテゴリを検出できず'
-            )
+        keywords = [
+            '個人投資家向け',
+            '個人株主向け',
+            'individual investor',
+            '5分でわかる',
+            'はじめてのIR',
+            '個人向けサイト',
+        ]
+        has_keyword = await self._check_keyword_in_html(page, keywords)
 
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if is_valid else 'FAIL',
-                confidence=0.6 if is_valid else 0.4,
-                details=details,
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        is_valid = has_link or has_keyword
+        details = (
+            '個人投資家向け導線を検出'
+            if is_valid
+            else '個人投資家向け特設カテゴリを検出できず'
+        )
+
+        return self._create_result(
+            site, item,
+            result='PASS' if is_valid else 'FAIL',
+            confidence=0.6 if is_valid else 0.4,
+            details=details,
+        )
 
+    @_returns_error_result
     async def check_item_245(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """No.2450: 個人投資家向け特設カテゴリ配下に動画を掲載している"""
-        try:
-            page_text = await page.inner_text('body')
-
-            # 個人投資家向けページの検出
-            individual_investor_keywords = ['個人投資家', '個人株主', 'Individual Investors']
-            has_individual_section = any(keyword in page_text for keyword in individual_investor_keywords)
-
-            # 動画要素の検出
-            video_elements = await page.locator('video, iframe[src*="youtube"], iframe[src*="vimeo"]').count()
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if (has_individual_section and video_elements > 0) else 'FAIL',
-                confidence=0.6,
-                details='個人投資家向け動画検出' if (has_individual_section and video_elements > 0) else '個人投資家向け動画未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        page_text = await self._body_text(page)
+
+        # 個人投資家向けページの検出
+        individual_investor_keywords = ['個人投資家', '個人株主', 'Individual Investors']
+        has_individual_section = any(keyword in page_text for keyword in individual_investor_keywords)
+
+        # 動画要素の検出
+        video_elements = (await self._collect_page_facts(page))['counts']['videos']
+
+        return self._create_result(
+            site, item,
+            result='PASS' if (has_individual_section and video_elements > 0) else 'FAIL',
+            confidence=0.6,
+            details='個人投資家向け動画検出' if (has_individual_section and video_elements > 0) else '個人投資家向け動画未検出',
+        )
 
+    @_returns_error_result
     async def check_item_246(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """No.2460: 個人投資家向け特設カテゴリに経営計画や成長戦略を掲載している"""
-        try:
-            page_text = await page.inner_text('body')
-
-            # 個人投資家向けページの検出
-            individual_investor_keywords = ['個人投資家', '個人株主']
-            has_individual_section = any(keyword in page_text for keyword in individual_investor_keywords)
-
-            # 経営計画・成長戦略のキーワード
-            strategy_keywords = ['経営計画', '成長戦略', '中期経営計画', '経営方針', 'Management Plan', 'Growth Strategy']
-            has_strategy = any(keyword in page_text for keyword in strategy_keywords)
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if (has_individual_section and has_strategy) else 'FAIL',
-                confidence=0.6,
-                details='個人投資家向け経営計画検出' if (has_individual_section and has_strategy) else '個人投資家向け経営計画未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        page_text = await self._body_text(page)
+
+        # 個人投資家向けページの検出
+        individual_investor_keywords = ['個人投資家', '個人株主']
+        has_individual_section = any(keyword in page_text for keyword in individual_investor_keywords)
+
+        # 経営計画・成長戦略のキーワード
+        strategy_keywords = ['経営計画', '成長戦略', '中期経営計画', '経営方針', 'Management Plan', 'Growth Strategy']
+        has_strategy = any(keyword in page_text for keyword in strategy_keywords)
+
+        return self._create_result(
+            site, item,
+            result='PASS' if (has_individual_section and has_strategy) else 'FAIL',
+            confidence=0.6,
+            details='個人投資家向け経営計画検出' if (has_individual_section and has_strategy) else '個人投資家向け経営計画未検出',
+        )
 
+    @_returns_error_result
     async def check_item_247(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """No.2470: 個人投資家向け特設カテゴリに株主還元情報を掲載している"""
-        try:
-            page_text = await page.inner_text('body')
-
-            # 個人投資家向けページの検出
-            individual_investor_keywords = ['個人投資家', '個人株主']
-            has_individual_section = any(keyword in page_text for keyword in individual_investor_keywords)
-
-            # 株主還元のキーワード
-            return_keywords = ['株主還元', '配当', '自己株式', '株主優待', 'Shareholder Returns', 'Dividend']
-            has_return = any(keyword in page_text for keyword in return_keywords)
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if (has_individual_section and has_return) else 'FAIL',
-                confidence=0.6,
-                details='個人投資家向け株主還元情報検出' if (has_individual_section and has_return) else '個人投資家向け株主還元情報未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        page_text = await self._body_text(page)
+
+        # 個人投資家向けページの検出
+        individual_investor_keywords = ['個人投資家', '個人株主']
+        has_individual_section = any(keyword in page_text for keyword in individual_investor_keywords)
+
+        # 株主還元のキーワード
+        return_keywords = ['株主還元', '配当', '自己株式', '株主優待', 'Shareholder Returns', 'Dividend']
+        has_return = any(keyword in page_text for keyword in return_keywords)
+
+        return self._create_result(
+            site, item,
+            result='PASS' if (has_individual_section and has_return) else 'FAIL',
+            confidence=0.6,
+            details='個人投資家向け株主還元情報検出' if (has_individual_section and has_return) else '個人投資家向け株主還元情報未検出',
+        )
 
+    @_returns_error_result
     async def check_item_248(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """No.2480: 個人投資家向け特設カテゴリに簡潔な事業解説を掲載している"""
-        try:
-            page_text = await page.inner_text('body')
-
-            # 個人投資家向けページの検出
-            individual_investor_keywords = ['個人投資家', '個人株主']
-            has_individual_section = any(keyword in page_text for keyword in individual_investor_keywords)
-
-            # 事業解説のキーワード
-            business_keywords = ['事業内容', '事業紹介', 'ビジネスモデル', '何をしている会社', 'Our Business', 'Business Overview']
-            has_business = any(keyword in page_text for keyword in business_keywords)
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if (has_individual_section and has_business) else 'FAIL',
-                confidence=0.6,
-                details='個人投資家向け事業解説検出' if (has_individual_section and has_business) else '個人投資家向け事業解説未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        page_text = await self._body_text(page)
+
+        # 個人投資家向けページの検出
+        individual_investor_keywords = ['個人投資家', '個人株主']
+        has_individual_section = any(keyword in page_text for keyword in individual_investor_keywords)
+
+        # 事業解説のキーワード
+        business_keywords = ['事業内容', '事業紹介', 'ビジネスモデル', '何をしている会社', 'Our Business', 'Business Overview']
+        has_business = any(keyword in page_text for keyword in business_keywords)
+
+        return self._create_result(
+            site, item,
+            result='PASS' if (has_individual_section and has_business) else 'FAIL',
+            confidence=0.6,
+            details='個人投資家向け事業解説検出' if (has_individual_section and has_business) else '個人投資家向け事業解説未検出',
+        )
 
+    @_returns_error_result
     async def check_item_249(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """株主専用サイト導線チェック（item_id: 249）"""
-        try:
-            selectors = [
-                'a:has-text("株主専用")',
-                'a:has-text("株主さま専用")',
-                'a:has-text("shareholder portal")',
-                'a[href*="shareholder"]',
-                'a[href*="kabunushi"]',
+        selectors = [
+            'a:has-text("株主専用")',
+            'a:has-text("株主さま専用")',
+            'a:has-text("shareholder portal")',
+            'a[href*="shareholder"]',
+            'a[href*="kabunushi"]',
+        ]
+
+        has_link = await self._any_selector_matches(page, selectors)
+
+        if not has_link:
+            keywords = [
+                '株主専用サイト',
+                '株主さま専用サイト',
+                'shareholder site',
+                'shareholder club',
             ]
+            has_link = await self._check_keyword_in_html(page, keywords)
 
-            has_link = False
-            for selector in selectors:
-                if await page.locator(selector).count() > 0:
-                    has_link = True
-                    break
+        details = '株主専用サイト導線を検出' if has_link else '株主専用サイト導線を検出できず'
 
-            if not has_link:
-                keywords = [
-                    '株主専用サイト',
-                    '株主さま専用サイト',
-                    'shareholder site',
-                    'shareholder club',
-                ]
-                has_link = await self._check_keyword_in_html(page, keywords)
-
-            details = '株主専用サイト導線を検出' if has_link else '株主専用サイト導線を検出できず'
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_link else 'FAIL',
-                confidence=0.6 if has_link else 0.4,
-                details=details,
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        return self._create_result(
+            site, item,
+            result='PASS' if has_link else 'FAIL',
+            confidence=0.6 if has_link else 0.4,
+            details=details,
+        )
 
 
 
@@ -5575,17 +3841,13 @@ class ScriptValidator:
 
     def _normalize_text(self, text: str) -> str:
         """半角/全角差異を吸収した比較用テキストを返す"""
-        try:
-            import unicodedata
-            return unicodedata.normalize('NFKC', text or '')
-        except Exception:
-            return text or ''
+        return _nfkc(text or '')
 
     async def _check_keyword_in_html(self, page: Page, keywords: list, context: str = 'body') -> bool:
         """Check if any keyword exists in the page HTML"""
         try:
             if context == 'body':
-                text = await page.inner_text('body')
+                text = await self._body_text(page)
             else:
                 text = await page.inner_text(context)
             text_lower = text.lower()
@@ -5609,46 +3871,12 @@ class ScriptValidator:
             return False
 
 
-    async def _has_chart_near_keywords(self, page: Page, keywords: list, selectors: list | None = None) -> bool:
+    async def _has_chart_near_keywords(self, page: Page, keywords: list, selectors: Sequence[str] = CHART_SELECTORS) -> bool:
         """Check if chart-like elements exist near given keywords"""
-        selectors = selectors or [
-            'canvas',
-            'svg',
-            '[class*="chart" i]',
-            '[class*="graph" i]',
-            '[class*="trend" i]',
-            '[class*="line" i]',
-            'img[alt*="グラフ"]',
-            'img[alt*="chart" i]',
-        ]
         try:
             return await page.evaluate(
-                """
-                (keywords, selectors) => {
-                    const lowerKeywords = keywords.map((kw) => kw.toLowerCase());
-                    const elements = Array.from(document.querySelectorAll('body *'));
-                    for (const element of elements) {
-                        const text = (element.textContent || '').toLowerCase();
-                        if (!lowerKeywords.some((kw) => text.includes(kw))) {
-                            continue;
-                        }
-                        let current = element;
-                        let depth = 0;
-                        while (current && depth < 3) {
-                            for (const selector of selectors) {
-                                if (current.querySelector && current.querySelector(selector)) {
-                                    return true;
-                                }
-                            }
-                            current = current.parentElement;
-                            depth += 1;
-                        }
-                    }
-                    return false;
-                }
-                """,
-                keywords,
-                selectors,
+                CHART_NEAR_KEYWORDS_SCRIPT,
+                {'keywords': list(keywords), 'selectors': list(selectors)},
             )
         except Exception:
             return False
@@ -5658,454 +3886,296 @@ class ScriptValidator:
     # VALIDATOR METHODS (56 items)
     # ============================================================================
 
+    @_returns_error_result
     async def check_item_61(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Item 61: 推奨環境にGoogle ChromeとEdgeの記載がある（両方、最新バージョン）"""
-        try:
-            page_text = await page.inner_text('body')
-            page_lower = page_text.lower()
-
-            has_chrome = 'chrome' in page_lower or 'クローム' in page_text
-            has_edge = 'edge' in page_lower or 'エッジ' in page_text
-            has_latest = '最新' in page_text or 'latest' in page_lower
-
-            is_valid = has_chrome and has_edge and has_latest
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if is_valid else 'FAIL',
-                confidence=0.8,
-                details='Chrome・Edge・最新バージョン記載検出' if is_valid else 'Chrome/Edge/最新バージョンの記載が不十分',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        page_text = await self._body_text(page)
+        page_lower = page_text.lower()
+
+        has_chrome = 'chrome' in page_lower or 'クローム' in page_text
+        has_edge = 'edge' in page_lower or 'エッジ' in page_text
+        has_latest = '最新' in page_text or 'latest' in page_lower
 
+        is_valid = has_chrome and has_edge and has_latest
 
+        return self._create_result(
+            site, item,
+            result='PASS' if is_valid else 'FAIL',
+            confidence=0.8,
+            details='Chrome・Edge・最新バージョン記載検出' if is_valid else 'Chrome/Edge/最新バージョンの記載が不十分',
+        )
+
+
+    @_returns_error_result
     async def check_item_69(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Item 69: XMLサイトマップが設置されている"""
-        try:
-            # Check for sitemap.xml in common locations
-            has_sitemap_link = await self._check_keyword_in_html(page, ['sitemap.xml', 'sitemap'])
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_sitemap_link else 'FAIL',
-                confidence=0.7,
-                details='XMLサイトマップへのリンク検出' if has_sitemap_link else 'XMLサイトマップリンク未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        # Check for sitemap.xml in common locations
+        has_sitemap_link = await self._check_keyword_in_html(page, ['sitemap.xml', 'sitemap'])
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_sitemap_link else 'FAIL',
+            confidence=0.7,
+            details='XMLサイトマップへのリンク検出' if has_sitemap_link else 'XMLサイトマップリンク未検出',
+        )
 
 
+    @_returns_error_result
     async def check_item_70(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Item 70: XMLサイトマップ内の3xxエラーは10以下である"""
-        try:
-            # This requires actual sitemap crawling - placeholder implementation
-            has_sitemap = await self._check_keyword_in_html(page, ['sitemap.xml'])
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_sitemap else 'FAIL',
-                confidence=0.5,
-                details='XMLサイトマップ検出（リダイレクトエラー詳細検証は手動推奨）' if has_sitemap else 'XMLサイトマップ未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        # This requires actual sitemap crawling - placeholder implementation
+        has_sitemap = await self._check_keyword_in_html(page, ['sitemap.xml'])
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_sitemap else 'FAIL',
+            confidence=0.5,
+            details='XMLサイトマップ検出（リダイレクトエラー詳細検証は手動推奨）' if has_sitemap else 'XMLサイトマップ未検出',
+        )
 
 
+    @_returns_error_result
     async def check_item_73(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Item 73: Cookieポリシーがある"""
-        try:
-            keywords = ['cookie', 'クッキー', 'cookie policy', 'クッキーポリシー']
-            has_cookie_policy = await self._check_keyword_in_html(page, keywords)
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_cookie_policy else 'FAIL',
-                confidence=0.8,
-                details='Cookieポリシー検出' if has_cookie_policy else 'Cookieポリシー未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        keywords = ['cookie', 'クッキー', 'cookie policy', 'クッキーポリシー']
+        has_cookie_policy = await self._check_keyword_in_html(page, keywords)
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_cookie_policy else 'FAIL',
+            confidence=0.8,
+            details='Cookieポリシー検出' if has_cookie_policy else 'Cookieポリシー未検出',
+        )
 
 
+    @_returns_error_result
     async def check_item_74(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Item 74: Cookieコンセントがある"""
-        try:
-            # Check for cookie consent dialogs/banners
-            consent_selectors = [
-                '[class*="cookie"]',
-                '[id*="cookie"]',
-                '[class*="consent"]',
-                '[id*="consent"]'
-            ]
+        # Check for cookie consent dialogs/banners
+        consent_selectors = [
+            '[class*="cookie"]',
+            '[id*="cookie"]',
+            '[class*="consent"]',
+            '[id*="consent"]'
+        ]
 
-            has_consent = False
-            for selector in consent_selectors:
-                count = await page.locator(selector).count()
-                if count > 0:
-                    has_consent = True
-                    break
+        has_consent = await self._any_selector_matches(page, consent_selectors)
 
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_consent else 'FAIL',
-                confidence=0.7,
-                details='Cookieコンセント要素検出' if has_consent else 'Cookieコンセント要素未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        return self._create_result(
+            site, item,
+            result='PASS' if has_consent else 'FAIL',
+            confidence=0.7,
+            details='Cookieコンセント要素検出' if has_consent else 'Cookieコンセント要素未検出',
+        )
 
 
+    @_returns_error_result
     async def check_item_87(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Item 87: 自己資本比率を掲載している（5期分以上）"""
-        try:
-            keywords = ['自己資本比率', 'equity ratio', '資本比率']
-            has_equity_ratio = await self._check_keyword_in_html(page, keywords)
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_equity_ratio else 'FAIL',
-                confidence=0.7,
-                details='自己資本比率記載検出' if has_equity_ratio else '自己資本比率未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        keywords = ['自己資本比率', 'equity ratio', '資本比率']
+        has_equity_ratio = await self._check_keyword_in_html(page, keywords)
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_equity_ratio else 'FAIL',
+            confidence=0.7,
+            details='自己資本比率記載検出' if has_equity_ratio else '自己資本比率未検出',
+        )
 
 
+    @_returns_error_result
     async def check_item_88(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Item 88: PBR（株価純資産倍率）を掲載している"""
-        try:
-            keywords = ['pbr', 'p/b', '株価純資産倍率', 'price to book']
-            has_pbr = await self._check_keyword_in_html(page, keywords)
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_pbr else 'FAIL',
-                confidence=0.8,
-                details='PBR記載検出' if has_pbr else 'PBR未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        keywords = ['pbr', 'p/b', '株価純資産倍率', 'price to book']
+        has_pbr = await self._check_keyword_in_html(page, keywords)
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_pbr else 'FAIL',
+            confidence=0.8,
+            details='PBR記載検出' if has_pbr else 'PBR未検出',
+        )
 
 
+    @_returns_error_result
     async def check_item_97(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Item 97: 各セグメントの業績についてグラフ（または表）がある"""
-        try:
-            keywords = ['セグメント', 'segment', '事業別', 'by segment']
-            has_segment = await self._check_keyword_in_html(page, keywords)
-
-            # Check for charts/graphs
-            chart_elements = await page.locator('canvas, svg, img[src*="chart"], img[src*="graph"]').count()
-            has_chart = chart_elements > 0
-
-            is_valid = has_segment and has_chart
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if is_valid else 'FAIL',
-                confidence=0.6,
-                details='セグメント業績グラフ検出' if is_valid else 'セグメント業績グラフ未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        keywords = ['セグメント', 'segment', '事業別', 'by segment']
+        has_segment = await self._check_keyword_in_html(page, keywords)
+
+        # Check for charts/graphs
+        chart_elements = await page.locator('canvas, svg, img[src*="chart"], img[src*="graph"]').count()
+        has_chart = chart_elements > 0
 
+        is_valid = has_segment and has_chart
 
+        return self._create_result(
+            site, item,
+            result='PASS' if is_valid else 'FAIL',
+            confidence=0.6,
+            details='セグメント業績グラフ検出' if is_valid else 'セグメント業績グラフ未検出',
+        )
+
+
+    @_returns_error_result
     async def check_item_99(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Item 99: 直近の決算短信を掲載している（PDF可）"""
-        try:
-            keywords = ['決算短信', 'tanshin', '短信', 'financial results']
-            has_tanshin_pdf = await self._check_pdf_link_exists(page, keywords)
-            has_tanshin_text = await self._check_keyword_in_html(page, keywords)
-
-            is_valid = has_tanshin_pdf or has_tanshin_text
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if is_valid else 'FAIL',
-                confidence=0.8,
-                details='決算短信検出' if is_valid else '決算短信未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        keywords = ['決算短信', 'tanshin', '短信', 'financial results']
+        has_tanshin_pdf = await self._check_pdf_link_exists(page, keywords)
+        has_tanshin_text = await self._check_keyword_in_html(page, keywords)
+
+        is_valid = has_tanshin_pdf or has_tanshin_text
+
+        return self._create_result(
+            site, item,
+            result='PASS' if is_valid else 'FAIL',
+            confidence=0.8,
+            details='決算短信検出' if is_valid else '決算短信未検出',
+        )
 
 
+    @_returns_error_result
     async def check_item_108(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Item 108: ファクトシートやby the numbers方式のコンパクトな会社概要を掲載している"""
-        try:
-            keywords = ['fact sheet', 'factsheet', 'ファクトシート', 'by the numbers', 'key figures', '主要数値']
-            has_factsheet = await self._check_keyword_in_html(page, keywords)
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_factsheet else 'FAIL',
-                confidence=0.8,
-                details='ファクトシート検出' if has_factsheet else 'ファクトシート未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        keywords = ['fact sheet', 'factsheet', 'ファクトシート', 'by the numbers', 'key figures', '主要数値']
+        has_factsheet = await self._check_keyword_in_html(page, keywords)
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_factsheet else 'FAIL',
+            confidence=0.8,
+            details='ファクトシート検出' if has_factsheet else 'ファクトシート未検出',
+        )
 
 
+    @_returns_error_result
     async def check_item_110(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Item 110: IR資料は期間・種類別のマトリックス表示をしている"""
-        try:
-            # Check for table structures that might be matrix displays
-            table_count = await page.locator('table').count()
-            has_ir_keywords = await self._check_keyword_in_html(page, ['IR資料', 'IR library', '資料一覧', 'documents'])
-
-            is_valid = table_count > 0 and has_ir_keywords
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if is_valid else 'FAIL',
-                confidence=0.6,
-                details='IR資料マトリックス表示検出' if is_valid else 'IR資料マトリックス表示未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        # Check for table structures that might be matrix displays
+        table_count = (await self._collect_page_facts(page))['counts']['tables']
+        has_ir_keywords = await self._check_keyword_in_html(page, ['IR資料', 'IR library', '資料一覧', 'documents'])
+
+        is_valid = table_count > 0 and has_ir_keywords
+
+        return self._create_result(
+            site, item,
+            result='PASS' if is_valid else 'FAIL',
+            confidence=0.6,
+            details='IR資料マトリックス表示検出' if is_valid else 'IR資料マトリックス表示未検出',
+        )
 
 
+    @_returns_error_result
     async def check_item_122(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Item 122: 株主総会の議決権行使結果（臨時報告書等）を掲載している（PDF可）"""
-        try:
-            keywords = ['議決権行使結果', '臨時報告書', 'voting results', '行使結果']
-            has_voting_results = await self._check_pdf_link_exists(page, keywords) or await self._check_keyword_in_html(page, keywords)
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_voting_results else 'FAIL',
-                confidence=0.8,
-                details='議決権行使結果検出' if has_voting_results else '議決権行使結果未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        keywords = ['議決権行使結果', '臨時報告書', 'voting results', '行使結果']
+        has_voting_results = await self._check_pdf_link_exists(page, keywords) or await self._check_keyword_in_html(page, keywords)
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_voting_results else 'FAIL',
+            confidence=0.8,
+            details='議決権行使結果検出' if has_voting_results else '議決権行使結果未検出',
+        )
 
 
+    @_returns_error_result
     async def check_item_124(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Item 124: 株主総会の動画には質疑応答パートを含む"""
-        try:
-            keywords = ['質疑応答', 'Q&A', 'QA', 'Q＆A', 'question', 'answer']
-            has_qa = await self._check_keyword_in_html(page, keywords)
-
-            # Check for video elements
-            video_count = await page.locator('video, iframe[src*="youtube"], iframe[src*="vimeo"]').count()
-            has_video = video_count > 0
-
-            is_valid = has_qa and has_video
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if is_valid else 'FAIL',
-                confidence=0.6,
-                details='株主総会動画（質疑応答含む）検出' if is_valid else '株主総会動画質疑応答未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        keywords = ['質疑応答', 'Q&A', 'QA', 'Q＆A', 'question', 'answer']
+        has_qa = await self._check_keyword_in_html(page, keywords)
+
+        # Check for video elements
+        video_count = (await self._collect_page_facts(page))['counts']['videos']
+        has_video = video_count > 0
 
+        is_valid = has_qa and has_video
 
+        return self._create_result(
+            site, item,
+            result='PASS' if is_valid else 'FAIL',
+            confidence=0.6,
+            details='株主総会動画（質疑応答含む）検出' if is_valid else '株主総会動画質疑応答未検出',
+        )
+
+
+    @_returns_error_result
     async def check_item_125(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Item 125: 株主総会の質疑応答の内容を掲載している（PDF可）"""
-        try:
-            keywords = ['質疑応答', '株主総会', 'Q&A', 'QA']
-            has_qa_pdf = await self._check_pdf_link_exists(page, keywords)
-            has_qa_text = await self._check_keyword_in_html(page, keywords)
-
-            is_valid = has_qa_pdf or has_qa_text
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if is_valid else 'FAIL',
-                confidence=0.7,
-                details='株主総会質疑応答検出' if is_valid else '株主総会質疑応答未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        keywords = ['質疑応答', '株主総会', 'Q&A', 'QA']
+        has_qa_pdf = await self._check_pdf_link_exists(page, keywords)
+        has_qa_text = await self._check_keyword_in_html(page, keywords)
 
+        is_valid = has_qa_pdf or has_qa_text
 
+        return self._create_result(
+            site, item,
+            result='PASS' if is_valid else 'FAIL',
+            confidence=0.7,
+            details='株主総会質疑応答検出' if is_valid else '株主総会質疑応答未検出',
+        )
+
+
+    @_returns_error_result
     async def check_item_132(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Item 132: 株主還元に関する数値目標を記載している"""
-        try:
-            keywords = ['株主還元', '配当', 'dividend', '目標', 'target', 'payout ratio', '配当性向']
-            has_shareholder_return = await self._check_keyword_in_html(page, keywords)
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_shareholder_return else 'FAIL',
-                confidence=0.7,
-                details='株主還元数値目標検出' if has_shareholder_return else '株主還元数値目標未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        keywords = ['株主還元', '配当', 'dividend', '目標', 'target', 'payout ratio', '配当性向']
+        has_shareholder_return = await self._check_keyword_in_html(page, keywords)
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_shareholder_return else 'FAIL',
+            confidence=0.7,
+            details='株主還元数値目標検出' if has_shareholder_return else '株主還元数値目標未検出',
+        )
 
 
+    @_returns_error_result
     async def check_item_134(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Item 134: 配当性向の推移をHTMLで記載している（5期分以上）"""
-        try:
-            keywords = ['配当性向', 'payout ratio', '配当推移']
-            has_payout_ratio = await self._check_keyword_in_html(page, keywords)
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_payout_ratio else 'FAIL',
-                confidence=0.7,
-                details='配当性向推移検出' if has_payout_ratio else '配当性向推移未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        keywords = ['配当性向', 'payout ratio', '配当推移']
+        has_payout_ratio = await self._check_keyword_in_html(page, keywords)
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_payout_ratio else 'FAIL',
+            confidence=0.7,
+            details='配当性向推移検出' if has_payout_ratio else '配当性向推移未検出',
+        )
 
 
+    @_returns_error_result
     async def check_item_137(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Item 137: 株主優待情報を掲載している"""
-        try:
-            keywords = ['株主優待', 'shareholder benefit', '優待']
-            has_benefit = await self._check_keyword_in_html(page, keywords)
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_benefit else 'FAIL',
-                confidence=0.8,
-                details='株主優待情報検出' if has_benefit else '株主優待情報未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        keywords = ['株主優待', 'shareholder benefit', '優待']
+        has_benefit = await self._check_keyword_in_html(page, keywords)
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_benefit else 'FAIL',
+            confidence=0.8,
+            details='株主優待情報検出' if has_benefit else '株主優待情報未検出',
+        )
 
 
+    @_returns_error_result
     async def check_item_139(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """株主構成グラフ掲載チェック（item_id: 139）"""
-        try:
-            keywords = ['株主構成', '株主比率', 'shareholder composition', 'shareholder breakdown']
-            has_keyword = await self._check_keyword_in_html(page, keywords)
-
-            chart_selectors = [
-                'canvas',
-                'svg',
-                '[class*="chart" i]',
-                '[class*="graph" i]',
-                '[class*="pie" i]',
-                'img[alt*="株主"]',
-                'img[alt*="shareholder" i]',
-            ]
+        keywords = ['株主構成', '株主比率', 'shareholder composition', 'shareholder breakdown']
+        has_keyword = await self._check_keyword_in_html(page, keywords)
 
-            has_chart_near_keyword = await page.evaluate(
-                """
+        chart_selectors = [
+            'canvas',
+            'svg',
+            '[class*="chart" i]',
+            '[class*="graph" i]',
+            '[class*="pie" i]',
+            'img[alt*="株主"]',
+            'img[alt*="shareholder" i]',
+        ]
+
+        has_chart_near_keyword = await page.evaluate(
+            """
                 (keywords, selectors) => {
                     const lowerKeywords = keywords.map((kw) => kw.toLowerCase());
                     const elements = Array.from(document.querySelectorAll('body *'));
@@ -6129,1015 +4199,667 @@ class ScriptValidator:
                     return false;
                 }
                 """,
-                keywords,
-                chart_selectors,
-            )
+            keywords,
+            chart_selectors,
+        )
 
-            if not has_chart_near_keyword:
-                chart_count = 0
-                for selector in chart_selectors:
-                    chart_count += await page.locator(selector).count()
-                has_chart_near_keyword = chart_count > 0
-
-            is_valid = has_keyword and has_chart_near_keyword
-            details = (
-                '株主構成グラフ検出'
-                if is_valid
-                else '株主構成テキストまたはグラフを検出できず'
-            )
+        if not has_chart_near_keyword:
+            chart_count = 0
+            for selector in chart_selectors:
+                chart_count += await page.locator(selector).count()
+            has_chart_near_keyword = chart_count > 0
+
+        is_valid = has_keyword and has_chart_near_keyword
+        details = (
+            '株主構成グラフ検出'
+            if is_valid
+            else '株主構成テキストまたはグラフを検出できず'
+        )
 
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if is_valid else 'FAIL',
-                confidence=0.55 if is_valid else 0.4,
-                details=details,
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        return self._create_result(
+            site, item,
+            result='PASS' if is_valid else 'FAIL',
+            confidence=0.55 if is_valid else 0.4,
+            details=details,
+        )
 
+    @_returns_error_result
     async def check_item_142(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Item 142: 格付情報を掲載している"""
-        try:
-            keywords = ['格付', 'rating', 'credit rating', 'bond rating']
-            has_rating = await self._check_keyword_in_html(page, keywords)
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_rating else 'FAIL',
-                confidence=0.8,
-                details='格付情報検出' if has_rating else '格付情報未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        keywords = ['格付', 'rating', 'credit rating', 'bond rating']
+        has_rating = await self._check_keyword_in_html(page, keywords)
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_rating else 'FAIL',
+            confidence=0.8,
+            details='格付情報検出' if has_rating else '格付情報未検出',
+        )
 
 
+    @_returns_error_result
     async def check_item_143(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Item 143: 格付の推移を掲載している"""
-        try:
-            keywords = ['格付', 'rating', '推移', 'history', 'transition']
-            page_text = await page.inner_text('body')
-
-            has_rating = any(kw in page_text.lower() for kw in ['格付', 'rating'])
-            has_history = any(kw in page_text for kw in ['推移', 'history', 'transition', '履歴'])
-
-            is_valid = has_rating and has_history
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if is_valid else 'FAIL',
-                confidence=0.7,
-                details='格付推移検出' if is_valid else '格付推移未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        keywords = ['格付', 'rating', '推移', 'history', 'transition']
+        page_text = await self._body_text(page)
+
+        has_rating = any(kw in page_text.lower() for kw in ['格付', 'rating'])
+        has_history = any(kw in page_text for kw in ['推移', 'history', 'transition', '履歴'])
+
+        is_valid = has_rating and has_history
+
+        return self._create_result(
+            site, item,
+            result='PASS' if is_valid else 'FAIL',
+            confidence=0.7,
+            details='格付推移検出' if is_valid else '格付推移未検出',
+        )
 
 
+    @_returns_error_result
     async def check_item_145(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Item 145: アナリスト・カバレッジを掲載している"""
-        try:
-            keywords = ['アナリスト', 'analyst', 'coverage', 'カバレッジ']
-            has_analyst = await self._check_keyword_in_html(page, keywords)
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_analyst else 'FAIL',
-                confidence=0.8,
-                details='アナリストカバレッジ検出' if has_analyst else 'アナリストカバレッジ未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        keywords = ['アナリスト', 'analyst', 'coverage', 'カバレッジ']
+        has_analyst = await self._check_keyword_in_html(page, keywords)
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_analyst else 'FAIL',
+            confidence=0.8,
+            details='アナリストカバレッジ検出' if has_analyst else 'アナリストカバレッジ未検出',
+        )
 
 
+    @_returns_error_result
     async def check_item_146(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Item 146: スポンサードリサーチによるレポートを掲載している"""
-        try:
-            keywords = ['スポンサードリサーチ', 'sponsored research', 'スポンサード']
-            has_sponsored = await self._check_keyword_in_html(page, keywords)
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_sponsored else 'FAIL',
-                confidence=0.8,
-                details='スポンサードリサーチ検出' if has_sponsored else 'スポンサードリサーチ未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        keywords = ['スポンサードリサーチ', 'sponsored research', 'スポンサード']
+        has_sponsored = await self._check_keyword_in_html(page, keywords)
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_sponsored else 'FAIL',
+            confidence=0.8,
+            details='スポンサードリサーチ検出' if has_sponsored else 'スポンサードリサーチ未検出',
+        )
 
 
+    @_returns_error_result
     async def check_item_148(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Item 148: 従業員数を掲載している"""
-        try:
-            keywords = ['従業員', 'employee', '社員数', 'number of employees']
-            has_employee_count = await self._check_keyword_in_html(page, keywords)
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_employee_count else 'FAIL',
-                confidence=0.8,
-                details='従業員数記載検出' if has_employee_count else '従業員数記載未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        keywords = ['従業員', 'employee', '社員数', 'number of employees']
+        has_employee_count = await self._check_keyword_in_html(page, keywords)
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_employee_count else 'FAIL',
+            confidence=0.8,
+            details='従業員数記載検出' if has_employee_count else '従業員数記載未検出',
+        )
 
 
+    @_returns_error_result
     async def check_item_149(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Item 149: トップページから会社概要まで通常メニューで2クリックで到達できる"""
-        try:
-            keywords = ['会社概要', 'company', 'about', '企業情報']
-            has_company_info = await self._check_keyword_in_html(page, keywords)
-
-            # Check if company info links exist in navigation
-            nav_count = await page.locator('nav a, header a').count()
-            has_navigation = nav_count > 0
-
-            is_valid = has_company_info and has_navigation
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if is_valid else 'FAIL',
-                confidence=0.6,
-                details='会社概要へのナビゲーション検出' if is_valid else '会社概要へのナビゲーション未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        keywords = ['会社概要', 'company', 'about', '企業情報']
+        has_company_info = await self._check_keyword_in_html(page, keywords)
+
+        # Check if company info links exist in navigation
+        nav_count = await page.locator('nav a, header a').count()
+        has_navigation = nav_count > 0
 
+        is_valid = has_company_info and has_navigation
 
+        return self._create_result(
+            site, item,
+            result='PASS' if is_valid else 'FAIL',
+            confidence=0.6,
+            details='会社概要へのナビゲーション検出' if is_valid else '会社概要へのナビゲーション未検出',
+        )
+
+
+    @_returns_error_result
     async def check_item_152(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Item 152: 会社案内もしくは事業紹介の動画を掲載している"""
-        try:
-            # Check for video elements
-            video_count = await page.locator('video, iframe[src*="youtube"], iframe[src*="vimeo"]').count()
-
-            keywords = ['会社案内', '事業紹介', 'company introduction', 'business introduction']
-            has_intro = await self._check_keyword_in_html(page, keywords)
-
-            is_valid = video_count > 0 and has_intro
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if is_valid else 'FAIL',
-                confidence=0.7,
-                details='会社案内動画検出' if is_valid else '会社案内動画未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        # Check for video elements
+        video_count = (await self._collect_page_facts(page))['counts']['videos']
+
+        keywords = ['会社案内', '事業紹介', 'company introduction', 'business introduction']
+        has_intro = await self._check_keyword_in_html(page, keywords)
+
+        is_valid = video_count > 0 and has_intro
+
+        return self._create_result(
+            site, item,
+            result='PASS' if is_valid else 'FAIL',
+            confidence=0.7,
+            details='会社案内動画検出' if is_valid else '会社案内動画未検出',
+        )
 
 
+    @_returns_error_result
     async def check_item_154(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """社名・ロゴの由来掲載チェック（item_id: 154）"""
-        try:
-            keywords = [
-                '社名の由来',
-                '社名の意味',
-                'ロゴの由来',
-                'ロゴの意味',
-                'company name origin',
-                'meaning of the logo',
-                'origin of the logo',
-                'company name story',
-            ]
-            has_story = await self._check_keyword_in_html(page, keywords)
-
-            details = '社名・ロゴの由来記載を検出' if has_story else '社名・ロゴの由来記載を検出できず'
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_story else 'FAIL',
-                confidence=0.65 if has_story else 0.4,
-                details=details,
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        keywords = [
+            '社名の由来',
+            '社名の意味',
+            'ロゴの由来',
+            'ロゴの意味',
+            'company name origin',
+            'meaning of the logo',
+            'origin of the logo',
+            'company name story',
+        ]
+        has_story = await self._check_keyword_in_html(page, keywords)
+
+        details = '社名・ロゴの由来記載を検出' if has_story else '社名・ロゴの由来記載を検出できず'
 
+        return self._create_result(
+            site, item,
+            result='PASS' if has_story else 'FAIL',
+            confidence=0.65 if has_story else 0.4,
+            details=details,
+        )
+
+    @_returns_error_result
     async def check_item_155(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Item 155: 経営理念・パーパスを掲載している"""
-        try:
-            keywords = ['経営理念', 'パーパス', 'purpose', 'mission', 'philosophy', '企業理念']
-            has_philosophy = await self._check_keyword_in_html(page, keywords)
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_philosophy else 'FAIL',
-                confidence=0.8,
-                details='経営理念・パーパス検出' if has_philosophy else '経営理念・パーパス未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        keywords = ['経営理念', 'パーパス', 'purpose', 'mission', 'philosophy', '企業理念']
+        has_philosophy = await self._check_keyword_in_html(page, keywords)
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_philosophy else 'FAIL',
+            confidence=0.8,
+            details='経営理念・パーパス検出' if has_philosophy else '経営理念・パーパス未検出',
+        )
 
 
+    @_returns_error_result
     async def check_item_157(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Item 157: 会社組織図を掲載している"""
-        try:
-            keywords = ['組織図', 'organization', 'organizational chart', '組織体制']
-            has_org_chart = await self._check_keyword_in_html(page, keywords)
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_org_chart else 'FAIL',
-                confidence=0.8,
-                details='組織図検出' if has_org_chart else '組織図未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        keywords = ['組織図', 'organization', 'organizational chart', '組織体制']
+        has_org_chart = await self._check_keyword_in_html(page, keywords)
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_org_chart else 'FAIL',
+            confidence=0.8,
+            details='組織図検出' if has_org_chart else '組織図未検出',
+        )
 
 
+    @_returns_error_result
     async def check_item_158(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Item 158: グループ企業一覧に事業内容を記載している"""
-        try:
-            keywords = ['グループ企業', 'group company', 'subsidiaries', '子会社', '事業内容', 'business']
-            page_text = await page.inner_text('body')
-
-            has_group = any(kw in page_text for kw in ['グループ企業', 'グループ会社', 'group company', 'subsidiaries', '子会社'])
-            has_business = any(kw in page_text for kw in ['事業内容', 'business', '事業'])
-
-            is_valid = has_group and has_business
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if is_valid else 'FAIL',
-                confidence=0.7,
-                details='グループ企業事業内容検出' if is_valid else 'グループ企業事業内容未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        keywords = ['グループ企業', 'group company', 'subsidiaries', '子会社', '事業内容', 'business']
+        page_text = await self._body_text(page)
+
+        has_group = any(kw in page_text for kw in ['グループ企業', 'グループ会社', 'group company', 'subsidiaries', '子会社'])
+        has_business = any(kw in page_text for kw in ['事業内容', 'business', '事業'])
+
+        is_valid = has_group and has_business
+
+        return self._create_result(
+            site, item,
+            result='PASS' if is_valid else 'FAIL',
+            confidence=0.7,
+            details='グループ企業事業内容検出' if is_valid else 'グループ企業事業内容未検出',
+        )
 
 
+    @_returns_error_result
     async def check_item_159(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Item 159: グループ企業一覧に議決権所有割合を記載している"""
-        try:
-            keywords = ['議決権', 'voting rights', '所有割合', 'ownership', '持株比率']
-            has_voting_info = await self._check_keyword_in_html(page, keywords)
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_voting_info else 'FAIL',
-                confidence=0.7,
-                details='議決権所有割合検出' if has_voting_info else '議決権所有割合未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        keywords = ['議決権', 'voting rights', '所有割合', 'ownership', '持株比率']
+        has_voting_info = await self._check_keyword_in_html(page, keywords)
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_voting_info else 'FAIL',
+            confidence=0.7,
+            details='議決権所有割合検出' if has_voting_info else '議決権所有割合未検出',
+        )
 
 
+    @_returns_error_result
     async def check_item_161(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Item 161: 代表取締役の経歴を記載している"""
-        try:
-            keywords = ['代表取締役', '経歴', 'ceo', 'president', 'biography', 'profile']
-            has_ceo_bio = await self._check_keyword_in_html(page, keywords)
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_ceo_bio else 'FAIL',
-                confidence=0.7,
-                details='代表取締役経歴検出' if has_ceo_bio else '代表取締役経歴未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        keywords = ['代表取締役', '経歴', 'ceo', 'president', 'biography', 'profile']
+        has_ceo_bio = await self._check_keyword_in_html(page, keywords)
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_ceo_bio else 'FAIL',
+            confidence=0.7,
+            details='代表取締役経歴検出' if has_ceo_bio else '代表取締役経歴未検出',
+        )
 
 
+    @_returns_error_result
     async def check_item_162(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Item 162: 全取締役・監査役の経歴と写真を掲載している"""
-        try:
-            keywords = ['取締役', '監査役', 'director', 'auditor', '経歴']
-            has_board_info = await self._check_keyword_in_html(page, keywords)
-
-            # Check for images (photos)
-            img_count = await page.locator('img').count()
-            has_photos = img_count > 5  # Arbitrary threshold
-
-            is_valid = has_board_info and has_photos
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if is_valid else 'FAIL',
-                confidence=0.6,
-                details='役員経歴・写真検出' if is_valid else '役員経歴・写真未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        keywords = ['取締役', '監査役', 'director', 'auditor', '経歴']
+        has_board_info = await self._check_keyword_in_html(page, keywords)
+
+        # Check for images (photos)
+        img_count = await page.locator('img').count()
+        has_photos = img_count > 5  # Arbitrary threshold
+
+        is_valid = has_board_info and has_photos
+
+        return self._create_result(
+            site, item,
+            result='PASS' if is_valid else 'FAIL',
+            confidence=0.6,
+            details='役員経歴・写真検出' if is_valid else '役員経歴・写真未検出',
+        )
 
 
+    @_returns_error_result
     async def check_item_164(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Item 164: 役員の生年月日（または年齢）を記載している"""
-        try:
-            keywords = ['生年月日', '年齢', 'age', 'born', 'date of birth']
-            has_age_info = await self._check_keyword_in_html(page, keywords)
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_age_info else 'FAIL',
-                confidence=0.7,
-                details='役員年齢情報検出' if has_age_info else '役員年齢情報未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        keywords = ['生年月日', '年齢', 'age', 'born', 'date of birth']
+        has_age_info = await self._check_keyword_in_html(page, keywords)
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_age_info else 'FAIL',
+            confidence=0.7,
+            details='役員年齢情報検出' if has_age_info else '役員年齢情報未検出',
+        )
 
 
+    @_returns_error_result
     async def check_item_169(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Item 169: コーポレート・ガバナンスに関する報告書を掲載している（PDF可）"""
-        try:
-            keywords = ['コーポレートガバナンス', 'corporate governance', 'ガバナンス報告書']
-            has_cg_pdf = await self._check_pdf_link_exists(page, keywords)
-            has_cg_text = await self._check_keyword_in_html(page, keywords)
-
-            is_valid = has_cg_pdf or has_cg_text
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if is_valid else 'FAIL',
-                confidence=0.8,
-                details='ガバナンス報告書検出' if is_valid else 'ガバナンス報告書未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        keywords = ['コーポレートガバナンス', 'corporate governance', 'ガバナンス報告書']
+        has_cg_pdf = await self._check_pdf_link_exists(page, keywords)
+        has_cg_text = await self._check_keyword_in_html(page, keywords)
 
+        is_valid = has_cg_pdf or has_cg_text
 
+        return self._create_result(
+            site, item,
+            result='PASS' if is_valid else 'FAIL',
+            confidence=0.8,
+            details='ガバナンス報告書検出' if is_valid else 'ガバナンス報告書未検出',
+        )
+
+
+    @_returns_error_result
     async def check_item_171(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Item 171: コーポレートガバナンスに関する記載は、見出し、余白、フォントといった見やすさに配慮したデザインとなっている"""
-        try:
-            keywords = ['コーポレートガバナンス', 'corporate governance']
-            has_cg = await self._check_keyword_in_html(page, keywords)
-
-            # Check for heading tags
-            heading_count = await page.locator('h1, h2, h3, h4').count()
-            has_structure = heading_count > 3
-
-            is_valid = has_cg and has_structure
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if is_valid else 'FAIL',
-                confidence=0.6,
-                details='ガバナンス情報の構造化検出' if is_valid else 'ガバナンス情報の構造化未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        keywords = ['コーポレートガバナンス', 'corporate governance']
+        has_cg = await self._check_keyword_in_html(page, keywords)
+
+        # Check for heading tags
+        heading_count = await page.locator('h1, h2, h3, h4').count()
+        has_structure = heading_count > 3
 
+        is_valid = has_cg and has_structure
 
+        return self._create_result(
+            site, item,
+            result='PASS' if is_valid else 'FAIL',
+            confidence=0.6,
+            details='ガバナンス情報の構造化検出' if is_valid else 'ガバナンス情報の構造化未検出',
+        )
+
+
+    @_returns_error_result
     async def check_item_182(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Item 182: 「資本コストや株価を意識した経営の実現に向けた対応」について専用ページやセクションがある"""
-        try:
-            keywords = ['資本コスト', 'cost of capital', '株価', 'stock price', 'roe', 'roic']
-            has_capital_cost = await self._check_keyword_in_html(page, keywords)
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_capital_cost else 'FAIL',
-                confidence=0.7,
-                details='資本コスト意識経営情報検出' if has_capital_cost else '資本コスト意識経営情報未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        keywords = ['資本コスト', 'cost of capital', '株価', 'stock price', 'roe', 'roic']
+        has_capital_cost = await self._check_keyword_in_html(page, keywords)
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_capital_cost else 'FAIL',
+            confidence=0.7,
+            details='資本コスト意識経営情報検出' if has_capital_cost else '資本コスト意識経営情報未検出',
+        )
 
 
+    @_returns_error_result
     async def check_item_187(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Item 187: 社外取締役のメッセージもしくは社外取締役との対談を掲載している"""
-        try:
-            keywords = ['社外取締役', 'outside director', 'independent director', 'メッセージ', '対談', 'interview']
-            has_outside_director = await self._check_keyword_in_html(page, keywords)
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_outside_director else 'FAIL',
-                confidence=0.7,
-                details='社外取締役メッセージ検出' if has_outside_director else '社外取締役メッセージ未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        keywords = ['社外取締役', 'outside director', 'independent director', 'メッセージ', '対談', 'interview']
+        has_outside_director = await self._check_keyword_in_html(page, keywords)
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_outside_director else 'FAIL',
+            confidence=0.7,
+            details='社外取締役メッセージ検出' if has_outside_director else '社外取締役メッセージ未検出',
+        )
 
 
+    @_returns_error_result
     async def check_item_188(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Item 188: トップページのメニューにESG、サステナビリティ、CSR等を配置している"""
-        try:
-            # Check navigation areas
-            keywords = ['esg', 'サステナビリティ', 'sustainability', 'csr']
+        # Check navigation areas
+        keywords = ['esg', 'サステナビリティ', 'sustainability', 'csr']
             
-            # Get all nav and header elements and combine their text
-            nav_elements = await page.locator('nav, header').all()
-            nav_text = ' '.join([await elem.inner_text() for elem in nav_elements])
-            nav_lower = nav_text.lower()
-
-            has_esg = any(kw in nav_lower for kw in keywords)
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_esg else 'FAIL',
-                confidence=0.8,
-                details='メニューにESG/サステナビリティ検出' if has_esg else 'メニューにESG/サステナビリティ未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        # Get all nav and header elements and combine their text
+        nav_elements = await page.locator('nav, header').all()
+        nav_text = ' '.join([await elem.inner_text() for elem in nav_elements])
+        nav_lower = nav_text.lower()
+
+        has_esg = any(kw in nav_lower for kw in keywords)
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_esg else 'FAIL',
+            confidence=0.8,
+            details='メニューにESG/サステナビリティ検出' if has_esg else 'メニューにESG/サステナビリティ未検出',
+        )
 
 
+    @_returns_error_result
     async def check_item_190(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Item 190: ESG、サステナビリティ、CSR等の実績評価指標（KPI）とその進捗状況を掲載している"""
-        try:
-            keywords = ['kpi', '指標', 'indicator', '目標', 'target', '進捗']
-            page_text = await page.inner_text('body')
-            page_lower = page_text.lower()
-
-            has_esg = any(kw in page_lower for kw in ['esg', 'サステナビリティ', 'sustainability', 'csr'])
-            has_kpi = any(kw in page_lower for kw in ['kpi', '指標', 'indicator', '目標'])
-
-            is_valid = has_esg and has_kpi
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if is_valid else 'FAIL',
-                confidence=0.7,
-                details='ESG KPI検出' if is_valid else 'ESG KPI未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        keywords = ['kpi', '指標', 'indicator', '目標', 'target', '進捗']
+        page_text = await self._body_text(page)
+        page_lower = page_text.lower()
+
+        has_esg = any(kw in page_lower for kw in ['esg', 'サステナビリティ', 'sustainability', 'csr'])
+        has_kpi = any(kw in page_lower for kw in ['kpi', '指標', 'indicator', '目標'])
+
+        is_valid = has_esg and has_kpi
+
+        return self._create_result(
+            site, item,
+            result='PASS' if is_valid else 'FAIL',
+            confidence=0.7,
+            details='ESG KPI検出' if is_valid else 'ESG KPI未検出',
+        )
 
 
+    @_returns_error_result
     async def check_item_191(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Item 191: TCFDのガイドラインに沿った情報開示を掲載している"""
-        try:
-            keywords = ['tcfd', 'task force on climate', '気候変動']
-            has_tcfd = await self._check_keyword_in_html(page, keywords)
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_tcfd else 'FAIL',
-                confidence=0.8,
-                details='TCFD情報開示検出' if has_tcfd else 'TCFD情報開示未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        keywords = ['tcfd', 'task force on climate', '気候変動']
+        has_tcfd = await self._check_keyword_in_html(page, keywords)
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_tcfd else 'FAIL',
+            confidence=0.8,
+            details='TCFD情報開示検出' if has_tcfd else 'TCFD情報開示未検出',
+        )
 
 
+    @_returns_error_result
     async def check_item_197(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Item 197: 男女間の賃金比を掲載している（3期分以上）"""
-        try:
-            keywords = ['男女間', '賃金', 'gender pay', 'wage gap', '男女別', '男女の賃金']
-            has_gender_pay = await self._check_keyword_in_html(page, keywords)
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_gender_pay else 'FAIL',
-                confidence=0.7,
-                details='男女間賃金比検出' if has_gender_pay else '男女間賃金比未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        keywords = ['男女間', '賃金', 'gender pay', 'wage gap', '男女別', '男女の賃金']
+        has_gender_pay = await self._check_keyword_in_html(page, keywords)
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_gender_pay else 'FAIL',
+            confidence=0.7,
+            details='男女間賃金比検出' if has_gender_pay else '男女間賃金比未検出',
+        )
 
 
+    @_returns_error_result
     async def check_item_205(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Item 205: What We Are / Overview / at a Glance 等のグローバルスタイルの会社概要を掲載している"""
-        try:
-            keywords = ['what we are', 'overview', 'at a glance', 'who we are', 'about us']
-            has_global_overview = await self._check_keyword_in_html(page, keywords)
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_global_overview else 'FAIL',
-                confidence=0.8,
-                details='グローバルスタイル会社概要検出' if has_global_overview else 'グローバルスタイル会社概要未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        keywords = ['what we are', 'overview', 'at a glance', 'who we are', 'about us']
+        has_global_overview = await self._check_keyword_in_html(page, keywords)
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_global_overview else 'FAIL',
+            confidence=0.8,
+            details='グローバルスタイル会社概要検出' if has_global_overview else 'グローバルスタイル会社概要未検出',
+        )
 
 
+    @_returns_error_result
     async def check_item_206(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Item 206: Mission/Principle/Purposeを掲載している"""
-        try:
-            keywords = ['mission', 'principle', 'purpose', 'vision', 'values']
-            has_mission = await self._check_keyword_in_html(page, keywords)
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_mission else 'FAIL',
-                confidence=0.8,
-                details='Mission/Principle/Purpose検出' if has_mission else 'Mission/Principle/Purpose未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        keywords = ['mission', 'principle', 'purpose', 'vision', 'values']
+        has_mission = await self._check_keyword_in_html(page, keywords)
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_mission else 'FAIL',
+            confidence=0.8,
+            details='Mission/Principle/Purpose検出' if has_mission else 'Mission/Principle/Purpose未検出',
+        )
 
 
+    @_returns_error_result
     async def check_item_207(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Item 207: 代表メッセージを掲載し、直近1年以内の更新日付を記載している"""
-        try:
-            keywords = ['message', 'ceo', 'president', '社長', '代表']
-            has_message = await self._check_keyword_in_html(page, keywords)
-
-            # Check for recent dates (2024, 2025)
-            page_text = await page.inner_text('body')
-            has_recent_date = '2024' in page_text or '2025' in page_text
-
-            is_valid = has_message and has_recent_date
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if is_valid else 'FAIL',
-                confidence=0.6,
-                details='代表メッセージ（更新日付含む）検出' if is_valid else '代表メッセージ（更新日付含む）未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        keywords = ['message', 'ceo', 'president', '社長', '代表']
+        has_message = await self._check_keyword_in_html(page, keywords)
+
+        # Check for recent dates (2024, 2025)
+        page_text = await self._body_text(page)
+        has_recent_date = '2024' in page_text or '2025' in page_text
+
+        is_valid = has_message and has_recent_date
+
+        return self._create_result(
+            site, item,
+            result='PASS' if is_valid else 'FAIL',
+            confidence=0.6,
+            details='代表メッセージ（更新日付含む）検出' if is_valid else '代表メッセージ（更新日付含む）未検出',
+        )
 
 
+    @_returns_error_result
     async def check_item_208(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Item 208: Strategy を掲載している"""
-        try:
-            keywords = ['strategy', 'strategic', '戦略', '経営戦略']
-            has_strategy = await self._check_keyword_in_html(page, keywords)
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_strategy else 'FAIL',
-                confidence=0.8,
-                details='Strategy検出' if has_strategy else 'Strategy未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        keywords = ['strategy', 'strategic', '戦略', '経営戦略']
+        has_strategy = await self._check_keyword_in_html(page, keywords)
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_strategy else 'FAIL',
+            confidence=0.8,
+            details='Strategy検出' if has_strategy else 'Strategy未検出',
+        )
 
 
+    @_returns_error_result
     async def check_item_209(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Item 209: 全取締役・監査役のSkills Matrixを掲載している"""
-        try:
-            keywords = ['skills matrix', 'skill matrix', 'スキルマトリックス', 'スキル・マトリックス']
-            has_skills_matrix = await self._check_keyword_in_html(page, keywords)
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_skills_matrix else 'FAIL',
-                confidence=0.8,
-                details='Skills Matrix検出' if has_skills_matrix else 'Skills Matrix未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        keywords = ['skills matrix', 'skill matrix', 'スキルマトリックス', 'スキル・マトリックス']
+        has_skills_matrix = await self._check_keyword_in_html(page, keywords)
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_skills_matrix else 'FAIL',
+            confidence=0.8,
+            details='Skills Matrix検出' if has_skills_matrix else 'Skills Matrix未検出',
+        )
 
 
+    @_returns_error_result
     async def check_item_210(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Item 210: Sustainabilityを掲載している"""
-        try:
-            keywords = ['sustainability', 'サステナビリティ', 'sustainable']
-            has_sustainability = await self._check_keyword_in_html(page, keywords)
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_sustainability else 'FAIL',
-                confidence=0.8,
-                details='Sustainability検出' if has_sustainability else 'Sustainability未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        keywords = ['sustainability', 'サステナビリティ', 'sustainable']
+        has_sustainability = await self._check_keyword_in_html(page, keywords)
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_sustainability else 'FAIL',
+            confidence=0.8,
+            details='Sustainability検出' if has_sustainability else 'Sustainability未検出',
+        )
 
 
+    @_returns_error_result
     async def check_item_211(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Item 211: TCFDガイドラインに沿った情報を掲載している"""
-        try:
-            keywords = ['tcfd', 'task force on climate', '気候変動']
-            has_tcfd = await self._check_keyword_in_html(page, keywords)
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_tcfd else 'FAIL',
-                confidence=0.8,
-                details='TCFD情報検出' if has_tcfd else 'TCFD情報未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        keywords = ['tcfd', 'task force on climate', '気候変動']
+        has_tcfd = await self._check_keyword_in_html(page, keywords)
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_tcfd else 'FAIL',
+            confidence=0.8,
+            details='TCFD情報検出' if has_tcfd else 'TCFD情報未検出',
+        )
 
 
+    @_returns_error_result
     async def check_item_212(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Item 212: Key Figuresなど業績のデータ集約ページがある"""
-        try:
-            keywords = ['key figures', 'financial highlights', 'data', 'at a glance', '業績ハイライト']
-            has_key_figures = await self._check_keyword_in_html(page, keywords)
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_key_figures else 'FAIL',
-                confidence=0.7,
-                details='Key Figures検出' if has_key_figures else 'Key Figures未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        keywords = ['key figures', 'financial highlights', 'data', 'at a glance', '業績ハイライト']
+        has_key_figures = await self._check_keyword_in_html(page, keywords)
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_key_figures else 'FAIL',
+            confidence=0.7,
+            details='Key Figures検出' if has_key_figures else 'Key Figures未検出',
+        )
 
 
+    @_returns_error_result
     async def check_item_213(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Item 213: 主要株主一覧を掲載している"""
-        try:
-            keywords = ['主要株主', 'major shareholders', 'principal shareholders', '大株主']
-            has_shareholders = await self._check_keyword_in_html(page, keywords)
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_shareholders else 'FAIL',
-                confidence=0.8,
-                details='主要株主一覧検出' if has_shareholders else '主要株主一覧未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        keywords = ['主要株主', 'major shareholders', 'principal shareholders', '大株主']
+        has_shareholders = await self._check_keyword_in_html(page, keywords)
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_shareholders else 'FAIL',
+            confidence=0.8,
+            details='主要株主一覧検出' if has_shareholders else '主要株主一覧未検出',
+        )
 
 
+    @_returns_error_result
     async def check_item_215(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Item 215: Financial Results（Quarterly）を掲載している（PDF可）"""
-        try:
-            keywords = ['financial results', 'quarterly', 'earnings', '決算']
-            has_results_pdf = await self._check_pdf_link_exists(page, keywords)
-            has_results_text = await self._check_keyword_in_html(page, keywords)
-
-            is_valid = has_results_pdf or has_results_text
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if is_valid else 'FAIL',
-                confidence=0.8,
-                details='Financial Results検出' if is_valid else 'Financial Results未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        keywords = ['financial results', 'quarterly', 'earnings', '決算']
+        has_results_pdf = await self._check_pdf_link_exists(page, keywords)
+        has_results_text = await self._check_keyword_in_html(page, keywords)
+
+        is_valid = has_results_pdf or has_results_text
+
+        return self._create_result(
+            site, item,
+            result='PASS' if is_valid else 'FAIL',
+            confidence=0.8,
+            details='Financial Results検出' if is_valid else 'Financial Results未検出',
+        )
 
 
+    @_returns_error_result
     async def check_item_216(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Item 216: Integrated Report /Annual Reportを掲載している（PDF可）"""
-        try:
-            keywords = ['integrated report', 'annual report', '統合報告書', 'アニュアルレポート']
-            has_report_pdf = await self._check_pdf_link_exists(page, keywords)
-            has_report_text = await self._check_keyword_in_html(page, keywords)
-
-            is_valid = has_report_pdf or has_report_text
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if is_valid else 'FAIL',
-                confidence=0.8,
-                details='Integrated/Annual Report検出' if is_valid else 'Integrated/Annual Report未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        keywords = ['integrated report', 'annual report', '統合報告書', 'アニュアルレポート']
+        has_report_pdf = await self._check_pdf_link_exists(page, keywords)
+        has_report_text = await self._check_keyword_in_html(page, keywords)
 
+        is_valid = has_report_pdf or has_report_text
 
+        return self._create_result(
+            site, item,
+            result='PASS' if is_valid else 'FAIL',
+            confidence=0.8,
+            details='Integrated/Annual Report検出' if is_valid else 'Integrated/Annual Report未検出',
+        )
+
+
+    @_returns_error_result
     async def check_item_217(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Item 217: Presentationsを掲載している（PDF可）"""
-        try:
-            keywords = ['presentation', 'プレゼンテーション', '説明資料']
-            has_presentation_pdf = await self._check_pdf_link_exists(page, keywords)
-            has_presentation_text = await self._check_keyword_in_html(page, keywords)
-
-            is_valid = has_presentation_pdf or has_presentation_text
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if is_valid else 'FAIL',
-                confidence=0.8,
-                details='Presentations検出' if is_valid else 'Presentations未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        keywords = ['presentation', 'プレゼンテーション', '説明資料']
+        has_presentation_pdf = await self._check_pdf_link_exists(page, keywords)
+        has_presentation_text = await self._check_keyword_in_html(page, keywords)
+
+        is_valid = has_presentation_pdf or has_presentation_text
+
+        return self._create_result(
+            site, item,
+            result='PASS' if is_valid else 'FAIL',
+            confidence=0.8,
+            details='Presentations検出' if is_valid else 'Presentations未検出',
+        )
 
 
 
+    @_returns_error_result
     async def check_item_221(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """IR連絡先の電話番号掲載チェック（item_id: 221）"""
-        try:
-            import re
+        body_text = await self._body_text(page)
+        normalized = self._normalize_text(body_text)
+        lines = [line.strip() for line in normalized.splitlines() if line.strip()]
 
-            body_text = await page.inner_text('body')
-            normalized = self._normalize_text(body_text)
-            lines = [line.strip() for line in normalized.splitlines() if line.strip()]
+        role_pattern = re.compile(r'(IR|investor relations|インベスターリレーションズ)', re.IGNORECASE)
+        qualifier_pattern = re.compile(r'(部署|部|室|担当|contact|お問い合わせ|窓口)', re.IGNORECASE)
+        phone_pattern = re.compile(r'(?:tel|電話|phone)[:：]?\s*(\+?\d[\d\-() ]{6,})', re.IGNORECASE)
 
-            role_pattern = re.compile(r'(IR|investor relations|インベスターリレーションズ)', re.IGNORECASE)
-            qualifier_pattern = re.compile(r'(部署|部|室|担当|contact|お問い合わせ|窓口)', re.IGNORECASE)
-            phone_pattern = re.compile(r'(?:tel|電話|phone)[:：]?\s*(\+?\d[\d\-() ]{6,})', re.IGNORECASE)
+        found = False
+        snippet = ''
 
-            found = False
-            snippet = ''
+        for idx, line in enumerate(lines):
+            if role_pattern.search(line) and qualifier_pattern.search(line):
+                if phone_pattern.search(line):
+                    found = True
+                    snippet = line
+                    break
+                if idx + 1 < len(lines) and phone_pattern.search(lines[idx + 1]):
+                    found = True
+                    snippet = f"{line} / {lines[idx + 1]}"
+                    break
 
-            for idx, line in enumerate(lines):
-                if role_pattern.search(line) and qualifier_pattern.search(line):
-                    if phone_pattern.search(line):
-                        found = True
-                        snippet = line
-                        break
-                    if idx + 1 < len(lines) and phone_pattern.search(lines[idx + 1]):
-                        found = True
-                        snippet = f"{line} / {lines[idx + 1]}"
-                        break
+        if not found:
+            for line in lines:
+                if role_pattern.search(line) and phone_pattern.search(line):
+                    found = True
+                    snippet = line
+                    break
 
-            if not found:
-                for line in lines:
-                    if role_pattern.search(line) and phone_pattern.search(line):
-                        found = True
-                        snippet = line
-                        break
+        details = f'IR連絡先: {snippet[:80]}' if found else 'IR部署の電話番号を検出できず'
 
-            details = f'IR連絡先: {snippet[:80]}' if found else 'IR部署の電話番号を検出できず'
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if found else 'FAIL',
-                confidence=0.6 if found else 0.4,
-                details=details,
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        return self._create_result(
+            site, item,
+            result='PASS' if found else 'FAIL',
+            confidence=0.6 if found else 0.4,
+            details=details,
+        )
 
 
+    @_returns_error_result
     async def check_item_223(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """英語ページの不自然な表現チェック（item_id: 223）"""
-        try:
-            import re
-
-            body_text = await page.inner_text('body')
-            normalized = self._normalize_text(body_text).lower()
-            pattern = re.compile(r'\b(ir\s+library|csr)\b')
-            matches = pattern.findall(normalized)
-            has_unusual = len(matches) > 0
-
-            if has_unusual:
-                unique_terms = ', '.join(sorted(set(m.strip() for m in matches)))
-                details = f'不自然な英語表現検出: {unique_terms}'
-            else:
-                details = '不自然な英語表現を検出せず'
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='FAIL' if has_unusual else 'PASS',
-                confidence=0.5,
-                details=details,
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        body_text = await self._body_text(page)
+        normalized = self._normalize_text(body_text).lower()
+        pattern = re.compile(r'\b(ir\s+library|csr)\b')
+        matches = pattern.findall(normalized)
+        has_unusual = len(matches) > 0
+
+        if has_unusual:
+            unique_terms = ', '.join(sorted(set(m.strip() for m in matches)))
+            details = f'不自然な英語表現検出: {unique_terms}'
+        else:
+            details = '不自然な英語表現を検出せず'
+
+        return self._create_result(
+            site, item,
+            result='FAIL' if has_unusual else 'PASS',
+            confidence=0.5,
+            details=details,
+        )
 
+    @_returns_error_result
     async def check_item_224(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """日英言語切り替えの直接遷移チェック（item_id: 224）"""
-        try:
-            import re
-
-            current_url = page.url
-            current_path = urlparse(current_url).path or '/'
+        current_url = page.url
+        current_path = urlparse(current_url).path or '/'
 
-            candidates = await page.evaluate(
-                """
+        candidates = await page.evaluate(
+            """
                 () => {
                     const anchors = Array.from(document.querySelectorAll('a'));
                     const matches = [];
@@ -7164,32 +4886,32 @@ class ScriptValidator:
                     return matches;
                 }
                 """
-            )
+        )
 
-            def _normalize_path(path: str) -> str:
-                if not path:
-                    return '/'
-                base = path.split('?', 1)[0]
-                base = re.sub(r'^/(?:ja|jp|ja-jp|jp-jp|japanese)(/|$)', '/', base, flags=re.IGNORECASE)
-                base = re.sub(r'^/(?:en|en-us|en-gb|english)(/|$)', '/', base, flags=re.IGNORECASE)
-                return base.rstrip('/') or '/'
-
-            has_switch = len(candidates) > 0
-            has_direct = False
-
-            if has_switch:
-                normalized_current = _normalize_path(current_path)
-                for candidate in candidates:
-                    absolute = urljoin(current_url, candidate['href'])
-                    en_path = urlparse(absolute).path or '/'
-                    if _normalize_path(en_path) == normalized_current:
-                        has_direct = True
-                        break
+        def _normalize_path(path: str) -> str:
+            if not path:
+                return '/'
+            base = path.split('?', 1)[0]
+            base = JA_PATH_PREFIX.sub('/', base)
+            base = EN_PATH_PREFIX.sub('/', base)
+            return base.rstrip('/') or '/'
+
+        has_switch = len(candidates) > 0
+        has_direct = False
+
+        if has_switch:
+            normalized_current = _normalize_path(current_path)
+            for candidate in candidates:
+                absolute = urljoin(current_url, candidate['href'])
+                en_path = urlparse(absolute).path or '/'
+                if _normalize_path(en_path) == normalized_current:
+                    has_direct = True
+                    break
 
-            if has_switch and not has_direct:
-                # fallback: alternate linkタグ
-                alternates = await page.evaluate(
-                    """
+        if has_switch and not has_direct:
+            # fallback: alternate linkタグ
+            alternates = await page.evaluate(
+                """
                     () => {
                         const links = Array.from(document.querySelectorAll('link[rel="alternate"][hreflang]'));
                         return links.map((link) => ({
@@ -7198,163 +4920,107 @@ class ScriptValidator:
                         }));
                     }
                     """
-                )
-                for link in alternates:
-                    if not link['hreflang'].startswith('en'):
-                        continue
-                    absolute = urljoin(current_url, link['href'])
-                    en_path = urlparse(absolute).path or '/'
-                    if _normalize_path(en_path) == _normalize_path(current_path):
-                        has_direct = True
-                        break
-
-            if has_switch and has_direct:
-                details = '日本語ページから英語ページへの直接リンクを検出'
-            elif has_switch:
-                details = '言語切替リンクはあるが同一ページへの遷移を確認できず'
-            else:
-                details = '英語への言語切替リンクを検出できず'
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_switch and has_direct else 'FAIL',
-                confidence=0.55 if has_switch and has_direct else 0.35,
-                details=details,
-                checked_at=datetime.now()
             )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+            for link in alternates:
+                if not link['hreflang'].startswith('en'):
+                    continue
+                absolute = urljoin(current_url, link['href'])
+                en_path = urlparse(absolute).path or '/'
+                if _normalize_path(en_path) == _normalize_path(current_path):
+                    has_direct = True
+                    break
+
+        if has_switch and has_direct:
+            details = '日本語ページから英語ページへの直接リンクを検出'
+        elif has_switch:
+            details = '言語切替リンクはあるが同一ページへの遷移を確認できず'
+        else:
+            details = '英語への言語切替リンクを検出できず'
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_switch and has_direct else 'FAIL',
+            confidence=0.55 if has_switch and has_direct else 0.35,
+            details=details,
+        )
 
 
+    @_returns_error_result
     async def check_item_225(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Item 225: 経営者インタビュー・メッセージの動画を掲載している"""
-        try:
-            # Check for video elements
-            video_count = await page.locator('video, iframe[src*="youtube"], iframe[src*="vimeo"]').count()
-
-            keywords = ['経営者', 'インタビュー', 'メッセージ', 'ceo', 'president', 'message']
-            has_message = await self._check_keyword_in_html(page, keywords)
-
-            is_valid = video_count > 0 and has_message
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if is_valid else 'FAIL',
-                confidence=0.7,
-                details='経営者メッセージ動画検出' if is_valid else '経営者メッセージ動画未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        # Check for video elements
+        video_count = (await self._collect_page_facts(page))['counts']['videos']
+
+        keywords = ['経営者', 'インタビュー', 'メッセージ', 'ceo', 'president', 'message']
+        has_message = await self._check_keyword_in_html(page, keywords)
 
+        is_valid = video_count > 0 and has_message
 
+        return self._create_result(
+            site, item,
+            result='PASS' if is_valid else 'FAIL',
+            confidence=0.7,
+            details='経営者メッセージ動画検出' if is_valid else '経営者メッセージ動画未検出',
+        )
+
+
+    @_returns_error_result
     async def check_item_226(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Item 226: 動画ライブラリーを設置している"""
-        try:
-            keywords = ['動画ライブラリ', 'video library', 'ビデオライブラリ', '動画一覧']
-            has_video_library = await self._check_keyword_in_html(page, keywords)
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_video_library else 'FAIL',
-                confidence=0.8,
-                details='動画ライブラリ検出' if has_video_library else '動画ライブラリ未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        keywords = ['動画ライブラリ', 'video library', 'ビデオライブラリ', '動画一覧']
+        has_video_library = await self._check_keyword_in_html(page, keywords)
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_video_library else 'FAIL',
+            confidence=0.8,
+            details='動画ライブラリ検出' if has_video_library else '動画ライブラリ未検出',
+        )
 
 
+    @_returns_error_result
     async def check_item_227(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Item 227: Youtubeに開設する公式アカウントをIRトップで紹介している"""
-        try:
-            # Check for YouTube links
-            youtube_links = await page.locator('a[href*="youtube.com"]').count()
-            has_youtube = youtube_links > 0
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_youtube else 'FAIL',
-                confidence=0.8,
-                details='YouTubeリンク検出' if has_youtube else 'YouTubeリンク未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        # Check for YouTube links
+        has_youtube = await self._any_selector_matches(page, ('a[href*="youtube.com"]',))
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_youtube else 'FAIL',
+            confidence=0.8,
+            details='YouTubeリンク検出' if has_youtube else 'YouTubeリンク未検出',
+        )
 
 
+    @_returns_error_result
     async def check_item_239(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Item 239: ウェブサイトに対する意見・要望を送信できる機能がある"""
-        try:
-            keywords = ['お問い合わせ', 'contact', 'feedback', 'ご意見', 'フィードバック']
-            has_contact = await self._check_keyword_in_html(page, keywords)
-
-            # Check for form elements
-            form_count = await page.locator('form').count()
-            has_form = form_count > 0
-
-            is_valid = has_contact or has_form
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if is_valid else 'FAIL',
-                confidence=0.7,
-                details='問い合わせ機能検出' if is_valid else '問い合わせ機能未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        keywords = ['お問い合わせ', 'contact', 'feedback', 'ご意見', 'フィードバック']
+        has_contact = await self._check_keyword_in_html(page, keywords)
+
+        # Check for form elements
+        has_form = await self._any_selector_matches(page, ('form',))
+
+        is_valid = has_contact or has_form
+
+        return self._create_result(
+            site, item,
+            result='PASS' if is_valid else 'FAIL',
+            confidence=0.7,
+            details='問い合わせ機能検出' if is_valid else '問い合わせ機能未検出',
+        )
 
 
+    @_returns_error_result
     async def check_item_240(self, site: Site, page: Page, item: ValidationItem) -> ValidationResult:
         """Item 240: IRサイトアンケートを掲載している"""
-        try:
-            keywords = ['アンケート', 'survey', 'questionnaire', 'ご意見', 'フィードバック']
-            has_survey = await self._check_keyword_in_html(page, keywords)
-
-            return ValidationResult(
-                site_id=site.site_id,
-                company_name=site.company_name,
-                url=site.url,
-                item_id=item.item_id,
-                item_name=item.item_name,
-                category=item.category,
-                subcategory=item.subcategory,
-                result='PASS' if has_survey else 'FAIL',
-                confidence=0.7,
-                details='アンケート検出' if has_survey else 'アンケート未検出',
-                checked_at=datetime.now()
-            )
-        except Exception as e:
-            return self._create_error_result(site, item, str(e))
+        keywords = ['アンケート', 'survey', 'questionnaire', 'ご意見', 'フィードバック']
+        has_survey = await self._check_keyword_in_html(page, keywords)
+
+        return self._create_result(
+            site, item,
+            result='PASS' if has_survey else 'FAIL',
+            confidence=0.7,
+            details='アンケート検出' if has_survey else 'アンケート未検出',
+        )
 
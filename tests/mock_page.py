@@ -28,6 +28,9 @@ class MockLocator:
     def nth(self, index: int) -> MockElement:
         return MockElement(self.nodes[index])
 
+    async def all_inner_texts(self) -> List[str]:
+        return [node.get_text(" ", strip=True) for node in self.nodes]
+
     async def all_text_contents(self) -> List[str]:
         return [node.get_text(" ", strip=True) for node in self.nodes]
 
@@ -73,64 +76,69 @@ class MockPage:
         nodes = self._select(selector)
         if not nodes:
             return ""
-        return nodes[0].get_text(" ", strip=True)
+        # innerText と同様に display:none / hidden の要素は含めない
+        node = BeautifulSoup(str(nodes[0]), "html.parser")
+        for hidden in node.select('[hidden], [style*="display:none"], [style*="display: none"]'):
+            hidden.decompose()
+        return node.get_text(" ", strip=True)
 
     async def content(self) -> str:
         return self.html
 
     async def evaluate(self, script: str, arg: Optional[object] = None):
+        if "/* page facts */" in script:
+            return self._page_facts()
+
+        if "/* any selector matches */" in script:
+            if any(self._select(selector) for selector in arg['selectors']):
+                return True
+            return any(
+                text.lower() in node.get_text().lower()
+                for selector, text in arg['textProbes']
+                for node in self._select(selector)
+            )
+
+        if "/* news category filter */" in script:
+            return self._has_news_category_filter(arg['probes'], arg['keywords'])
+
+        if "/* format filter */" in script:
+            options = {node.get_text().strip().lower() for node in self.soup.select('select option')}
+            controls = [node.get_text().lower() for node in self.soup.select('button, label, a')[:arg]]
+            return ({'html', 'pdf'} <= options) or (
+                any('html' in text for text in controls) and any('pdf' in text for text in controls)
+            )
+
+        if "/* chart near keywords */" in script:
+            return self._has_chart_near_keywords(arg['keywords'], ','.join(arg['selectors']))
+
+        if "/* search category filter */" in script:
+            return self._has_search_category_filter()
+
+        if "/* search labels */" in script:
+            return [
+                ' '.join([node.get('placeholder') or '', node.get('aria-label') or '', node.get_text()])
+                for base, text, _ in arg
+                for node in self.soup.select(base)
+                if not text or text.lower() in node.get_text().lower()
+            ]
+
+        if "/* first matches */" in script:
+            return [self._first_match(step) for step in arg]
+
+        if "/* ambiguous link count */" in script:
+            return sum(
+                1 for node in self.soup.select('a')
+                if any(keyword in node.get_text() for keyword in arg)
+            )
+
         if "window.innerHeight" in script and "getBoundingClientRect" in script:
-            viewport = 600
-            count = 0
-            for link in self.soup.select('a[href$=".pdf"]'):
-                top = self._extract_top(link)
-                if 0 <= top <= viewport:
-                    count += 1
-            return count
-
-        if "document.querySelectorAll('a[href$=\".pdf\"]')" in script:
-            pdf_links = self.soup.select('a[href$=".pdf"]')
-            indicated = 0
-            for link in pdf_links:
-                text = link.get_text()
-                has_icon = link.select_one('img[src*="pdf"], i[class*="pdf"], svg')
-                has_text = 'PDF' in text or 'pdf' in text
-                has_class = 'pdf' in (link.get('class') or [])
-                if has_icon or has_text or has_class:
-                    indicated += 1
-            return {'total': len(pdf_links), 'indicated': indicated}
-
-        if "document.querySelectorAll('a[target=\"_blank\"]')" in script:
-            links = self.soup.select('a[target="_blank"]')
-            indicated = 0
-            for link in links:
-                text = (link.get_text() or "")
-                title = link.get('title') or ""
-                has_icon = bool(link.select_one('svg, i, img'))
-                has_text = any(keyword in text for keyword in ['別ウィンドウ', '新しいウィンドウ', '外部サイト']) or '別ウィンドウ' in title
-                if has_icon or has_text:
-                    indicated += 1
-            return indicated
+            return self._first_view_pdf_count()
 
         if "const elements = document.querySelectorAll('*');" in script and 'style.overflow' in script:
-            count = 0
-            for node in self.soup.find_all(True):
-                if node.name in ('html', 'body'):
-                    continue
-                style = (node.get('style') or '').lower()
-                if any(kw in style for kw in ['overflow:', 'overflowx:', 'overflowy:']):
-                    if any(val in style for val in ['scroll', 'auto']):
-                        count += 1
-                        continue
-                classes = ' '.join(node.get('class') or []).lower()
-                if 'scroll' in classes:
-                    count += 1
-            return count
+            return self._scroll_area_count()
 
         if "return lhValue / fsValue;" in script:
-            font_size = self._get_typography_value('font-size')
-            line_height = self._get_typography_value('line-height', font_size)
-            return line_height / font_size if font_size else 1.0
+            return self._line_height_ratio()
 
         if "window.getComputedStyle(mainElement).fontSize" in script:
             size = self._get_typography_value('font-size')
@@ -151,6 +159,188 @@ class MockPage:
 
     # --- helpers ---
 
+    def _page_facts(self) -> dict:
+        viewport_meta_count = len(self.soup.select('meta[name="viewport"]'))
+        return {
+            'fontSize': f"{self._get_typography_value('font-size')}px",
+            'lineHeightRatio': self._line_height_ratio(),
+            'hasScrollArea': self._scroll_area_count() > 0,
+            'contrastIssues': 0,  # 計算済みスタイルを持たないため判定しない
+            'viewportMetaCount': viewport_meta_count,
+            # viewport meta がある場合は実装同様にスタイルシートを走査しない
+            'hasMediaQueries': None if viewport_meta_count else any(
+                '@media' in (style.string or '') for style in self.soup.find_all('style')
+            ),
+            'hasVisitedRule': any(':visited' in (style.string or '') for style in self.soup.find_all('style')),
+            'firstViewPdfCount': self._first_view_pdf_count(),
+            'links': {
+                'anchorCount': len(self.soup.select('a')),
+                'underlineIssues': 0,  # 計算済みスタイルを持たないため判定しない
+                'external': self._external_link_stats(),
+                'pdfIcon': self._pdf_icon_stats(),
+                'pdfNewWindow': {
+                    'total': len(self.soup.select('a[href$=".pdf"]')),
+                    'indicated': len(self.soup.select('a[href$=".pdf"][target="_blank" i]')),
+                },
+                'pdfLabel': self._pdf_label_stats(),
+            },
+            'cookie': self._cookie_features(),
+            'hasSearchInput': self.soup.select_one('input[type="search"], input[name*="search"]') is not None,
+            'counts': {
+                'pdfLinks': len(self.soup.select('a[href$=".pdf"]')),
+                'videos': len(self.soup.select('video, iframe[src*="youtube"], iframe[src*="vimeo"]')),
+                'tables': len(self.soup.select('table')),
+            },
+        }
+
+    def _first_match(self, step: List[str]) -> Optional[dict]:
+        base, text, rest = step
+        scopes = [
+            node for node in self.soup.select(base)
+            if not text or text.lower() in node.get_text().lower()
+        ]
+        if rest:
+            scopes = [found for scope in scopes for found in scope.select(rest)]
+        if not scopes:
+            return None
+        node = scopes[0]
+        styles = self._parse_style_attr(node)
+        return {
+            'width': float(styles.get('width', '0px').replace('px', '') or 0),
+            'height': float(styles.get('height', '0px').replace('px', '') or 0),
+        }
+
+    def _external_link_stats(self) -> dict:
+        links = self.soup.select('a[target="_blank"]')
+        indicated = 0
+        for link in links:
+            text = (link.get_text() or "")
+            title = link.get('title') or ""
+            has_icon = bool(link.select_one('svg, i, img'))
+            has_text = any(keyword in text for keyword in ['別ウィンドウ', '新しいウィンドウ', '外部サイト']) or '別ウィンドウ' in title
+            if has_icon or has_text:
+                indicated += 1
+        return {'total': len(links), 'indicated': indicated}
+
+    def _pdf_icon_stats(self) -> dict:
+        pdf_links = self.soup.select('a[href$=".pdf"]')
+        indicated = 0
+        for link in pdf_links:
+            text = link.get_text()
+            has_icon = link.select_one('img[src*="pdf"], i[class*="pdf"], svg')
+            has_text = 'PDF' in text or 'pdf' in text
+            has_class = 'pdf' in (link.get('class') or [])
+            if has_icon or has_text or has_class:
+                indicated += 1
+        return {'total': len(pdf_links), 'indicated': indicated}
+
+    def _has_news_category_filter(self, probes: List[List[str]], keywords: List[str]) -> bool:
+        def has_category(node: Tag) -> bool:
+            text = node.get_text().lower()
+            return any(keyword in text for keyword in keywords)
+
+        sections = [
+            node for node in self.soup.select(','.join(selector for selector, _ in probes))
+            if any(node.name == selector and needle.lower() in node.get_text().lower() for selector, needle in probes)
+        ][:5]
+        for section in sections:
+            if any(has_category(option) for option in section.select('select option')):
+                return True
+            if sum(1 for tab in section.select('button, a') if has_category(tab)) >= 2:
+                return True
+        return bool(self.soup.select('[data-filter], [data-category]'))
+
+    def _has_chart_near_keywords(self, keywords: List[str], chart_selector: str) -> bool:
+        lower_keywords = [keyword.lower() for keyword in keywords]
+        for text in self.soup.body.find_all(string=True) if self.soup.body else []:
+            if not any(keyword in text.lower() for keyword in lower_keywords):
+                continue
+            current = text.parent
+            for _ in range(3):
+                if current is None or not isinstance(current, Tag):
+                    break
+                if current.select_one(chart_selector) is not None:
+                    return True
+                current = current.parent
+        return False
+
+    def _has_search_category_filter(self) -> bool:
+        pattern = re.compile(
+            r'カテゴリ|category|ニュース|ir|csr|決算|プレス|press|investor|finance|library|report', re.IGNORECASE
+        )
+
+        def is_search_input(node: Tag) -> bool:
+            name = (node.get('name') or '').lower()
+            placeholder = (node.get('placeholder') or '').lower()
+            return (node.get('type') or '').lower() == 'search' or any(
+                word in value for value, word in [
+                    (name, 'search'), (name, 'keyword'), (placeholder, '検索'), (placeholder, 'search'),
+                ]
+            )
+
+        for form in self.soup.select('form'):
+            if not any(is_search_input(node) for node in form.select('input')):
+                continue
+            texts = [option.get_text() for option in form.select('select option')]
+            for choice in form.select('input[type="checkbox"], input[type="radio"]'):
+                label = choice.find_parent('label') or form.select_one(f'label[for="{choice.get("id", "")}"]')
+                texts.append((label.get_text() if label else '') or choice.get('value') or '')
+            if sum(1 for text in texts if pattern.search(text)) >= 2:
+                return True
+        return False
+
+    def _cookie_features(self) -> dict:
+        def has_label(nodes, labels) -> bool:
+            return any(label in node.get_text().lower() for node in nodes for label in labels)
+
+        consent_nodes = self.locator('[class*="cookie"], [class*="consent"], [id*="cookie"], [id*="consent"]').nodes
+        return {
+            'policyLink': has_label(self.soup.select('a'), ['cookie', 'クッキー']),
+            'consentBanner': any(
+                word in node.get_text() for node in consent_nodes for word in ['Cookie', 'cookie', 'クッキー', '同意']
+            ),
+            'settingsControl': has_label(self.soup.select('a, button'), ['cookie設定', 'クッキー設定']),
+        }
+
+    def _pdf_label_stats(self) -> dict:
+        pdf_links = self.soup.select('a[href*=".pdf"]')
+        indicated = 0
+        for link in pdf_links:
+            text = link.get_text().lower()
+            title = (link.get('title') or '').lower()
+            has_icon = link.select_one('img[alt*="pdf"], img[src*="pdf"], svg')
+            if 'pdf' in text or 'pdf' in title or has_icon:
+                indicated += 1
+        return {'total': len(pdf_links), 'indicated': indicated}
+
+    def _first_view_pdf_count(self, viewport: int = 600) -> int:
+        count = 0
+        for link in self.soup.select('a[href$=".pdf"]'):
+            top = self._extract_top(link)
+            if 0 <= top <= viewport:
+                count += 1
+        return count
+
+    def _scroll_area_count(self) -> int:
+        count = 0
+        for node in self.soup.find_all(True):
+            if node.name in ('html', 'body'):
+                continue
+            style = (node.get('style') or '').lower()
+            if any(kw in style for kw in ['overflow:', 'overflowx:', 'overflowy:']):
+                if any(val in style for val in ['scroll', 'auto']):
+                    count += 1
+                    continue
+            classes = ' '.join(node.get('class') or []).lower()
+            if 'scroll' in classes:
+                count += 1
+        return count
+
+    def _line_height_ratio(self) -> float:
+        font_size = self._get_typography_value('font-size')
+        line_height = self._get_typography_value('line-height', font_size)
+        return line_height / font_size if font_size else 1.0
+
     def _first_typography_node(self) -> Tag:
         for selector in ['main', 'article', '.main-content']:
             nodes = self._select(selector)
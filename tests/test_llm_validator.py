@@ -0,0 +1,402 @@
+"""LLMValidator テスト"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+
+from src.models import LLMResponse, ValidationItem
+from src.utils.response_cache import ResponseCache
+from src.utils.site_mapper import SiteMap
+from src.validators import llm_validator
+from src.validators.llm_validator import LLMValidator
+from tests.script_validator_utils import make_site, run_async
+
+SAMPLE_HTML = """
+<html><head><title>IR</title><script>var x = 1;</script></head>
+<body><h1>IR情報</h1><p>決算短信を掲載しています。</p><p>決算短信を掲載しています。</p></body></html>
+"""
+
+
+class FakeLLMClient:
+    """acall の呼び出しを記録するだけのテスト用クライアント"""
+
+    def __init__(self, responses=None):
+        self.responses = list(responses or [])
+        self.calls = []
+
+    async def acall(self, prompt: str, context: str) -> str:
+        self.calls.append((prompt, context))
+        if self.responses:
+            return self.responses.pop(0)
+        return json.dumps({"found": True, "confidence": 0.8, "details": "決算短信あり"})
+
+
+def make_llm_item(item_id: int = 101, name: str = "決算短信の掲載") -> ValidationItem:
+    return ValidationItem(
+        item_id=item_id,
+        category="情報公開の透明性",
+        subcategory="IR資料",
+        item_name=name,
+        automation_type="B",
+        check_type="llm",
+        priority="high",
+        difficulty=2,
+        instruction="決算短信が掲載されているか",
+        target_page="IRトップ",
+        original_no=item_id * 10,
+    )
+
+
+def make_llm_validator(client: FakeLLMClient, response_cache: ResponseCache = None) -> LLMValidator:
+    logger = logging.getLogger("llm-validator-test")
+    logger.setLevel(logging.ERROR)
+    return LLMValidator(client, logger, response_cache=response_cache)
+
+
+def make_payload(html: str = SAMPLE_HTML, url: str = "https://example.com/ir") -> dict:
+    return {"url": url, "html": html, "structure": None}
+
+
+async def _validate_with_pages_case():
+    client = FakeLLMClient()
+    validator = make_llm_validator(client)
+
+    result = await validator.validate_with_pages(make_site(), make_llm_item(), [make_payload()])
+
+    assert result.result == "PASS"
+    assert result.confidence == 0.8
+    assert len(client.calls) == 1
+    _, context = client.calls[0]
+    assert "var x" not in context
+    assert context.count("決算短信を掲載しています。") == 1
+
+
+def test_validate_with_pages_awaits_client():
+    run_async(_validate_with_pages_case())
+
+
+def test_system_prompt_is_shared_across_items():
+    client = FakeLLMClient()
+    validator = make_llm_validator(client)
+    site = make_site()
+
+    run_async(validator.validate_with_pages(site, make_llm_item(101, "決算短信の掲載"), [make_payload()]))
+    run_async(validator.validate_with_pages(site, make_llm_item(190, "ESG KPI の掲載"), [make_payload()]))
+
+    (system_a, user_a), (system_b, user_b) = client.calls
+    assert system_a == system_b
+    assert "決算短信の掲載" in user_a
+    assert "ESG KPI の掲載" in user_b
+    assert user_a.index("## ページ内容") < user_a.index("## 追加要件")
+
+
+def test_response_cache_skips_repeated_calls():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ResponseCache(Path(tmp), logging.getLogger("llm-validator-test"))
+        client = FakeLLMClient(responses=[
+            "not json",
+            "still not json",
+            json.dumps({"found": False, "confidence": 0.7, "details": "なし"}),
+        ])
+        validator = make_llm_validator(client, response_cache=cache)
+        site = make_site()
+        item = make_llm_item()
+
+        # パース不能な応答（整形の再依頼も失敗）はキャッシュされない
+        first = run_async(validator.validate_with_pages(site, item, [make_payload()]))
+        second = run_async(validator.validate_with_pages(site, item, [make_payload()]))
+        third = run_async(validator.validate_with_pages(site, item, [make_payload()]))
+        uncached = run_async(validator.validate_with_pages(site, item, [make_payload()], use_cache=False))
+
+        assert first.result == "ERROR"
+        assert second.result == "FAIL" and second.confidence == 0.7
+        assert third.details == "なし"
+        assert uncached.result == "PASS"
+        assert len(client.calls) == 4
+        assert cache.hits == 1
+
+
+class RecordingBatchValidator:
+    """validate_batch の同時実行数を記録するテスト用バリデータ"""
+
+    max_batch_items = 1
+
+    def __init__(self):
+        self.running = 0
+        self.max_running = 0
+
+    async def validate_batch(self, site, items, payloads):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0)
+        self.running -= 1
+        return [SimpleNamespace(item_id=item.item_id) for item in items]
+
+
+def _run_llm_batches(enable_item_parallel: bool) -> int:
+    from src.main import IRSiteEvaluator
+
+    evaluator = IRSiteEvaluator.__new__(IRSiteEvaluator)
+    evaluator.config = SimpleNamespace(processing=SimpleNamespace(
+        batch_semantic_checks=True,
+        enable_item_parallel=enable_item_parallel,
+        max_parallel_items_per_site=10,
+    ))
+    evaluator.logger = logging.getLogger("llm-validator-test")
+    evaluator.llm_validator = RecordingBatchValidator()
+    evaluator.validation_items = [make_llm_item(101 + i) for i in range(3)]
+    site = make_site()
+
+    results = run_async(evaluator._run_llm_batches(site, SiteMap(ir_top_url=site.url), {}, {}, {}))
+
+    assert sorted(results) == [101, 102, 103]
+    return evaluator.llm_validator.max_running
+
+
+def test_llm_batches_follow_item_parallel_setting():
+    # 項目並列化が無効ならバッチも1件ずつ送る
+    assert _run_llm_batches(enable_item_parallel=False) == 1
+    assert _run_llm_batches(enable_item_parallel=True) == 3
+
+
+def test_response_cache_evicts_oldest_entries():
+    with tempfile.TemporaryDirectory() as tmp:
+        # 1エントリは約150バイト（3件目で上限を超え、上限の9割以下になるまで古い順に削除）
+        cache = ResponseCache(Path(tmp), logging.getLogger("llm-validator-test"), max_size_bytes=400)
+        keys = [ResponseCache.make_key('item', i) for i in range(3)]
+        for i, key in enumerate(keys[:2]):
+            cache.set(key, "x" * 100)
+            # 更新日時の順序を確定させる
+            os.utime(cache._path_for(key), (1000 + i, 1000 + i))
+
+        cache.set(keys[2], "x" * 100)
+
+        assert cache.get(keys[0]) is None
+        assert cache.get(keys[1]) is not None and cache.get(keys[2]) is not None
+        assert cache._size_bytes <= 400
+
+
+def test_response_cache_write_failure_is_not_raised():
+    with tempfile.TemporaryDirectory() as tmp:
+        # キャッシュディレクトリの位置にファイルがあり mkdir できない
+        blocked = Path(tmp) / "blocked"
+        blocked.write_text("")
+        warnings = []
+        cache = ResponseCache(blocked, SimpleNamespace(warning=warnings.append))
+        client = FakeLLMClient(responses=[json.dumps({"found": True, "confidence": 0.8, "details": "掲載あり"})])
+        validator = make_llm_validator(client, response_cache=cache)
+
+        result = run_async(validator.validate_with_pages(make_site(), make_llm_item(), [make_payload()]))
+
+        assert result.result == "PASS"
+        assert list(Path(tmp).iterdir()) == [blocked]
+        assert len(warnings) == 1 and "Failed to write LLM response cache" in warnings[0]
+
+
+def test_unparsable_response_is_repaired_once():
+    client = FakeLLMClient(responses=[
+        "判定: 掲載あり（信頼度0.9）",
+        json.dumps({"found": True, "confidence": 0.9, "details": "掲載あり"}),
+    ])
+    validator = make_llm_validator(client)
+
+    result = run_async(validator.validate_with_pages(make_site(), make_llm_item(), [make_payload()]))
+
+    assert result.result == "PASS" and result.confidence == 0.9
+    assert len(client.calls) == 2
+    repair_prompt, repair_context = client.calls[1]
+    assert repair_prompt == llm_validator.JSON_REPAIR_PROMPT
+    assert repair_context == "判定: 掲載あり（信頼度0.9）"
+    assert validator.json_repair_attempts == validator.json_repair_successes == 1
+
+
+def test_preprocess_html_parses_each_page_once():
+    validator = make_llm_validator(FakeLLMClient())
+    html = SAMPLE_HTML + "<!-- unique page -->"
+    llm_validator._clean_html_text.cache_clear()
+
+    full = validator.preprocess_html(html, max_chars=30000)
+    truncated = validator.preprocess_html(html, max_chars=10)
+
+    info = llm_validator._clean_html_text.cache_info()
+    assert info.misses == 1 and info.hits == 1
+    assert full.startswith("IR")
+    assert "中間省略" in truncated
+
+
+def test_validate_batch_uses_single_call():
+    batch_response = json.dumps({
+        "results": [
+            {"item_id": 101, "found": True, "confidence": 0.9, "details": "決算短信あり"},
+            {"item_id": 190, "found": False, "confidence": 0.6, "details": "KPIなし"},
+        ]
+    })
+    client = FakeLLMClient(responses=[batch_response])
+    validator = make_llm_validator(client)
+    items = [make_llm_item(101, "決算短信の掲載"), make_llm_item(190, "ESG KPI の掲載")]
+
+    results = run_async(validator.validate_batch(make_site(), items, [make_payload()]))
+
+    assert [r.item_id for r in results] == [101, 190]
+    assert [r.result for r in results] == ["PASS", "FAIL"]
+    assert len(client.calls) == 1
+    _, context = client.calls[0]
+    assert "決算短信の掲載" in context and "ESG KPI の掲載" in context
+    assert context.count("決算短信を掲載しています。") == 1
+
+
+def test_validate_batch_falls_back_to_single_calls():
+    # 190 が欠落した応答 → 190 のみ個別呼び出し
+    partial = json.dumps({"results": [{"item_id": 101, "found": True, "confidence": 0.9, "details": "あり"}]})
+    client = FakeLLMClient(responses=[partial])
+    validator = make_llm_validator(client)
+    items = [make_llm_item(101, "決算短信の掲載"), make_llm_item(190, "ESG KPI の掲載")]
+
+    results = run_async(validator.validate_batch(make_site(), items, [make_payload()]))
+
+    assert [r.result for r in results] == ["PASS", "PASS"]
+    assert len(client.calls) == 2
+
+    # パース不能な応答 → 全項目を個別呼び出し
+    client = FakeLLMClient(responses=["not json"])
+    validator = make_llm_validator(client)
+    results = run_async(validator.validate_batch(make_site(), items, [make_payload()]))
+
+    assert len(results) == 2
+    assert len(client.calls) == 3
+
+
+def test_not_supported_items_skip_llm_calls():
+    batch_response = json.dumps({
+        "results": [
+            {"item_id": 101, "found": True, "confidence": 0.9, "details": "あり"},
+            {"item_id": 190, "found": True, "confidence": 0.9, "details": "あり"},
+        ]
+    })
+    client = FakeLLMClient(responses=[batch_response])
+    validator = make_llm_validator(client)
+    site = make_site()
+    unsupported = make_llm_item(56, "サイト稼働率の公開")
+
+    single = run_async(validator.validate_with_pages(site, unsupported, [make_payload()]))
+    html_result = run_async(validator.validate_with_html(site, SAMPLE_HTML, unsupported, "https://example.com/ir"))
+    batch = run_async(validator.validate_batch(
+        site, [make_llm_item(101), unsupported, make_llm_item(190)], [make_payload()]
+    ))
+
+    assert single.result == html_result.result == "NOT_SUPPORTED"
+    assert single.checked_url == "https://example.com/ir"
+    assert [r.result for r in batch] == ["PASS", "NOT_SUPPORTED", "PASS"]
+    assert len(client.calls) == 1
+    assert "稼働率" not in client.calls[0][1]
+
+
+def test_llm_response_extracts_json_from_prose():
+    text = '判定結果は以下の通りです。\n{"found": true, "confidence": 0.85, "details": "IRカレンダーあり"}\n以上です。'
+
+    response = LLMResponse.from_json(text)
+
+    assert response.parse_error is None
+    assert response.found is True
+    assert response.confidence == 0.85
+
+    broken = LLMResponse.from_json("判定できませんでした")
+    assert broken.parse_error is not None
+    assert broken.confidence == 0.0
+
+
+def test_keyword_scan_drives_hints_and_structure():
+    validator = make_llm_validator(FakeLLMClient())
+    chart_item = make_llm_item(101, "売上高のグラフ推移")
+    plain_item = make_llm_item(102, "IR担当部署の記載")
+    plain_item.instruction = "問い合わせ先が掲載されているか"
+
+    assert validator._needs_structure(chart_item)
+    assert any("グラフ/チャート" in hint for hint in validator._build_prompt_hints(chart_item))
+    assert not validator._needs_structure(plain_item)
+    assert not any("グラフ/チャート" in hint for hint in validator._build_prompt_hints(plain_item))
+
+
+def test_async_context_matches_sync_context():
+    validator = make_llm_validator(FakeLLMClient())
+    payloads = [
+        make_payload(url="https://example.com/ir"),
+        make_payload("<html><body><p>株主総会のお知らせ</p></body></html>", "https://example.com/ir/meeting"),
+    ]
+
+    async_context = run_async(validator._abuild_context(payloads, include_structure=False))
+
+    assert async_context == validator._build_context(payloads, include_structure=False)
+    assert async_context.index("example.com/ir\n") < async_context.index("example.com/ir/meeting")
+
+
+def test_context_is_reused_across_items():
+    client = FakeLLMClient()
+    validator = make_llm_validator(client)
+    site = make_site()
+    built = []
+    build_context = validator._abuild_context
+
+    async def counting_build(payloads, include_structure):
+        built.append(include_structure)
+        return await build_context(payloads, include_structure)
+
+    validator._abuild_context = counting_build
+    run_async(validator.validate_with_pages(site, make_llm_item(101, "決算短信の掲載"), [make_payload()]))
+    run_async(validator.validate_with_pages(site, make_llm_item(102, "統合報告書の掲載"), [make_payload()]))
+    run_async(validator.validate_with_pages(site, make_llm_item(103, "業績グラフの掲載"), [make_payload()]))
+    run_async(validator.validate_with_pages(site, make_llm_item(104, "決算短信の掲載"), [make_payload(url="https://example.com/ir/news")]))
+
+    # 構造情報の要否・ページが変わった場合のみ組み立て直す
+    assert built == [False, True, False]
+    assert len(client.calls) == 4
+
+
+class CharEncoding:
+    """1文字=1トークンとみなすテスト用エンコーディング"""
+
+    def encode(self, text, disallowed_special=()):
+        return [ord(ch) for ch in text]
+
+    def decode(self, tokens):
+        return ''.join(chr(token) for token in tokens)
+
+
+def test_preprocess_html_truncates_by_tokens():
+    validator = make_llm_validator(FakeLLMClient())
+    html = "<html><body><p>" + "あ" * 70 + "い" * 30 + "</p></body></html>"
+    original = llm_validator._get_token_encoding
+    llm_validator._truncate_to_tokens.cache_clear()
+    llm_validator._get_token_encoding = lambda: CharEncoding()
+    try:
+        text = validator.preprocess_html(html, max_chars=1000, max_tokens=10)
+    finally:
+        llm_validator._get_token_encoding = original
+        llm_validator._truncate_to_tokens.cache_clear()
+
+    assert text == "あ" * 7 + llm_validator.TRUNCATION_MARKER + "い" * 3
+
+
+if __name__ == "__main__":
+    test_validate_with_pages_awaits_client()
+    test_system_prompt_is_shared_across_items()
+    test_response_cache_skips_repeated_calls()
+    test_llm_batches_follow_item_parallel_setting()
+    test_response_cache_evicts_oldest_entries()
+    test_response_cache_write_failure_is_not_raised()
+    test_unparsable_response_is_repaired_once()
+    test_preprocess_html_parses_each_page_once()
+    test_validate_batch_uses_single_call()
+    test_validate_batch_falls_back_to_single_calls()
+    test_not_supported_items_skip_llm_calls()
+    test_llm_response_extracts_json_from_prose()
+    test_keyword_scan_drives_hints_and_structure()
+    test_async_context_matches_sync_context()
+    test_context_is_reused_across_items()
+    test_preprocess_html_truncates_by_tokens()
+    print("✓ LLMValidator tests passed")
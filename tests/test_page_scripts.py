@@ -0,0 +1,189 @@
+"""ブラウザ内で実行する JavaScript 定数のテスト
+
+MockPage はスクリプトを Python で再実装しているため、ここでは実際のスクリプト文字列を検証する。
+- node があれば構文を確認する
+- Playwright の Chromium が起動できれば、同じ HTML に対する実ブラウザと MockPage の結果を比較する
+どちらも使えない環境ではスキップする。
+"""
+from __future__ import annotations
+
+import shutil
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.utils import scraper
+from src.validators import script_validator
+from tests.mock_page import MockPage
+from tests.script_validator_utils import make_validator, run_async
+
+# script_validator の `*_SCRIPT` 定数はすべて関数式（`(arg) => {...}`）
+FUNCTION_SCRIPTS = {
+    name: getattr(script_validator, name)
+    for name in dir(script_validator)
+    if name.endswith('_SCRIPT') and isinstance(getattr(script_validator, name), str)
+}
+
+PARITY_HTML = """
+<html><head>
+<meta name="viewport" content="width=device-width">
+<style>a:visited { color: purple; }</style>
+</head><body>
+<main>
+  <section><h2>IRニュース</h2><a class="ir-link" href="/ir/news/">ニュース一覧</a></section>
+  <form><input type="search" name="q" placeholder="サイト内検索"></form>
+  <a href="/ir/tanshin.pdf" target="_blank">決算短信（PDF）</a>
+  <a href="https://example.org/" target="_blank">外部サイト（別ウィンドウ）</a>
+  <a href="/privacy/cookie/">Cookieポリシー</a>
+  <a href="/ir/library/">詳しくはこちら</a>
+  <video src="/ir/briefing.mp4"></video>
+  <table><tr><td>売上高</td></tr></table>
+</main>
+</body></html>
+"""
+
+
+def _find_node() -> str | None:
+    node = shutil.which('node')
+    if node:
+        return node
+    # nvm 経由のインストールは PATH に入っていないことがある
+    candidates = sorted(Path.home().glob('.nvm/versions/node/*/bin/node'))
+    return str(candidates[-1]) if candidates else None
+
+
+def _node_check(node: str, source: str) -> subprocess.CompletedProcess:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'script.js'
+        path.write_text(source, encoding='utf-8')
+        return subprocess.run([node, '--check', str(path)], capture_output=True, text=True)
+
+
+def test_page_scripts_are_valid_javascript():
+    node = _find_node()
+    if node is None:
+        raise unittest.SkipTest('node が見つからない')
+
+    assert FUNCTION_SCRIPTS
+    # page.evaluate と同じく式として評価されるよう括弧で囲む
+    sources = {name: f'({source});' for name, source in FUNCTION_SCRIPTS.items()}
+    sources['STEALTH_INIT_SCRIPT'] = scraper.STEALTH_INIT_SCRIPT
+
+    errors = {}
+    for name, source in sources.items():
+        completed = _node_check(node, source)
+        if completed.returncode != 0:
+            errors[name] = completed.stderr
+    assert errors == {}
+
+
+async def _launch_page():
+    """Chromium のページを開く（起動できない環境ではスキップ）"""
+    try:
+        from playwright.async_api import Error as PlaywrightError
+        from playwright.async_api import async_playwright
+    except ImportError:
+        raise unittest.SkipTest('playwright が未導入')
+
+    playwright = await async_playwright().start()
+    try:
+        browser = await playwright.chromium.launch()
+    except PlaywrightError as e:
+        await playwright.stop()
+        raise unittest.SkipTest(f'Chromium を起動できない: {e}')
+    return await browser.new_page(), browser, playwright
+
+
+async def _browser_parity_case():
+    page, browser, playwright = await _launch_page()
+    try:
+        await page.set_content(PARITY_HTML)
+        # open な shadow root 内の要素は locator 同様に検出する（MockPage では再現しない）
+        await page.evaluate(
+            "() => { const host = document.createElement('div');"
+            " host.attachShadow({mode: 'open'}).innerHTML = '<button class=\"in-shadow\">検索</button>';"
+            " document.body.appendChild(host); }"
+        )
+        mock = MockPage(PARITY_HTML)
+        validator = make_validator()
+
+        # 不正なセレクタが混ざっていても他のセレクタで判定できる
+        selectors = ('a[href=', '.ir-link', 'section:has-text("irニュース")')
+        for target in (page, mock):
+            assert await validator._any_selector_matches(target, selectors) is True
+            assert await validator._any_selector_matches(target, ('a[href=', '.missing')) is False
+        assert await validator._any_selector_matches(page, ('.in-shadow',)) is True
+
+        for script, arg in [
+            (script_validator.AMBIGUOUS_LINK_COUNT_SCRIPT, script_validator.AMBIGUOUS_LINK_KEYWORDS),
+            (script_validator.FORMAT_FILTER_SCRIPT, 200),
+            (script_validator.SEARCH_CATEGORY_FILTER_SCRIPT, None),
+            (script_validator.SEARCH_LABELS_SCRIPT, script_validator._selector_steps(('input[type="search"]',))),
+            (
+                script_validator.CHART_NEAR_KEYWORDS_SCRIPT,
+                {'keywords': ['売上高'], 'selectors': list(script_validator.CHART_SELECTORS)},
+            ),
+        ]:
+            assert await page.evaluate(script, arg) == await mock.evaluate(script, arg)
+
+        facts = await page.evaluate(script_validator.PAGE_FACTS_SCRIPT)
+        expected = await mock.evaluate(script_validator.PAGE_FACTS_SCRIPT)
+        # 計算済みスタイルに依存しない項目だけを比較する
+        for key in ('hasSearchInput', 'counts', 'cookie', 'viewportMetaCount', 'hasVisitedRule'):
+            assert facts[key] == expected[key], key
+        for key in ('anchorCount', 'external', 'pdfNewWindow'):
+            assert facts['links'][key] == expected['links'][key], key
+    finally:
+        await browser.close()
+        await playwright.stop()
+
+
+# 非表示のメニュー内（display:none の子孫）のコントラスト不足は数えない
+HIDDEN_MENU_HTML = """
+<html><body style="background: #fff; color: #000">
+<nav style="display: none">
+  <ul>{items}</ul>
+</nav>
+<p style="color: #000; background: #fff">本文</p>
+</body></html>
+""".format(items="".join(
+    f'<li><a href="/m{i}" style="color: #eee; background: #fff">メニュー{i}</a></li>' for i in range(12)
+))
+VISIBLE_MENU_HTML = HIDDEN_MENU_HTML.replace('display: none', 'display: block')
+
+
+async def _hidden_contrast_case():
+    page, browser, playwright = await _launch_page()
+    try:
+        await page.set_content(HIDDEN_MENU_HTML)
+        hidden = await page.evaluate(script_validator.PAGE_FACTS_SCRIPT)
+        await page.set_content(VISIBLE_MENU_HTML)
+        visible = await page.evaluate(script_validator.PAGE_FACTS_SCRIPT)
+    finally:
+        await browser.close()
+        await playwright.stop()
+
+    expected = await MockPage(HIDDEN_MENU_HTML).evaluate(script_validator.PAGE_FACTS_SCRIPT)
+    assert hidden['contrastIssues'] == expected['contrastIssues'] == 0
+    assert visible['contrastIssues'] == 11
+
+
+def test_hidden_subtree_is_excluded_from_contrast():
+    run_async(_hidden_contrast_case())
+
+
+def test_page_scripts_match_mock_page_in_browser():
+    run_async(_browser_parity_case())
+
+
+if __name__ == "__main__":
+    for test in (
+        test_page_scripts_are_valid_javascript,
+        test_page_scripts_match_mock_page_in_browser,
+        test_hidden_subtree_is_excluded_from_contrast,
+    ):
+        try:
+            test()
+        except unittest.SkipTest as e:
+            print(f"skip {test.__name__}: {e}")
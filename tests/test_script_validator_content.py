@@ -1,6 +1,9 @@
 """コンテンツ/アクセシビリティ系 ScriptValidator テスト"""
 from __future__ import annotations
 
+import asyncio
+
+from src.validators import script_validator
 from tests.mock_page import MockPage
 from tests.script_validator_utils import (
     load_fixture,
@@ -186,6 +189,27 @@ def test_financial_statements_link():
     run_async(_financial_metric_case(31, "決算短信テスト"))
 
 
+async def _hidden_statements_link_case():
+    validator = make_validator()
+    site = make_site()
+    item = make_item(31, "決算短信テスト")
+    page = MockPage(
+        "<html><body><nav><ul class='mega-menu' style='display:none'>"
+        "<li><a href='/ir/library/tanshin.html'>決算短信</a></li></ul></nav>"
+        "<p>IR情報トップ</p></body></html>"
+    )
+
+    assert "決算短信" not in await page.inner_text("body")
+    result = await validator.check_financial_statements(site, page, item)
+
+    # 非表示メニュー内のリンク文言も :has-text と同様に検出する
+    assert result.result == "PASS"
+
+
+def test_financial_statements_link_in_hidden_menu():
+    run_async(_hidden_statements_link_case())
+
+
 def test_securities_report_link():
     run_async(_financial_metric_case(32, "有価証券報告書テスト"))
 
@@ -262,6 +286,411 @@ async def _line_height_case():
     assert ng.result == "FAIL"
 
 
+class CountingMockPage(MockPage):
+    def __init__(self, html: str):
+        super().__init__(html)
+        self.evaluate_calls = 0
+
+    async def evaluate(self, script, arg=None):
+        self.evaluate_calls += 1
+        return await super().evaluate(script, arg)
+
+
+async def _page_facts_shared_case():
+    validator = make_validator()
+    site = make_site()
+    page = CountingMockPage(load_fixture("layout_typography_pass.html"))
+
+    font = await validator.check_font_size_not_too_small(site, page, make_item(11, "フォントサイズ最小テスト"))
+    line = await validator.check_line_height(site, page, make_item(13, "行間テスト"))
+    scroll = await validator.check_no_scroll_areas(site, page, make_item(5, "スクロールテスト"))
+
+    assert font.result == line.result == "PASS"
+    assert scroll.result in ("PASS", "FAIL")
+    assert page.evaluate_calls == 1
+
+    # URLが変わったページは取り直す
+    page.url = "https://example.com/ir/other"
+    await validator.check_font_size_large_enough(site, page, make_item(12, "フォントサイズ確保テスト"))
+    assert page.evaluate_calls == 2
+
+
+class BodyTextCountingMockPage(MockPage):
+    def __init__(self, html: str):
+        super().__init__(html)
+        self.body_text_calls = 0
+
+    async def inner_text(self, selector: str) -> str:
+        if selector == 'body':
+            self.body_text_calls += 1
+            await asyncio.sleep(0)
+        return await super().inner_text(selector)
+
+
+async def _body_text_shared_case():
+    validator = make_validator()
+    page = BodyTextCountingMockPage("<html><body><p>ROE 8.5%</p><p>自己資本比率 45%</p></body></html>")
+
+    texts = await asyncio.gather(*(validator._body_text(page) for _ in range(3)))
+    assert len(set(texts)) == 1 and "ROE" in texts[0]
+    assert page.body_text_calls == 1
+
+    await validator.check_roe_data(make_site(), page, make_item(28, "ROEテスト"))
+    assert page.body_text_calls == 1
+
+    # URLが変わったページは取り直す
+    page.url = "https://example.com/ir/other"
+    await validator._body_text(page)
+    assert page.body_text_calls == 2
+
+
+def test_body_text_is_fetched_once_per_page():
+    run_async(_body_text_shared_case())
+
+
+async def _validate_batch_case():
+    validator = make_validator()
+    site = make_site()
+    page = CountingMockPage(load_fixture("layout_typography_pass.html"))
+    items = [
+        make_item(11, "フォントサイズ最小テスト"),
+        make_item(13, "行間テスト"),
+        make_item(9999, "未実装項目"),
+        make_item(5, "スクロールテスト"),
+    ]
+
+    results = await validator.validate_batch(site, page, items, "https://example.com/ir", concurrency=2)
+
+    assert [r.item_id for r in results] == [11, 13, 9999, 5]
+    assert results[0].result == results[1].result == "PASS"
+    assert results[2].result == "UNKNOWN"
+    assert all(r.checked_url == "https://example.com/ir" for r in results)
+    # 検証日時はバッチ開始時刻で揃え、バッチ終了後は通常の現在時刻に戻る
+    assert len({r.checked_at for r in results}) == 1
+    assert script_validator._BATCH_STARTED_AT.get() is None
+    # 共有ページ情報は事前取得の1回のみ
+    assert page.evaluate_calls == 1
+
+
+class SlowMockPage(MockPage):
+    """evaluate のたびに待ちを入れ、並行バッチの処理を交互に進めるモック"""
+
+    async def evaluate(self, script, arg=None):
+        await asyncio.sleep(0.01)
+        return await super().evaluate(script, arg)
+
+
+async def _concurrent_batches_case():
+    validator = make_validator()
+    site = make_site()
+    items = [make_item(11, "フォントサイズ最小テスト"), make_item(13, "行間テスト"), make_item(5, "スクロールテスト")]
+
+    async def run_batch(delay: float):
+        await asyncio.sleep(delay)
+        page = SlowMockPage(load_fixture("layout_typography_pass.html"))
+        return await validator.validate_batch(site, page, items, "https://example.com/ir", concurrency=1)
+
+    # 同じインスタンスで2サイト分のバッチを重ねて実行する
+    first, second = await asyncio.gather(run_batch(0), run_batch(0.005))
+
+    assert len({r.checked_at for r in first}) == 1
+    assert len({r.checked_at for r in second}) == 1
+    assert first[0].checked_at != second[0].checked_at
+
+
+def test_concurrent_batches_keep_their_own_checked_at():
+    run_async(_concurrent_batches_case())
+
+
+async def _collect_texts_case():
+    validator = make_validator()
+    page = MockPage(
+        "<html><body>"
+        "<div class='hero'>決算説明会</div><div class='hero'> </div><div class='hero'>株主総会</div>"
+        "<div class='mv'>統合報告書</div><div class='mv'>IRカレンダー</div>"
+        "</body></html>"
+    )
+
+    texts = await validator._collect_texts(page, ['.hero', '.mv'], max_samples=3)
+
+    assert texts == ["決算説明会", "株主総会", "統合報告書"]
+
+
+def test_collect_texts_limits_samples():
+    run_async(_collect_texts_case())
+
+
+async def _invalid_selector_case():
+    validator = make_validator()
+    page = MockPage("<html><body><a class='ir-link' href='/ir/'>IR</a></body></html>")
+    selectors = ('a[href=', '.ir-link', 'div:has-text("IR")')
+
+    probe = script_validator._selector_probe(selectors)
+
+    # CSS セレクタは結合せず1つずつ渡す（1つが不正でも他の判定に影響させない）
+    assert probe == {'selectors': ['a[href=', '.ir-link'], 'textProbes': [['div', 'IR']]}
+    assert await validator._any_selector_matches(page, selectors) is True
+    assert await validator._any_selector_matches(page, ('a[href=',)) is False
+
+
+def test_any_selector_matches_skips_invalid_selector():
+    run_async(_invalid_selector_case())
+
+
+async def _search_input_shared_case():
+    validator = make_validator()
+    site = make_site()
+    page_pass = CountingMockPage(
+        "<html><body><form><input type='search' name='q'></form>"
+        "<a href='/ir/cg.pdf'>CG報告書</a></body></html>"
+    )
+    page_fail = MockPage("<html><body><form><input type='text' name='q'></form></body></html>")
+
+    url = "https://example.com/ir"
+    results = [
+        await validator.validate(site, page_pass, make_item(36, "検索結果件数テスト"), url),
+        await validator.validate(site, page_pass, make_item(39, "オートサジェストテスト"), url),
+        await validator.validate(site, page_pass, make_item(199, "ニュース検索テスト"), url),
+        await validator.validate(site, page_pass, make_item(136, "CG報告書テスト"), url),
+    ]
+    ng = await validator.validate(site, page_fail, make_item(36, "検索結果件数テスト"), url)
+
+    assert [r.result for r in results] == ["PASS", "PASS", "PASS", "PASS"]
+    assert ng.result == "FAIL"
+    # 判定が同じ項目は共有メソッドに振り分ける
+    assert validator._dispatch_table()[39] == "check_search_input_present"
+    assert validator._dispatch_table()[136] == "check_pdf_link_present"
+    # 検索窓の有無・PDFリンク数は共有ページ情報から読み、項目ごとに問い合わせない
+    assert page_pass.evaluate_calls == 1
+
+
+def test_search_input_read_from_page_facts():
+    run_async(_search_input_shared_case())
+
+
+async def _format_filter_case():
+    validator = make_validator()
+    site = make_site()
+    item = make_item(51, "HTML/PDF絞り込みテスト")
+    page_option = MockPage("<html><body><select><option>すべて</option><option> HTML </option><option>PDF</option></select></body></html>")
+    page_button = MockPage("<html><body><button>HTMLのみ</button><label>PDFのみ</label></body></html>")
+    page_fail = MockPage("<html><body><select><option>HTML</option></select><a href='/ir'>IR</a></body></html>")
+
+    assert (await validator.check_item_51(site, page_option, item)).result == "PASS"
+    assert (await validator.check_item_51(site, page_button, item)).result == "PASS"
+    assert (await validator.check_item_51(site, page_fail, item)).result == "FAIL"
+
+
+def test_format_filter_detection():
+    run_async(_format_filter_case())
+
+
+async def _search_category_filter_case():
+    validator = make_validator()
+    site = make_site()
+    item = make_item(47, "カテゴリ絞り込み検索テスト")
+    page_select = MockPage(
+        "<html><body><form><input type='search' name='q'>"
+        "<select><option>すべて</option><option>ニュース</option><option>IR資料</option></select>"
+        "</form></body></html>"
+    )
+    page_radio = MockPage(
+        "<html><body><form><input type='text' placeholder='サイト内検索'>"
+        "<label><input type='radio' name='c'>決算短信</label><input type='radio' name='c' value='Press'>"
+        "</form></body></html>"
+    )
+    page_fail = MockPage(
+        "<html><body><form><input type='text' name='q'>"
+        "<select><option>ニュース</option><option>IR資料</option></select></form></body></html>"
+    )
+
+    assert (await validator.check_item_47(site, page_select, item)).result == "PASS"
+    assert (await validator.check_item_47(site, page_radio, item)).result == "PASS"
+    assert (await validator.check_item_47(site, page_fail, item)).result == "FAIL"
+
+
+def test_search_category_filter_detection():
+    run_async(_search_category_filter_case())
+
+
+async def _global_search_labels_case():
+    validator = make_validator()
+    site = make_site()
+    item = make_item(44, "サイト内検索導線テスト")
+    page_pass = CountingMockPage(
+        "<html><body><header><form><input type='search' placeholder='サイト内検索'>"
+        "<button>Search</button></form></header></body></html>"
+    )
+    page_fail = MockPage("<html><body><header><p>IR情報</p></header><p>お問い合わせ</p></body></html>")
+
+    ok = await validator.check_item_44(site, page_pass, item)
+    ng = await validator.check_item_44(site, page_fail, item)
+
+    assert ok.result == "PASS"
+    assert ng.result == "FAIL" and "グローバル検索導線なし" in ng.details
+    # 候補要素の属性・テキストは1回の evaluate でまとめて取得する
+    assert page_pass.evaluate_calls == 1
+
+
+def test_global_search_labels():
+    run_async(_global_search_labels_case())
+
+
+async def _capital_cost_case():
+    validator = make_validator()
+    site = make_site()
+    item = make_item(89, "資本コストテスト")
+    page_pass = MockPage("<html><body><p>当社の株主資本コストは約 8.5 ％と認識しています。</p></body></html>")
+    page_fail = MockPage("<html><body><p>資本コストを意識した経営を進めます。</p></body></html>")
+
+    ok = await validator.check_item_89(site, page_pass, item)
+    ng = await validator.check_item_89(site, page_fail, item)
+
+    assert ok.result == "PASS" and "8.5%" in ok.details
+    assert ng.result == "FAIL"
+
+
+def test_capital_cost_percentage():
+    run_async(_capital_cost_case())
+
+
+async def _performance_chart_case():
+    validator = make_validator()
+    site = make_site()
+    chart_html = (
+        "<html><body><section><h2>業績推移（5期）</h2>"
+        "<div class='chart-area'><p>売上高・営業利益・経常利益・当期純利益</p><svg></svg></div>"
+        "<p>第3四半期（Q3）の増収について解説します。</p></section></body></html>"
+    )
+    page_pass = CountingMockPage(chart_html)
+    page_fail = CountingMockPage("<html><body><p>売上高のグラフ</p><svg></svg></body></html>")
+
+    trend = await validator.check_item_78(site, page_pass, make_item(78, "業績推移グラフテスト"))
+    quarter = await validator.check_item_81(site, page_pass, make_item(81, "四半期グラフテスト"))
+    explained = await validator.check_item_82(site, page_pass, make_item(82, "四半期グラフ説明テスト"))
+    missing = await validator.check_item_78(site, page_fail, make_item(78, "業績推移グラフテスト"))
+
+    assert trend.result == quarter.result == explained.result == "PASS"
+    assert missing.result == "FAIL"
+    # 本文の条件を満たさないページではグラフ探索の evaluate を行わない
+    assert page_fail.evaluate_calls == 0
+
+
+def test_performance_chart_checks():
+    run_async(_performance_chart_case())
+
+
+async def _chart_probe_case():
+    validator = make_validator()
+    keywords = ['売上高', '営業利益']
+    # 外側のラッパーはキーワードを含むが、近くにあるのはアイコンの svg と headline だけ
+    icon_only = MockPage(
+        "<html><body><div class='wrapper'><header><svg class='icon'></svg><p class='headline'>IR</p></header>"
+        "<main><section><div><div><p>売上高と営業利益の推移</p></div></div></section></main></div></body></html>"
+    )
+    paragraph_class = MockPage("<html><body><div><p class='paragraph'>売上高</p></div></body></html>")
+    near_chart = MockPage(
+        "<html><body><section><h3>売上高の推移</h3><div class='highcharts-container'></div></section></body></html>"
+    )
+
+    assert await validator._has_chart_near_keywords(icon_only, keywords) is False
+    assert await validator._has_chart_near_keywords(paragraph_class, keywords) is False
+    assert await validator._has_chart_near_keywords(near_chart, keywords) is True
+
+
+def test_chart_probe_starts_from_keyword_text():
+    run_async(_chart_probe_case())
+
+
+async def _news_search_case():
+    validator = make_validator()
+    site = make_site()
+    item = make_item(234, "ニュース検索テスト")
+    page_pass = CountingMockPage(
+        "<html><body><section><h2>ニュースリリース</h2><input type='text' name='q'></section></body></html>"
+    )
+    page_fail = MockPage("<html><body><section><h2>ニュース</h2><p>お知らせ</p></section></body></html>")
+
+    ok = await validator.check_item_234(site, page_pass, item)
+    ng = await validator.check_item_234(site, page_fail, item)
+
+    assert ok.result == "PASS"
+    assert ng.result == "FAIL"
+    assert page_pass.evaluate_calls == 1
+
+
+def test_news_search_probes_selectors_in_one_evaluate():
+    run_async(_news_search_case())
+
+
+async def _news_category_filter_case():
+    validator = make_validator()
+    site = make_site()
+    item = make_item(235, "ニュースカテゴリテスト")
+    page_pass = CountingMockPage(
+        "<html><body><section><h2>ニュースリリース</h2>"
+        "<a href='#ir'>IR</a><a href='#csr'>CSR</a><a href='#all'>すべて</a></section></body></html>"
+    )
+    page_fail = MockPage(
+        "<html><body><section><h2>ニュース</h2><a href='#all'>すべて</a><a href='#ir'>IR</a></section></body></html>"
+    )
+
+    ok = await validator.check_item_235(site, page_pass, item)
+    ng = await validator.check_item_235(site, page_fail, item)
+
+    assert ok.result == "PASS"
+    assert ng.result == "FAIL"
+    assert page_pass.evaluate_calls == 1
+
+
+def test_news_category_filter_uses_single_evaluate():
+    run_async(_news_category_filter_case())
+
+
+def test_visual_analyzer_is_created_lazily():
+    validator = make_validator()
+    assert validator._visual_analyzer is None
+
+    analyzer = validator.visual_analyzer
+    assert analyzer is validator.visual_analyzer
+
+
+class CountingVisualAnalyzer:
+    """capture の呼び出し回数を記録するテスト用アナライザ"""
+
+    def __init__(self):
+        self.calls = []
+
+    async def capture(self, page, selectors=None):
+        self.calls.append(selectors)
+        styles = [{'selector': selector, 'found': False} for selector in dict.fromkeys(selectors or [])]
+        return {'styles': styles, 'screenshots': [], 'carousels': []}
+
+
+async def _visual_snapshot_cache_case():
+    validator = make_validator()
+    analyzer = CountingVisualAnalyzer()
+    validator._visual_analyzer = analyzer
+    page = MockPage("<html><body><main>本文</main></body></html>")
+
+    await validator._capture_visual(page)
+    await validator._capture_visual(page)
+    first = await validator._capture_visual(page, ['body', 'main'])
+    second = await validator._capture_visual(page, ['main', 'body'])
+
+    assert len(analyzer.calls) == 2
+    assert [entry['selector'] for entry in first['styles']] == ['body', 'main']
+    assert [entry['selector'] for entry in second['styles']] == ['main', 'body']
+
+    page.url = "https://example.com/ir/other"
+    await validator._capture_visual(page)
+    assert len(analyzer.calls) == 3
+
+
+def test_visual_snapshot_is_cached_per_page():
+    run_async(_visual_snapshot_cache_case())
+
+
 def test_ambiguous_link_detection():
     run_async(_ambiguous_link_case())
 
@@ -299,3 +728,11 @@ def test_font_size_large_enough():
 
 def test_line_height_requirement():
     run_async(_line_height_case())
+
+
+def test_page_facts_evaluated_once_per_page():
+    run_async(_page_facts_shared_case())
+
+
+def test_validate_batch_runs_items_concurrently():
+    run_async(_validate_batch_case())
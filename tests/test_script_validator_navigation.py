@@ -1,6 +1,7 @@
 """ナビゲーション関連 ScriptValidator テスト"""
 from __future__ import annotations
 
+from src.validators.script_validator import ScriptValidator
 from tests.mock_page import MockPage
 from tests.script_validator_utils import (
     load_fixture,
@@ -101,6 +102,40 @@ async def _sitemap_case():
     assert ng.result == "FAIL"
 
 
+async def _carousel_pause_case():
+    validator = make_validator()
+    site = make_site()
+    item = make_item(9, "カルーセル停止テスト")
+
+    no_carousel = MockPage("<html><body><p>IR情報</p></body></html>")
+    with_pause = MockPage('<html><body><div class="slider"></div><button>Pause</button></body></html>')
+    without_pause = MockPage('<html><body><div class="slider"></div><button>次へ</button></body></html>')
+
+    assert (await validator.check_carousel_pause_button(site, no_carousel, item)).result == "PASS"
+    assert (await validator.check_carousel_pause_button(site, with_pause, item)).result == "PASS"
+    assert (await validator.check_carousel_pause_button(site, without_pause, item)).result == "FAIL"
+
+
+async def _dispatch_case():
+    first = make_validator()
+    second = make_validator()
+    site = make_site()
+    page = MockPage(load_fixture("navigation_pass.html"))
+
+    menu = await first.validate(site, page, make_item(1, "メニュー構成テスト"), "https://example.com/ir")
+    unknown = await second.validate(site, page, make_item(9999, "未実装項目"), "https://example.com/ir")
+
+    assert menu.result == "PASS" and menu.checked_url == "https://example.com/ir"
+    assert unknown.result == "UNKNOWN"
+    # 対応表はクラスで1回だけ構築され、インスタンス間で共有される
+    assert first._dispatch_table() is second._dispatch_table()
+    assert ScriptValidator._dispatch_table()[247] == "check_item_247"
+    assert ScriptValidator._dispatch_slots()[247] == "check_item_247"
+    # 転送だけの項目は別名として共通メソッドを直接引く
+    assert ScriptValidator._dispatch_slots()[75] == "check_cookie_settings"
+    assert ScriptValidator._dispatch_slots()[40] == "check_external_link_icon"
+
+
 def test_menu_count_pass_and_fail():
     run_async(_menu_count_case())
 
@@ -123,3 +158,11 @@ def test_footer_navigation():
 
 def test_sitemap_link():
     run_async(_sitemap_case())
+
+
+def test_carousel_pause_button():
+    run_async(_carousel_pause_case())
+
+
+def test_validate_dispatch_table():
+    run_async(_dispatch_case())